@@ -0,0 +1,23 @@
+"""Repository-wide pytest fixtures."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+from spec_driver.core.paths import CACHE_DIR_ENV_VAR
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+  """Send derived caches to a session temp directory.
+
+  Tests that resolve the workspace with ``find_repo_root()`` run against
+  this checkout; without this they would write caches into its
+  ``.spec-driver/run/cache/``. Every workspace gets its own
+  subdirectory, so tests on temporary workspaces never share caches.
+  """
+  with pytest.MonkeyPatch.context() as monkeypatch:
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path_factory.mktemp("cache")))
+    yield
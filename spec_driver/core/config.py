@@ -39,8 +39,13 @@ DEFAULT_CONFIG: dict = {
   "events": {
     "enabled": True,
   },
+  "cache": {
+    "enabled": True,
+    "verify_content": False,
+  },
   "sync": {
     "spec_autocreate": False,
+    "ts_extract_server": [],
   },
   "contracts": {
     "enabled": True,
@@ -379,9 +384,15 @@ _SECTION_COMMENTS: dict[str, list[str]] = {
   "events": [
     "Event logging for spec-driver operations (powers TUI track mode).",
   ],
+  "cache": [
+    "Persistent artefact parse cache under .spec-driver/run/cache/.",
+    "verify_content: also compare a content digest, not just mtime + size.",
+  ],
   "sync": [
     "Controls for the sync subsystem.",
     "spec_autocreate: automatically create unit specs during sync.",
+    "ts_extract_server: argv of a JSON-lines ts-doc-extract server, started",
+    "once per package root (empty: the bundled Node server).",
   ],
   "contracts": [
     "Generated API contracts corpus.",
@@ -43,6 +43,13 @@ def command_was_invoked() -> bool:
   return _command_invoked
 
 
+def reset_command_state() -> None:
+  """Clear per-command state so a long-lived process can run another command."""
+  global _command_invoked  # noqa: PLW0603
+  _command_invoked = False
+  _touched_artifacts.clear()
+
+
 def record_artifact(artifact_id: str) -> None:
   """Register an artifact ID touched by the current command."""
   _touched_artifacts.append(artifact_id)
@@ -53,14 +60,27 @@ def emit_event(
   argv: list[str],
   exit_code: int,
   status: str,
+  profile: dict | None = None,
 ) -> None:
   """Emit a structured event to JSONL log and socket.
 
   Fail-silent: swallows all exceptions so CLI commands are never affected.
   No-op when no workspace is available.
+
+  Args:
+    argv: Command-line arguments of the command.
+    exit_code: Process exit status.
+    status: ``"ok"`` or ``"error"``.
+    profile: Phase timings of a profiled command (see
+      ``spec_driver.core.profiling``); recorded under ``"profile"``.
   """
   with contextlib.suppress(Exception):
-    _emit_event_unsafe(argv=argv, exit_code=exit_code, status=status)
+    _emit_event_unsafe(
+      argv=argv,
+      exit_code=exit_code,
+      status=status,
+      profile=profile,
+    )
 
 
 # --- Internal helpers ---
@@ -71,6 +91,7 @@ def _emit_event_unsafe(
   argv: list[str],
   exit_code: int,
   status: str,
+  profile: dict | None = None,
 ) -> None:
   """Build and write the event record. May raise."""
   run_dir = _get_run_dir()
@@ -87,6 +108,8 @@ def _emit_event_unsafe(
     "exit_code": exit_code,
     "status": status,
   }
+  if profile is not None:
+    event["profile"] = profile
 
   _write_log(event, run_dir)
   _send_socket(event, run_dir)
@@ -179,6 +202,4 @@ def _send_socket(event: dict, run_dir: Path) -> None:
 
 def _reset() -> None:
   """Reset module state (test helper only)."""
-  global _command_invoked  # noqa: PLW0603
-  _command_invoked = False
-  _touched_artifacts.clear()
+  reset_command_state()
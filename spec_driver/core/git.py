@@ -2,12 +2,25 @@
 
 Provides lightweight wrappers for git operations needed by
 artifact verification and staleness tracking.
+
+A command can activate a process-wide :class:`GitFacts` session with
+``activate_git_facts()``. While it is active, the wrappers below answer
+from one batched ``git status`` and one ``git ls-files`` per repository,
+memoized until ``deactivate_git_facts()``. Without a session every call runs
+its own git command.
 """
 
 from __future__ import annotations
 
 import subprocess
+import threading
+from dataclasses import dataclass
 from pathlib import Path
+from shutil import which
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+  from collections.abc import Callable
 
 SHA_HEX_PATTERN = r"^[0-9a-f]{40}$"
 """Regex pattern matching a full 40-character hex SHA."""
@@ -15,6 +28,168 @@ SHA_HEX_PATTERN = r"^[0-9a-f]{40}$"
 DEFAULT_SHORT_SHA_LENGTH = 8
 
 
+@dataclass(frozen=True)
+class GitStatus:
+  """Repository state from one ``git status --porcelain=v2 --branch``."""
+
+  head_sha: str | None
+  branch: str | None
+  has_unstaged: bool
+  has_staged: bool
+
+
+def _parse_status(output: str) -> GitStatus:
+  """Parse ``git status --porcelain=v2 --branch -z`` output."""
+  head_sha: str | None = None
+  branch: str | None = None
+  unstaged = staged = False
+  for record in output.split("\0"):
+    if record.startswith("# branch.oid "):
+      oid = record.removeprefix("# branch.oid ")
+      head_sha = None if oid == "(initial)" else oid
+    elif record.startswith("# branch.head "):
+      head = record.removeprefix("# branch.head ")
+      branch = None if head == "(detached)" else head
+    elif record[:2] in {"1 ", "2 ", "u "}:
+      # "<kind> XY ...": X is the index side, Y the worktree side.
+      staged = staged or record[2] != "."
+      unstaged = unstaged or record[3] != "."
+  return GitStatus(head_sha, branch, unstaged, staged)
+
+
+class GitFacts:
+  """Memoized git queries for one repository.
+
+  Each query runs at most once per instance; concurrent callers (e.g. sync
+  worker threads) wait for the first. Failures are memoized as None.
+  """
+
+  def __init__(self, root: Path) -> None:
+    self.root = Path(root)
+    self._lock = threading.Lock()
+    self._memo: dict[tuple[str, ...], Any] = {}
+
+  def _memoized[T](self, key: tuple[str, ...], compute: Callable[[], T]) -> T:
+    with self._lock:
+      if key not in self._memo:
+        self._memo[key] = compute()
+      return self._memo[key]
+
+  def _git(self, *args: str, timeout: int = 30) -> str | None:
+    """Run ``git <args>`` in the root; None when git fails or is missing."""
+    try:
+      result = subprocess.run(  # noqa: S603, S607
+        ["git", *args],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        cwd=self.root,
+        check=False,
+      )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+      return None
+    return result.stdout if result.returncode == 0 else None
+
+  def status(self) -> GitStatus | None:
+    """HEAD, branch and dirty state, or None outside a git repo."""
+
+    def compute() -> GitStatus | None:
+      output = self._git(
+        "status",
+        "--porcelain=v2",
+        "--branch",
+        "--untracked-files=no",
+        "-z",
+      )
+      return None if output is None else _parse_status(output)
+
+    return self._memoized(("status",), compute)
+
+  def tracked_files(self) -> frozenset[Path]:
+    """Absolute paths of files tracked by git (empty if unavailable)."""
+
+    def compute() -> frozenset[Path]:
+      if not which("git"):
+        return frozenset()
+      try:
+        result = subprocess.run(  # noqa: S603, S607
+          ["git", "-C", str(self.root), "ls-files"],
+          check=True,
+          capture_output=True,
+          text=True,
+          timeout=30,
+        )
+      except (
+        subprocess.CalledProcessError,
+        subprocess.TimeoutExpired,
+        FileNotFoundError,
+      ):
+        return frozenset()
+      return frozenset(
+        self.root / line.strip() for line in result.stdout.splitlines() if line.strip()
+      )
+
+    return self._memoized(("ls-files",), compute)
+
+  def changed_files(self, from_ref: str, to_ref: str = "HEAD") -> list[str]:
+    """Files changed between two refs (empty on failure)."""
+
+    def compute() -> list[str]:
+      output = self._git("diff", "--name-only", from_ref, to_ref, timeout=10)
+      return [] if output is None else [f for f in output.split("\n") if f]
+
+    return list(self._memoized(("diff", from_ref, to_ref), compute))
+
+  def log_name_only(self, rev_range: str, pathspecs: list[str]) -> str | None:
+    """``git log --oneline --name-only`` output for *rev_range*, or None."""
+    args = ("log", "--oneline", "--name-only", rev_range, "--", *pathspecs)
+    return self._memoized(args, lambda: self._git(*args))
+
+
+# --- Process-global session ---
+
+_active_facts: dict[Path, GitFacts] | None = None
+_active_lock = threading.Lock()
+
+
+def activate_git_facts() -> None:
+  """Start memoizing git queries for the rest of this command."""
+  global _active_facts  # noqa: PLW0603
+  _active_facts = {}
+
+
+def deactivate_git_facts() -> None:
+  """Stop memoizing git queries and forget everything learned."""
+  global _active_facts  # noqa: PLW0603
+  _active_facts = None
+
+
+def get_git_facts(root: Path | None = None) -> GitFacts | None:
+  """Return the session's facts for *root* (default cwd), or None if inactive."""
+  if _active_facts is None:
+    return None
+  key = Path(root or Path.cwd()).resolve()
+  with _active_lock:
+    facts = _active_facts.get(key)
+    if facts is None:
+      facts = _active_facts[key] = GitFacts(Path(root) if root else key)
+    return facts
+
+
+def get_tracked_files(root: Path) -> frozenset[Path]:
+  """Return absolute paths of git-tracked files under *root*.
+
+  Shared across callers while a session is active.
+  """
+  facts = get_git_facts(root)
+  return (facts or GitFacts(root)).tracked_files()
+
+
+def _session_status(root: Path | None) -> GitStatus | None:
+  facts = get_git_facts(root)
+  return facts.status() if facts is not None else None
+
+
 def get_head_sha(root: Path | None = None) -> str | None:
   """Return full 40-char SHA of HEAD, or None if not in a git repo.
 
@@ -24,6 +199,8 @@ def get_head_sha(root: Path | None = None) -> str | None:
   Returns:
     Full hex SHA string, or None if git is unavailable or not in a repo.
   """
+  if (status := _session_status(root)) is not None:
+    return status.head_sha
   try:
     result = subprocess.run(  # noqa: S603, S607
       ["git", "rev-parse", "HEAD"],
@@ -40,6 +217,8 @@ def get_head_sha(root: Path | None = None) -> str | None:
 
 def get_branch(root: Path | None = None) -> str | None:
   """Return current branch name, or None if detached/not in a repo."""
+  if (status := _session_status(root)) is not None:
+    return status.branch
   try:
     result = subprocess.run(  # noqa: S603, S607
       ["git", "rev-parse", "--abbrev-ref", "HEAD"],
@@ -59,6 +238,8 @@ def get_branch(root: Path | None = None) -> str | None:
 
 def has_uncommitted_changes(root: Path | None = None) -> bool:
   """Check if working tree has uncommitted changes (unstaged)."""
+  if (status := _session_status(root)) is not None:
+    return status.has_unstaged
   try:
     result = subprocess.run(  # noqa: S603, S607
       ["git", "diff", "--quiet"],
@@ -74,6 +255,8 @@ def has_uncommitted_changes(root: Path | None = None) -> bool:
 
 def has_staged_changes(root: Path | None = None) -> bool:
   """Check if index has staged changes."""
+  if (status := _session_status(root)) is not None:
+    return status.has_staged
   try:
     result = subprocess.run(  # noqa: S603, S607
       ["git", "diff", "--cached", "--quiet"],
@@ -117,6 +300,8 @@ def get_changed_files(
   Returns:
     List of changed file paths (relative to repo root).
   """
+  if (facts := get_git_facts(root)) is not None:
+    return facts.changed_files(from_ref, to_ref)
   try:
     result = subprocess.run(  # noqa: S603, S607
       ["git", "diff", "--name-only", from_ref, to_ref],
@@ -136,9 +321,15 @@ def get_changed_files(
 __all__ = [
   "DEFAULT_SHORT_SHA_LENGTH",
   "SHA_HEX_PATTERN",
+  "GitFacts",
+  "GitStatus",
+  "activate_git_facts",
+  "deactivate_git_facts",
   "get_branch",
   "get_changed_files",
+  "get_git_facts",
   "get_head_sha",
+  "get_tracked_files",
   "has_staged_changes",
   "has_uncommitted_changes",
   "short_sha",
@@ -12,7 +12,16 @@ import pytest
 from spec_driver.core.git import (
   DEFAULT_SHORT_SHA_LENGTH,
   SHA_HEX_PATTERN,
+  GitFacts,
+  GitStatus,
+  _parse_status,
+  activate_git_facts,
+  deactivate_git_facts,
+  get_branch,
   get_head_sha,
+  get_tracked_files,
+  has_staged_changes,
+  has_uncommitted_changes,
   short_sha,
 )
 
@@ -140,3 +149,119 @@ class TestShaHexPattern:
   )
   def test_invalid_shas(self, sha: str) -> None:
     assert not re.match(SHA_HEX_PATTERN, sha)
+
+
+STATUS_OUTPUT = "\0".join(
+  [
+    f"# branch.oid {SAMPLE_SHA}",
+    "# branch.head main",
+    "1 .M N... 100644 100644 100644 aaa bbb src/mod.py",
+    "",
+  ],
+)
+
+
+@pytest.fixture
+def git_session():
+  activate_git_facts()
+  yield
+  deactivate_git_facts()
+
+
+def _git(root: Path, *args: str) -> None:
+  subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+
+
+class TestParseStatus:
+  """Tests for porcelain v2 status parsing."""
+
+  def test_branch_and_worktree_change(self) -> None:
+    assert _parse_status(STATUS_OUTPUT) == GitStatus(
+      head_sha=SAMPLE_SHA,
+      branch="main",
+      has_unstaged=True,
+      has_staged=False,
+    )
+
+  def test_staged_rename_detached_initial(self) -> None:
+    output = "\0".join(
+      [
+        "# branch.oid (initial)",
+        "# branch.head (detached)",
+        "2 R. N... 100644 100644 100644 aaa bbb R100 new.py",
+        "old.py",
+      ],
+    )
+    assert _parse_status(output) == GitStatus(None, None, False, True)
+
+
+class TestGitFactsSession:
+  """Tests for the memoized git facts session."""
+
+  def test_status_queries_share_one_git_call(self, git_session) -> None:
+    with patch("spec_driver.core.git.subprocess.run") as mock_run:
+      mock_run.return_value = subprocess.CompletedProcess(
+        args=[],
+        returncode=0,
+        stdout=STATUS_OUTPUT,
+      )
+      assert get_head_sha(Path("/repo")) == SAMPLE_SHA
+      assert get_branch(Path("/repo")) == "main"
+      assert has_uncommitted_changes(Path("/repo")) is True
+      assert has_staged_changes(Path("/repo")) is False
+
+    assert mock_run.call_count == 1
+    assert mock_run.call_args.args[0][:2] == ["git", "status"]
+
+  def test_tracked_files_shared_per_root(self, git_session) -> None:
+    with patch("spec_driver.core.git.subprocess.run") as mock_run:
+      mock_run.return_value = subprocess.CompletedProcess(
+        args=[],
+        returncode=0,
+        stdout="a.py\nlib/b.py\n",
+      )
+      first = get_tracked_files(Path("/repo"))
+      second = get_tracked_files(Path("/repo"))
+
+    assert mock_run.call_count == 1
+    assert first is second
+    assert first == {Path("/repo/a.py"), Path("/repo/lib/b.py")}
+
+  def test_no_session_runs_each_command(self) -> None:
+    with patch("spec_driver.core.git.subprocess.run") as mock_run:
+      mock_run.return_value = subprocess.CompletedProcess(
+        args=[],
+        returncode=0,
+        stdout="main\n",
+      )
+      get_branch(Path("/repo"))
+      get_branch(Path("/repo"))
+
+    assert mock_run.call_count == 2
+
+  def test_real_repository(self, tmp_path: Path) -> None:
+    """GitFacts agrees with a freshly committed and modified repo."""
+    _git(tmp_path, "init", "-q", "-b", "trunk")
+    (tmp_path / "a.txt").write_text("one\n")
+    _git(tmp_path, "add", "a.txt")
+    _git(
+      tmp_path,
+      "-c",
+      "user.name=t",
+      "-c",
+      "user.email=t@example.com",
+      "commit",
+      "-qm",
+      "init",
+    )
+    (tmp_path / "a.txt").write_text("two\n")
+
+    facts = GitFacts(tmp_path)
+    status = facts.status()
+
+    assert status is not None
+    assert re.match(SHA_HEX_PATTERN, status.head_sha or "")
+    assert status.branch == "trunk"
+    assert status.has_unstaged is True
+    assert status.has_staged is False
+    assert facts.tracked_files() == {tmp_path / "a.txt"}
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import json
 import os
 import tempfile
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Any
+
+from .version import get_package_version
 
 
 def atomic_write(path: Path, content: str) -> Path:
@@ -47,4 +52,68 @@ def atomic_write(path: Path, content: str) -> Path:
   return path
 
 
-__all__ = ["atomic_write"]
+def read_json_cache(
+  path: Path,
+  version: int,
+  stamp: Mapping[str, Any] | None = None,
+) -> dict[str, Any] | None:
+  """Load a cache file written by :func:`write_json_cache`.
+
+  Never raises: a missing, unreadable or malformed file reads as None, as
+  does one written with another format *version*, by another package
+  version (the cached data is derived by code that may have changed), or
+  with a different *stamp* — e.g. the directory the cache describes.
+
+  Args:
+    path: Cache file.
+    version: Format version the caller understands.
+    stamp: Keys the payload must carry with exactly these values.
+
+  Returns:
+    The decoded payload, stamps included, or None.
+  """
+  try:
+    data = json.loads(path.read_text(encoding="utf-8"))
+  except (OSError, ValueError):
+    return None
+  if (
+    not isinstance(data, dict)
+    or data.get("version") != version
+    or data.get("package_version") != get_package_version()
+    or any(data.get(key) != value for key, value in (stamp or {}).items())
+  ):
+    return None
+  return data
+
+
+def write_json_cache(
+  path: Path,
+  version: int,
+  payload: Mapping[str, Any],
+  stamp: Mapping[str, Any] | None = None,
+) -> bool:
+  """Atomically write *payload* as a versioned cache file (fail-silent).
+
+  Args:
+    path: Cache file; parent directories are created.
+    version: Format version, checked by :func:`read_json_cache`.
+    payload: JSON-serialisable cache content.
+    stamp: Keys :func:`read_json_cache` will require to match.
+
+  Returns:
+    Whether the file was written.
+  """
+  data = {
+    "version": version,
+    "package_version": get_package_version(),
+    **(stamp or {}),
+    **payload,
+  }
+  try:
+    atomic_write(path, json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+  except OSError:
+    return False
+  return True
+
+
+__all__ = ["atomic_write", "read_json_cache", "write_json_cache"]
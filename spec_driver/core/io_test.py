@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
-from spec_driver.core.io import atomic_write
+from spec_driver.core.io import atomic_write, read_json_cache, write_json_cache
 
 
 class TestAtomicWrite:
@@ -51,3 +52,40 @@ class TestAtomicWrite:
       content = "héllo wörld — 日本語\n"
       atomic_write(dest, content)
       assert dest.read_text(encoding="utf-8") == content
+
+
+class TestJsonCache:
+  """Tests for read_json_cache / write_json_cache."""
+
+  def test_round_trip(self, tmp_path: Path):
+    path = tmp_path / "cache" / "c.json"
+    assert write_json_cache(path, 2, {"items": [1, "é"]}, stamp={"dir": "a"})
+    data = read_json_cache(path, 2, stamp={"dir": "a"})
+    assert data is not None
+    assert data["items"] == [1, "é"]
+    assert data["dir"] == "a"
+
+  def test_missing_or_malformed_reads_none(self, tmp_path: Path):
+    path = tmp_path / "c.json"
+    assert read_json_cache(path, 1) is None
+    path.write_text("{not json", encoding="utf-8")
+    assert read_json_cache(path, 1) is None
+    path.write_text("[]", encoding="utf-8")
+    assert read_json_cache(path, 1) is None
+
+  def test_version_and_stamp_mismatch_read_none(self, tmp_path: Path):
+    path = tmp_path / "c.json"
+    write_json_cache(path, 1, {}, stamp={"dir": "a"})
+    assert read_json_cache(path, 2, stamp={"dir": "a"}) is None
+    assert read_json_cache(path, 1, stamp={"dir": "b"}) is None
+
+  def test_package_version_mismatch_reads_none(self, tmp_path: Path):
+    path = tmp_path / "c.json"
+    write_json_cache(path, 1, {})
+    with patch("spec_driver.core.io.get_package_version", return_value="0.0.0-x"):
+      assert read_json_cache(path, 1) is None
+
+  def test_write_failure_is_silent(self, tmp_path: Path):
+    blocker = tmp_path / "file"
+    blocker.write_text("", encoding="utf-8")
+    assert not write_json_cache(blocker / "c.json", 1, {})
@@ -0,0 +1,282 @@
+"""Persistent on-disk parse cache for markdown artefacts.
+
+Every registry loads its artefacts through ``load_markdown_file``; on large
+workspaces most CLI wall time is spent re-parsing unchanged YAML frontmatter.
+This module keeps a workspace-level cache under ``.spec-driver/run/cache/``
+holding the parsed frontmatter and the body offsets of each file, keyed by
+absolute path and validated by ``mtime_ns`` + size (optionally a content
+digest). Unchanged files are served from the cache without touching PyYAML.
+
+The cache is process-global and opt-in: ``activate_parse_cache(root)`` makes
+``load_markdown_file`` consult it for paths inside ``root``. Callers that never
+activate it (tests, library users) see the uncached behaviour unchanged.
+
+All persistence is fail-silent — a broken or unwritable cache degrades to a
+plain parse, never to an error.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+from .io import read_json_cache, write_json_cache
+from .paths import get_cache_dir
+
+CACHE_FILENAME = "markdown.json"
+CACHE_FORMAT_VERSION = 1
+
+# Env override: "0"/"off" disables the cache, "verify" forces digest checks.
+CACHE_ENV_VAR = "SPEC_DRIVER_PARSE_CACHE"
+
+ParseFn = Callable[[Path, str], tuple[dict[str, Any], str]]
+
+
+class _UncacheableError(ValueError):
+  """Raised when frontmatter contains values the cache cannot round-trip."""
+
+
+def _encode_value(value: Any) -> Any:
+  """Convert a YAML-loaded value to a JSON-safe structure.
+
+  Dates are tagged so they round-trip; anything else exotic (non-string
+  keys, binary, sets) marks the file as uncacheable.
+  """
+  if value is None or isinstance(value, str | bool | int | float):
+    return value
+  if isinstance(value, datetime):
+    return {"$datetime": value.isoformat()}
+  if isinstance(value, date):
+    return {"$date": value.isoformat()}
+  if isinstance(value, list):
+    return [_encode_value(item) for item in value]
+  if isinstance(value, dict):
+    encoded: dict[str, Any] = {}
+    for key, item in value.items():
+      if not isinstance(key, str) or key.startswith("$"):
+        msg = f"unsupported frontmatter key {key!r}"
+        raise _UncacheableError(msg)
+      encoded[key] = _encode_value(item)
+    return encoded
+  msg = f"unsupported frontmatter value of type {type(value).__name__}"
+  raise _UncacheableError(msg)
+
+
+def _decode_hook(obj: dict[str, Any]) -> Any:
+  if len(obj) == 1:
+    if "$date" in obj:
+      return date.fromisoformat(obj["$date"])
+    if "$datetime" in obj:
+      return datetime.fromisoformat(obj["$datetime"])
+  return obj
+
+
+def _digest(text: str) -> str:
+  return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _body_span(text: str, body: str) -> tuple[int, int, bool] | None:
+  """Locate *body* inside *text* as ``(start, end, newline_appended)``.
+
+  ``load_markdown_file`` returns a stripped slice of the file text, possibly
+  with a trailing newline re-added. Returns None if the body cannot be
+  expressed as such a slice (the file is then parsed on every load).
+  """
+  newline = body.endswith("\n")
+  core = body[:-1] if newline else body
+  end = len(text.rstrip()) if core else 0
+  start = end - len(core)
+  if start < 0 or text[start:end] != core:
+    return None
+  return start, end, newline
+
+
+def default_cache_path(root: Path) -> Path:
+  """Return the cache file location for the workspace at *root*."""
+  return get_cache_dir(root) / CACHE_FILENAME
+
+
+class MarkdownParseCache:
+  """Stat-validated cache of parsed markdown frontmatter and body offsets.
+
+  Entries map a resolved absolute path to ``[mtime_ns, size, digest, start, end,
+  newline, frontmatter_json]``. Frontmatter is kept as its JSON text and
+  decoded on every hit, so callers always receive a fresh, mutable dict.
+  """
+
+  def __init__(
+    self,
+    root: Path,
+    *,
+    cache_path: Path | None = None,
+    verify_content: bool = False,
+  ) -> None:
+    self.root = Path(root)
+    self.cache_path = cache_path or default_cache_path(self.root)
+    self.verify_content = verify_content
+    self._prefix = str(self.root.resolve()) + os.sep
+    self._entries: dict[str, list[Any]] = self._read_store()
+    self._dirty = False
+    self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+  # --- persistence ---
+
+  def _read_store(self) -> dict[str, list[Any]]:
+    raw = read_json_cache(self.cache_path, CACHE_FORMAT_VERSION) or {}
+    entries = raw.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+  def save(self) -> None:
+    """Write the cache back to disk if anything changed (fail-silent).
+
+    Entries for files that no longer exist are pruned on write.
+    """
+    if not self._dirty:
+      return
+    self._entries = {
+      key: entry for key, entry in self._entries.items() if Path(key).exists()
+    }
+    payload = {"entries": self._entries}
+    if write_json_cache(self.cache_path, CACHE_FORMAT_VERSION, payload):
+      self._dirty = False
+
+  # --- lookup ---
+
+  def covers(self, path: Path) -> bool:
+    """Return whether *path* lives inside this cache's workspace."""
+    return str(Path(path).resolve()).startswith(self._prefix)
+
+  def load(self, path: Path, parse: ParseFn) -> tuple[dict[str, Any], str]:
+    """Return ``(frontmatter, body)`` for *path*, parsing only on a miss.
+
+    Args:
+      path: Markdown file to load.
+      parse: Fallback parser called as ``parse(path, text)`` on a miss.
+        Its exceptions propagate unchanged; failures are never cached.
+    """
+    key = str(Path(path).resolve())
+    stat = Path(key).stat()
+    entry = self._entries.get(key)
+    text: str | None = None
+
+    if entry is not None:
+      if entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        text = Path(key).read_text(encoding="utf-8")
+        if not self.verify_content or entry[2] == _digest(text):
+          self.stats["hits"] += 1
+          start, end, newline = entry[3], entry[4], entry[5]
+          body = text[start:end] + ("\n" if newline else "")
+          return json.loads(entry[6], object_hook=_decode_hook), body
+      self.stats["invalidations"] += 1
+      del self._entries[key]
+      self._dirty = True
+    else:
+      self.stats["misses"] += 1
+
+    if text is None:
+      text = Path(key).read_text(encoding="utf-8")
+    frontmatter, body = parse(Path(path), text)
+    self._store(key, stat, text, frontmatter, body)
+    return frontmatter, body
+
+  def _store(
+    self,
+    key: str,
+    stat: os.stat_result,
+    text: str,
+    frontmatter: dict[str, Any],
+    body: str,
+  ) -> None:
+    span = _body_span(text, body)
+    if span is None:
+      return
+    try:
+      fm_json = json.dumps(
+        _encode_value(frontmatter),
+        separators=(",", ":"),
+        ensure_ascii=False,
+      )
+    except _UncacheableError:
+      return
+    digest = _digest(text) if self.verify_content else None
+    self._entries[key] = [stat.st_mtime_ns, stat.st_size, digest, *span, fm_json]
+    self._dirty = True
+
+  def invalidate(self, path: Path) -> None:
+    """Drop the entry for *path*, if any."""
+    if self._entries.pop(str(Path(path).resolve()), None) is not None:
+      self._dirty = True
+
+  def clear(self) -> None:
+    """Drop all entries and remove the on-disk store."""
+    self._entries.clear()
+    self._dirty = False
+    self.cache_path.unlink(missing_ok=True)
+    self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def get_stats(self) -> dict[str, int | float]:
+    """Get cache performance statistics."""
+    total = self.stats["hits"] + self.stats["misses"] + self.stats["invalidations"]
+    hit_rate = (self.stats["hits"] / total * 100) if total > 0 else 0
+
+    return {
+      **self.stats,
+      "total_requests": total,
+      "hit_rate_percent": round(hit_rate, 1),
+    }
+
+
+# --- Process-global activation ---
+
+_active_cache: MarkdownParseCache | None = None
+
+
+def activate_parse_cache(
+  root: Path,
+  *,
+  verify_content: bool = False,
+) -> MarkdownParseCache | None:
+  """Enable the parse cache for the workspace at *root*.
+
+  Honours ``SPEC_DRIVER_PARSE_CACHE``: ``0``/``off`` leaves the cache
+  disabled (returns None), ``verify`` turns on content-digest validation.
+  """
+  global _active_cache  # noqa: PLW0603
+  mode = os.environ.get(CACHE_ENV_VAR, "").strip().lower()
+  if mode in {"0", "off", "false", "no"}:
+    return None
+  if mode == "verify":
+    verify_content = True
+  _active_cache = MarkdownParseCache(root, verify_content=verify_content)
+  return _active_cache
+
+
+def deactivate_parse_cache(*, save: bool = True) -> None:
+  """Disable the active parse cache, persisting it first when *save*."""
+  global _active_cache  # noqa: PLW0603
+  if _active_cache is not None and save:
+    _active_cache.save()
+  _active_cache = None
+
+
+def get_active_parse_cache() -> MarkdownParseCache | None:
+  """Return the process-wide parse cache, or None when inactive."""
+  return _active_cache
+
+
+__all__ = [
+  "CACHE_ENV_VAR",
+  "MarkdownParseCache",
+  "activate_parse_cache",
+  "deactivate_parse_cache",
+  "default_cache_path",
+  "get_active_parse_cache",
+]
@@ -0,0 +1,205 @@
+"""Tests for the persistent markdown parse cache."""
+
+from __future__ import annotations
+
+import os
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from .parse_cache import (
+  CACHE_ENV_VAR,
+  MarkdownParseCache,
+  activate_parse_cache,
+  deactivate_parse_cache,
+  default_cache_path,
+  get_active_parse_cache,
+)
+from .spec_utils import MarkdownLoadError, _parse_markdown_text, load_markdown_file
+
+DOC = """---
+id: DE-001
+name: Example
+created: 2024-06-01
+tags: [a, b]
+---
+
+# DE-001 Example
+
+Body text
+"""
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+  (tmp_path / ".spec-driver").mkdir()
+  return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def _no_active_cache(monkeypatch: pytest.MonkeyPatch):
+  monkeypatch.delenv(CACHE_ENV_VAR, raising=False)
+  yield
+  deactivate_parse_cache(save=False)
+
+
+def _bump_mtime(path: Path) -> None:
+  st = path.stat()
+  os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_hit_returns_same_result_as_uncached_parse(workspace: Path) -> None:
+  doc = workspace / "doc.md"
+  doc.write_text(DOC, encoding="utf-8")
+  expected = load_markdown_file(doc)
+
+  cache = MarkdownParseCache(workspace)
+  first = cache.load(doc, _parse_markdown_text)
+  cache.save()
+
+  reloaded = MarkdownParseCache(workspace)
+  second = reloaded.load(doc, _parse_markdown_text)
+
+  assert first == expected
+  assert second == expected
+  assert second[0]["created"] == date(2024, 6, 1)
+  assert reloaded.get_stats()["hits"] == 1
+  assert default_cache_path(workspace).exists()
+
+
+def test_returned_frontmatter_is_not_shared(workspace: Path) -> None:
+  doc = workspace / "doc.md"
+  doc.write_text(DOC, encoding="utf-8")
+  activate_parse_cache(workspace)
+
+  first, _ = load_markdown_file(doc)
+  first["tags"].append("mutated")
+  second, _ = load_markdown_file(doc)
+
+  assert second["tags"] == ["a", "b"]
+
+
+def test_mtime_change_invalidates_entry(workspace: Path) -> None:
+  doc = workspace / "doc.md"
+  doc.write_text(DOC, encoding="utf-8")
+  cache = activate_parse_cache(workspace)
+  assert cache is not None
+
+  load_markdown_file(doc)
+  doc.write_text(DOC.replace("Example", "Changed"), encoding="utf-8")
+  _bump_mtime(doc)
+  frontmatter, _ = load_markdown_file(doc)
+
+  assert frontmatter["name"] == "Changed"
+  stats = cache.get_stats()
+  assert stats["misses"] == 1
+  assert stats["invalidations"] == 1
+
+
+def test_verify_content_detects_same_stat_rewrite(workspace: Path) -> None:
+  doc = workspace / "doc.md"
+  doc.write_text(DOC, encoding="utf-8")
+  cache = activate_parse_cache(workspace, verify_content=True)
+  assert cache is not None
+  load_markdown_file(doc)
+
+  st = doc.stat()
+  doc.write_text(DOC.replace("DE-001", "DE-002"), encoding="utf-8")
+  os.utime(doc, ns=(st.st_atime_ns, st.st_mtime_ns))
+  frontmatter, _ = load_markdown_file(doc)
+
+  assert frontmatter["id"] == "DE-002"
+  assert cache.get_stats()["invalidations"] == 1
+
+
+@pytest.mark.parametrize(
+  "text",
+  [
+    "---\nid: X\n---\n",
+    "no frontmatter at all",
+    "---\nid: X\n---\n\n\nbody without trailing newline",
+    "---\nid: X\n---\nbody\n\n\n",
+  ],
+)
+def test_body_offsets_round_trip_edge_cases(workspace: Path, text: str) -> None:
+  doc = workspace / "doc.md"
+  doc.write_text(text, encoding="utf-8")
+  expected = load_markdown_file(doc)
+  activate_parse_cache(workspace)
+
+  load_markdown_file(doc)
+  assert load_markdown_file(doc) == expected
+
+
+def test_uncacheable_frontmatter_falls_back_to_parse(workspace: Path) -> None:
+  doc = workspace / "doc.md"
+  doc.write_text("---\nextra:\n  1: int key\n---\nbody\n", encoding="utf-8")
+  cache = activate_parse_cache(workspace)
+  assert cache is not None
+
+  assert load_markdown_file(doc)[0] == {"extra": {1: "int key"}}
+  assert load_markdown_file(doc)[0] == {"extra": {1: "int key"}}
+  assert len(cache) == 0
+
+
+def test_parse_errors_propagate_and_are_not_cached(workspace: Path) -> None:
+  doc = workspace / "doc.md"
+  doc.write_text("---\nid: X: Y\n---\n", encoding="utf-8")
+  cache = activate_parse_cache(workspace)
+  assert cache is not None
+
+  with pytest.raises(MarkdownLoadError):
+    load_markdown_file(doc)
+  assert len(cache) == 0
+
+
+def test_paths_outside_workspace_bypass_cache(
+  workspace: Path,
+  tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+  outside = tmp_path_factory.mktemp("outside") / "doc.md"
+  outside.write_text(DOC, encoding="utf-8")
+  cache = activate_parse_cache(workspace)
+  assert cache is not None
+
+  load_markdown_file(outside)
+
+  assert cache.get_stats()["total_requests"] == 0
+
+
+def test_save_prunes_deleted_files(workspace: Path) -> None:
+  keep = workspace / "keep.md"
+  gone = workspace / "gone.md"
+  keep.write_text(DOC, encoding="utf-8")
+  gone.write_text(DOC, encoding="utf-8")
+  activate_parse_cache(workspace)
+  load_markdown_file(keep)
+  load_markdown_file(gone)
+  gone.unlink()
+
+  deactivate_parse_cache()
+
+  assert len(MarkdownParseCache(workspace)) == 1
+
+
+def test_corrupt_store_is_ignored(workspace: Path) -> None:
+  store = default_cache_path(workspace)
+  store.parent.mkdir(parents=True)
+  store.write_text("{not json", encoding="utf-8")
+  doc = workspace / "doc.md"
+  doc.write_text(DOC, encoding="utf-8")
+
+  cache = activate_parse_cache(workspace)
+  assert cache is not None
+  assert load_markdown_file(doc)[0]["id"] == "DE-001"
+
+
+def test_env_var_disables_cache(
+  workspace: Path,
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  monkeypatch.setenv(CACHE_ENV_VAR, "off")
+
+  assert activate_parse_cache(workspace) is None
+  assert get_active_parse_cache() is None
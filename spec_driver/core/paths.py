@@ -8,6 +8,8 @@ All content directories resolve as direct children of .spec-driver/ (DE-049).
 
 from __future__ import annotations
 
+import hashlib
+import os
 import warnings
 from pathlib import Path
 
@@ -40,6 +42,10 @@ PROBLEMS_SUBDIR = "problems"
 IMPROVEMENTS_SUBDIR = "improvements"
 RISKS_SUBDIR = "risks"
 
+# Env override for get_cache_dir: derived caches go to a per-workspace
+# subdirectory of this path instead of .spec-driver/run/cache/.
+CACHE_DIR_ENV_VAR = "SPEC_DRIVER_CACHE_DIR"
+
 # --- Config key → module constant name mapping ---
 
 _CONFIG_KEY_TO_CONSTANT: dict[str, str] = {
@@ -194,9 +200,23 @@ def get_run_dir(repo_root: Path | None = None) -> Path:
   return get_spec_driver_root(repo_root) / "run"
 
 
+def get_cache_dir(repo_root: Path | None = None) -> Path:
+  """Get the derived-cache directory (.spec-driver/run/cache/).
+
+  ``SPEC_DRIVER_CACHE_DIR`` relocates it (read-only checkouts, tests); each
+  workspace then gets its own subdirectory there.
+  """
+  override = os.environ.get(CACHE_DIR_ENV_VAR)
+  if override:
+    root = str(_resolve_root(repo_root).resolve())
+    return Path(override) / hashlib.sha256(root.encode()).hexdigest()[:16]
+  return get_run_dir(repo_root) / "cache"
+
+
 __all__ = [
   "AUDITS_SUBDIR",
   "BACKLOG_DIR",
+  "CACHE_DIR_ENV_VAR",
   "DECISIONS_SUBDIR",
   "DELTAS_SUBDIR",
   "DRIFT_SUBDIR",
@@ -215,6 +235,7 @@ __all__ = [
   "get_agents_dir",
   "get_audits_dir",
   "get_backlog_dir",
+  "get_cache_dir",
   "get_decisions_dir",
   "get_deltas_dir",
   "get_drift_dir",
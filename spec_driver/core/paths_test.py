@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import os
 import unittest
 import warnings
 from pathlib import Path
+from unittest.mock import patch
 
 import spec_driver.core.paths as paths_mod
 from spec_driver.core.paths import (
   AUDITS_SUBDIR,
   BACKLOG_DIR,
+  CACHE_DIR_ENV_VAR,
   DECISIONS_SUBDIR,
   DELTAS_SUBDIR,
   IMPROVEMENTS_SUBDIR,
@@ -25,12 +28,14 @@ from spec_driver.core.paths import (
   TECH_SPECS_SUBDIR,
   get_audits_dir,
   get_backlog_dir,
+  get_cache_dir,
   get_decisions_dir,
   get_deltas_dir,
   get_memory_dir,
   get_policies_dir,
   get_product_specs_dir,
   get_revisions_dir,
+  get_run_dir,
   get_spec_driver_root,
   get_standards_dir,
   get_tech_specs_dir,
@@ -302,5 +307,22 @@ class TestCustomDirsHelpers(unittest.TestCase):
     assert get_audits_dir(self.root) == self.sd / "reviews"
 
 
+class TestCacheDir(unittest.TestCase):
+  """Tests for get_cache_dir and its environment override."""
+
+  def test_default_under_run_dir(self) -> None:
+    root = Path("/repo")
+    with patch.dict(os.environ):
+      os.environ.pop(CACHE_DIR_ENV_VAR, None)
+      assert get_cache_dir(root) == get_run_dir(root) / "cache"
+
+  def test_override_gives_each_workspace_its_own_dir(self) -> None:
+    with patch.dict(os.environ, {CACHE_DIR_ENV_VAR: "/tmp/caches"}):
+      first = get_cache_dir(Path("/repo/a"))
+      second = get_cache_dir(Path("/repo/b"))
+    assert first.parent == second.parent == Path("/tmp/caches")
+    assert first != second
+
+
 if __name__ == "__main__":
   unittest.main()
@@ -0,0 +1,246 @@
+"""Opt-in per-command phase timing and cProfile capture.
+
+Profiling is off by default and costs one global lookup per instrumented
+call. When a command runs with ``--profile`` (or ``SPEC_DRIVER_PROFILE=1``),
+``activate_profiling`` starts a session that accumulates wall time per named
+phase:
+
+- ``config`` — workflow config load and path initialisation
+- ``registry.<artifact type>`` — each registry's scan of the workspace
+- ``yaml`` — PyYAML parsing (frontmatter and blocks)
+- ``format`` — table/JSON/TSV rendering
+- ``output`` — writing results (the CLI instruments ``typer.echo``)
+
+Phases nest (``registry.spec`` includes the ``yaml`` time of its files) and
+re-entering a phase that is already running on the same thread is not
+counted twice. Times from worker threads are summed, so a phase can exceed
+the command's wall time.
+
+``deactivate_profiling`` returns the record that is attached to the
+command's event. Passing ``dump_path`` (``--profile-dump`` or
+``SPEC_DRIVER_PROFILE_DUMP``) additionally captures a cProfile of the
+command thread and writes it there in pstats format.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import cProfile
+import functools
+import os
+import threading
+import time
+from collections.abc import Callable, Generator
+from pathlib import Path
+from typing import Any, TypeVar, cast
+
+import yaml
+
+# Env opt-in: any value other than ""/"0"/"false"/"off" enables timing.
+PROFILE_ENV_VAR = "SPEC_DRIVER_PROFILE"
+# Env path for a pstats dump; implies profiling.
+PROFILE_DUMP_ENV_VAR = "SPEC_DRIVER_PROFILE_DUMP"
+
+_FALSE_VALUES = frozenset({"", "0", "false", "off", "no"})
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class _Session:
+  """Phase totals for one profiled command."""
+
+  def __init__(self, dump_path: Path | None) -> None:
+    self.started = time.perf_counter()
+    self.dump_path = dump_path
+    self.totals: dict[str, float] = {}
+    self.counts: dict[str, int] = {}
+    self._lock = threading.Lock()
+    self._local = threading.local()
+    self._patches: list[tuple[Any, str, Any]] = []
+    self.profiler: cProfile.Profile | None = None
+
+  def running(self) -> dict[str, int]:
+    """Per-thread depth of each phase currently running."""
+    depth = getattr(self._local, "depth", None)
+    if depth is None:
+      depth = self._local.depth = {}
+    return depth
+
+  def add(self, name: str, seconds: float) -> None:
+    with self._lock:
+      self.totals[name] = self.totals.get(name, 0.0) + seconds
+      self.counts[name] = self.counts.get(name, 0) + 1
+
+  def patch(self, owner: Any, attr: str, phase: str) -> None:
+    """Time every call of ``owner.attr`` as *phase* until deactivation."""
+    original = getattr(owner, attr, None)
+    if original is None:
+      return
+    self._patches.append((owner, attr, original))
+    setattr(owner, attr, profiled(phase)(original))
+
+  def unpatch(self) -> None:
+    for owner, attr, original in reversed(self._patches):
+      setattr(owner, attr, original)
+    self._patches.clear()
+
+
+_session: _Session | None = None
+
+
+# --- Public API ---
+
+
+def profiling_requested() -> tuple[bool, Path | None]:
+  """Read the profiling opt-in from the environment.
+
+  Returns:
+    ``(enabled, dump_path)``; a dump path implies enabled.
+  """
+  dump = os.environ.get(PROFILE_DUMP_ENV_VAR, "").strip()
+  dump_path = Path(dump) if dump else None
+  flag = os.environ.get(PROFILE_ENV_VAR, "").strip().lower()
+  return (flag not in _FALSE_VALUES or dump_path is not None), dump_path
+
+
+def profiling_active() -> bool:
+  """Return whether a profiling session is running."""
+  return _session is not None
+
+
+def activate_profiling(*, dump_path: Path | None = None) -> None:
+  """Start a profiling session; a no-op if one is already running.
+
+  Args:
+    dump_path: Also capture a cProfile of this thread and write it here.
+  """
+  global _session  # noqa: PLW0603
+  if _session is not None:
+    return
+  session = _Session(dump_path)
+  # PyYAML has no hook of its own; frontmatter and block parsers all
+  # resolve these through the module at call time.
+  session.patch(yaml, "safe_load", "yaml")
+  session.patch(yaml, "load", "yaml")
+  if dump_path is not None:
+    profiler = cProfile.Profile()
+    try:
+      profiler.enable()
+    except ValueError:
+      # Another profiler (coverage, a debugger) owns the hook.
+      pass
+    else:
+      session.profiler = profiler
+  _session = session
+
+
+def deactivate_profiling() -> dict[str, Any] | None:
+  """End the session and return its record, or None if none was running.
+
+  The record holds ``wall_ms``, ``phases`` (``{name: {"ms", "calls"}}``,
+  slowest first) and, when a dump was requested and written, ``pstats``.
+  """
+  global _session  # noqa: PLW0603
+  session = _session
+  if session is None:
+    return None
+  _session = None
+  wall = time.perf_counter() - session.started
+  session.unpatch()
+
+  record: dict[str, Any] = {
+    "wall_ms": round(wall * 1000, 3),
+    "phases": {
+      name: {"ms": round(seconds * 1000, 3), "calls": session.counts[name]}
+      for name, seconds in sorted(
+        session.totals.items(),
+        key=lambda item: item[1],
+        reverse=True,
+      )
+    },
+  }
+  if session.profiler is not None and session.dump_path is not None:
+    session.profiler.disable()
+    with contextlib.suppress(OSError):
+      session.dump_path.parent.mkdir(parents=True, exist_ok=True)
+      session.profiler.dump_stats(session.dump_path)
+      record["pstats"] = str(session.dump_path)
+  return record
+
+
+@contextlib.contextmanager
+def profile_phase(name: str) -> Generator[None]:
+  """Time the enclosed block as phase *name* when profiling is active."""
+  session = _session
+  if session is None:
+    yield
+    return
+  running = session.running()
+  if running.get(name):
+    # Re-entered on this thread: the outer timer already covers it.
+    yield
+    return
+  running[name] = 1
+  start = time.perf_counter()
+  try:
+    yield
+  finally:
+    session.add(name, time.perf_counter() - start)
+    running[name] = 0
+
+
+def profiled(name: str) -> Callable[[_F], _F]:
+  """Decorate a function so each call is timed as phase *name*.
+
+  The decorated function keeps its exact type (method binding, overloads
+  and all), so callers and tests type-check as against the undecorated one.
+  """
+
+  def decorator(fn: _F) -> _F:
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+      if _session is None:
+        return fn(*args, **kwargs)
+      with profile_phase(name):
+        return fn(*args, **kwargs)
+
+    return cast("_F", wrapper)
+
+  return decorator
+
+
+def instrument(owner: Any, attr: str, phase: str) -> None:
+  """Time calls of ``owner.attr`` as *phase* for the rest of the session.
+
+  For third-party entry points with no hook of their own; the original
+  attribute is restored by ``deactivate_profiling``. No-op when inactive.
+  """
+  if _session is not None:
+    _session.patch(owner, attr, phase)
+
+
+def format_profile(record: dict[str, Any]) -> str:
+  """Render a profile record as a short text table (for ``--profile``)."""
+  lines = [f"profile: {record['wall_ms']:.1f} ms wall"]
+  phases = record.get("phases", {})
+  width = max((len(name) for name in phases), default=0)
+  for name, phase in phases.items():
+    lines.append(
+      f"  {name:<{width}}  {phase['ms']:10.1f} ms  {phase['calls']:>6} calls",
+    )
+  if "pstats" in record:
+    lines.append(f"  pstats: {record['pstats']}")
+  return "\n".join(lines)
+
+
+# --- Internal helpers ---
+
+
+def _reset() -> None:
+  """Drop any running session (test helper only)."""
+  global _session  # noqa: PLW0603
+  if _session is not None:
+    _session.unpatch()
+    if _session.profiler is not None:
+      _session.profiler.disable()
+  _session = None
@@ -0,0 +1,170 @@
+"""Tests for opt-in phase timing (spec_driver.core.profiling)."""
+
+from __future__ import annotations
+
+import pstats
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+from spec_driver.core import profiling
+
+
+@pytest.fixture(autouse=True)
+def _clean_session() -> Iterator[None]:
+  profiling._reset()
+  yield
+  profiling._reset()
+
+
+def test_inactive_phases_record_nothing() -> None:
+  """Without a session, phases and decorators are pass-through."""
+
+  @profiling.profiled("work")
+  def work() -> int:
+    return 42
+
+  with profiling.profile_phase("outer"):
+    assert work() == 42
+  assert profiling.deactivate_profiling() is None
+
+
+def test_phases_accumulate_per_name() -> None:
+  """Each phase reports its summed time and call count."""
+  profiling.activate_profiling()
+
+  @profiling.profiled("registry.spec")
+  def load() -> None:
+    with profiling.profile_phase("parse"):
+      pass
+
+  load()
+  load()
+  record = profiling.deactivate_profiling()
+
+  assert record is not None
+  assert record["phases"]["registry.spec"]["calls"] == 2
+  assert record["phases"]["parse"]["calls"] == 2
+  assert record["wall_ms"] >= record["phases"]["registry.spec"]["ms"]
+  assert not profiling.profiling_active()
+
+
+def test_reentrant_phase_counted_once() -> None:
+  """A phase re-entered on the same thread is timed by the outer call only."""
+  profiling.activate_profiling()
+
+  @profiling.profiled("format")
+  def render(depth: int) -> None:
+    if depth:
+      render(depth - 1)
+
+  render(3)
+  record = profiling.deactivate_profiling()
+
+  assert record is not None
+  assert record["phases"]["format"]["calls"] == 1
+
+
+def test_threads_time_independently() -> None:
+  """Concurrent phases on worker threads are each counted."""
+  profiling.activate_profiling()
+  barrier = threading.Barrier(2)
+
+  def worker() -> None:
+    with profiling.profile_phase("registry.delta"):
+      barrier.wait(timeout=5)
+
+  threads = [threading.Thread(target=worker) for _ in range(2)]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  record = profiling.deactivate_profiling()
+
+  assert record is not None
+  assert record["phases"]["registry.delta"]["calls"] == 2
+
+
+def test_yaml_parsing_is_instrumented_and_restored() -> None:
+  """PyYAML entry points are timed during a session and restored after."""
+  original = yaml.safe_load
+  profiling.activate_profiling()
+  assert yaml.safe_load("a: 1") == {"a": 1}
+  record = profiling.deactivate_profiling()
+
+  assert record is not None
+  # safe_load calls yaml.load internally; that is not counted again.
+  assert record["phases"]["yaml"]["calls"] == 1
+  assert yaml.safe_load is original
+
+
+def test_instrument_patches_for_session_only() -> None:
+  """instrument() is a no-op when inactive and undone on deactivation."""
+  owner = SimpleNamespace(echo=lambda text: text)
+  original = owner.echo
+
+  profiling.instrument(owner, "echo", "output")
+  assert owner.echo is original
+
+  profiling.activate_profiling()
+  profiling.instrument(owner, "echo", "output")
+  assert owner.echo("hi") == "hi"
+  record = profiling.deactivate_profiling()
+
+  assert record is not None
+  assert record["phases"]["output"]["calls"] == 1
+  assert owner.echo is original
+
+
+def test_dump_writes_pstats(tmp_path: Path) -> None:
+  """A dump path captures a cProfile readable by pstats."""
+  dump = tmp_path / "out" / "cmd.pstats"
+  profiling.activate_profiling(dump_path=dump)
+  sum(range(1000))
+  record = profiling.deactivate_profiling()
+
+  assert record is not None
+  if "pstats" not in record:
+    pytest.skip("another profiler owns the profiling hook")
+  assert record["pstats"] == str(dump)
+  assert pstats.Stats(str(dump)).get_stats_profile().func_profiles
+
+
+@pytest.mark.parametrize(
+  ("env", "expected"),
+  [
+    ({}, (False, None)),
+    ({"SPEC_DRIVER_PROFILE": "0"}, (False, None)),
+    ({"SPEC_DRIVER_PROFILE": "1"}, (True, None)),
+    ({"SPEC_DRIVER_PROFILE_DUMP": "x.pstats"}, (True, Path("x.pstats"))),
+  ],
+)
+def test_profiling_requested(
+  monkeypatch: pytest.MonkeyPatch,
+  env: dict[str, str],
+  expected: tuple[bool, Path | None],
+) -> None:
+  """The environment opt-in is read from SPEC_DRIVER_PROFILE[_DUMP]."""
+  monkeypatch.delenv(profiling.PROFILE_ENV_VAR, raising=False)
+  monkeypatch.delenv(profiling.PROFILE_DUMP_ENV_VAR, raising=False)
+  for name, value in env.items():
+    monkeypatch.setenv(name, value)
+
+  assert profiling.profiling_requested() == expected
+
+
+def test_format_profile() -> None:
+  """The text summary lists phases in record order."""
+  text = profiling.format_profile(
+    {
+      "wall_ms": 12.5,
+      "phases": {"registry.spec": {"ms": 8.0, "calls": 1}},
+    },
+  )
+
+  assert text.splitlines()[0] == "profile: 12.5 ms wall"
+  assert "registry.spec" in text
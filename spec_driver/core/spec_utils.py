@@ -38,6 +38,7 @@ from .frontmatter_schema import (
   FrontmatterValidationResult,
   validate_frontmatter,
 )
+from .parse_cache import get_active_parse_cache
 
 
 class MarkdownLoadError(ValueError):
@@ -47,12 +48,22 @@ class MarkdownLoadError(ValueError):
 def load_markdown_file(path: Path | str) -> tuple[dict[str, Any], str]:
   """Load markdown file and extract frontmatter and content.
 
+  When a workspace parse cache is active (see ``spec_driver.core.parse_cache``)
+  unchanged files are served from it instead of being re-parsed.
+
   Raises:
     MarkdownLoadError: if the file's YAML frontmatter cannot be parsed.
       The original ``yaml.YAMLError`` is chained via ``__cause__``.
   """
   path = Path(path)
-  text = path.read_text(encoding="utf-8")
+  cache = get_active_parse_cache()
+  if cache is not None and cache.covers(path):
+    return cache.load(path, _parse_markdown_text)
+  return _parse_markdown_text(path, path.read_text(encoding="utf-8"))
+
+
+def _parse_markdown_text(path: Path, text: str) -> tuple[dict[str, Any], str]:
+  """Split *text* (read from *path*) into frontmatter dict and body."""
   try:
     post = frontmatter.loads(text)
   except yaml.YAMLError as exc:
@@ -19,7 +19,12 @@ from .graph import (
   query_inverse,
   query_neighbourhood,
 )
-from .manager import add_relation, list_relations, remove_relation
+from .manager import (
+  add_relation,
+  list_relations,
+  relations_from_frontmatter,
+  remove_relation,
+)
 from .query import (
   ReferenceHit,
   RelationQueryable,
@@ -29,6 +34,7 @@ from .query import (
   find_related_to,
   matches_related_to,
   matches_relation,
+  partition_by_reference_targets,
   partition_by_reverse_references,
 )
 
@@ -50,9 +56,11 @@ __all__ = [
   "list_relations",
   "matches_related_to",
   "matches_relation",
+  "partition_by_reference_targets",
   "partition_by_reverse_references",
   "query_forward",
   "query_inverse",
   "query_neighbourhood",
+  "relations_from_frontmatter",
   "remove_relation",
 ]
@@ -13,7 +13,9 @@ Design reference: DR-097.
 from __future__ import annotations
 
 from collections import defaultdict
-from dataclasses import dataclass, field
+from collections.abc import Iterable
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass, field, replace
 from typing import Any
 
 from spec_driver.core.artifact_ids import normalize_artifact_id
@@ -30,12 +32,16 @@ class GraphEdge:
     target: Target artifact ID (normalized).
     source_slot: Provenance slot (e.g. "relation", "applies_to").
     detail: Slot-specific qualifier (relation type, field name, etc.).
+    raw_target: Target exactly as authored, before normalization. Kept so
+      incremental updates can re-resolve the edge when nodes come and go.
+      Excluded from equality and repr.
   """
 
   source: str
   target: str
   source_slot: str
   detail: str
+  raw_target: str = field(default="", compare=False, repr=False)
 
 
 @dataclass
@@ -45,6 +51,11 @@ class ReferenceGraph:
   Nodes are artifact IDs mapped to their kind. Edges are forward
   references extracted by ``collect_references``, with targets
   normalized against the node index.
+
+  The graph can be patched in place with ``upsert_artifact``,
+  ``remove_artifact`` or, for many artifacts at once, ``apply_changes``:
+  only the edited artifacts' edges are recomputed, plus re-resolution of
+  any edges whose normalized target appears or disappears as a result.
   """
 
   nodes: dict[str, str]
@@ -59,6 +70,160 @@ class ReferenceGraph:
     repr=False,
   )
 
+  # ── Incremental updates ──────────────────────────────────
+
+  def upsert_artifact(self, artifact_id: str, kind: str, obj: Any) -> None:
+    """Add or replace one artifact and recompute only its outgoing edges.
+
+    Args:
+      artifact_id: ID of the artifact being added or updated.
+      kind: Artifact kind recorded on the node.
+      obj: Artifact object passed to ``collect_references``.
+    """
+    self.apply_changes([(artifact_id, kind, obj)])
+
+  def remove_artifact(self, artifact_id: str) -> None:
+    """Remove one artifact, its outgoing edges and its node.
+
+    Edges from other artifacts that resolved to *artifact_id* are
+    re-resolved from their raw target (usually becoming unresolved).
+    No-op for unknown IDs.
+    """
+    self.apply_changes((), [artifact_id])
+
+  def apply_changes(
+    self,
+    upserts: Iterable[tuple[str, str, Any]],
+    removals: Iterable[str] = (),
+  ) -> None:
+    """Apply several upserts, then removals, deriving ``edges`` once.
+
+    Upserting an artifact whose kind and edges are unchanged is a no-op,
+    so re-applying every artifact of a re-collected source only costs the
+    edge extraction of each.
+
+    Args:
+      upserts: ``(artifact_id, kind, obj)`` triples, as for
+        ``upsert_artifact``.
+      removals: IDs to remove, as for ``remove_artifact``.
+    """
+    new_ids: set[str] = set()
+    changed = False
+    for artifact_id, kind, obj in upserts:
+      if artifact_id not in self.nodes:
+        new_ids.add(artifact_id)
+      changed |= self._upsert(artifact_id, kind, obj)
+    for artifact_id in removals:
+      changed |= self._remove(artifact_id)
+    new_ids &= self.nodes.keys()
+    if new_ids:
+      self._adopt_dangling_edges(new_ids)
+    if changed:
+      self._refresh_derived()
+
+  def _upsert(self, artifact_id: str, kind: str, obj: Any) -> bool:
+    """Replace *artifact_id*'s node and outgoing edges; False if unchanged."""
+    edges = [
+      _resolve_edge(artifact_id, hit, self.nodes.keys())[0]
+      for hit in collect_references(obj)
+    ]
+    current = self.forward_index.get(artifact_id, [])
+    if self.nodes.get(artifact_id) == kind and _same_edges(current, edges):
+      return False
+    self._drop_forward_edges(artifact_id)
+    self.nodes[artifact_id] = kind
+    if edges:
+      self.forward_index[artifact_id] = edges
+      for edge in edges:
+        self.inverse_index[edge.target].append(edge)
+    return True
+
+  def _remove(self, artifact_id: str) -> bool:
+    if artifact_id not in self.nodes:
+      return False
+    self._drop_forward_edges(artifact_id)
+    del self.nodes[artifact_id]
+    inbound = self.inverse_index.pop(artifact_id, [])
+    for edge in inbound:
+      raw = edge.raw_target or edge.target
+      target = normalize_artifact_id(raw, self.nodes.keys()).canonical or raw
+      self._retarget(edge, target)
+    return True
+
+  def _drop_forward_edges(self, artifact_id: str) -> None:
+    for edge in self.forward_index.pop(artifact_id, []):
+      bucket = self.inverse_index.get(edge.target)
+      if bucket is None:
+        continue
+      bucket[:] = [e for e in bucket if e is not edge]
+      if not bucket:
+        del self.inverse_index[edge.target]
+
+  def _adopt_dangling_edges(self, new_ids: set[str]) -> None:
+    """Re-point unresolved edges whose raw target normalizes to a new node."""
+    for target in [t for t in self.inverse_index if t not in self.nodes]:
+      canonical = normalize_artifact_id(target, new_ids).canonical
+      if canonical is None:
+        continue
+      for edge in list(self.inverse_index[target]):
+        self._retarget(edge, canonical)
+
+  def _retarget(self, edge: GraphEdge, target: str) -> None:
+    """Swap *edge* for a copy pointing at *target* in both indices."""
+    bucket = self.inverse_index.get(edge.target)
+    if bucket is not None:
+      bucket[:] = [e for e in bucket if e is not edge]
+      if not bucket:
+        del self.inverse_index[edge.target]
+    moved = replace(edge, target=target, raw_target=edge.raw_target)
+    forward = self.forward_index[edge.source]
+    forward[:] = [moved if e is edge else e for e in forward]
+    self.inverse_index[target].append(moved)
+
+  def _refresh_derived(self) -> None:
+    """Recompute the flat edge list and normalization diagnostics."""
+    self.edges = [edge for edges in self.forward_index.values() for edge in edges]
+    diagnostics: list[str] = []
+    for edge in self.edges:
+      if not edge.raw_target or edge.raw_target == edge.target:
+        continue
+      result = normalize_artifact_id(edge.raw_target, self.nodes.keys())
+      if result.diagnostic:
+        diagnostics.append(result.diagnostic)
+    self.diagnostics = diagnostics
+
+  # ── Serialization ────────────────────────────────────────
+
+  def to_dict(self) -> dict[str, Any]:
+    """Return a JSON-serializable snapshot of nodes and edges."""
+    return {
+      "nodes": dict(self.nodes),
+      "edges": [
+        [e.source, e.target, e.source_slot, e.detail, e.raw_target] for e in self.edges
+      ],
+      "diagnostics": list(self.diagnostics),
+    }
+
+  @classmethod
+  def from_dict(cls, data: dict[str, Any]) -> ReferenceGraph:
+    """Rebuild a graph (with indices) from ``to_dict`` output."""
+    graph = cls(
+      nodes=dict(data.get("nodes", {})),
+      edges=[
+        GraphEdge(
+          source=source,
+          target=target,
+          source_slot=slot,
+          detail=detail,
+          raw_target=raw,
+        )
+        for source, target, slot, detail, raw in data.get("edges", [])
+      ],
+      diagnostics=list(data.get("diagnostics", [])),
+    )
+    _build_indices(graph)
+    return graph
+
 
 def _build_indices(graph: ReferenceGraph) -> None:
   """Populate forward and inverse lookup indices from edges."""
@@ -69,6 +234,13 @@ def _build_indices(graph: ReferenceGraph) -> None:
     graph.inverse_index[edge.target].append(edge)
 
 
+def _same_edges(current: list[GraphEdge], edges: list[GraphEdge]) -> bool:
+  """True if both lists hold the same edges, raw targets included."""
+  return current == edges and all(
+    a.raw_target == b.raw_target for a, b in zip(current, edges, strict=True)
+  )
+
+
 def _hit_to_edge(source_id: str, hit: ReferenceHit) -> GraphEdge:
   """Convert a ReferenceHit to a GraphEdge."""
   return GraphEdge(
@@ -76,9 +248,36 @@ def _hit_to_edge(source_id: str, hit: ReferenceHit) -> GraphEdge:
     target=hit.target,
     source_slot=hit.source,
     detail=hit.detail,
+    raw_target=hit.target,
   )
 
 
+def _resolve_edge(
+  source_id: str,
+  hit: ReferenceHit,
+  known_ids: AbstractSet[str],
+) -> tuple[GraphEdge, str | None]:
+  """Build an edge for *hit*, normalizing its target against *known_ids*.
+
+  Returns the edge and the normalization diagnostic, if any.
+  """
+  target = hit.target
+  diagnostic: str | None = None
+  if target not in known_ids:
+    result = normalize_artifact_id(target, known_ids)
+    if result.canonical is not None:
+      target = result.canonical
+      diagnostic = result.diagnostic
+  edge = GraphEdge(
+    source=source_id,
+    target=target,
+    source_slot=hit.source,
+    detail=hit.detail,
+    raw_target=hit.target,
+  )
+  return edge, diagnostic
+
+
 def build_reference_graph_from_artifacts(
   artifacts: list[tuple[str, str, Any]],
 ) -> ReferenceGraph:
@@ -106,25 +305,11 @@ def build_reference_graph_from_artifacts(
 
   # Collect edges with normalization
   for art_id, _, obj in artifacts:
-    hits = collect_references(obj)
-    for hit in hits:
-      target = hit.target
-      # Normalize target against known IDs
-      if target not in known_ids:
-        result = normalize_artifact_id(target, known_ids)
-        if result.canonical is not None:
-          target = result.canonical
-          if result.diagnostic:
-            diagnostics.append(result.diagnostic)
-
-      edges.append(
-        GraphEdge(
-          source=art_id,
-          target=target,
-          source_slot=hit.source,
-          detail=hit.detail,
-        )
-      )
+    for hit in collect_references(obj):
+      edge, diagnostic = _resolve_edge(art_id, hit, known_ids)
+      if diagnostic:
+        diagnostics.append(diagnostic)
+      edges.append(edge)
 
   graph = ReferenceGraph(
     nodes=nodes,
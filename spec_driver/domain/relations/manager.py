@@ -34,16 +34,11 @@ def _ensure_relations(frontmatter: dict[str, Any]) -> list[RelationDict]:
   return value  # type: ignore[return-value]
 
 
-def list_relations(path: Path | str) -> list[Relation]:
-  """List relations from markdown file frontmatter.
-
-  Args:
-    path: Path to markdown file.
+def relations_from_frontmatter(frontmatter: Mapping[str, Any]) -> list[Relation]:
+  """Parse the ``relations`` list of already-loaded frontmatter.
 
-  Returns:
-    List of parsed Relation objects.
+  Malformed entries (non-mappings, missing type or target) are skipped.
   """
-  frontmatter, _ = load_markdown_file(path)
   relations_raw = frontmatter.get("relations")
   if not isinstance(relations_raw, Iterable):
     return []
@@ -62,6 +57,19 @@ def list_relations(path: Path | str) -> list[Relation]:
   return result
 
 
+def list_relations(path: Path | str) -> list[Relation]:
+  """List relations from markdown file frontmatter.
+
+  Args:
+    path: Path to markdown file.
+
+  Returns:
+    List of parsed Relation objects.
+  """
+  frontmatter, _ = load_markdown_file(path)
+  return relations_from_frontmatter(frontmatter)
+
+
 def add_relation(
   path: Path | str,
   *,
@@ -149,5 +157,6 @@ def remove_relation(path: Path | str, *, relation_type: str, target: str) -> boo
 __all__ = [
   "add_relation",
   "list_relations",
+  "relations_from_frontmatter",
   "remove_relation",
 ]
@@ -10,7 +10,7 @@ Design reference: DR-085 §5.2.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Collection, Iterable, Sequence
 from dataclasses import dataclass
 from typing import Any, Protocol, runtime_checkable
 
@@ -369,7 +369,24 @@ def partition_by_reverse_references[T](
     - candidates whose ID appears as a target in any referrer's references
     - candidates whose ID does not
   """
-  targets = collect_reverse_reference_targets(referrers)
+  return partition_by_reference_targets(
+    candidates,
+    collect_reverse_reference_targets(referrers),
+    candidate_id_fn,
+  )
+
+
+def partition_by_reference_targets[T](
+  candidates: Sequence[T],
+  targets: Collection[str],
+  candidate_id_fn: Callable[[T], str] = lambda c: c.id,  # type: ignore[attr-defined]
+) -> tuple[list[T], list[T]]:
+  """Partition candidates into (referenced, unreferenced) by a target set.
+
+  *targets* holds uppercased IDs, as built by
+  :func:`collect_reverse_reference_targets` — compute it once and reuse it
+  when several candidate lists are checked against the same referrers.
+  """
   referenced: list[T] = []
   unreferenced: list[T] = []
   for c in candidates:
@@ -420,5 +437,6 @@ __all__ = [
   "find_related_to",
   "matches_related_to",
   "matches_relation",
+  "partition_by_reference_targets",
   "partition_by_reverse_references",
 ]
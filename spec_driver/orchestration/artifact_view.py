@@ -12,7 +12,8 @@ from __future__ import annotations
 import contextlib
 import io
 import logging
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -220,21 +221,51 @@ def _collect_safe(
   if captured:
     logger.debug("stderr from %s collect: %s", artifact_type.value, captured.strip())
 
-  result: dict[str, ArtifactEntry] = {}
-  for key, record in records.items():
-    try:
-      result[key] = adapt_record(record, artifact_type)
-    except Exception as exc:
-      logger.warning("Failed to adapt %s record %s: %s", artifact_type.value, key, exc)
-      result[key] = ArtifactEntry(
-        id=str(key),
-        title="",
-        status="",
-        path=Path(),
-        artifact_type=artifact_type,
-        error=f"Adapt failed: {exc}",
-      )
-  return result
+  return {
+    key: _adapt_safe(key, record, artifact_type) for key, record in records.items()
+  }
+
+
+def _adapt_safe(key: str, record: Any, artifact_type: ArtifactType) -> ArtifactEntry:
+  """Adapt one record, returning an error entry if adaptation fails."""
+  try:
+    return adapt_record(record, artifact_type)
+  except Exception as exc:
+    logger.warning("Failed to adapt %s record %s: %s", artifact_type.value, key, exc)
+    return ArtifactEntry(
+      id=str(key),
+      title="",
+      status="",
+      path=Path(),
+      artifact_type=artifact_type,
+      error=f"Adapt failed: {exc}",
+    )
+
+
+@dataclass(frozen=True)
+class PathRefresh:
+  """Outcome of a per-path snapshot refresh.
+
+  Attributes:
+    records: Raw registry records re-read from the changed paths, keyed
+      like ``ArtifactSnapshot.entries``. Lets derived indexes (e.g. search)
+      patch themselves without re-collecting the registry.
+    removed: Keys whose entries were dropped and not re-read.
+  """
+
+  records: dict[str, Any] = field(default_factory=dict)
+  removed: frozenset[str] = frozenset()
+
+
+def _entry_at_paths(entry: ArtifactEntry, paths: list[Path]) -> bool:
+  """Return whether *entry*'s file or bundle directory is among *paths*."""
+  for path in paths:
+    if entry.path == path:
+      return True
+    bundle = entry.bundle_dir
+    if bundle is not None and (path == bundle or bundle in path.parents):
+      return True
+  return False
 
 
 class ArtifactSnapshot:
@@ -285,6 +316,55 @@ class ArtifactSnapshot:
     """Re-collect a single registry type (watch-triggered invalidation)."""
     self._load_type(art_type)
 
+  def refresh_paths(
+    self,
+    art_type: ArtifactType,
+    paths: Iterable[Path],
+  ) -> PathRefresh | None:
+    """Re-read only the records stored at *paths* (watch-triggered).
+
+    Entries whose file or bundle is among *paths* are dropped and those
+    files re-read via the registry's ``collect_path``, so edits, deletions
+    and ID changes are all reflected without re-collecting the registry.
+
+    Types without single-file loading (or a snapshot currently holding an
+    error entry for the type) fall back to :meth:`refresh`.
+
+    Returns:
+      The re-read records and removed keys, or None after a full refresh.
+    """
+    entries = self.entries.get(art_type)
+    if (
+      art_type not in _PATH_REFRESH_TYPES
+      or entries is None
+      or any(e.error is not None for e in entries.values())
+    ):
+      self.refresh(art_type)
+      return None
+
+    registry = self._make_registry(art_type)
+    if registry is None:
+      return None
+
+    changed = [Path(p) for p in paths]
+    stderr_capture = io.StringIO()
+    records: dict[str, Any] = {}
+    try:
+      with contextlib.redirect_stderr(stderr_capture):
+        for path in changed:
+          records.update(registry.collect_path(path))
+    except Exception as exc:
+      logger.warning("Failed to reload %s paths: %s", art_type.value, exc)
+      self.refresh(art_type)
+      return None
+
+    stale = {key for key, e in entries.items() if _entry_at_paths(e, changed)}
+    for key in stale:
+      del entries[key]
+    for key, record in records.items():
+      entries[key] = _adapt_safe(key, record, art_type)
+    return PathRefresh(records=records, removed=frozenset(stale - records.keys()))
+
   def all_entries(
     self,
     *,
@@ -440,6 +520,21 @@ def _make_drift_registry(root: Path) -> Any:
   return DriftLedgerRegistry(root=root)
 
 
+# Types whose registries expose ``collect_path`` for single-file reloads.
+# Specs, requirements, cards and backlog items are re-collected wholesale.
+_PATH_REFRESH_TYPES: frozenset[ArtifactType] = frozenset(
+  {
+    ArtifactType.ADR,
+    ArtifactType.POLICY,
+    ArtifactType.STANDARD,
+    ArtifactType.DELTA,
+    ArtifactType.REVISION,
+    ArtifactType.AUDIT,
+    ArtifactType.MEMORY,
+    ArtifactType.DRIFT_LEDGER,
+  }
+)
+
 _REGISTRY_FACTORIES: dict[ArtifactType, Any] = {
   ArtifactType.ADR: _make_decision_registry,
   ArtifactType.POLICY: _make_policy_registry,
@@ -114,6 +114,7 @@ def workspace_cmd(  # noqa: PLR0913 — Typer demands one parameter per flag
   ``--strict`` promotes warnings to errors. ``--fix`` rewrites the source
   file for diagnostics that carry a safe ``fix_hint`` / ``fix_kind``.
   ``--kind <kind>`` filters diagnostics to the named artefact kind.
+  Per-check timings are reported under ``--profile``.
 
   Exit codes (F-46):
   - 0 — clean (no error-severity diagnostics).
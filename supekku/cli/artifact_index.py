@@ -0,0 +1,339 @@
+"""Artifact ID → path index, persisted for ``show <ID>`` resolution.
+
+``build_artifact_index`` loads every registry to learn where each ID
+lives. Its result is kept in
+``.spec-driver/run/cache/artifact_index.json`` together with the mtime of
+every indexed file and of the directories holding them, so resolving an ID
+normally costs one dict lookup plus a parse of the file it names.
+
+Validation is lookup-driven:
+
+- A hit is returned as-is. The caller parses the file and, if it no longer
+  carries the ID, calls :func:`invalidate_artifact_index` and falls back to
+  its registry.
+- A miss is trusted only while every recorded directory and file mtime is
+  unchanged (stat calls only); otherwise the index is rebuilt first.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from spec_driver.core.io import read_json_cache, write_json_cache
+from supekku.scripts.lib.core import paths
+from supekku.scripts.lib.core.profiling import profile_phase
+
+log = logging.getLogger(__name__)
+
+ArtifactIndex = dict[str, tuple[str, str]]
+"""Artifact ID → (relative_path, kind)."""
+
+ARTIFACT_INDEX_FILENAME = "artifact_index.json"
+ARTIFACT_INDEX_VERSION = 1
+
+# Recorded for directories that did not exist, so creating one is noticed.
+_MISSING = -1
+
+# Index file → ((mtime_ns, size), payload); saves re-reading the JSON when
+# one command resolves the same workspace more than once.
+_memo: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+  """Where an artifact ID was found."""
+
+  kind: str
+  path: Path
+
+
+# ── Artifact index collectors ──────────────────────────────────
+# Registries are imported at call time, keeping CLI startup fast.
+
+
+def _collect_memory_artifacts(root: Path, index: ArtifactIndex) -> None:
+  """Add memory records to the artifact index."""
+  from supekku.scripts.lib.memory.registry import MemoryRegistry  # noqa: PLC0415
+
+  registry = MemoryRegistry(root=root)
+  for mem_id, record in registry.collect().items():
+    rel_path = str(Path(record.path).relative_to(root))
+    index[mem_id] = (rel_path, "memory")
+
+
+def _collect_decisions(root: Path, index: ArtifactIndex) -> None:
+  """Add ADR decisions to the artifact index."""
+  from supekku.scripts.lib.decisions.registry import DecisionRegistry  # noqa: PLC0415
+
+  registry = DecisionRegistry(root=root)
+  for decision in registry.iter():
+    if decision.path:
+      rel = str(Path(decision.path).relative_to(root))
+      index[decision.id] = (rel, "adr")
+
+
+def _collect_specs(root: Path, index: ArtifactIndex) -> None:
+  """Add specs to the artifact index."""
+  from supekku.scripts.lib.specs.registry import SpecRegistry  # noqa: PLC0415
+
+  registry = SpecRegistry(root=root)
+  for spec in registry.all_specs():
+    rel = str(spec.path.relative_to(root))
+    index[spec.id] = (rel, "spec")
+
+
+def _collect_changes(root: Path, index: ArtifactIndex) -> None:
+  """Add change artifacts (deltas, revisions, audits) to the artifact index."""
+  from supekku.scripts.lib.changes.registry import ChangeRegistry  # noqa: PLC0415
+
+  for kind in ("delta", "revision", "audit"):
+    registry = ChangeRegistry(root=root, kind=kind)
+    for artifact_id, artifact in registry.collect().items():
+      rel = str(artifact.path.relative_to(root))
+      index[artifact_id] = (rel, kind)
+
+
+def _collect_backlog_items(root: Path, index: ArtifactIndex) -> None:
+  """Add backlog items to the artifact index."""
+  from supekku.scripts.lib.backlog.registry import BacklogRegistry  # noqa: PLC0415
+
+  registry = BacklogRegistry(root=root)
+  for item_id, item in registry.collect().items():
+    rel = str(item.path.relative_to(root))
+    index[item_id] = (rel, item.kind)
+
+
+def _collect_drift_ledgers(root: Path, index: ArtifactIndex) -> None:
+  """Add drift ledgers to the artifact index."""
+  from supekku.scripts.lib.drift.registry import DriftLedgerRegistry  # noqa: PLC0415
+
+  registry = DriftLedgerRegistry(root=root)
+  for ledger_id, ledger in registry.collect().items():
+    rel = str(ledger.path.relative_to(root))
+    index[ledger_id] = (rel, "drift_ledger")
+
+
+# Registries whose failure is logged and skipped rather than raised.
+_OPTIONAL_COLLECTORS = (
+  ("decisions", _collect_decisions),
+  ("specs", _collect_specs),
+  ("changes", _collect_changes),
+  ("backlog", _collect_backlog_items),
+  ("drift ledger", _collect_drift_ledgers),
+)
+
+
+def build_artifact_index(
+  root: Path,
+  *,
+  skipped: list[str] | None = None,
+) -> ArtifactIndex:
+  """Build artifact ID → (relative_path, kind) index.
+
+  Collects IDs from all known registries: decisions, specs,
+  deltas, revisions, audits, memory records, and backlog items.
+
+  Args:
+    root: Repository root path.
+    skipped: If given, receives the name of each registry that failed to
+      load and was left out.
+
+  Returns:
+    Dict mapping artifact ID to (relative_path, kind).
+  """
+  index: ArtifactIndex = {}
+  _collect_memory_artifacts(root, index)
+  for name, collect in _OPTIONAL_COLLECTORS:
+    try:
+      collect(root, index)
+    except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+      log.debug("Skipping %s registry", name, exc_info=True)
+      if skipped is not None:
+        skipped.append(name)
+  return index
+
+
+# ── Persistent index ───────────────────────────────────────────
+
+
+def get_artifact_index_path(root: Path) -> Path:
+  """Return the on-disk artifact index location."""
+  return paths.get_cache_dir(root) / ARTIFACT_INDEX_FILENAME
+
+
+def lookup_artifacts(root: Path, artifact_ids: Iterable[str]) -> dict[str, IndexEntry]:
+  """Return index entries for those of *artifact_ids* that exist.
+
+  Rebuilds the index when it is missing, or when an ID is not found and the
+  workspace has changed since the index was written.
+
+  Args:
+    root: Repository root path.
+    artifact_ids: Canonical artifact IDs (e.g. ``DE-001``).
+
+  Returns:
+    Dict mapping each found ID to its entry; absent IDs are omitted.
+  """
+  wanted = list(dict.fromkeys(artifact_ids))
+  data = _read_index(root)
+  if data is not None:
+    found = _entries(root, data, wanted)
+    if len(found) == len(wanted) or _is_fresh(root, data):
+      return found
+  return _entries(root, rebuild_artifact_index(root), wanted)
+
+
+def lookup_artifact(root: Path, artifact_id: str) -> IndexEntry | None:
+  """Return the index entry for *artifact_id*, or None if it does not exist."""
+  return lookup_artifacts(root, [artifact_id]).get(artifact_id)
+
+
+def rebuild_artifact_index(root: Path) -> dict[str, Any]:
+  """Rebuild the index from the registries and persist it (fail-silent).
+
+  An index missing a registry that failed to load is used for this lookup
+  only, so the next command tries again.
+
+  Returns:
+    The index payload.
+  """
+  skipped: list[str] = []
+  with profile_phase("artifact_index"):
+    sources = _source_dirs(root)
+    # Stamp source directories before collecting, so an artefact created
+    # mid-scan leaves the index stale rather than silently missing it.
+    dirs = {_key(root, source): _mtime(source) for source in sources}
+    artifacts: dict[str, list[Any]] = {}
+    index = build_artifact_index(root, skipped=skipped)
+    for artifact_id, (rel_path, kind) in index.items():
+      path = root / rel_path
+      artifacts[artifact_id] = [kind, rel_path, _mtime(path)]
+      for parent in path.parents:
+        if parent in sources or parent == root:
+          break
+        key = _key(root, parent)
+        if key not in dirs:
+          dirs[key] = _mtime(parent)
+
+  payload = {"dirs": dirs, "artifacts": artifacts}
+  if not skipped:
+    _write_index(get_artifact_index_path(root), payload)
+  return payload
+
+
+def invalidate_artifact_index(root: Path) -> None:
+  """Discard the persisted index; the next lookup rebuilds it."""
+  index_path = get_artifact_index_path(root)
+  _memo.pop(index_path, None)
+  with contextlib.suppress(OSError):
+    index_path.unlink()
+
+
+# ── Internal helpers ───────────────────────────────────────────
+
+
+def _source_dirs(root: Path) -> list[Path]:
+  """Directories scanned by the registries ``build_artifact_index`` reads."""
+  return [
+    paths.get_memory_dir(root),
+    paths.get_decisions_dir(root),
+    paths.get_tech_specs_dir(root),
+    paths.get_product_specs_dir(root),
+    paths.get_deltas_dir(root),
+    paths.get_revisions_dir(root),
+    paths.get_audits_dir(root),
+    paths.get_backlog_dir(root),
+    paths.get_drift_dir(root),
+  ]
+
+
+def _key(root: Path, path: Path) -> str:
+  try:
+    return path.relative_to(root).as_posix()
+  except ValueError:
+    return path.as_posix()
+
+
+def _mtime(path: Path) -> int:
+  try:
+    return path.stat().st_mtime_ns
+  except OSError:
+    return _MISSING
+
+
+def _entries(
+  root: Path,
+  data: dict[str, Any],
+  wanted: list[str],
+) -> dict[str, IndexEntry]:
+  """Look up *wanted* IDs, skipping entries whose file has gone."""
+  artifacts = data["artifacts"]
+  found: dict[str, IndexEntry] = {}
+  for artifact_id in wanted:
+    record = artifacts.get(artifact_id)
+    if record is None:
+      continue
+    kind, rel_path, _mtime_ns = record
+    path = root / rel_path
+    if path.is_file():
+      found[artifact_id] = IndexEntry(kind=kind, path=path)
+  return found
+
+
+def _is_fresh(root: Path, data: dict[str, Any]) -> bool:
+  """Whether every recorded directory and file mtime still matches."""
+  for rel_path, mtime in data["dirs"].items():
+    if _mtime(root / rel_path) != mtime:
+      return False
+  return all(
+    _mtime(root / rel_path) == mtime
+    for _kind, rel_path, mtime in data["artifacts"].values()
+  )
+
+
+def _read_index(root: Path) -> dict[str, Any] | None:
+  index_path = get_artifact_index_path(root)
+  try:
+    st = index_path.stat()
+  except OSError:
+    return None
+  stamp = (st.st_mtime_ns, st.st_size)
+  memo = _memo.get(index_path)
+  if memo is not None and memo[0] == stamp:
+    return memo[1]
+  data = read_json_cache(index_path, ARTIFACT_INDEX_VERSION)
+  if (
+    data is None
+    or not isinstance(data.get("dirs"), dict)
+    or not isinstance(data.get("artifacts"), dict)
+  ):
+    return None
+  _memo[index_path] = (stamp, data)
+  return data
+
+
+def _write_index(index_path: Path, payload: dict[str, Any]) -> None:
+  """Persist the index atomically (fail-silent)."""
+  if not write_json_cache(index_path, ARTIFACT_INDEX_VERSION, payload):
+    return
+  with contextlib.suppress(OSError):
+    st = index_path.stat()
+    _memo[index_path] = ((st.st_mtime_ns, st.st_size), payload)
+
+
+__all__ = [
+  "ARTIFACT_INDEX_FILENAME",
+  "ArtifactIndex",
+  "IndexEntry",
+  "build_artifact_index",
+  "get_artifact_index_path",
+  "invalidate_artifact_index",
+  "lookup_artifact",
+  "lookup_artifacts",
+  "rebuild_artifact_index",
+]
@@ -0,0 +1,152 @@
+"""Tests for the persistent artifact index."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from supekku.cli import artifact_index
+from supekku.cli.artifact_index import (
+  get_artifact_index_path,
+  lookup_artifact,
+  lookup_artifacts,
+)
+from supekku.cli.artifacts import resolve_artifact, resolve_by_id
+from supekku.scripts.lib.benchmarks import WorkspaceShape, generate_workspace
+from supekku.scripts.lib.changes.registry import ChangeRegistry
+from supekku.scripts.lib.core.spec_utils import (
+  dump_markdown_file_update,
+  load_markdown_file,
+)
+
+SHAPE = WorkspaceShape(
+  specs=3,
+  deltas=2,
+  phases_per_delta=1,
+  memories=1,
+  issues=1,
+  adrs=1,
+)
+
+
+@pytest.fixture
+def root(tmp_path: Path) -> Path:
+  generate_workspace(tmp_path, SHAPE)
+  return tmp_path
+
+
+@pytest.fixture
+def builds(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+  """Record every full index build."""
+  calls: list[Path] = []
+  real = artifact_index.build_artifact_index
+
+  def counting(root: Path, **kwargs: Any) -> dict:
+    calls.append(root)
+    return real(root, **kwargs)
+
+  monkeypatch.setattr(artifact_index, "build_artifact_index", counting)
+  return calls
+
+
+def _indexed_path(root: Path, artifact_id: str) -> Path:
+  entry = lookup_artifact(root, artifact_id)
+  assert entry is not None
+  return entry.path
+
+
+def _touch_later(path: Path) -> None:
+  """Bump *path*'s mtime past filesystem timestamp granularity."""
+  st = path.stat()
+  os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_index_is_built_once_and_persisted(root: Path, builds: list[Path]) -> None:
+  """The first lookup builds the index; later lookups reuse it."""
+  entry = lookup_artifact(root, "DE-001")
+
+  assert entry is not None
+  assert entry.kind == "delta"
+  assert entry.path.name == "DE-001.md"
+  assert get_artifact_index_path(root).is_file()
+
+  artifact_index._memo.clear()
+  assert lookup_artifact(root, "SPEC-002") is not None
+  assert lookup_artifact(root, "DE-999") is None
+  assert len(builds) == 1
+
+
+def test_new_artifact_makes_miss_rebuild(root: Path, builds: list[Path]) -> None:
+  """An ID created after the index was written is found via a rebuild."""
+  lookup_artifact(root, "DE-001")
+  source = _indexed_path(root, "DE-002").parent
+  bundle = source.parent / "DE-003-added"
+  bundle.mkdir()
+  frontmatter, body = load_markdown_file(source / "DE-002.md")
+  dump_markdown_file_update(bundle / "DE-003.md", {**frontmatter, "id": "DE-003"}, body)
+
+  entry = lookup_artifact(root, "DE-003")
+
+  assert entry is not None
+  assert entry.path == bundle / "DE-003.md"
+  assert len(builds) == 2
+
+
+def test_deleted_artifact_is_not_returned(root: Path) -> None:
+  """A hit whose file has gone triggers a rebuild instead of a stale path."""
+  path = _indexed_path(root, "ISSUE-001")
+  path.unlink()
+
+  assert lookup_artifacts(root, ["ISSUE-001", "DE-001"]).keys() == {"DE-001"}
+
+
+def test_resolve_parses_only_the_indexed_file(
+  root: Path,
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  """With a warm index, resolving a delta never scans the delta directory."""
+  lookup_artifact(root, "DE-001")
+
+  def no_scan(self: ChangeRegistry) -> dict:
+    raise AssertionError("full scan")
+
+  monkeypatch.setattr(ChangeRegistry, "_scan", no_scan)
+  matches = resolve_by_id("DE-002", root)
+
+  assert [(kind, ref.id) for kind, ref in matches] == [("delta", "DE-002")]
+  assert matches[0][1].record.id == "DE-002"
+
+
+def test_id_edited_in_place(root: Path) -> None:
+  """An ID edited in place is found under its new ID, not its old one."""
+  path = _indexed_path(root, "DE-001")
+  frontmatter, body = load_markdown_file(path)
+  dump_markdown_file_update(path, {**frontmatter, "id": "DE-010"}, body)
+  _touch_later(path)
+
+  ref = resolve_artifact("delta", "DE-010", root)
+
+  assert ref.path == path
+  assert lookup_artifact(root, "DE-001") is None
+
+
+def test_partial_index_is_not_persisted(
+  root: Path,
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  """A registry failing to load keeps the index from being written."""
+
+  def broken(_root: Path, _index: dict) -> None:
+    raise ValueError("bad spec")
+
+  monkeypatch.setattr(
+    artifact_index,
+    "_OPTIONAL_COLLECTORS",
+    (("specs", broken), ("changes", artifact_index._collect_changes)),
+  )
+
+  assert lookup_artifact(root, "DE-001") is not None
+  assert not get_artifact_index_path(root).exists()
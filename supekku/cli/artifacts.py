@@ -60,9 +60,102 @@ class AmbiguousArtifactError(Exception):
 # Each _resolve_* function imports its registry at call time.
 
 
+def _load_indexed_change(root: Path, path: Path, artifact_id: str, kind: str) -> Any:
+  from supekku.scripts.lib.changes.registry import ChangeRegistry  # noqa: PLC0415
+
+  return ChangeRegistry(root=root, kind=kind).collect_path(path).get(artifact_id)
+
+
+def _load_indexed_decision(root: Path, path: Path, artifact_id: str) -> Any:
+  from supekku.scripts.lib.decisions.registry import DecisionRegistry  # noqa: PLC0415
+
+  return DecisionRegistry(root=root).collect_path(path).get(artifact_id)
+
+
+def _load_indexed_memory(root: Path, path: Path, artifact_id: str) -> Any:
+  from supekku.scripts.lib.memory.registry import MemoryRegistry  # noqa: PLC0415
+
+  return MemoryRegistry(root=root).collect_path(path).get(artifact_id)
+
+
+def _load_indexed_drift_ledger(root: Path, path: Path, artifact_id: str) -> Any:
+  from supekku.scripts.lib.drift.registry import DriftLedgerRegistry  # noqa: PLC0415
+
+  return DriftLedgerRegistry(root=root).collect_path(path).get(artifact_id)
+
+
+def _load_indexed_spec(_root: Path, path: Path, artifact_id: str) -> Any:
+  from supekku.scripts.lib.specs.registry import load_spec_file  # noqa: PLC0415
+
+  spec = load_spec_file(path)
+  return spec if spec is not None and spec.id == artifact_id else None
+
+
+def _load_indexed_backlog(root: Path, path: Path, artifact_id: str) -> Any:
+  from supekku.scripts.lib.backlog.registry import load_backlog_item  # noqa: PLC0415
+
+  item = load_backlog_item(path, root=root)
+  return item if item is not None and item.id == artifact_id else None
+
+
+# Single-file loaders for the kinds held in the persistent artifact index:
+# kind -> loader(root, path, artifact_id) -> record | None
+_INDEXED_LOADERS: dict[str, Any] = {
+  "spec": _load_indexed_spec,
+  "delta": lambda root, path, aid: _load_indexed_change(root, path, aid, "delta"),
+  "revision": lambda root, path, aid: _load_indexed_change(root, path, aid, "revision"),
+  "audit": lambda root, path, aid: _load_indexed_change(root, path, aid, "audit"),
+  "adr": _load_indexed_decision,
+  "memory": _load_indexed_memory,
+  "drift_ledger": _load_indexed_drift_ledger,
+  "issue": _load_indexed_backlog,
+  "problem": _load_indexed_backlog,
+  "improvement": _load_indexed_backlog,
+  "risk": _load_indexed_backlog,
+}
+
+_BACKLOG_KINDS = frozenset({"issue", "problem", "improvement", "risk"})
+
+
+def _resolve_indexed(root: Path, artifact_id: str, kind: str) -> ArtifactRef | None:
+  """Resolve through the persistent artifact index, parsing one file.
+
+  *kind* ``""`` accepts any backlog kind. Returns None when the index does
+  not hold *artifact_id* as *kind*, or its file no longer carries the ID
+  (the index is then discarded); callers fall back to a registry scan.
+  """
+  from supekku.cli.artifact_index import (  # noqa: PLC0415
+    invalidate_artifact_index,
+    lookup_artifact,
+  )
+
+  try:
+    entry = lookup_artifact(root, artifact_id)
+  except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+    return None
+  if entry is None:
+    return None
+  if entry.kind != kind and not (kind == "" and entry.kind in _BACKLOG_KINDS):
+    return None
+  loader = _INDEXED_LOADERS.get(entry.kind)
+  if loader is None:
+    return None
+  try:
+    record = loader(root, entry.path, artifact_id)
+  except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+    record = None
+  if record is None:
+    invalidate_artifact_index(root)
+    return None
+  return ArtifactRef(id=artifact_id, path=entry.path, record=record)
+
+
 def _resolve_spec(root: Path, raw_id: str) -> ArtifactRef:
   from supekku.scripts.lib.specs.registry import SpecRegistry  # noqa: PLC0415
 
+  indexed = _resolve_indexed(root, raw_id, "spec")
+  if indexed is not None:
+    return indexed
   registry = SpecRegistry(root)
   spec = registry.find(raw_id)
   if not spec:
@@ -74,6 +167,9 @@ def _resolve_change(root: Path, raw_id: str, kind: str) -> ArtifactRef:
   from supekku.scripts.lib.changes.registry import ChangeRegistry  # noqa: PLC0415
 
   normalized = normalize_id(kind, raw_id)
+  indexed = _resolve_indexed(root, normalized, kind)
+  if indexed is not None:
+    return indexed
   registry = ChangeRegistry(root=root, kind=kind)
   artifact = registry.find(normalized)
   if not artifact:
@@ -85,6 +181,9 @@ def _resolve_decision(root: Path, raw_id: str) -> ArtifactRef:
   from supekku.scripts.lib.decisions.registry import DecisionRegistry  # noqa: PLC0415
 
   normalized = normalize_id("adr", raw_id)
+  indexed = _resolve_indexed(root, normalized, "adr")
+  if indexed is not None:
+    return indexed
   registry = DecisionRegistry(root=root)
   decision = registry.find(normalized)
   if not decision:
@@ -133,6 +232,9 @@ def _resolve_drift_ledger(root: Path, raw_id: str) -> ArtifactRef:
   from supekku.scripts.lib.drift.registry import DriftLedgerRegistry  # noqa: PLC0415
 
   normalized = raw_id.upper()
+  indexed = _resolve_indexed(root, normalized, "drift_ledger")
+  if indexed is not None:
+    return indexed
   registry = DriftLedgerRegistry(root=root)
   ledger = registry.find(normalized)
   if not ledger:
@@ -153,6 +255,9 @@ def _resolve_card(root: Path, raw_id: str) -> ArtifactRef:
 def _resolve_memory(root: Path, raw_id: str) -> ArtifactRef:
   from supekku.scripts.lib.memory.registry import MemoryRegistry  # noqa: PLC0415
 
+  indexed = _resolve_indexed(root, raw_id, "memory")
+  if indexed is not None:
+    return indexed
   registry = MemoryRegistry(root=root)
   record = registry.find(raw_id)
   if not record:
@@ -181,6 +286,9 @@ def _resolve_backlog(root: Path, raw_id: str, kind: str) -> ArtifactRef:
   from supekku.scripts.lib.backlog.registry import BacklogRegistry  # noqa: PLC0415
 
   normalized = normalize_id(kind, raw_id) if kind else raw_id
+  indexed = _resolve_indexed(root, normalized, kind)
+  if indexed is not None:
+    return indexed
   registry = BacklogRegistry(root=root)
   item = registry.find(normalized)
   error_label = kind or "backlog item"
@@ -307,8 +415,9 @@ def resolve_artifact(artifact_type: str, raw_id: str, root: Path | None) -> Arti
 def resolve_by_id(raw_id: str, root: Path | None) -> list[tuple[str, ArtifactRef]]:
   """Resolve artifact type from a bare ID (prefixed or numeric).
 
-  Uses _build_artifact_index() from resolve.py for O(1) lookup across all
-  registries (DEC-063-04 / POL-001).
+  Looks IDs up in the persistent artifact index (``artifact_index.py``,
+  built from ``build_artifact_index`` in resolve.py) for O(1) lookup across
+  all registries (DEC-063-04 / POL-001); each match parses only its file.
 
   Args:
     raw_id: User-provided ID (e.g. 'DE-061', '61', 'SPEC-009').
@@ -318,17 +427,17 @@ def resolve_by_id(raw_id: str, root: Path | None) -> list[tuple[str, ArtifactRef
     List of (artifact_type, ArtifactRef) tuples. Empty if no match.
     Prefixed IDs return 0 or 1 matches; numeric IDs may return multiple.
   """
-  from supekku.cli.resolve import build_artifact_index  # noqa: PLC0415
+  from supekku.cli.artifact_index import lookup_artifacts  # noqa: PLC0415
 
   root = resolve_root(root)
-  index = build_artifact_index(root)
 
   # Prefixed ID: look up directly
   prefix = _parse_prefix(raw_id)
   if prefix and prefix in PREFIX_TO_TYPE:
     canonical = raw_id.upper()
+    index = lookup_artifacts(root, [canonical])
     if canonical in index:
-      _rel_path, kind = index[canonical]
+      kind = index[canonical].kind
       try:
         ref = resolve_artifact(kind, canonical, root)
         return [(kind, ref)]
@@ -339,9 +448,13 @@ def resolve_by_id(raw_id: str, root: Path | None) -> list[tuple[str, ArtifactRef
   # Numeric-only: try all prefixed expansions
   if raw_id.isdigit():
     padded = f"{int(raw_id):03d}"
+    candidates = {
+      (f"T{raw_id}" if pfx == "T" else f"{pfx}-{padded}"): kind
+      for pfx, kind in PREFIX_TO_TYPE.items()
+    }
+    index = lookup_artifacts(root, candidates)
     matches: list[tuple[str, ArtifactRef]] = []
-    for pfx, kind in PREFIX_TO_TYPE.items():
-      candidate = f"T{raw_id}" if pfx == "T" else f"{pfx}-{padded}"
+    for candidate, kind in candidates.items():
       if candidate in index:
         try:
           ref = resolve_artifact(kind, candidate, root)
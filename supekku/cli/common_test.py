@@ -5,6 +5,7 @@ VT-resolve, VT-emit, VT-find-artifacts verification artifacts.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
@@ -27,6 +28,18 @@ from supekku.cli.common import (
 )
 from supekku.scripts.lib.core.paths import BACKLOG_DIR, DELTAS_SUBDIR, SPEC_DRIVER_DIR
 
+
+@pytest.fixture(autouse=True)
+def _registry_resolution() -> Iterator[None]:
+  """Resolve through the (mocked) registries, never the artifact index.
+
+  Building the index would call the mocked registries too, and a cached
+  index from another test would bypass them.
+  """
+  with patch("supekku.cli.artifacts._resolve_indexed", return_value=None):
+    yield
+
+
 # ── ArtifactRef ─────────────────────────────────────────────────
 
 
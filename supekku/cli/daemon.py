@@ -0,0 +1,246 @@
+"""Client side of the ``spec-driver serve`` daemon protocol.
+
+``spec-driver serve`` keeps a warm interpreter for one workspace and answers
+CLI requests over ``.spec-driver/run/cli.sock`` (AF_UNIX SOCK_STREAM, next to
+the ``tui.sock`` event socket). Each connection carries one newline-terminated
+JSON request and one newline-terminated JSON response.
+
+``main()`` calls :func:`run_via_daemon` before doing anything else. It only
+forwards read-only commands whose output is not going to a terminal (the
+agent case), and returns None — meaning "run in-process" — whenever no
+daemon is reachable. This module must stay cheap to import.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any
+
+from supekku.scripts.lib.core.paths import get_run_dir
+from supekku.scripts.lib.core.repo import find_repo_root
+
+PROTOCOL_VERSION = 1
+SOCKET_FILENAME = "cli.sock"
+MAX_SOCKET_PATH_LEN = 104
+
+# Env override: "0"/"off" never contacts the daemon.
+DAEMON_ENV_VAR = "SPEC_DRIVER_DAEMON"
+
+# Read-only subcommands safe to answer from the daemon, per top-level
+# command: no pager, no editor, no prompts, no writes. Anything else runs
+# in-process, and so does a command whose daemon round-trip fails.
+DAEMON_COMMANDS: dict[str, frozenset[str]] = {
+  "list": frozenset(
+    {
+      *("specs", "deltas", "changes", "plans", "requirements"),
+      *("adrs", "policies", "standards", "revisions", "audits"),
+      *("backlog", "drift", "issues", "problems", "improvements", "risks"),
+      *("cards", "memories", "schemas"),
+      # Hidden singular aliases.
+      *("spec", "delta", "change", "plan", "requirement"),
+      *("adr", "policy", "standard", "revision", "audit"),
+      *("issue", "problem", "improvement", "risk"),
+      *("card", "memory", "schema"),
+    }
+  ),
+  "show": frozenset(
+    {
+      *("spec", "delta", "revision", "requirement", "plan", "audit"),
+      *("adr", "policy", "standard", "template", "card", "memory"),
+      *("backlog", "drift", "issue", "problem", "improvement", "risk"),
+      *("schema", "relations"),
+    }
+  ),
+  "find": frozenset(
+    {
+      *("spec", "delta", "revision", "requirement", "plan", "audit"),
+      *("adr", "policy", "standard", "card", "memory"),
+      *("issue", "problem", "improvement", "risk"),
+    }
+  ),
+  "schema": frozenset({"enums"}),
+}
+
+# Flags that open $EDITOR (``--prioritize``, which then saves the backlog
+# registry) or a pager; they need the caller's terminal.
+_BACKLOG_INTERACTIVE = frozenset(
+  {"--prioritize", "--prioritise", "-p", "--pager", "-P"},
+)
+INTERACTIVE_FLAGS: dict[tuple[str, str], frozenset[str]] = {
+  ("list", name): _BACKLOG_INTERACTIVE
+  for name in (
+    "backlog",
+    "issues",
+    "issue",
+    "problems",
+    "problem",
+    "improvements",
+    "improvement",
+    "risks",
+    "risk",
+  )
+}
+
+# Environment the daemon applies for the duration of one request.
+FORWARDED_ENV = (
+  "COLUMNS",
+  "LINES",
+  "NO_COLOR",
+  "TERM",
+  "SPEC_DRIVER_SESSION",
+  "SPEC_DRIVER_PROFILE",
+  "SPEC_DRIVER_PROFILE_DUMP",
+)
+
+
+class DaemonError(RuntimeError):
+  """Raised when the daemon cannot be reached or answers malformed data."""
+
+
+def get_socket_path(root: Path) -> Path:
+  """Return the daemon socket location for the workspace at *root*."""
+  return get_run_dir(root) / SOCKET_FILENAME
+
+
+def encode_message(message: dict[str, Any]) -> bytes:
+  """Serialise one protocol message as a JSON line."""
+  return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def read_message(sock: socket.socket) -> dict[str, Any]:
+  """Read one JSON-line message from *sock*.
+
+  Raises:
+    DaemonError: If the peer closes early or sends something other than
+      a JSON object.
+  """
+  chunks: list[bytes] = []
+  while True:
+    chunk = sock.recv(65536)
+    if not chunk:
+      break
+    chunks.append(chunk)
+    if chunk.endswith(b"\n"):
+      break
+  try:
+    message = json.loads(b"".join(chunks))
+  except ValueError as exc:
+    msg = "malformed daemon message"
+    raise DaemonError(msg) from exc
+  if not isinstance(message, dict):
+    msg = "malformed daemon message"
+    raise DaemonError(msg)
+  return message
+
+
+def request(
+  socket_path: Path,
+  message: dict[str, Any],
+  *,
+  timeout: float | None = None,
+) -> dict[str, Any]:
+  """Send *message* to the daemon at *socket_path* and return its reply.
+
+  Raises:
+    DaemonError: If nothing is listening or the exchange fails.
+  """
+  sock_path = str(socket_path)
+  if len(sock_path) > MAX_SOCKET_PATH_LEN:
+    msg = f"socket path too long: {sock_path}"
+    raise DaemonError(msg)
+  sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+  try:
+    sock.settimeout(timeout)
+    sock.connect(sock_path)
+    sock.sendall(encode_message({"v": PROTOCOL_VERSION, **message}))
+    sock.shutdown(socket.SHUT_WR)
+    return read_message(sock)
+  except OSError as exc:
+    msg = f"daemon unavailable at {sock_path}: {exc}"
+    raise DaemonError(msg) from exc
+  finally:
+    sock.close()
+
+
+def is_daemon_command(argv: list[str]) -> bool:
+  """Return whether *argv* is an allowlisted, non-interactive invocation."""
+  if len(argv) < 2 or argv[1] not in DAEMON_COMMANDS.get(argv[0], ()):
+    return False
+  interactive = INTERACTIVE_FLAGS.get((argv[0], argv[1]), frozenset())
+  short = {flag[1] for flag in interactive if len(flag) == 2}
+  for arg in argv[2:]:
+    if arg == "--":
+      break
+    if arg in {"--help", "-h"} or arg in interactive:
+      return False
+    # Clustered short flags: ``-ap`` is ``-a -p``.
+    if arg.startswith("-") and not arg.startswith("--") and short & set(arg[1:]):
+      return False
+  return True
+
+
+def should_use_daemon(argv: list[str]) -> bool:
+  """Return whether *argv* may be answered by a running daemon."""
+  if os.environ.get(DAEMON_ENV_VAR, "").strip().lower() in {"0", "off", "false"}:
+    return False
+  if not is_daemon_command(argv):
+    return False
+  with contextlib.suppress(ValueError, OSError):
+    if sys.stdout.isatty():
+      return False
+  return True
+
+
+def run_via_daemon(argv: list[str]) -> int | None:
+  """Run *argv* on the workspace daemon, replaying its output locally.
+
+  Returns:
+    The command's exit code, or None when the command must run
+    in-process (not eligible, no workspace, no daemon, protocol error).
+  """
+  if not should_use_daemon(argv):
+    return None
+  try:
+    socket_path = get_socket_path(find_repo_root())
+  except RuntimeError:
+    return None
+  if not socket_path.exists():
+    return None
+
+  env = {name: os.environ[name] for name in FORWARDED_ENV if name in os.environ}
+  try:
+    reply = request(
+      socket_path,
+      {"op": "run", "argv": argv, "cwd": str(Path.cwd()), "env": env},
+    )
+  except DaemonError:
+    return None
+  if reply.get("v") != PROTOCOL_VERSION or not isinstance(reply.get("exit_code"), int):
+    return None
+
+  sys.stdout.write(reply.get("stdout", ""))
+  sys.stdout.flush()
+  sys.stderr.write(reply.get("stderr", ""))
+  sys.stderr.flush()
+  return reply["exit_code"]
+
+
+__all__ = [
+  "DAEMON_COMMANDS",
+  "DAEMON_ENV_VAR",
+  "PROTOCOL_VERSION",
+  "SOCKET_FILENAME",
+  "INTERACTIVE_FLAGS",
+  "DaemonError",
+  "get_socket_path",
+  "is_daemon_command",
+  "read_message",
+  "request",
+  "run_via_daemon",
+  "should_use_daemon",
+]
@@ -0,0 +1,95 @@
+"""Lazy subcommand loading for the top-level CLI.
+
+Importing every command module up front pulls in pydantic models, rich,
+jinja2, the formatters and every registry before a command runs — even
+for ``spec-driver --version``. A :class:`LazySubcommand` names the module
+attribute holding a sub-app or command function; the group imports it
+only when that subcommand is dispatched (or when help lists it).
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+from dataclasses import dataclass
+from typing import Any
+
+import click
+import typer
+from typer.core import TyperGroup
+
+
+@dataclass(frozen=True)
+class LazySubcommand:
+  """A top-level subcommand resolved on first use.
+
+  Attributes:
+    name: Command name on the CLI.
+    target: ``"module:attribute"`` naming a ``typer.Typer`` sub-app or a
+      command function.
+    help: Help text shown in the parent's command listing.
+  """
+
+  name: str
+  target: str
+  help: str
+
+  def resolve(self) -> Any:
+    """Import and return the target object."""
+    module_name, _, attr = self.target.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+  def load(self) -> click.Command:
+    """Return the click command for this subcommand, built once per process."""
+    return _load_command(self)
+
+
+@functools.cache
+def _load_command(sub: LazySubcommand) -> click.Command:
+  """Convert a Typer sub-app or command function to a click command.
+
+  Mirrors ``Typer.add_typer`` / ``Typer.command``: a sub-app always
+  becomes a group, even with a single command.
+  """
+  obj = sub.resolve()
+  name, help_text = sub.name, sub.help
+  if isinstance(obj, typer.Typer):
+    command: click.Command = typer.main.get_group(obj)
+  else:
+    holder = typer.Typer()
+    holder.command(name, help=help_text)(obj)
+    command = typer.main.get_command(holder)
+  command.name = name
+  command.help = help_text
+  return command
+
+
+def lazy_group(subcommands: list[LazySubcommand]) -> type[TyperGroup]:
+  """Return a ``TyperGroup`` class that resolves *subcommands* lazily.
+
+  Pass the result as ``typer.Typer(cls=...)``. Lazy subcommands are listed
+  first, in the given order, followed by eagerly registered commands.
+  The app needs a callback (or more than one eager command) so Typer
+  builds a group rather than collapsing it into a single command.
+  """
+  by_name = {sub.name: sub for sub in subcommands}
+
+  class LazyTyperGroup(TyperGroup):
+    """Typer group that imports lazy subcommands on dispatch."""
+
+    lazy_subcommands = by_name
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+      eager = [n for n in super().list_commands(ctx) if n not in by_name]
+      return [*by_name, *eager]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+      sub = by_name.get(cmd_name)
+      if sub is not None:
+        return sub.load()
+      return super().get_command(ctx, cmd_name)
+
+  return LazyTyperGroup
+
+
+__all__ = ["LazySubcommand", "lazy_group"]
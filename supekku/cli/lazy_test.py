@@ -0,0 +1,115 @@
+"""Tests for lazy top-level subcommand loading."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import typer
+from typer.testing import CliRunner
+
+from supekku.cli.lazy import LazySubcommand, lazy_group
+
+runner = CliRunner()
+
+# Modules that must not be imported just to build the top-level CLI.
+HEAVY_MODULES = (
+  "jinja2",
+  "pydantic",
+  "rich.console",
+  "yaml",
+  "supekku.cli.show",
+  "supekku.cli.list",
+  "supekku.scripts.lib.workspace",
+  "spec_driver.presentation.cli.validate",
+)
+
+sub_app = typer.Typer()
+
+
+@sub_app.command("hello")
+def _hello() -> None:
+  typer.echo("hello from sub")
+
+
+def _ping(name: str = "world") -> None:
+  typer.echo(f"ping {name}")
+
+
+def _make_app() -> typer.Typer:
+  subcommands = [
+    LazySubcommand("sub", f"{__name__}:sub_app", "A lazy sub-app"),
+    LazySubcommand("ping", f"{__name__}:_ping", "A lazy command"),
+  ]
+  app = typer.Typer(cls=lazy_group(subcommands), no_args_is_help=True)
+
+  # A callback keeps Typer from collapsing a one-command app into that command.
+  @app.callback()
+  def _root() -> None:
+    pass
+
+  @app.command("eager")
+  def _eager() -> None:
+    typer.echo("eager")
+
+  return app
+
+
+class TestLazyGroup:
+  """Dispatch and listing through a lazy group."""
+
+  def test_dispatches_sub_app(self) -> None:
+    result = runner.invoke(_make_app(), ["sub", "hello"])
+    assert result.exit_code == 0, result.output
+    assert "hello from sub" in result.output
+
+  def test_dispatches_command_function(self) -> None:
+    result = runner.invoke(_make_app(), ["ping", "--name", "lazy"])
+    assert result.exit_code == 0, result.output
+    assert "ping lazy" in result.output
+
+  def test_eager_commands_still_work(self) -> None:
+    result = runner.invoke(_make_app(), ["eager"])
+    assert result.exit_code == 0, result.output
+    assert "eager" in result.output
+
+  def test_help_lists_lazy_then_eager(self) -> None:
+    result = runner.invoke(_make_app(), ["--help"])
+    assert result.exit_code == 0, result.output
+    out = result.output
+    assert "A lazy sub-app" in out
+    assert out.index("sub ") < out.index("ping ") < out.index("eager")
+
+  def test_load_is_cached(self) -> None:
+    sub = LazySubcommand("sub", f"{__name__}:sub_app", "A lazy sub-app")
+    assert sub.load() is sub.load()
+
+
+class TestMainImportCost:
+  """Importing the CLI entry point must stay cheap (agents call it a lot)."""
+
+  def _run(self, *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+      [sys.executable, *args],
+      capture_output=True,
+      text=True,
+      check=True,
+    )
+
+  def test_heavy_modules_not_imported(self) -> None:
+    code = (
+      "import sys, supekku.cli.main\n"
+      f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    loaded = self._run("-c", code).stdout.strip()
+    assert loaded == ""
+
+  def test_lazy_subcommand_modules_not_imported(self) -> None:
+    code = (
+      "import sys, supekku.cli.main\n"
+      "m = sys.modules['supekku.cli.main']\n"
+      "targets = {s.target.partition(':')[0] for s in m._LAZY_SUBCOMMANDS}\n"
+      "print(','.join(sorted(t for t in targets if t in sys.modules)))"
+    )
+    loaded = self._run("-c", code).stdout.strip()
+    assert loaded == ""
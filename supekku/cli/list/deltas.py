@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import re
-from typing import Annotated
+from functools import partial
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
@@ -16,24 +17,28 @@ from supekku.cli.common import (
   RegexpOption,
   RootOption,
   TruncateOption,
-  load_all_artifacts,
-  matches_regexp,
 )
 from supekku.cli.list import _parse_relation_filter, app
+from supekku.cli.query import ListQuery, QueryContext, compile_regexp
 from supekku.scripts.lib.blocks.metadata.aliases import normalize_field
-from supekku.scripts.lib.changes.audit_check import collect_audited_delta_ids
 from supekku.scripts.lib.changes.lifecycle import CHANGE_STATUSES, STATUS_COMPLETED
-from supekku.scripts.lib.changes.registry import ChangeRegistry
 from supekku.scripts.lib.core.filters import parse_multi_value_filter
 from supekku.scripts.lib.formatters.change_formatters import (
   format_change_with_context,
   format_delta_list_table,
 )
-from supekku.scripts.lib.relations.query import (
-  find_by_relation,
-  find_related_to,
-  partition_by_reverse_references,
-)
+
+if TYPE_CHECKING:
+  from supekku.scripts.lib.changes.artifacts import ChangeArtifact
+
+
+def _touches_spec(spec_upper: str, delta: ChangeArtifact) -> bool:
+  """``--spec``: spec in ``applies_to.specs`` or within any relation target."""
+  if spec_upper in [s.upper() for s in (delta.applies_to or {}).get("specs", [])]:
+    return True
+  return any(
+    spec_upper in str(rel.get("target", "")).upper() for rel in delta.relations
+  )
 
 
 @app.command("deltas")
@@ -219,107 +224,54 @@ def list_deltas(
     raise typer.Exit(EXIT_FAILURE)
 
   try:
-    registry = ChangeRegistry(root=root, kind="delta")
-    artifacts = registry.collect()
-
-    if not artifacts:
-      raise typer.Exit(EXIT_SUCCESS)
+    context = QueryContext(root)
+    registry = context.changes("delta")
 
-    # Apply reverse relationship query first (if specified)
+    # Reverse relationship query narrows the candidate IDs (index lookup)
+    query_ids = list(ids) if ids else None
     if implements:
-      filtered_by_implements = registry.find_by_implements(implements)
-      # Convert to dict for consistent filtering below
-      artifacts = {a.id: a for a in filtered_by_implements}
-      if not artifacts:
-        raise typer.Exit(EXIT_SUCCESS)
-
-    delta_ids = set(ids) if ids else None
+      implementing = [a.id for a in registry.find_by_implements(implements)]
+      query_ids = (
+        implementing
+        if query_ids is None
+        else [aid for aid in implementing if aid in set(query_ids)]
+      )
 
     # Parse multi-value status filter
     status_values = parse_multi_value_filter(status)
-    status_normalized = (
-      [normalize_field("delta", "status", s) for s in status_values]
-      if status_values
-      else []
+    status_normalized = frozenset(
+      normalize_field("delta", "status", s) for s in status_values
     )
 
-    # Apply default status filter if no status is specified and --all is not set
-    # (Hide completed deltas by default)
-    default_hidden = {STATUS_COMPLETED} if not status and not show_all else set()
-
-    # Apply filters
-    filtered_artifacts = []
-    for artifact in artifacts.values():
-      # Check ID filter
-      if delta_ids is not None and artifact.id not in delta_ids:
-        continue
-
-      # Check status filter (multi-value OR logic)
-      norm_status = normalize_field("delta", "status", artifact.status)
-      if status_normalized and norm_status not in status_normalized:
-        continue
-
-      if norm_status in default_hidden:
-        continue
-
-      # Check substring filter
-      if substring:
-        filter_lower = substring.lower()
-        if (
-          filter_lower not in artifact.id.lower()
-          and filter_lower not in artifact.name.lower()
-        ):
-          continue
-      # Check regexp filter on id, name, slug
-      if regexp:
-        try:
-          if not matches_regexp(
-            regexp,
-            [artifact.id, artifact.name, artifact.slug],
-            case_insensitive,
-          ):
-            continue
-        except re.error as e:
-          typer.echo(f"Error: invalid regexp pattern: {e}", err=True)
-          raise typer.Exit(EXIT_FAILURE) from e
-
-      # Check tag filter (repeatable, OR logic)
-      if tag and not any(t in artifact.tags for t in tag):
-        continue
-
-      filtered_artifacts.append(artifact)
+    # Hide completed deltas by default (no status given and --all not set)
+    default_hidden = (
+      frozenset({STATUS_COMPLETED}) if not status and not show_all else frozenset()
+    )
 
-    # Apply generic relation filters
+    predicates = []
     if spec_filter:
-      spec_upper = spec_filter.upper()
-      filtered_artifacts = [
-        d
-        for d in filtered_artifacts
-        if spec_upper in [s.upper() for s in (d.applies_to or {}).get("specs", [])]
-        or (
-          d.relations
-          and any(
-            spec_upper in str(rel.get("target", "")).upper() for rel in d.relations
-          )
-        )
-      ]
-    if related_to:
-      filtered_artifacts = find_related_to(filtered_artifacts, related_to)
-    if relation:
-      rel_type, rel_target = _parse_relation_filter(relation)
-      filtered_artifacts = find_by_relation(
-        filtered_artifacts, relation_type=rel_type, target=rel_target
-      )
+      predicates.append(partial(_touches_spec, spec_filter.upper()))
 
-    # Apply reverse reference filtering
-    if referenced_by or not_referenced_by:
-      ref_type = referenced_by or not_referenced_by or ""
-      referrers = load_all_artifacts(root, ref_type)
-      referenced, unreferenced = partition_by_reverse_references(
-        filtered_artifacts,
-        referrers,
-      )
-      filtered_artifacts = referenced if referenced_by else unreferenced
+    try:
+      pattern = compile_regexp(regexp, case_insensitive)
+    except re.error as e:
+      typer.echo(f"Error: invalid regexp pattern: {e}", err=True)
+      raise typer.Exit(EXIT_FAILURE) from e
+
+    query = ListQuery(
+      ids=query_ids,
+      statuses=status_normalized,
+      hidden_statuses=default_hidden,
+      tags=tag or (),
+      substring=substring,
+      regexp=pattern,
+      related_to=related_to,
+      relation=_parse_relation_filter(relation) if relation else None,
+      predicates=predicates,
+      referenced_by=referenced_by,
+      not_referenced_by=not_referenced_by,
+    )
+    filtered_artifacts = query.run(registry, context)
 
     if not filtered_artifacts:
       raise typer.Exit(EXIT_SUCCESS)
@@ -335,11 +287,9 @@ def list_deltas(
         output = format_change_with_context(artifact)
         typer.echo(output)
     else:
-      audit_registry = ChangeRegistry(root=root, kind="audit")
-      audited_delta_ids = collect_audited_delta_ids(audit_registry.collect())
       output = format_delta_list_table(
         filtered_artifacts,
-        audited_delta_ids=audited_delta_ids,
+        audited_delta_ids=context.audited_delta_ids(),
         format_type=format_type,
         truncate=truncate,
         show_tags=show_tags,
@@ -236,12 +236,9 @@ def list_memories(  # noqa: PLR0913
     # Step 0: backlink filter (overrides normal filter pipeline)
     if links_to:
       from supekku.scripts.lib.memory.ids import normalize_memory_id  # noqa: PLC0415
-      from supekku.scripts.lib.memory.links import compute_backlinks  # noqa: PLC0415
 
       target_id = normalize_memory_id(links_to)
-      bodies = registry.collect_bodies()
-      backlinks = compute_backlinks(bodies)
-      source_ids = set(backlinks.get(target_id, []))
+      source_ids = set(registry.link_graph().backlinks.get(target_id, []))
       all_records = registry.collect()
       records = [all_records[sid] for sid in sorted(source_ids) if sid in all_records]
     # Step 1: metadata pre-filter
@@ -297,6 +294,7 @@ def list_memories(  # noqa: PLR0913
       include_draft=include_draft,
       skip_status_filter=status is not None,
       limit=limit,
+      index=registry.scope_index() if context else None,
     )
 
     if not records:
@@ -16,16 +16,14 @@ from supekku.cli.common import (
   RegexpOption,
   RootOption,
   TruncateOption,
-  load_all_artifacts,
   matches_regexp,
 )
 from supekku.cli.list import app
-from supekku.scripts.lib.changes.registry import ChangeRegistry
+from supekku.cli.query import ListQuery, QueryContext
 from supekku.scripts.lib.core.filters import parse_multi_value_filter
 from supekku.scripts.lib.formatters.requirement_formatters import (
   format_requirement_list_table,
 )
-from supekku.scripts.lib.relations.query import partition_by_reverse_references
 
 
 @app.command("requirements")
@@ -191,6 +189,7 @@ def list_requirements(
     repo_root = Path(root) if root else Path.cwd()
     registry_path = get_registry_dir(repo_root) / "requirements.yaml"
     registry = RequirementsRegistry(registry_path)
+    context = QueryContext(repo_root)
 
     # Apply reverse relationship query first (if specified)
     if verified_by:
@@ -212,8 +211,8 @@ def list_requirements(
       )
 
       delta_id = normalize_id("delta", implemented_by)
-      delta_registry = ChangeRegistry(root=root, kind="delta")
-      delta_art = delta_registry.find(delta_id)
+      found = context.changes("delta").find_many([delta_id])
+      delta_art = found[0] if found else None
       if delta_art is None:
         typer.echo(f"Error: delta not found: {delta_id}", err=True)
         raise typer.Exit(EXIT_FAILURE)
@@ -311,15 +310,10 @@ def list_requirements(
       ]
 
     # Apply reverse reference filtering
-    if referenced_by or not_referenced_by:
-      ref_type = referenced_by or not_referenced_by
-      referrers = load_all_artifacts(repo_root, ref_type)
-      referenced, unreferenced = partition_by_reverse_references(
-        requirements,
-        referrers,
-        candidate_id_fn=lambda r: r.uid,
-      )
-      requirements = referenced if referenced_by else unreferenced
+    requirements = ListQuery(
+      referenced_by=referenced_by,
+      not_referenced_by=not_referenced_by,
+    ).filter_references(requirements, context, candidate_id_fn=lambda r: r.uid)
 
     if not requirements:
       raise typer.Exit(EXIT_SUCCESS)
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import re
-from typing import Annotated
+from functools import partial
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
@@ -16,19 +17,62 @@ from supekku.cli.common import (
   RegexpOption,
   RootOption,
   TruncateOption,
-  load_all_artifacts,
-  matches_regexp,
 )
 from supekku.cli.list import app
+from supekku.cli.query import ListQuery, QueryContext, compile_regexp
 from supekku.scripts.lib.changes.audit_check import audit_findings_summary
-from supekku.scripts.lib.changes.registry import ChangeRegistry
 from supekku.scripts.lib.changes.revision_check import revision_change_summary
 from supekku.scripts.lib.core.filters import parse_multi_value_filter
 from supekku.scripts.lib.formatters.change_formatters import (
   format_audit_list_table,
   format_revision_list_table,
 )
-from supekku.scripts.lib.relations.query import partition_by_reverse_references
+
+if TYPE_CHECKING:
+  from supekku.scripts.lib.changes.artifacts import ChangeArtifact
+
+
+def _relation_target_contains(needle: str, artifact: ChangeArtifact) -> bool:
+  return any(needle in str(rel.get("target", "")).upper() for rel in artifact.relations)
+
+
+def _relation_target_is(target: str, artifact: ChangeArtifact) -> bool:
+  return any(target == str(rel.get("target", "")).upper() for rel in artifact.relations)
+
+
+def _review_query(
+  *,
+  status: str | None,
+  spec: str | None,
+  delta: str | None,
+  tag: list[str] | None,
+  substring: str | None,
+  regexp: str | None,
+  case_insensitive: bool,
+  referenced_by: str | None = None,
+  not_referenced_by: str | None = None,
+) -> ListQuery:
+  """Build the revision/audit query; ``--spec``/``--delta`` match relations.
+
+  Raises:
+    re.error: If *regexp* is invalid.
+  """
+  predicates = []
+  if spec:
+    predicates.append(partial(_relation_target_contains, spec.upper()))
+  if delta:
+    from supekku.cli.common import normalize_id  # noqa: PLC0415
+
+    predicates.append(partial(_relation_target_is, normalize_id("delta", delta)))
+  return ListQuery(
+    statuses=frozenset(s.lower() for s in parse_multi_value_filter(status)),
+    tags=tag or (),
+    substring=substring,
+    regexp=compile_regexp(regexp, case_insensitive),
+    predicates=predicates,
+    referenced_by=referenced_by,
+    not_referenced_by=not_referenced_by,
+  )
 
 
 @app.command("revisions")
@@ -90,55 +134,21 @@ def list_revisions(
     raise typer.Exit(EXIT_FAILURE)
 
   try:
-    registry = ChangeRegistry(root=root, kind="revision")
-    revisions = list(registry.collect().values())
-
-    # Apply filters (multi-value status OR logic)
-    if status:
-      status_values = parse_multi_value_filter(status)
-      status_normalized = [s.lower() for s in status_values]
-      revisions = [r for r in revisions if r.status.lower() in status_normalized]
-    if spec:
-      spec_upper = spec.upper()
-      revisions = [
-        r
-        for r in revisions
-        if r.relations
-        and any(spec_upper in str(rel.get("target", "")).upper() for rel in r.relations)
-      ]
-    if delta:
-      from supekku.cli.common import normalize_id  # noqa: PLC0415
-
-      delta_normalized = normalize_id("delta", delta)
-      revisions = [
-        r
-        for r in revisions
-        if r.relations
-        and any(
-          delta_normalized == str(rel.get("target", "")).upper() for rel in r.relations
-        )
-      ]
-    if tag:
-      revisions = [r for r in revisions if any(t in r.tags for t in tag)]
-    if substring:
-      filter_lower = substring.lower()
-      revisions = [
-        r
-        for r in revisions
-        if filter_lower in r.id.lower() or filter_lower in r.name.lower()
-      ]
-
-    # Apply regexp filter on id, slug, name
-    if regexp:
-      try:
-        revisions = [
-          r
-          for r in revisions
-          if matches_regexp(regexp, [r.id, r.slug, r.name], case_insensitive)
-        ]
-      except re.error as e:
-        typer.echo(f"Error: invalid regexp pattern: {e}", err=True)
-        raise typer.Exit(EXIT_FAILURE) from e
+    context = QueryContext(root)
+    try:
+      query = _review_query(
+        status=status,
+        spec=spec,
+        delta=delta,
+        tag=tag,
+        substring=substring,
+        regexp=regexp,
+        case_insensitive=case_insensitive,
+      )
+    except re.error as e:
+      typer.echo(f"Error: invalid regexp pattern: {e}", err=True)
+      raise typer.Exit(EXIT_FAILURE) from e
+    revisions = query.run(context.changes("revision"), context)
 
     if not revisions:
       raise typer.Exit(EXIT_SUCCESS)
@@ -243,65 +253,23 @@ def list_audits(
     raise typer.Exit(EXIT_FAILURE)
 
   try:
-    registry = ChangeRegistry(root=root, kind="audit")
-    audits = list(registry.collect().values())
-
-    # Apply filters (multi-value status OR logic)
-    if status:
-      status_values = parse_multi_value_filter(status)
-      status_normalized = [s.lower() for s in status_values]
-      audits = [a for a in audits if a.status.lower() in status_normalized]
-    if spec:
-      spec_upper = spec.upper()
-      audits = [
-        a
-        for a in audits
-        if a.relations
-        and any(spec_upper in str(rel.get("target", "")).upper() for rel in a.relations)
-      ]
-    if delta:
-      from supekku.cli.common import normalize_id  # noqa: PLC0415
-
-      delta_normalized = normalize_id("delta", delta)
-      audits = [
-        a
-        for a in audits
-        if a.relations
-        and any(
-          delta_normalized == str(rel.get("target", "")).upper() for rel in a.relations
-        )
-      ]
-    if tag:
-      audits = [a for a in audits if any(t in a.tags for t in tag)]
-    if substring:
-      filter_lower = substring.lower()
-      audits = [
-        a
-        for a in audits
-        if filter_lower in a.id.lower() or filter_lower in a.name.lower()
-      ]
-
-    # Apply regexp filter on id, slug, name
-    if regexp:
-      try:
-        audits = [
-          a
-          for a in audits
-          if matches_regexp(regexp, [a.id, a.slug, a.name], case_insensitive)
-        ]
-      except re.error as e:
-        typer.echo(f"Error: invalid regexp pattern: {e}", err=True)
-        raise typer.Exit(EXIT_FAILURE) from e
-
-    # Apply reverse reference filtering
-    if referenced_by or not_referenced_by:
-      ref_type = referenced_by or not_referenced_by
-      referrers = load_all_artifacts(root, ref_type)
-      referenced, unreferenced = partition_by_reverse_references(
-        audits,
-        referrers,
+    context = QueryContext(root)
+    try:
+      query = _review_query(
+        status=status,
+        spec=spec,
+        delta=delta,
+        tag=tag,
+        substring=substring,
+        regexp=regexp,
+        case_insensitive=case_insensitive,
+        referenced_by=referenced_by,
+        not_referenced_by=not_referenced_by,
       )
-      audits = referenced if referenced_by else unreferenced
+    except re.error as e:
+      typer.echo(f"Error: invalid regexp pattern: {e}", err=True)
+      raise typer.Exit(EXIT_FAILURE) from e
+    audits = query.run(context.changes("audit"), context)
 
     if not audits:
       raise typer.Exit(EXIT_SUCCESS)
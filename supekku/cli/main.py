@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import sys
+import traceback
+from pathlib import Path
+from typing import Annotated
 
 if sys.version_info < (3, 12):  # noqa: UP036 — defensive guard for broken installs
   sys.exit(
@@ -14,26 +17,14 @@ if sys.version_info < (3, 12):  # noqa: UP036 — defensive guard for broken ins
 import click
 import typer
 
-from spec_driver.presentation.cli.schema import app as schema_app
-from spec_driver.presentation.cli.validate import app as validate_app
-from supekku.cli import (
-  admin,
-  complete,
-  create,
-  edit,
-  find,
-  show,
-  sync,
-  view,
-  workflow,
-  workspace,
-)
-from supekku.cli import list as list_module
 from supekku.cli.common import VersionOption
+from supekku.cli.daemon import run_via_daemon
+from supekku.cli.lazy import LazySubcommand, lazy_group
 from supekku.scripts.lib.core.events import (
   command_was_invoked,
   emit_event,
   mark_command_invoked,
+  reset_command_state,
 )
 
 # Intercept leaf Command.invoke to set the command-invocation flag (DEC-052-01).
@@ -49,11 +40,122 @@ def _tracking_invoke(self, ctx):  # type: ignore[no-untyped-def]
 
 click.Command.invoke = _tracking_invoke  # type: ignore[assignment]
 
+# Top-level commands, imported only when dispatched (or listed by --help).
+# Each target is "module:attribute" naming a Typer sub-app or command function.
+_LAZY_SUBCOMMANDS = [
+  LazySubcommand(
+    "install",
+    "supekku.cli.workspace:install",
+    "Initialize spec-driver workspace structure and registry files",
+  ),
+  LazySubcommand(
+    "validate",
+    "spec_driver.presentation.cli.validate:app",
+    "Validate workspace artefacts, individual files, or templates",
+  ),
+  LazySubcommand(
+    "schema",
+    "spec_driver.presentation.cli.schema:app",
+    "Inspect frontmatter metadata schemas (enums, aliases, fields)",
+  ),
+  LazySubcommand(
+    "doctor",
+    "supekku.cli.workspace:doctor",
+    "Run workspace health diagnostics",
+  ),
+  LazySubcommand(
+    "sync",
+    "supekku.cli.sync:sync",
+    "Synchronize specifications and registries with source code",
+  ),
+  LazySubcommand(
+    "create",
+    "supekku.cli.create:app",
+    "Create new artifacts (specs, deltas, requirements, revisions, ADRs)",
+  ),
+  LazySubcommand(
+    "list",
+    "supekku.cli.list:app",
+    "List artifacts (specs, deltas, changes, adrs)",
+  ),
+  LazySubcommand(
+    "show",
+    "supekku.cli.show:app",
+    "Show detailed artifact information",
+  ),
+  LazySubcommand(
+    "view",
+    "supekku.cli.view:app",
+    "View artifacts (rendered markdown; use -p for pager)",
+  ),
+  LazySubcommand(
+    "read",
+    "supekku.cli.view:app",
+    "Read artifacts (alias for view)",
+  ),
+  LazySubcommand(
+    "edit",
+    "supekku.cli.edit:app",
+    "Edit artifacts in editor ($EDITOR)",
+  ),
+  LazySubcommand(
+    "find",
+    "supekku.cli.find:app",
+    "Find artifacts by ID across the repository",
+  ),
+  LazySubcommand(
+    "complete",
+    "supekku.cli.complete:app",
+    "Complete artifacts (mark deltas as completed)",
+  ),
+  LazySubcommand(
+    "admin",
+    "supekku.cli.admin:app",
+    "Workspace maintenance commands",
+  ),
+  LazySubcommand(
+    "phase",
+    "supekku.cli.workflow:phase_app",
+    "Workflow phase operations",
+  ),
+  LazySubcommand(
+    "workflow",
+    "supekku.cli.workflow:workflow_app",
+    "Workflow orchestration commands",
+  ),
+  LazySubcommand(
+    "accept",
+    "supekku.cli.workflow:accept_app",
+    "Accept workflow artifacts (handoffs)",
+  ),
+  LazySubcommand(
+    "review",
+    "supekku.cli.workflow:review_app",
+    "Review lifecycle commands",
+  ),
+  LazySubcommand(
+    "block",
+    "supekku.cli.workflow:block_command",
+    "Block a workflow (transitions to blocked state)",
+  ),
+  LazySubcommand(
+    "unblock",
+    "supekku.cli.workflow:unblock_command",
+    "Unblock a workflow (restores previous state)",
+  ),
+  LazySubcommand(
+    "serve",
+    "supekku.cli.serve:serve",
+    "Keep a warm workspace daemon answering read-only CLI requests",
+  ),
+]
+
 # Main Typer application
 app = typer.Typer(
   name="spec-driver",
   help="The specification-driving development toolkit.",
   no_args_is_help=True,
+  cls=lazy_group(_LAZY_SUBCOMMANDS),
 )
 
 
@@ -109,145 +211,95 @@ def _warn_if_version_stale(config: dict) -> None:
 
 
 @app.callback()
-def _app_callback(_version: VersionOption = None) -> None:
+def _app_callback(
+  _version: VersionOption = None,
+  profile: Annotated[
+    bool,
+    typer.Option(
+      "--profile",
+      help="Time command phases; print them to stderr and record them in the event",
+    ),
+  ] = False,
+  profile_dump: Annotated[
+    Path | None,
+    typer.Option(
+      "--profile-dump",
+      help="Also write a cProfile of the command to this file (implies --profile)",
+      dir_okay=False,
+    ),
+  ] = None,
+) -> None:
   """Process global options and initialize path configuration."""
-  config = _init_paths_from_config()
-  if config is not None:
-    _warn_if_version_stale(config)
-
-
-# Top-level commands
-app.command(
-  "install",
-  help="Initialize spec-driver workspace structure and registry files",
-)(workspace.install)
-
-app.add_typer(
-  validate_app,
-  name="validate",
-  help="Validate workspace artefacts, individual files, or templates",
-)
-
-app.add_typer(
-  schema_app,
-  name="schema",
-  help="Inspect frontmatter metadata schemas (enums, aliases, fields)",
-)
+  if profile or profile_dump is not None:
+    _start_profiling(profile_dump, report=True)
 
-app.command(
-  "doctor",
-  help="Run workspace health diagnostics",
-)(workspace.doctor)
-
-app.command(
-  "sync",
-  help="Synchronize specifications and registries with source code",
-)(sync.sync)
-
-# Add command groups with verb-noun structure
-app.add_typer(
-  create.app,
-  name="create",
-  help="Create new artifacts (specs, deltas, requirements, revisions, ADRs)",
-)
-
-app.add_typer(
-  list_module.app,
-  name="list",
-  help="List artifacts (specs, deltas, changes, adrs)",
-)
-
-app.add_typer(
-  show.app,
-  name="show",
-  help="Show detailed artifact information",
-)
+  from supekku.scripts.lib.core.profiling import profile_phase  # noqa: PLC0415
 
-app.add_typer(
-  view.app,
-  name="view",
-  help="View artifacts (rendered markdown; use -p for pager)",
-)
+  with profile_phase("config"):
+    config = _init_paths_from_config()
+  if config is not None:
+    _warn_if_version_stale(config)
 
-app.add_typer(
-  view.app,
-  name="read",
-  help="Read artifacts (alias for view)",
-)
 
-app.add_typer(
-  edit.app,
-  name="edit",
-  help="Edit artifacts in editor ($EDITOR)",
-)
+@app.command("tui", help="Launch the TUI artifact browser")
+def tui_command() -> None:
+  """Launch the interactive TUI artifact browser."""
+  from supekku.scripts.lib.core.repo import find_repo_root  # noqa: PLC0415
+  from supekku.tui.app import SpecDriverApp  # noqa: PLC0415
 
-app.add_typer(
-  find.app,
-  name="find",
-  help="Find artifacts by ID across the repository",
-)
+  root = find_repo_root()
+  app_instance = SpecDriverApp(root=root)
+  app_instance.run()
 
-app.add_typer(
-  complete.app,
-  name="complete",
-  help="Complete artifacts (mark deltas as completed)",
-)
 
-app.add_typer(
-  admin.app,
-  name="admin",
-  help="Workspace maintenance commands",
-)
+# Main entry point — process-boundary wrapper (DEC-052-01)
 
-app.add_typer(
-  workflow.phase_app,
-  name="phase",
-  help="Workflow phase operations",
-)
 
-app.add_typer(
-  workflow.workflow_app,
-  name="workflow",
-  help="Workflow orchestration commands",
-)
+# Whether the running command asked for its profile on stderr (--profile).
+_profile_report = False
 
-app.add_typer(
-  workflow.accept_app,
-  name="accept",
-  help="Accept workflow artifacts (handoffs)",
-)
 
-app.add_typer(
-  workflow.review_app,
-  name="review",
-  help="Review lifecycle commands",
-)
+def _start_profiling(dump_path: Path | None, *, report: bool = False) -> None:
+  """Start phase timing for this command, including CLI output."""
+  global _profile_report  # noqa: PLW0603
+  from supekku.scripts.lib.core.profiling import (  # noqa: PLC0415
+    activate_profiling,
+    instrument,
+  )
 
-app.command("block", help="Block a workflow (transitions to blocked state)")(
-  workflow.block_command
-)
+  activate_profiling(dump_path=dump_path)
+  instrument(typer, "echo", "output")
+  instrument(click, "echo", "output")
+  _profile_report = _profile_report or report
 
-app.command("unblock", help="Unblock a workflow (restores previous state)")(
-  workflow.unblock_command
-)
 
+def _start_profiling_from_env() -> None:
+  """Start profiling when ``SPEC_DRIVER_PROFILE[_DUMP]`` asks for it."""
+  from supekku.scripts.lib.core.profiling import profiling_requested  # noqa: PLC0415
 
-@app.command("tui", help="Launch the TUI artifact browser")
-def tui_command() -> None:
-  """Launch the interactive TUI artifact browser."""
-  from supekku.scripts.lib.core.repo import find_repo_root  # noqa: PLC0415
-  from supekku.tui.app import SpecDriverApp  # noqa: PLC0415
+  enabled, dump_path = profiling_requested()
+  if enabled:
+    _start_profiling(dump_path)
 
-  root = find_repo_root()
-  app_instance = SpecDriverApp(root=root)
-  app_instance.run()
 
+def _finish_profiling() -> dict | None:
+  """End profiling; print the summary when ``--profile`` asked for it."""
+  global _profile_report  # noqa: PLW0603
+  from supekku.scripts.lib.core.profiling import (  # noqa: PLC0415
+    deactivate_profiling,
+    format_profile,
+  )
 
-# Main entry point — process-boundary wrapper (DEC-052-01)
+  profile = deactivate_profiling()
+  if profile is not None and _profile_report:
+    sys.stderr.write(format_profile(profile) + "\n")
+  _profile_report = False
+  return profile
 
 
 def _emit(argv: list[str], exit_code: int | None) -> None:
   """Emit event if a leaf command was invoked and events are enabled."""
+  profile = _finish_profiling()
   if not command_was_invoked():
     return
   try:
@@ -260,13 +312,87 @@ def _emit(argv: list[str], exit_code: int | None) -> None:
   except Exception:  # noqa: BLE001
     pass  # Outside workspace or config error — still emit (fail-open)
 
-  code = exit_code if isinstance(exit_code, int) else (1 if exit_code else 0)
+  code = _exit_code(exit_code)
   status = "ok" if code == 0 else "error"
-  emit_event(argv=argv, exit_code=code, status=status)
+  emit_event(argv=argv, exit_code=code, status=status, profile=profile)
+
+
+def _exit_code(code: object) -> int:
+  """Normalise a ``SystemExit.code`` to an integer exit status."""
+  return code if isinstance(code, int) else (1 if code else 0)
+
+
+def invoke(argv: list[str]) -> int:
+  """Run the CLI for *argv* in this process and return its exit code.
+
+  Used by ``spec-driver serve`` to answer forwarded requests: per-command
+  event state is reset first, and the event is emitted as ``main()`` does.
+  """
+  from spec_driver.core.git import (  # noqa: PLC0415
+    activate_git_facts,
+    deactivate_git_facts,
+  )
+
+  reset_command_state()
+  _start_profiling_from_env()
+  activate_git_facts()
+  try:
+    app(args=argv, prog_name="spec-driver")
+  except SystemExit as exc:
+    if isinstance(exc.code, str):
+      sys.stderr.write(f"{exc.code}\n")
+    code = _exit_code(exc.code)
+  except Exception:  # noqa: BLE001
+    traceback.print_exc()
+    code = 1
+  else:
+    code = 0
+  finally:
+    deactivate_git_facts()
+  _emit(argv, code)
+  return code
+
+
+def _activate_parse_cache() -> None:
+  """Enable the workspace parse cache for this process (fail-open).
+
+  Skipped outside a workspace or when ``[cache] enabled = false``.
+  """
+  from spec_driver.core.parse_cache import activate_parse_cache  # noqa: PLC0415
+  from supekku.scripts.lib.core.config import load_workflow_config  # noqa: PLC0415
+  from supekku.scripts.lib.core.paths import get_spec_driver_root  # noqa: PLC0415
+  from supekku.scripts.lib.core.repo import find_repo_root  # noqa: PLC0415
+
+  try:
+    root = find_repo_root()
+    if not get_spec_driver_root(root).is_dir():
+      return
+    cache_config = load_workflow_config(root).get("cache", {})
+  except Exception:  # noqa: BLE001
+    return
+  if not cache_config.get("enabled", True):
+    return
+  activate_parse_cache(
+    root,
+    verify_content=bool(cache_config.get("verify_content", False)),
+  )
 
 
 def main() -> None:
   """Spec-driver CLI main entry point."""
+  from spec_driver.core.git import (  # noqa: PLC0415
+    activate_git_facts,
+    deactivate_git_facts,
+  )
+  from spec_driver.core.parse_cache import deactivate_parse_cache  # noqa: PLC0415
+
+  code = run_via_daemon(sys.argv[1:])
+  if code is not None:
+    sys.exit(code)
+
+  _start_profiling_from_env()
+  _activate_parse_cache()
+  activate_git_facts()
   try:
     app()
   except SystemExit as exc:
@@ -275,6 +401,9 @@ def main() -> None:
   except BaseException:
     _emit(sys.argv[1:], 1)
     raise
+  finally:
+    deactivate_git_facts()
+    deactivate_parse_cache()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,187 @@
+"""Shared query layer for the ``list`` commands.
+
+A :class:`ListQuery` holds one invocation's parsed filters. ``run`` pushes
+the indexable ones (IDs, statuses, tags) down to
+:meth:`ChangeRegistry.select`, checks the remaining predicates only on the
+survivors, and resolves ``--referenced-by`` against a reverse-reference
+target set rather than re-walking the referrers per candidate.
+
+A :class:`QueryContext` memoizes the registries and target sets an
+invocation touches, so a registry needed both as a filter source and for a
+rendered column (audits for ``list deltas --unaudited``) is loaded once.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from supekku.scripts.lib.relations.query import (
+  collect_reverse_reference_targets,
+  matches_related_to,
+  matches_relation,
+  partition_by_reference_targets,
+)
+
+if TYPE_CHECKING:
+  from pathlib import Path
+
+  from supekku.scripts.lib.changes.artifacts import ChangeArtifact
+  from supekku.scripts.lib.changes.registry import ChangeRegistry
+
+_CHANGE_KINDS = frozenset({"delta", "revision", "audit"})
+
+
+def compile_regexp(
+  pattern: str | None,
+  case_insensitive: bool = False,
+) -> re.Pattern[str] | None:
+  """Compile a ``--regexp`` pattern once per invocation.
+
+  Raises:
+    re.error: If the pattern is invalid.
+  """
+  if pattern is None:
+    return None
+  return re.compile(pattern, re.IGNORECASE if case_insensitive else 0)
+
+
+class QueryContext:
+  """Registries and reverse-reference indexes shared by one invocation.
+
+  Args:
+    root: Repository root as given on the command line (None: auto-detect).
+  """
+
+  def __init__(self, root: Path | None) -> None:
+    self.root = root
+    self._changes: dict[str, ChangeRegistry] = {}
+    self._targets: dict[str, frozenset[str]] = {}
+
+  def changes(self, kind: str) -> ChangeRegistry:
+    """Return the (memoized) change registry for *kind*."""
+    registry = self._changes.get(kind)
+    if registry is None:
+      from supekku.scripts.lib.changes.registry import (  # noqa: PLC0415
+        ChangeRegistry,
+      )
+
+      registry = self._changes[kind] = ChangeRegistry(root=self.root, kind=kind)
+    return registry
+
+  def referenced_ids(self, artifact_type: str) -> frozenset[str]:
+    """Uppercased IDs referenced by any artifact of *artifact_type*.
+
+    Raises:
+      typer.BadParameter: If *artifact_type* is unknown.
+    """
+    targets = self._targets.get(artifact_type)
+    if targets is None:
+      referrers: Iterable[Any]
+      if artifact_type in _CHANGE_KINDS:
+        referrers = self.changes(artifact_type).iter()
+      else:
+        from supekku.cli.artifacts import load_all_artifacts  # noqa: PLC0415
+
+        referrers = load_all_artifacts(self.root, artifact_type)
+      targets = frozenset(collect_reverse_reference_targets(referrers))
+      self._targets[artifact_type] = targets
+    return targets
+
+  def audited_delta_ids(self) -> set[str]:
+    """Delta IDs covered by completed audits (the ``list deltas`` Audit column)."""
+    from supekku.scripts.lib.changes.audit_check import (  # noqa: PLC0415
+      collect_audited_delta_ids,
+    )
+
+    return collect_audited_delta_ids(self.changes("audit").collect())
+
+
+@dataclass(frozen=True)
+class ListQuery:
+  """Filters of one ``list`` invocation, applied cheapest-first.
+
+  Attributes:
+    ids: Restrict to these IDs.
+    statuses: Keep any of these (canonical) statuses; empty keeps all.
+    hidden_statuses: Drop these statuses (e.g. completed by default).
+    tags: Keep artifacts carrying any of these tags; empty keeps all.
+    substring: Case-insensitive substring of ID or name.
+    regexp: Compiled pattern searched in ID, name and slug.
+    related_to: ID referenced in any reference slot.
+    relation: ``(type, target)`` matched against ``.relations`` only.
+    predicates: Command-specific checks, all of which must pass.
+    referenced_by: Keep artifacts referenced by artifacts of this type.
+    not_referenced_by: Keep artifacts not referenced by this type.
+  """
+
+  ids: Sequence[str] | None = None
+  statuses: frozenset[str] = frozenset()
+  hidden_statuses: frozenset[str] = frozenset()
+  tags: Sequence[str] = ()
+  substring: str | None = None
+  regexp: re.Pattern[str] | None = None
+  related_to: str | None = None
+  relation: tuple[str, str] | None = None
+  predicates: Sequence[Callable[[Any], bool]] = ()
+  referenced_by: str | None = None
+  not_referenced_by: str | None = None
+
+  def matches(self, artifact: Any) -> bool:
+    """Check the non-indexed filters against one artifact."""
+    if self.substring:
+      needle = self.substring.lower()
+      if needle not in artifact.id.lower() and needle not in artifact.name.lower():
+        return False
+    if self.regexp is not None and not any(
+      self.regexp.search(value)
+      for value in (artifact.id, artifact.name, artifact.slug)
+      if value
+    ):
+      return False
+    if not all(predicate(artifact) for predicate in self.predicates):
+      return False
+    if self.related_to and not matches_related_to(artifact, self.related_to):
+      return False
+    if self.relation is not None:
+      rel_type, rel_target = self.relation
+      if not matches_relation(artifact, relation_type=rel_type, target=rel_target):
+        return False
+    return True
+
+  def run(
+    self, registry: ChangeRegistry, context: QueryContext
+  ) -> list[ChangeArtifact]:
+    """Execute the query against a change registry."""
+    candidates = registry.select(
+      ids=self.ids,
+      statuses=self.statuses or None,
+      exclude_statuses=self.hidden_statuses,
+      tags=self.tags or None,
+    )
+    return self.filter_references(
+      [artifact for artifact in candidates if self.matches(artifact)],
+      context,
+    )
+
+  def filter_references[T](
+    self,
+    candidates: Sequence[T],
+    context: QueryContext,
+    candidate_id_fn: Callable[[T], str] = lambda c: c.id,  # type: ignore[attr-defined]
+  ) -> list[T]:
+    """Apply ``referenced_by`` / ``not_referenced_by`` to *candidates*."""
+    ref_type = self.referenced_by or self.not_referenced_by
+    if not ref_type:
+      return list(candidates)
+    referenced, unreferenced = partition_by_reference_targets(
+      candidates,
+      context.referenced_ids(ref_type),
+      candidate_id_fn,
+    )
+    return referenced if self.referenced_by else unreferenced
+
+
+__all__ = ["ListQuery", "QueryContext", "compile_regexp"]
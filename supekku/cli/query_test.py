@@ -0,0 +1,163 @@
+"""Tests for the shared ``list`` query layer."""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from supekku.cli.query import ListQuery, QueryContext, compile_regexp
+from supekku.scripts.lib.changes import registry as registry_module
+from supekku.scripts.lib.core.paths import DELTAS_SUBDIR, SPEC_DRIVER_DIR
+
+
+def _write_change(
+  root: Path,
+  subdir: str,
+  artifact_id: str,
+  *,
+  kind: str,
+  status: str = "draft",
+  name: str = "",
+  tags: list[str] | None = None,
+  relations: list[dict[str, str]] | None = None,
+  **extra: str,
+) -> None:
+  bundle = root / SPEC_DRIVER_DIR / subdir / f"{artifact_id}-sample"
+  bundle.mkdir(parents=True, exist_ok=True)
+  frontmatter = {
+    "id": artifact_id,
+    "slug": f"{artifact_id.lower()}-sample",
+    "name": name or artifact_id,
+    "created": "2026-03-01",
+    "updated": "2026-03-02",
+    "status": status,
+    "kind": kind,
+    "tags": tags or [],
+    "relations": relations or [],
+    **extra,
+  }
+  (bundle / f"{artifact_id}.md").write_text(
+    f"---\n{yaml.safe_dump(frontmatter)}---\n\n# {artifact_id}\n",
+    encoding="utf-8",
+  )
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+  (tmp_path / ".git").mkdir()
+  _write_change(
+    tmp_path, DELTAS_SUBDIR, "DE-001", kind="delta", name="Parser", tags=["api"]
+  )
+  _write_change(
+    tmp_path,
+    DELTAS_SUBDIR,
+    "DE-002",
+    kind="delta",
+    status="completed",
+    name="Renderer",
+    relations=[{"type": "relates_to", "target": "IMPR-006"}],
+  )
+  _write_change(
+    tmp_path, DELTAS_SUBDIR, "DE-003", kind="delta", status="completed", name="Docs"
+  )
+  _write_change(
+    tmp_path,
+    "audits",
+    "AUD-001",
+    kind="audit",
+    status="completed",
+    relations=[{"type": "audits", "target": "DE-002"}],
+    delta_ref="DE-002",
+  )
+  return tmp_path
+
+
+def _ids(artifacts) -> list[str]:
+  return sorted(a.id for a in artifacts)
+
+
+class TestListQuery:
+  """Indexed criteria and residual predicates combine with AND."""
+
+  def _run(self, root: Path, query: ListQuery) -> list[str]:
+    context = QueryContext(root)
+    return _ids(query.run(context.changes("delta"), context))
+
+  def test_empty_query_returns_everything(self, workspace: Path) -> None:
+    assert self._run(workspace, ListQuery()) == ["DE-001", "DE-002", "DE-003"]
+
+  def test_status_and_hidden_statuses(self, workspace: Path) -> None:
+    query = ListQuery(hidden_statuses=frozenset({"completed"}))
+    assert self._run(workspace, query) == ["DE-001"]
+    query = ListQuery(statuses=frozenset({"completed"}))
+    assert self._run(workspace, query) == ["DE-002", "DE-003"]
+
+  def test_residual_filters(self, workspace: Path) -> None:
+    assert self._run(workspace, ListQuery(substring="rend")) == ["DE-002"]
+    assert self._run(workspace, ListQuery(tags=["api"])) == ["DE-001"]
+    pattern = compile_regexp("^docs$", case_insensitive=True)
+    assert self._run(workspace, ListQuery(regexp=pattern)) == ["DE-003"]
+    query = ListQuery(relation=("relates_to", "impr-006"))
+    assert self._run(workspace, query) == ["DE-002"]
+    assert self._run(workspace, ListQuery(related_to="IMPR-006")) == ["DE-002"]
+    query = ListQuery(predicates=[lambda a: a.id != "DE-001"], substring="de-00")
+    assert self._run(workspace, query) == ["DE-002", "DE-003"]
+
+  def test_referenced_by(self, workspace: Path) -> None:
+    assert self._run(workspace, ListQuery(referenced_by="audit")) == ["DE-002"]
+    query = ListQuery(not_referenced_by="audit")
+    assert self._run(workspace, query) == ["DE-001", "DE-003"]
+
+  def test_filter_references_with_custom_id(self, workspace: Path) -> None:
+    candidates = [{"uid": "de-002"}, {"uid": "DE-003"}]
+    kept = ListQuery(referenced_by="audit").filter_references(
+      candidates, QueryContext(workspace), candidate_id_fn=lambda c: c["uid"]
+    )
+    assert kept == [{"uid": "de-002"}]
+
+  def test_invalid_regexp_raises(self) -> None:
+    with pytest.raises(re.error):
+      compile_regexp("[unclosed")
+    assert compile_regexp(None) is None
+
+
+class TestQueryContext:
+  """Registries and target sets are loaded once per invocation."""
+
+  def test_audits_loaded_once_for_filter_and_column(self, workspace: Path) -> None:
+    context = QueryContext(workspace)
+    loads: list[str] = []
+    original = registry_module.load_change_artifact
+
+    def _counting_load(path: Path):
+      loads.append(path.name)
+      return original(path)
+
+    with patch.object(registry_module, "load_change_artifact", _counting_load):
+      deltas = ListQuery(not_referenced_by="audit").run(
+        context.changes("delta"), context
+      )
+      assert context.audited_delta_ids() == {"DE-002"}
+      assert context.referenced_ids("audit") >= {"DE-002"}
+
+    assert _ids(deltas) == ["DE-001", "DE-003"]
+    assert loads.count("AUD-001.md") == 1
+
+  def test_ids_read_only_requested_bundles(self, workspace: Path) -> None:
+    context = QueryContext(workspace)
+    loads: list[str] = []
+    original = registry_module.load_change_artifact
+
+    def _counting_load(path: Path):
+      loads.append(path.name)
+      return original(path)
+
+    with patch.object(registry_module, "load_change_artifact", _counting_load):
+      found = ListQuery(ids=["DE-003"]).run(context.changes("delta"), context)
+
+    assert _ids(found) == ["DE-003"]
+    assert loads == ["DE-003.md"]
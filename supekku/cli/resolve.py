@@ -2,29 +2,21 @@
 
 from __future__ import annotations
 
-import logging
 from pathlib import Path
 from typing import Annotated
 
 import typer
 
+from supekku.cli.artifact_index import ArtifactIndex, build_artifact_index
 from supekku.cli.common import EXIT_FAILURE, EXIT_SUCCESS
-from supekku.scripts.lib.changes.registry import ChangeRegistry
 from supekku.scripts.lib.core.paths import get_memory_dir
 from supekku.scripts.lib.core.repo import find_repo_root
 from supekku.scripts.lib.core.spec_utils import (
   dump_markdown_file_update,
   load_markdown_file,
 )
-from supekku.scripts.lib.decisions.registry import DecisionRegistry
 from supekku.scripts.lib.memory.links import links_to_frontmatter, resolve_all_links
 from supekku.scripts.lib.memory.registry import MemoryRegistry
-from supekku.scripts.lib.specs.registry import SpecRegistry
-
-log = logging.getLogger(__name__)
-
-ArtifactIndex = dict[str, tuple[str, str]]
-"""Artifact ID → (relative_path, kind)."""
 
 app = typer.Typer(help="Resolve cross-references", no_args_is_help=True)
 
@@ -144,100 +136,6 @@ def _resolve_memory_path(root: Path, mem_id: str) -> Path:
   return path
 
 
-# ── Artifact index collectors ──────────────────────────────────
-
-
-def _collect_memory_artifacts(root: Path, index: ArtifactIndex) -> None:
-  """Add memory records to the artifact index."""
-  registry = MemoryRegistry(root=root)
-  for mem_id, record in registry.collect().items():
-    rel_path = str(Path(record.path).relative_to(root))
-    index[mem_id] = (rel_path, "memory")
-
-
-def _collect_decisions(root: Path, index: ArtifactIndex) -> None:
-  """Add ADR decisions to the artifact index."""
-  try:
-    registry = DecisionRegistry(root=root)
-    for decision in registry.iter():
-      if decision.path:
-        rel = str(Path(decision.path).relative_to(root))
-        index[decision.id] = (rel, "adr")
-  except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
-    log.debug("Skipping decisions registry", exc_info=True)
-
-
-def _collect_specs(root: Path, index: ArtifactIndex) -> None:
-  """Add specs to the artifact index."""
-  try:
-    registry = SpecRegistry(root=root)
-    for spec in registry.all_specs():
-      rel = str(spec.path.relative_to(root))
-      index[spec.id] = (rel, "spec")
-  except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
-    log.debug("Skipping specs registry", exc_info=True)
-
-
-def _collect_changes(root: Path, index: ArtifactIndex) -> None:
-  """Add change artifacts (deltas, revisions, audits) to the artifact index."""
-  try:
-    for kind in ("delta", "revision", "audit"):
-      registry = ChangeRegistry(root=root, kind=kind)
-      for artifact_id, artifact in registry.collect().items():
-        rel = str(artifact.path.relative_to(root))
-        index[artifact_id] = (rel, kind)
-  except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
-    log.debug("Skipping changes registry", exc_info=True)
-
-
-def _collect_backlog_items(root: Path, index: ArtifactIndex) -> None:
-  """Add backlog items to the artifact index."""
-  try:
-    from supekku.scripts.lib.backlog.registry import BacklogRegistry  # noqa: PLC0415
-
-    registry = BacklogRegistry(root=root)
-    for item_id, item in registry.collect().items():
-      rel = str(item.path.relative_to(root))
-      index[item_id] = (rel, item.kind)
-  except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
-    log.debug("Skipping backlog registry", exc_info=True)
-
-
-def _collect_drift_ledgers(root: Path, index: ArtifactIndex) -> None:
-  """Add drift ledgers to the artifact index."""
-  try:
-    from supekku.scripts.lib.drift.registry import DriftLedgerRegistry  # noqa: PLC0415
-
-    registry = DriftLedgerRegistry(root=root)
-    for ledger_id, ledger in registry.collect().items():
-      rel = str(ledger.path.relative_to(root))
-      index[ledger_id] = (rel, "drift_ledger")
-  except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
-    log.debug("Skipping drift ledger registry", exc_info=True)
-
-
-def build_artifact_index(root: Path) -> ArtifactIndex:
-  """Build artifact ID → (relative_path, kind) index.
-
-  Collects IDs from all known registries: decisions, specs,
-  deltas, revisions, audits, memory records, and backlog items.
-
-  Args:
-    root: Repository root path.
-
-  Returns:
-    Dict mapping artifact ID to (relative_path, kind).
-  """
-  index: ArtifactIndex = {}
-  _collect_memory_artifacts(root, index)
-  _collect_decisions(root, index)
-  _collect_specs(root, index)
-  _collect_changes(root, index)
-  _collect_backlog_items(root, index)
-  _collect_drift_ledgers(root, index)
-  return index
-
-
 # ── Link resolution ────────────────────────────────────────────
 
 
@@ -0,0 +1,329 @@
+"""``spec-driver serve`` — warm workspace daemon for agent sessions.
+
+Agents shell out to ``spec-driver`` for every ``list``/``show``/``find`` and
+each call pays interpreter start-up, imports and a cold registry load. The
+daemon keeps one interpreter alive per workspace:
+
+- every command module is imported once;
+- the markdown parse cache stays in memory, so registries rebuilt by each
+  command read unchanged files without touching PyYAML;
+- a watchfiles thread drops cached parses of artefacts as soon as they
+  are written.
+
+Requests arrive on ``.spec-driver/run/cli.sock`` (see
+:mod:`supekku.cli.daemon`) and run one at a time through the same Typer app
+as the in-process CLI, with stdout/stderr captured and sent back.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import logging
+import os
+import socketserver
+import threading
+from collections.abc import Generator
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+
+from supekku.cli.common import RootOption
+from supekku.cli.daemon import (
+  DAEMON_COMMANDS,
+  PROTOCOL_VERSION,
+  DaemonError,
+  encode_message,
+  get_socket_path,
+  is_daemon_command,
+  read_message,
+  request,
+)
+from supekku.scripts.lib.core.paths import get_run_dir
+from supekku.scripts.lib.core.repo import find_repo_root
+
+logger = logging.getLogger(__name__)
+
+
+class DaemonAlreadyRunningError(RuntimeError):
+  """Raised when a live daemon already owns the workspace socket."""
+
+
+@contextlib.contextmanager
+def _request_scope(cwd: str, env: dict[str, str]) -> Generator[None]:
+  """Apply a client's working directory and environment for one request."""
+  saved_cwd = Path.cwd()
+  saved_env = {name: os.environ.get(name) for name in env}
+  os.environ.update(env)
+  os.chdir(cwd)
+  try:
+    yield
+  finally:
+    os.chdir(saved_cwd)
+    for name, value in saved_env.items():
+      if value is None:
+        os.environ.pop(name, None)
+      else:
+        os.environ[name] = value
+
+
+class _Handler(socketserver.StreamRequestHandler):
+  """Read one request, answer it, close the connection."""
+
+  server: _UnixServer
+
+  def handle(self) -> None:
+    try:
+      message = read_message(self.request)
+    except DaemonError:
+      return
+    reply = self.server.daemon.handle(message)
+    with contextlib.suppress(OSError):
+      self.request.sendall(encode_message({"v": PROTOCOL_VERSION, **reply}))
+
+
+class _UnixServer(socketserver.UnixStreamServer):
+  def __init__(self, path: str, daemon: CliDaemon) -> None:
+    self.daemon = daemon
+    super().__init__(path, _Handler)
+
+
+class CliDaemon:
+  """Warm spec-driver process answering CLI requests for one workspace.
+
+  Args:
+    root: Workspace root.
+    watch: Start the watchfiles invalidator thread.
+  """
+
+  def __init__(self, root: Path, *, watch: bool = True) -> None:
+    self.root = Path(root).resolve()
+    self.socket_path = get_socket_path(self.root)
+    self._watch = watch
+    self._lock = threading.Lock()
+    self._server: _UnixServer | None = None
+    self._stop_watching = threading.Event()
+    self._watcher: threading.Thread | None = None
+    self.requests_served = 0
+
+  # --- lifecycle ---
+
+  def start(self) -> None:
+    """Warm caches and bind the socket.
+
+    Raises:
+      DaemonAlreadyRunningError: If another daemon answers on the socket.
+    """
+    self._claim_socket()
+    self._warm()
+    self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+    self._server = _UnixServer(str(self.socket_path), self)
+    if self._watch:
+      self._watcher = threading.Thread(
+        target=self._watch_files,
+        name="spec-driver-serve-watch",
+        daemon=True,
+      )
+      self._watcher.start()
+
+  def serve_forever(self) -> None:
+    """Answer requests until :meth:`shutdown` is called (or a ``stop`` op)."""
+    if self._server is None:
+      self.start()
+    server = self._server
+    if server is None:
+      return
+    try:
+      server.serve_forever()
+    finally:
+      self.close()
+
+  def shutdown(self) -> None:
+    """Stop :meth:`serve_forever` from another thread."""
+    if self._server is not None:
+      self._server.shutdown()
+
+  def close(self) -> None:
+    """Release the socket, stop watching and persist the parse cache."""
+    from spec_driver.core.parse_cache import deactivate_parse_cache  # noqa: PLC0415
+
+    self._stop_watching.set()
+    if self._server is not None:
+      self._server.server_close()
+      self._server = None
+      self.socket_path.unlink(missing_ok=True)
+    with self._lock:
+      deactivate_parse_cache()
+
+  def _claim_socket(self) -> None:
+    if not self.socket_path.exists():
+      return
+    try:
+      request(self.socket_path, {"op": "ping"}, timeout=2.0)
+    except DaemonError:
+      self.socket_path.unlink(missing_ok=True)  # stale, left by a crash
+      return
+    msg = f"spec-driver serve is already running on {self.socket_path}"
+    raise DaemonAlreadyRunningError(msg)
+
+  def _warm(self) -> None:
+    """Import the command modules and activate the parse cache."""
+    from spec_driver.core.parse_cache import activate_parse_cache  # noqa: PLC0415
+    from supekku.cli.main import _LAZY_SUBCOMMANDS  # noqa: PLC0415
+    from supekku.scripts.lib.core.config import load_workflow_config  # noqa: PLC0415
+    from supekku.scripts.lib.core.paths import init_paths  # noqa: PLC0415
+
+    config = load_workflow_config(self.root)
+    init_paths(config)
+    cache_config = config.get("cache", {})
+    if cache_config.get("enabled", True):
+      activate_parse_cache(
+        self.root,
+        verify_content=bool(cache_config.get("verify_content", False)),
+      )
+    for sub in _LAZY_SUBCOMMANDS:
+      if sub.name in DAEMON_COMMANDS:
+        sub.load()
+
+  # --- requests ---
+
+  def handle(self, message: dict[str, Any]) -> dict[str, Any]:
+    """Answer one decoded request; never raises."""
+    if message.get("v") != PROTOCOL_VERSION:
+      return {"error": f"unsupported protocol version {message.get('v')!r}"}
+    op = message.get("op")
+    if op == "ping":
+      return self._status()
+    if op == "stop":
+      threading.Thread(target=self.shutdown, daemon=True).start()
+      return {"ok": True}
+    if op == "run":
+      return self._run(message)
+    return {"error": f"unknown op {op!r}"}
+
+  def _status(self) -> dict[str, Any]:
+    return {
+      "ok": True,
+      "pid": os.getpid(),
+      "root": str(self.root),
+      "requests": self.requests_served,
+    }
+
+  def _run(self, message: dict[str, Any]) -> dict[str, Any]:
+    from supekku.cli.main import invoke  # noqa: PLC0415
+
+    argv = message.get("argv")
+    cwd = message.get("cwd")
+    env = message.get("env") or {}
+    if (
+      not isinstance(argv, list)
+      or not argv
+      or not all(isinstance(arg, str) for arg in argv)
+      or not is_daemon_command(argv)
+    ):
+      return {"error": "command not served by the daemon"}
+    if not isinstance(cwd, str) or not isinstance(env, dict):
+      return {"error": "malformed run request"}
+    try:
+      if find_repo_root(Path(cwd)) != self.root:
+        return {"error": f"{cwd} is outside {self.root}"}
+    except RuntimeError:
+      return {"error": f"{cwd} is outside {self.root}"}
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with (
+      self._lock,
+      _request_scope(cwd, {str(k): str(v) for k, v in env.items()}),
+      contextlib.redirect_stdout(stdout),
+      contextlib.redirect_stderr(stderr),
+    ):
+      exit_code = invoke(argv)
+    self.requests_served += 1
+    return {
+      "exit_code": exit_code,
+      "stdout": stdout.getvalue(),
+      "stderr": stderr.getvalue(),
+    }
+
+  # --- invalidation ---
+
+  def _watch_files(self) -> None:
+    from watchfiles import watch  # noqa: PLC0415
+
+    run_dir = str(get_run_dir(self.root)) + os.sep
+
+    def _filter(_change: int, path: str) -> bool:
+      # The daemon's own socket and cache writes live under run/.
+      return not path.startswith(run_dir) and "/.spec-driver/" in path
+
+    try:
+      for changes in watch(
+        self.root,
+        watch_filter=_filter,
+        stop_event=self._stop_watching,
+      ):
+        self.refresh({Path(path) for _change, path in changes})
+    except Exception:  # noqa: BLE001
+      logger.debug("serve file watcher stopped", exc_info=True)
+
+  def refresh(self, paths: set[Path]) -> None:
+    """Drop cached parses for *paths* so the next request re-reads them."""
+    from spec_driver.core.parse_cache import get_active_parse_cache  # noqa: PLC0415
+
+    with self._lock:
+      cache = get_active_parse_cache()
+      if cache is not None:
+        for path in paths:
+          cache.invalidate(path)
+
+
+def serve(
+  root: RootOption = None,
+  stop: Annotated[
+    bool,
+    typer.Option("--stop", help="Stop the daemon serving this workspace"),
+  ] = False,
+  status: Annotated[
+    bool,
+    typer.Option("--status", help="Report whether a daemon is serving"),
+  ] = False,
+) -> None:
+  """Run a warm daemon that answers read-only CLI requests.
+
+  While it runs, read-only ``list``, ``show``, ``find`` and ``schema``
+  invocations whose output is not a terminal are answered by the daemon;
+  ``--prioritize`` and ``--pager`` still run in-process. Without a daemon
+  the CLI runs in-process as usual. Set SPEC_DRIVER_DAEMON=0 to bypass a
+  running daemon.
+  """
+  workspace_root = find_repo_root(root)
+  socket_path = get_socket_path(workspace_root)
+
+  if stop or status:
+    try:
+      reply = request(socket_path, {"op": "stop" if stop else "ping"}, timeout=5.0)
+    except DaemonError:
+      typer.echo("spec-driver serve: not running")
+      raise typer.Exit(1) from None
+    if stop:
+      typer.echo("spec-driver serve: stopping")
+    else:
+      typer.echo(
+        f"spec-driver serve: pid {reply.get('pid')}, "
+        f"{reply.get('requests')} requests served"
+      )
+    return
+
+  daemon = CliDaemon(workspace_root)
+  try:
+    daemon.start()
+  except DaemonAlreadyRunningError as exc:
+    typer.echo(str(exc), err=True)
+    raise typer.Exit(1) from None
+  typer.echo(f"spec-driver serve: listening on {socket_path}", err=True)
+  with contextlib.suppress(KeyboardInterrupt):
+    daemon.serve_forever()
+
+
+__all__ = ["CliDaemon", "DaemonAlreadyRunningError", "serve"]
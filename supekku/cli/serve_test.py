@@ -0,0 +1,214 @@
+"""Tests for the ``spec-driver serve`` daemon and its CLI client."""
+
+from __future__ import annotations
+
+import io
+import threading
+from pathlib import Path
+
+import pytest
+
+from supekku.cli.daemon import (
+  DAEMON_ENV_VAR,
+  PROTOCOL_VERSION,
+  DaemonError,
+  get_socket_path,
+  request,
+  run_via_daemon,
+  should_use_daemon,
+)
+from supekku.cli.serve import CliDaemon, DaemonAlreadyRunningError
+
+ADR = """---
+id: ADR-001
+title: "ADR-001: {title}"
+status: accepted
+---
+
+# ADR-001: {title}
+"""
+
+
+class _Pipe(io.StringIO):
+  """Captured stdout that is not a terminal (the agent case)."""
+
+  def isatty(self) -> bool:
+    return False
+
+
+@pytest.fixture
+def workspace(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+  root = tmp_path / "ws"
+  (root / ".git").mkdir(parents=True)
+  decisions = root / ".spec-driver" / "decisions"
+  decisions.mkdir(parents=True)
+  (decisions / "ADR-001-first.md").write_text(
+    ADR.format(title="first"), encoding="utf-8"
+  )
+  monkeypatch.chdir(root)
+  monkeypatch.delenv(DAEMON_ENV_VAR, raising=False)
+  return root
+
+
+@pytest.fixture
+def running(workspace: Path):
+  daemon = CliDaemon(workspace, watch=False)
+  daemon.start()
+  thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+  thread.start()
+  yield daemon
+  daemon.shutdown()
+  thread.join(timeout=5)
+
+
+class TestShouldUseDaemon:
+  """Only read-only, non-interactive invocations are forwarded."""
+
+  @pytest.fixture(autouse=True)
+  def _piped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(DAEMON_ENV_VAR, raising=False)
+    monkeypatch.setattr("sys.stdout", _Pipe())
+
+  def test_read_only_command(self) -> None:
+    assert should_use_daemon(["list", "adrs"])
+
+  @pytest.mark.parametrize(
+    "argv",
+    [
+      [],
+      ["list"],
+      ["create", "adr"],
+      ["view", "ADR-001"],
+      ["list", "adrs", "--help"],
+      ["list", "backlog", "--prioritize"],
+      ["list", "issues", "--pager"],
+      ["list", "risks", "-aP"],
+    ],
+  )
+  def test_not_forwarded(self, argv: list[str]) -> None:
+    assert not should_use_daemon(argv)
+
+  def test_short_flag_meaning_depends_on_subcommand(self) -> None:
+    assert should_use_daemon(["list", "memories", "-p", "src/"])
+
+  def test_env_var_disables(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(DAEMON_ENV_VAR, "0")
+    assert not should_use_daemon(["list", "adrs"])
+
+  def test_terminal_output_runs_in_process(
+    self, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
+    tty = _Pipe()
+    monkeypatch.setattr(tty, "isatty", lambda: True)
+    monkeypatch.setattr("sys.stdout", tty)
+    assert not should_use_daemon(["list", "adrs"])
+
+
+class TestFallback:
+  """Without a live daemon the CLI runs in-process."""
+
+  def test_no_socket(self, workspace: Path) -> None:
+    assert run_via_daemon(["list", "adrs"]) is None
+
+  def test_stale_socket_file(
+    self, workspace: Path, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
+    monkeypatch.setattr("sys.stdout", _Pipe())
+    socket_path = get_socket_path(workspace)
+    socket_path.parent.mkdir(parents=True)
+    socket_path.touch()
+
+    assert run_via_daemon(["list", "adrs"]) is None
+
+  def test_request_raises_daemon_error(self, workspace: Path) -> None:
+    with pytest.raises(DaemonError):
+      request(get_socket_path(workspace), {"op": "ping"}, timeout=1.0)
+
+
+class TestCliDaemon:
+  """End-to-end requests against a daemon running in a thread."""
+
+  def test_ping_reports_status(self, running: CliDaemon) -> None:
+    reply = request(running.socket_path, {"op": "ping"}, timeout=5.0)
+
+    assert reply["v"] == PROTOCOL_VERSION
+    assert reply["ok"] is True
+    assert reply["root"] == str(running.root)
+    assert reply["requests"] == 0
+
+  def test_run_via_daemon_replays_output(
+    self, running: CliDaemon, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
+    out = _Pipe()
+    monkeypatch.setattr("sys.stdout", out)
+
+    code = run_via_daemon(["find", "adr", "ADR-001"])
+
+    assert code == 0
+    assert "ADR-001-first.md" in out.getvalue()
+    assert running.requests_served == 1
+
+  def test_nonzero_exit_code_is_forwarded(self, running: CliDaemon) -> None:
+    reply = request(
+      running.socket_path,
+      {"op": "run", "argv": ["show", "adr", "ADR-999"], "cwd": str(running.root)},
+      timeout=30.0,
+    )
+
+    assert reply["exit_code"] != 0
+
+  def test_refuses_commands_outside_allowlist(self, running: CliDaemon) -> None:
+    reply = request(
+      running.socket_path,
+      {"op": "run", "argv": ["create", "adr", "x"], "cwd": str(running.root)},
+      timeout=5.0,
+    )
+
+    assert "error" in reply
+    assert "exit_code" not in reply
+
+  def test_prioritize_runs_in_process(
+    self, running: CliDaemon, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
+    monkeypatch.setattr("sys.stdout", _Pipe())
+
+    assert run_via_daemon(["list", "backlog", "-p"]) is None
+    reply = request(
+      running.socket_path,
+      {"op": "run", "argv": ["list", "backlog", "-p"], "cwd": str(running.root)},
+      timeout=5.0,
+    )
+
+    assert "exit_code" not in reply
+    assert running.requests_served == 0
+
+  def test_refresh_picks_up_edits(self, running: CliDaemon) -> None:
+    adr = running.root / ".spec-driver" / "decisions" / "ADR-001-first.md"
+    adr.write_text(ADR.format(title="renamed"), encoding="utf-8")
+    running.refresh({adr})
+
+    reply = request(
+      running.socket_path,
+      {"op": "run", "argv": ["list", "adrs"], "cwd": str(running.root)},
+      timeout=30.0,
+    )
+
+    assert reply["exit_code"] == 0
+    assert "renamed" in reply["stdout"]
+
+  def test_second_daemon_is_refused(self, running: CliDaemon) -> None:
+    with pytest.raises(DaemonAlreadyRunningError):
+      CliDaemon(running.root, watch=False).start()
+
+  def test_stop_op_removes_socket(self, workspace: Path) -> None:
+    daemon = CliDaemon(workspace, watch=False)
+    daemon.start()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+
+    request(daemon.socket_path, {"op": "stop"}, timeout=5.0)
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert not daemon.socket_path.exists()
+    assert run_via_daemon(["list", "adrs"]) is None
@@ -684,15 +684,12 @@ def show_memory(  # noqa: PLR0913
         format_link_graph_table,
         format_link_graph_tree,
       )
-      from supekku.scripts.lib.memory.links import expand_link_graph  # noqa: PLC0415
 
       all_records = registry.collect()
-      bodies = registry.collect_bodies()
       names = {mid: r.name for mid, r in all_records.items()}
       types = {mid: r.memory_type for mid, r in all_records.items()}
-      nodes = expand_link_graph(
+      nodes = registry.link_graph().expand(
         normalized_id,
-        bodies,
         names,
         types,
         max_depth=links_depth,
@@ -1050,7 +1047,7 @@ def show_relations(
     normalize_artifact_id,
   )
   from supekku.scripts.lib.relations.graph import (  # noqa: PLC0415
-    build_reference_graph,
+    load_reference_graph,
     query_neighbourhood,
   )
   from supekku.scripts.lib.workspace import Workspace  # noqa: PLC0415
@@ -1066,7 +1063,7 @@ def show_relations(
   try:
     repo_root = find_repo_root(root)
     workspace = Workspace(root=repo_root)
-    graph = build_reference_graph(workspace)
+    graph = load_reference_graph(workspace)
 
     # Try normalization if ID not in graph
     resolved_id = artifact_id
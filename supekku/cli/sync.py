@@ -123,6 +123,23 @@ def sync(
       help="Allow pruning of non-stub specs (requires --prune)",
     ),
   ] = False,
+  incremental: Annotated[
+    bool,
+    typer.Option(
+      "--incremental",
+      help="Only re-read requirement sources changed since the last sync",
+    ),
+  ] = False,
+  jobs: Annotated[
+    int,
+    typer.Option(
+      "--jobs",
+      "-j",
+      min=0,
+      metavar="N",
+      help="Parallel contract generation workers (0: one per CPU, 1: serial)",
+    ),
+  ] = 0,
 ) -> None:
   """Synchronize specifications and registries with source code.
 
@@ -211,6 +228,7 @@ def sync(
         force=force,
         create_specs=resolved_specs,
         generate_contracts=contracts,
+        jobs=jobs,
       )
       results["specs"] = spec_result
     except (FileNotFoundError, ValueError, KeyError) as e:
@@ -238,7 +256,7 @@ def sync(
   # Always sync requirements from specs
   typer.echo("Synchronizing requirements registry...")
   try:
-    req_result = _sync_requirements(root=root)
+    req_result = _sync_requirements(root=root, incremental=incremental)
     results["requirements"] = req_result
   except Exception as e:
     typer.echo(f"Error syncing requirements: {e}", err=True)
@@ -286,8 +304,14 @@ def _sync_specs(
   force: bool,
   create_specs: bool = True,
   generate_contracts: bool = True,
+  jobs: int | None = 1,
 ) -> dict:
-  """Execute spec synchronization."""
+  """Execute spec synchronization.
+
+  Contract generation for a language's source units runs on up to *jobs*
+  worker threads (None or 0: one per CPU); results are reported in
+  discovery order.
+  """
   # Initialize spec sync engine and spec manager
   engine = SpecSyncEngine(
     repo_root=root,
@@ -442,17 +466,21 @@ def _sync_specs(
     created_specs = {}
     skipped_units = []
 
-    for unit in source_units:
-      typer.echo(f"Processing {unit.identifier}...")
-
-      result = spec_manager.process_source_unit(
-        unit,
+    try:
+      unit_results = spec_manager.process_source_units(
+        source_units,
         adapter,
         check_mode=check,
         dry_run=dry_run,
         generate_contracts=generate_contracts,
         create_specs=create_specs,
+        jobs=jobs,
       )
+    finally:
+      adapter.close()
+
+    for unit, result in zip(source_units, unit_results, strict=True):
+      typer.echo(f"Processing {unit.identifier}...")
 
       if result["processed"]:
         processed_count += 1
@@ -612,7 +640,7 @@ def _sync_adr(root: Path) -> dict:
   return {"success": True}
 
 
-def _sync_requirements(root: Path) -> dict:
+def _sync_requirements(root: Path, *, incremental: bool = False) -> dict:
   """Execute requirements registry synchronization from specs and backlog."""
   from supekku.scripts.lib.backlog.registry import BacklogRegistry
   from supekku.scripts.lib.core.paths import get_registry_dir
@@ -640,12 +668,17 @@ def _sync_requirements(root: Path) -> dict:
     revision_dirs=revision_dirs,
     audit_dirs=audit_dirs,
     backlog_registry=backlog,
+    incremental=incremental,
   )
-  req_registry.save()
+  if not incremental or stats.sources_changed:
+    req_registry.save()
 
-  typer.echo(
-    f"  Requirements: {stats.created} created, {stats.updated} updated",
-  )
+  summary = f"  Requirements: {stats.created} created, {stats.updated} updated"
+  if incremental:
+    summary += (
+      f" ({stats.sources_read} sources re-read, {stats.sources_reused} unchanged)"
+    )
+  typer.echo(summary)
 
   return {"success": True, "created": stats.created, "updated": stats.updated}
 
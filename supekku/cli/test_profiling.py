@@ -0,0 +1,79 @@
+"""Tests for the --profile global option and SPEC_DRIVER_PROFILE."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+import yaml
+
+from supekku.cli.main import invoke
+from supekku.scripts.lib.benchmarks import WorkspaceShape, generate_workspace
+from supekku.scripts.lib.core.events import LOG_FILENAME
+from supekku.scripts.lib.core.paths import get_run_dir
+
+SHAPE = WorkspaceShape(
+  specs=3,
+  deltas=1,
+  phases_per_delta=1,
+  memories=1,
+  issues=1,
+  adrs=1,
+)
+
+
+@pytest.fixture
+def workspace(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+  generate_workspace(tmp_path, SHAPE)
+  monkeypatch.chdir(tmp_path)
+  monkeypatch.delenv("SPEC_DRIVER_PROFILE", raising=False)
+  monkeypatch.delenv("SPEC_DRIVER_PROFILE_DUMP", raising=False)
+  yield tmp_path
+
+
+def _run(root: Path, *argv: str) -> tuple[int, str, dict]:
+  stdout, stderr = io.StringIO(), io.StringIO()
+  with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+    code = invoke([*argv, "--root", str(root)])
+  log = get_run_dir(root) / LOG_FILENAME
+  event = json.loads(log.read_text(encoding="utf-8").splitlines()[-1])
+  return code, stderr.getvalue(), event
+
+
+def test_profile_flag_reports_phases(workspace: Path) -> None:
+  """--profile prints phase timings and records them in the event."""
+  code, stderr, event = _run(workspace, "--profile", "list", "specs", "-c", "all")
+
+  assert code == 0
+  assert "profile:" in stderr
+  phases = event["profile"]["phases"]
+  for phase in ("config", "registry.spec", "yaml", "format", "output"):
+    assert phase in phases, phases
+  assert phases["registry.spec"]["calls"] == 1
+
+
+def test_env_opt_in_records_without_printing(
+  workspace: Path,
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  """SPEC_DRIVER_PROFILE records timings in the event only."""
+  monkeypatch.setenv("SPEC_DRIVER_PROFILE", "1")
+  code, stderr, event = _run(workspace, "show", "delta", "DE-001")
+
+  assert code == 0
+  assert "profile:" not in stderr
+  assert "registry.delta" in event["profile"]["phases"]
+
+
+def test_unprofiled_command_has_no_profile(workspace: Path) -> None:
+  """Profiling is opt-in and leaves library entry points untouched."""
+  original = yaml.safe_load
+  code, _stderr, event = _run(workspace, "list", "specs")
+
+  assert code == 0
+  assert "profile" not in event
+  assert yaml.safe_load is original
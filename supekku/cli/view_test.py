@@ -359,20 +359,19 @@ class TestReadAlias:
 
   def test_read_alias_registered(self) -> None:
     """read appears in the main app."""
-    from supekku.cli.main import app as main_app  # noqa: PLC0415
+    from supekku.cli.main import _LAZY_SUBCOMMANDS  # noqa: PLC0415
 
-    commands = [info.name for info in main_app.registered_groups]
+    commands = [sub.name for sub in _LAZY_SUBCOMMANDS]
     assert "read" in commands
     assert "view" in commands
 
   def test_read_invokes_same_app(self) -> None:
     """read and view reference the same Typer app instance."""
-    from supekku.cli.main import app as main_app  # noqa: PLC0415
+    from supekku.cli.main import _LAZY_SUBCOMMANDS  # noqa: PLC0415
 
-    groups_by_name = {info.name: info for info in main_app.registered_groups}
-    read_app = groups_by_name["read"].typer_instance
-    view_app = groups_by_name["view"].typer_instance
-    assert read_app is view_app
+    subs_by_name = {sub.name: sub for sub in _LAZY_SUBCOMMANDS}
+    assert subs_by_name["read"].resolve() is app
+    assert subs_by_name["view"].resolve() is app
 
 
 # ── view card (special --anywhere flag) ──────────────────────────
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Benchmark spec-driver hot paths against a synthetic workspace."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from supekku.scripts.lib.benchmarks import SCALES, resolve_shape, run_suite
+from supekku.scripts.lib.core.paths import get_run_dir
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+  """Parse command-line arguments for a benchmark run.
+
+  Args:
+    argv: Optional command-line arguments.
+
+  Returns:
+    Parsed arguments namespace.
+  """
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument(
+    "--scale",
+    default="100",
+    help=f"Workspace size: {', '.join(SCALES)} or a spec count (default: 100)",
+  )
+  parser.add_argument(
+    "--repeat",
+    type=int,
+    default=3,
+    help="Timed runs per benchmark",
+  )
+  parser.add_argument(
+    "--only",
+    action="append",
+    metavar="GLOB",
+    help="Run only benchmarks matching this name glob (repeatable)",
+  )
+  parser.add_argument(
+    "--seed",
+    type=int,
+    default=0,
+    help="Seed for the synthetic workspace",
+  )
+  parser.add_argument(
+    "--workdir",
+    type=Path,
+    help="Generate the workspace here and keep it (default: temporary)",
+  )
+  parser.add_argument(
+    "--output",
+    type=Path,
+    help="Write the JSON report to this file",
+  )
+  return parser.parse_args(argv)
+
+
+def default_json_path(scale: str) -> Path:
+  """Choose a default output path for the benchmark report.
+
+  Args:
+    scale: Scale label of the run.
+
+  Returns:
+    Path under .spec-driver/run/benchmarks/.
+  """
+  return get_run_dir() / "benchmarks" / f"{scale}.json"
+
+
+def render_summary(report: dict[str, Any], *, json_path: Path) -> str:
+  """Render a compact text table of median timings.
+
+  Args:
+    report: Report produced by ``run_suite``.
+    json_path: Where the full report was written.
+
+  Returns:
+    Multi-line summary.
+  """
+  counts = ", ".join(f"{n} {kind}" for kind, n in report["workspace"].items())
+  lines = [f"scale {report['scale']}: {counts}", ""]
+  width = max((len(b["name"]) for b in report["benchmarks"]), default=0)
+  for bench in report["benchmarks"]:
+    if "error" in bench:
+      lines.append(f"{bench['name']:<{width}}  ERROR {bench['error']}")
+    else:
+      lines.append(
+        f"{bench['name']:<{width}}  {bench['median'] * 1000:10.1f} ms"
+        f"  (min {bench['min'] * 1000:.1f}, max {bench['max'] * 1000:.1f})"
+      )
+  lines += ["", f"Report: {json_path}"]
+  return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+  """Run the benchmark suite and write its JSON report.
+
+  Args:
+    argv: Optional command-line arguments.
+
+  Returns:
+    0 on success, 1 if any benchmark failed, 2 for invalid arguments.
+  """
+  args = parse_args(argv)
+  try:
+    shape = resolve_shape(args.scale)
+  except ValueError as exc:
+    print(str(exc), file=sys.stderr)
+    return 2
+  if args.repeat < 1:
+    print("--repeat must be at least 1", file=sys.stderr)
+    return 2
+
+  report = run_suite(
+    args.scale,
+    shape,
+    repeat=args.repeat,
+    only=args.only,
+    seed=args.seed,
+    root=args.workdir,
+  )
+
+  json_path = args.output or default_json_path(args.scale)
+  json_path.parent.mkdir(parents=True, exist_ok=True)
+  json_path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+  print(render_summary(report, json_path=json_path))
+  return 1 if any("error" in b for b in report["benchmarks"]) else 0
+
+
+if __name__ == "__main__":
+  raise SystemExit(main())
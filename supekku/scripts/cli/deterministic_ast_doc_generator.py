@@ -159,6 +159,12 @@ def main() -> None:
   )
   parser.add_argument("--no-cache", action="store_true", help="Disable parsing cache")
   parser.add_argument("--cache-dir", type=Path, help="Custom cache directory")
+  parser.add_argument(
+    "--jobs",
+    type=int,
+    default=1,
+    help="Worker processes for AST analysis (default: 1, in-process)",
+  )
   parser.add_argument(
     "--cache-stats",
     action="store_true",
@@ -190,6 +196,7 @@ def main() -> None:
       check=args.check,
       output_root=output_dir,
       cache_dir=cache_dir,
+      jobs=args.jobs,
     )
   except Exception as e:
     print(f"Error generating documentation: {e}")
@@ -1,46 +1,99 @@
-"""Supekku library modules for spec management and documentation generation."""
+"""Supekku library modules for spec management and documentation generation.
+
+Exports resolve on first attribute access so that importing any submodule
+(e.g. ``supekku.scripts.lib.core.events``) does not load every registry.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+  from .backlog.registry import (
+    append_backlog_summary,
+    create_backlog_entry,
+    find_repo_root,
+  )
+  from .changes.registry import ChangeRegistry
+  from .core.frontmatter_schema import (
+    FrontmatterValidationError,
+    FrontmatterValidationResult,
+    Relation,
+    validate_frontmatter,
+  )
+  from .core.paths import (
+    SPEC_DRIVER_DIR,
+    get_about_dir,
+    get_registry_dir,
+    get_spec_driver_root,
+    get_templates_dir,
+  )
+  from .core.spec_utils import (
+    append_unique,
+    dump_markdown_file_create,
+    dump_markdown_file_update,
+    ensure_list_entry,
+    load_markdown_file,
+    load_validated_markdown_file,
+  )
+  from .relations.manager import (
+    add_relation,
+    list_relations,
+    remove_relation,
+  )
+  from .specs.creation import (
+    CreateSpecOptions,
+    CreateSpecResult,
+    SpecCreationError,
+    create_spec,
+  )
+  from .specs.models import Spec
+  from .specs.registry import SpecRegistry
+  from .workspace import Workspace
+
+_LAZY_EXPORTS: dict[str, str] = {
+  "append_backlog_summary": ".backlog.registry",
+  "create_backlog_entry": ".backlog.registry",
+  "find_repo_root": ".backlog.registry",
+  "ChangeRegistry": ".changes.registry",
+  "FrontmatterValidationError": ".core.frontmatter_schema",
+  "FrontmatterValidationResult": ".core.frontmatter_schema",
+  "Relation": ".core.frontmatter_schema",
+  "validate_frontmatter": ".core.frontmatter_schema",
+  "SPEC_DRIVER_DIR": ".core.paths",
+  "get_about_dir": ".core.paths",
+  "get_registry_dir": ".core.paths",
+  "get_spec_driver_root": ".core.paths",
+  "get_templates_dir": ".core.paths",
+  "append_unique": ".core.spec_utils",
+  "dump_markdown_file_create": ".core.spec_utils",
+  "dump_markdown_file_update": ".core.spec_utils",
+  "ensure_list_entry": ".core.spec_utils",
+  "load_markdown_file": ".core.spec_utils",
+  "load_validated_markdown_file": ".core.spec_utils",
+  "add_relation": ".relations.manager",
+  "list_relations": ".relations.manager",
+  "remove_relation": ".relations.manager",
+  "CreateSpecOptions": ".specs.creation",
+  "CreateSpecResult": ".specs.creation",
+  "SpecCreationError": ".specs.creation",
+  "create_spec": ".specs.creation",
+  "Spec": ".specs.models",
+  "SpecRegistry": ".specs.registry",
+  "Workspace": ".workspace",
+}
+
+
+def __getattr__(name: str) -> Any:
+  module = _LAZY_EXPORTS.get(name)
+  if module is None:
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+  value = getattr(importlib.import_module(module, __name__), name)
+  globals()[name] = value
+  return value
 
-from .backlog.registry import (
-  append_backlog_summary,
-  create_backlog_entry,
-  find_repo_root,
-)
-from .changes.registry import ChangeRegistry
-from .core.frontmatter_schema import (
-  FrontmatterValidationError,
-  FrontmatterValidationResult,
-  Relation,
-  validate_frontmatter,
-)
-from .core.paths import (
-  SPEC_DRIVER_DIR,
-  get_about_dir,
-  get_registry_dir,
-  get_spec_driver_root,
-  get_templates_dir,
-)
-from .core.spec_utils import (
-  append_unique,
-  dump_markdown_file_create,
-  dump_markdown_file_update,
-  ensure_list_entry,
-  load_markdown_file,
-  load_validated_markdown_file,
-)
-from .relations.manager import (
-  add_relation,
-  list_relations,
-  remove_relation,
-)
-from .specs.creation import (
-  CreateSpecOptions,
-  CreateSpecResult,
-  SpecCreationError,
-  create_spec,
-)
-from .specs.models import Spec
-from .specs.registry import SpecRegistry
-from .workspace import Workspace
 
 __all__ = [
   "SPEC_DRIVER_DIR",
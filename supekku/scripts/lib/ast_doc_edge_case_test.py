@@ -140,6 +140,7 @@ class ParseCacheTest(unittest.TestCase):
     # Create cache with temporary directory
     self.cache_dir = self.temp_path / "cache"
     self.cache = ParseCache(self.cache_dir)
+    self.addCleanup(self.cache.close)
 
   def _create_test_file(self, content: str, filename: str = "test.py") -> Path:
     """Create a test file with given content."""
@@ -208,19 +209,20 @@ class ParseCacheTest(unittest.TestCase):
     """Test handling of corrupted cache files."""
     file_path = self._create_test_file("def test(): pass")
 
-    # Create corrupted cache file
-    cache_key = self.cache._get_cache_key(file_path)
-    corrupt_cache_file = self.cache.cache_dir / f"{cache_key}.json"
-    corrupt_cache_file.parent.mkdir(parents=True, exist_ok=True)
-    corrupt_cache_file.write_text("invalid json content")
+    # Corrupt the store on disk
+    self.cache.close()
+    self.cache.cache_path.write_text("invalid cache content")
 
-    # Should handle corruption gracefully
-    result = self.cache.get(file_path)
+    # Reopening should handle corruption gracefully
+    cache = ParseCache(self.cache_dir)
+    self.addCleanup(cache.close)
+    result = cache.get(file_path)
     assert result is None
-    assert self.cache.stats["misses"] == 1
+    assert cache.stats["misses"] == 1
 
-    # Corrupted file should be removed
-    assert not corrupt_cache_file.exists()
+    # Corrupted store should be rebuilt
+    cache.put(file_path, {"test": "data"})
+    assert cache.get(file_path) == {"test": "data"}
 
   def test_cache_clear(self) -> None:
     """Test cache clearing functionality."""
@@ -691,6 +693,7 @@ class IntegrationWithCacheTest(unittest.TestCase):
 
     self.cache_dir = self.temp_path / "cache"
     self.cache = ParseCache(self.cache_dir)
+    self.addCleanup(self.cache.close)
 
   def test_cache_with_complex_content(self) -> None:
     """Test caching behavior with complex content."""
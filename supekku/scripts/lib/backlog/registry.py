@@ -19,6 +19,7 @@ from supekku.scripts.lib.backlog.models import BacklogItem
 from supekku.scripts.lib.core import slugify
 from supekku.scripts.lib.core.ids import next_sequential_id
 from supekku.scripts.lib.core.paths import get_backlog_dir, get_registry_dir
+from supekku.scripts.lib.core.profiling import profiled
 from supekku.scripts.lib.core.repo import find_repo_root
 from supekku.scripts.lib.core.spec_utils import (
   dump_markdown_file_create,
@@ -98,6 +99,7 @@ class BacklogRegistry:
     self._items: dict[str, BacklogItem] = {}
     self._load()
 
+  @profiled("registry.backlog")
   def _load(self) -> None:
     """Scan filesystem and cache all backlog items."""
     if not self._directory.exists():
@@ -124,47 +126,7 @@ class BacklogRegistry:
 
   def _parse_item(self, md_file: Path, kind_dir_name: str) -> BacklogItem | None:
     """Parse a single backlog item file into a BacklogItem."""
-    match = BACKLOG_ID_PATTERN.match(md_file.name)
-    if not match:
-      return None
-
-    prefix = match.group(1)
-    number = match.group(2)
-    item_id = f"{prefix}-{number}"
-
-    try:
-      frontmatter, _ = load_markdown_file(md_file)
-    except Exception as exc:  # noqa: BLE001
-      logger.warning(
-        "Skipping %s: invalid YAML frontmatter — %s",
-        md_file.relative_to(self.root),
-        exc,
-      )
-      return None
-
-    item_kind = str(frontmatter.get("kind", "")).lower() or kind_dir_name.rstrip("s")
-    status = str(frontmatter.get("status", "")).lower() or "unknown"
-    title = str(frontmatter.get("name", "")).strip()
-    if not title:
-      title = extract_title(md_file)
-
-    return BacklogItem(
-      id=item_id,
-      kind=item_kind,
-      status=status,
-      title=title,
-      path=md_file,
-      frontmatter=dict(frontmatter),
-      tags=list(frontmatter.get("tags", [])),
-      severity=str(frontmatter.get("severity", "")),
-      categories=list(frontmatter.get("categories", [])),
-      impact=str(frontmatter.get("impact", "")),
-      likelihood=float(frontmatter.get("likelihood", 0.0)),
-      created=str(frontmatter.get("created", "")),
-      updated=str(frontmatter.get("updated", "")),
-      ext_id=str(frontmatter.get("ext_id", "")),
-      ext_url=str(frontmatter.get("ext_url", "")),
-    )
+    return load_backlog_item(md_file, root=self.root, kind_dir_name=kind_dir_name)
 
   def find(self, item_id: str) -> BacklogItem | None:
     """Find a backlog item by ID.
@@ -217,6 +179,69 @@ class BacklogRegistry:
     return results
 
 
+def load_backlog_item(
+  md_file: Path,
+  *,
+  root: Path,
+  kind_dir_name: str | None = None,
+) -> BacklogItem | None:
+  """Parse the single backlog item file at *md_file*.
+
+  Args:
+    md_file: An ``ISSUE-NNN.md`` (etc.) file inside its item directory.
+    root: Repository root, for log messages.
+    kind_dir_name: The kind directory (``issues``, ``risks``, ...) the item
+      lives under; defaults to the grandparent of *md_file*.
+
+  Returns:
+    The BacklogItem, or None if the filename is not an item ID or the
+    frontmatter does not parse.
+  """
+  if kind_dir_name is None:
+    kind_dir_name = md_file.parent.parent.name
+  match = BACKLOG_ID_PATTERN.match(md_file.name)
+  if not match:
+    return None
+
+  prefix = match.group(1)
+  number = match.group(2)
+  item_id = f"{prefix}-{number}"
+
+  try:
+    frontmatter, _ = load_markdown_file(md_file)
+  except Exception as exc:  # noqa: BLE001
+    logger.warning(
+      "Skipping %s: invalid YAML frontmatter — %s",
+      md_file.relative_to(root),
+      exc,
+    )
+    return None
+
+  item_kind = str(frontmatter.get("kind", "")).lower() or kind_dir_name.rstrip("s")
+  status = str(frontmatter.get("status", "")).lower() or "unknown"
+  title = str(frontmatter.get("name", "")).strip()
+  if not title:
+    title = extract_title(md_file)
+
+  return BacklogItem(
+    id=item_id,
+    kind=item_kind,
+    status=status,
+    title=title,
+    path=md_file,
+    frontmatter=dict(frontmatter),
+    tags=list(frontmatter.get("tags", [])),
+    severity=str(frontmatter.get("severity", "")),
+    categories=list(frontmatter.get("categories", [])),
+    impact=str(frontmatter.get("impact", "")),
+    likelihood=float(frontmatter.get("likelihood", 0.0)),
+    created=str(frontmatter.get("created", "")),
+    updated=str(frontmatter.get("updated", "")),
+    ext_id=str(frontmatter.get("ext_id", "")),
+    ext_url=str(frontmatter.get("ext_url", "")),
+  )
+
+
 def backlog_root(repo_root: Path) -> Path:
   """Get backlog directory path.
 
@@ -542,6 +567,7 @@ __all__ = [
   "find_backlog_items_by_id",
   "find_item",
   "find_repo_root",
+  "load_backlog_item",
   "load_backlog_registry",
   "save_backlog_registry",
   "sync_backlog_registry",
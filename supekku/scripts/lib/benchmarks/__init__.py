@@ -0,0 +1,40 @@
+"""Performance benchmarks over synthetic workspaces.
+
+This package provides:
+- WorkspaceShape / generate_workspace: synthetic ``.spec-driver`` workspaces
+  at configurable scale
+- run_suite: time the registry, sync, validation, graph, search and CLI hot
+  paths and report the results as JSON-serializable data
+"""
+
+from supekku.scripts.lib.benchmarks.runner import (
+  Benchmark,
+  BenchmarkResult,
+  build_report,
+  default_benchmarks,
+  prepare_workspace,
+  run_benchmarks,
+  run_suite,
+  select_benchmarks,
+)
+from supekku.scripts.lib.benchmarks.workspace_gen import (
+  SCALES,
+  WorkspaceShape,
+  generate_workspace,
+  resolve_shape,
+)
+
+__all__ = [
+  "SCALES",
+  "Benchmark",
+  "BenchmarkResult",
+  "WorkspaceShape",
+  "build_report",
+  "default_benchmarks",
+  "generate_workspace",
+  "prepare_workspace",
+  "resolve_shape",
+  "run_benchmarks",
+  "run_suite",
+  "select_benchmarks",
+]
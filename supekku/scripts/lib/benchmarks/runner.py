@@ -0,0 +1,289 @@
+"""Timed benchmarks of workspace hot paths.
+
+Each benchmark runs against a workspace root and is repeated; results carry
+every run's wall time plus min/median/max so reports can be compared
+release over release. Benchmarks build fresh registries and workspaces on
+every run, so in-memory state does not carry over between repeats. The
+``cli.*`` benchmarks start ``spec-driver`` in a new interpreter each run and
+so include startup and import time, as a shell invocation does.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fnmatch
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from spec_driver.core.version import get_package_version
+
+from .workspace_gen import WorkspaceShape, generate_workspace, spec_id
+
+if TYPE_CHECKING:
+  from supekku.tui.search import SearchEngine
+
+REPORT_VERSION = 1
+
+# Queries timed by the search benchmark: an ID prefix, a multi-word phrase
+# and a fuzzy subsequence.
+SEARCH_QUERIES = ("SPEC-00", "registry cache", "mmryptn")
+
+
+@dataclass(frozen=True)
+class Benchmark:
+  """A named, repeatable measurement.
+
+  Args:
+    name: Dotted benchmark name, e.g. ``collect.spec``.
+    run: Timed callable; receives the setup result (or the root).
+    setup: Optional untimed callable run once before the timed runs.
+  """
+
+  name: str
+  run: Callable[[Any], object]
+  setup: Callable[[Path], Any] | None = None
+
+
+@dataclass
+class BenchmarkResult:
+  """Wall times of one benchmark's runs, or the error that stopped it."""
+
+  name: str
+  runs: list[float] = field(default_factory=list)
+  error: str | None = None
+
+  def to_dict(self) -> dict[str, Any]:
+    """Serialize for the JSON report."""
+    data: dict[str, Any] = {"name": self.name}
+    if self.runs:
+      data.update(
+        min=min(self.runs),
+        median=statistics.median(self.runs),
+        max=max(self.runs),
+        runs=self.runs,
+      )
+    if self.error is not None:
+      data["error"] = self.error
+    return data
+
+
+# --- benchmark bodies ---
+
+
+def _collect(art_type: Any) -> Callable[[Path], object]:
+  def run(root: Path) -> object:
+    from supekku.scripts.lib.core.artifact_view import (  # noqa: PLC0415
+      _REGISTRY_FACTORIES,
+    )
+
+    return _REGISTRY_FACTORIES[art_type](root).collect()
+
+  return run
+
+
+def _sync_all_registries(root: Path) -> object:
+  from supekku.scripts.lib.workspace import Workspace  # noqa: PLC0415
+
+  return Workspace(root=root).sync_all_registries()
+
+
+def _validate(root: Path) -> object:
+  from supekku.scripts.lib.validation.validator import (  # noqa: PLC0415
+    WorkspaceValidator,
+  )
+  from supekku.scripts.lib.workspace import Workspace  # noqa: PLC0415
+
+  return WorkspaceValidator(Workspace(root=root)).validate()
+
+
+def _reference_graph(root: Path) -> object:
+  from supekku.scripts.lib.relations.graph import (  # noqa: PLC0415
+    build_reference_graph,
+  )
+  from supekku.scripts.lib.workspace import Workspace  # noqa: PLC0415
+
+  return build_reference_graph(Workspace(root=root))
+
+
+def _search_index(root: Path) -> object:
+  from supekku.tui.search import build_search_index  # noqa: PLC0415
+
+  return build_search_index(root=root)
+
+
+def _search_engine(root: Path) -> SearchEngine:
+  from supekku.tui.search import SearchEngine, build_search_index  # noqa: PLC0415
+
+  engine = SearchEngine(build_search_index(root=root))
+  # The first query builds the weight groups; time steady-state queries,
+  # as the TUI runs them on every keystroke.
+  engine.search(SEARCH_QUERIES[0])
+  return engine
+
+
+def _search(engine: SearchEngine) -> object:
+  return [engine.search(query) for query in SEARCH_QUERIES]
+
+
+def _cli(*args: str) -> Callable[[Path], object]:
+  """Run ``spec-driver <args>`` as a subprocess from *root*, discarding output."""
+
+  def run(root: Path) -> object:
+    result = subprocess.run(
+      [sys.executable, "-m", "supekku.cli.main", *args, "--root", str(root)],
+      cwd=root,
+      capture_output=True,
+      text=True,
+      check=False,
+    )
+    if result.returncode != 0:
+      output = (result.stdout + result.stderr)[-500:]
+      msg = f"spec-driver {' '.join(args)} exited {result.returncode}: {output}"
+      raise RuntimeError(msg)
+    return result.returncode
+
+  return run
+
+
+def default_benchmarks() -> list[Benchmark]:
+  """Return the standard benchmark set, in run order."""
+  from supekku.scripts.lib.core.artifact_view import (  # noqa: PLC0415
+    _REGISTRY_FACTORIES,
+  )
+
+  benchmarks = [
+    Benchmark(f"collect.{art_type.value}", _collect(art_type))
+    for art_type in _REGISTRY_FACTORIES
+  ]
+  benchmarks += [
+    Benchmark("workspace.sync_all_registries", _sync_all_registries),
+    Benchmark("validator.validate", _validate),
+    Benchmark("relations.build_reference_graph", _reference_graph),
+    Benchmark("search.build_index", _search_index),
+    Benchmark("search.query", _search, setup=_search_engine),
+    Benchmark("cli.list_specs", _cli("list", "specs")),
+    Benchmark("cli.list_deltas", _cli("list", "deltas")),
+    Benchmark("cli.show_spec", _cli("show", "spec", spec_id(1))),
+    Benchmark("cli.show_delta", _cli("show", "delta", "DE-001")),
+  ]
+  return benchmarks
+
+
+def select_benchmarks(
+  benchmarks: Iterable[Benchmark],
+  patterns: Iterable[str] | None,
+) -> list[Benchmark]:
+  """Keep benchmarks whose name matches any glob in *patterns* (all if None)."""
+  patterns = list(patterns or [])
+  if not patterns:
+    return list(benchmarks)
+  return [b for b in benchmarks if any(fnmatch.fnmatch(b.name, p) for p in patterns)]
+
+
+def run_benchmarks(
+  root: Path,
+  benchmarks: Iterable[Benchmark],
+  *,
+  repeat: int = 3,
+) -> list[BenchmarkResult]:
+  """Time each benchmark *repeat* times against the workspace at *root*.
+
+  A benchmark that raises is recorded with its error and skipped; the
+  remaining benchmarks still run.
+  """
+  results = []
+  for benchmark in benchmarks:
+    result = BenchmarkResult(benchmark.name)
+    try:
+      subject = benchmark.setup(root) if benchmark.setup else root
+      for _ in range(repeat):
+        start = time.perf_counter()
+        benchmark.run(subject)
+        result.runs.append(time.perf_counter() - start)
+    except Exception as exc:  # noqa: BLE001
+      result.error = f"{type(exc).__name__}: {exc}"
+    results.append(result)
+  return results
+
+
+def prepare_workspace(root: Path, shape: WorkspaceShape, *, seed: int = 0) -> None:
+  """Generate a workspace and sync it once, as a real repository would be."""
+  from supekku.scripts.lib.workspace import Workspace  # noqa: PLC0415
+
+  generate_workspace(root, shape, seed=seed)
+  Workspace(root=root).sync_all_registries()
+
+
+def build_report(
+  scale: str,
+  shape: WorkspaceShape,
+  results: Iterable[BenchmarkResult],
+  *,
+  repeat: int,
+  seed: int,
+) -> dict[str, Any]:
+  """Assemble the JSON-serializable report for one suite run."""
+  return {
+    "report_version": REPORT_VERSION,
+    "spec_driver_version": get_package_version(),
+    "python": platform.python_version(),
+    "platform": platform.platform(),
+    "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+    "scale": scale,
+    "workspace": shape.counts(),
+    "repeat": repeat,
+    "seed": seed,
+    "benchmarks": [result.to_dict() for result in results],
+  }
+
+
+def run_suite(
+  scale: str,
+  shape: WorkspaceShape,
+  *,
+  repeat: int = 3,
+  only: Iterable[str] | None = None,
+  seed: int = 0,
+  root: Path | None = None,
+) -> dict[str, Any]:
+  """Generate a workspace, time the selected benchmarks and report.
+
+  Args:
+    scale: Scale label recorded in the report.
+    shape: Artefact counts to generate.
+    repeat: Timed runs per benchmark.
+    only: Glob patterns selecting benchmarks by name; all when empty.
+    seed: Generator seed.
+    root: Directory to generate into (must not hold a workspace); a
+      temporary directory is used and removed when omitted.
+  """
+  benchmarks = select_benchmarks(default_benchmarks(), only)
+  with contextlib.ExitStack() as stack:
+    if root is None:
+      root = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="sd-bench-")))
+    prepare_workspace(root, shape, seed=seed)
+    results = run_benchmarks(root, benchmarks, repeat=repeat)
+  return build_report(scale, shape, results, repeat=repeat, seed=seed)
+
+
+__all__ = [
+  "REPORT_VERSION",
+  "SEARCH_QUERIES",
+  "Benchmark",
+  "BenchmarkResult",
+  "build_report",
+  "default_benchmarks",
+  "prepare_workspace",
+  "run_benchmarks",
+  "run_suite",
+  "select_benchmarks",
+]
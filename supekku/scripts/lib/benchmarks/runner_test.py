@@ -0,0 +1,98 @@
+"""Tests for the benchmark runner."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from .runner import (
+  Benchmark,
+  BenchmarkResult,
+  default_benchmarks,
+  run_benchmarks,
+  run_suite,
+  select_benchmarks,
+)
+from .workspace_gen import WorkspaceShape
+
+TINY = WorkspaceShape(
+  specs=4,
+  deltas=2,
+  phases_per_delta=1,
+  memories=2,
+  issues=1,
+  adrs=1,
+)
+
+
+def test_runs_each_benchmark_repeatedly(tmp_path: Path) -> None:
+  """Setup runs once; the timed body runs *repeat* times."""
+  calls: list[str] = []
+
+  def setup(root: Path) -> str:
+    calls.append("setup")
+    return str(root)
+
+  results = run_benchmarks(
+    tmp_path,
+    [Benchmark("demo", calls.append, setup=setup)],
+    repeat=3,
+  )
+
+  assert calls == ["setup", str(tmp_path), str(tmp_path), str(tmp_path)]
+  assert len(results[0].runs) == 3
+  assert results[0].error is None
+
+
+def test_failure_is_recorded_and_suite_continues(tmp_path: Path) -> None:
+  """A raising benchmark reports its error; later benchmarks still run."""
+
+  def boom(_root: Path) -> None:
+    raise RuntimeError("broken")
+
+  results = run_benchmarks(
+    tmp_path,
+    [Benchmark("bad", boom), Benchmark("good", lambda _root: None)],
+    repeat=1,
+  )
+
+  assert results[0].to_dict() == {"name": "bad", "error": "RuntimeError: broken"}
+  assert results[1].error is None
+
+
+def test_result_summary() -> None:
+  """Reports carry min, median and max alongside every run."""
+  data = BenchmarkResult("x", runs=[3.0, 1.0, 2.0]).to_dict()
+
+  assert (data["min"], data["median"], data["max"]) == (1.0, 2.0, 3.0)
+  assert data["runs"] == [3.0, 1.0, 2.0]
+
+
+def test_select_benchmarks_by_glob() -> None:
+  """--only patterns filter by name; no patterns keeps everything."""
+  benchmarks = default_benchmarks()
+  names = [b.name for b in select_benchmarks(benchmarks, ["collect.spec", "cli.*"])]
+
+  assert names[0] == "collect.spec"
+  assert names[1:] and all(name.startswith("cli.") for name in names[1:])
+  assert select_benchmarks(benchmarks, None) == benchmarks
+
+
+def test_suite_report_is_json(tmp_path: Path) -> None:
+  """An end-to-end run over a tiny workspace produces a JSON report."""
+  report = run_suite(
+    "tiny",
+    TINY,
+    repeat=1,
+    only=["collect.spec", "search.query", "cli.show_spec"],
+    root=tmp_path,
+  )
+
+  assert report["workspace"]["specs"] == 4
+  assert [b["name"] for b in report["benchmarks"]] == [
+    "collect.spec",
+    "search.query",
+    "cli.show_spec",
+  ]
+  assert all("error" not in b for b in report["benchmarks"]), report["benchmarks"]
+  assert json.loads(json.dumps(report)) == report
@@ -0,0 +1,482 @@
+"""Synthetic large-workspace generator for benchmarks.
+
+Writes a ``.spec-driver`` workspace with tech specs, deltas (with plans and
+phases), ADRs, memories and backlog issues directly to disk. Artefacts are
+rendered with the canonical block renderers and cross-reference each other
+the way a real workspace does: deltas implement spec requirements, specs
+interact with other specs, ADRs cite specs and earlier ADRs, and memories
+link to specs and decisions.
+
+Files are written directly rather than through the ``create_*`` APIs, which
+scan for the next free ID on every call and would make large workspaces
+quadratic to generate. Output is deterministic for a given shape and seed.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from supekku.scripts.lib.blocks.delta import render_delta_relationships_block
+from supekku.scripts.lib.blocks.plan import (
+  render_phase_overview_block,
+  render_plan_overview_block,
+)
+from supekku.scripts.lib.blocks.relationships import (
+  render_spec_capabilities_block,
+  render_spec_relationships_block,
+)
+from supekku.scripts.lib.blocks.spec_requirements import (
+  render_spec_requirements_block,
+)
+from supekku.scripts.lib.core.paths import (
+  SPEC_DRIVER_DIR,
+  get_backlog_dir,
+  get_decisions_dir,
+  get_deltas_dir,
+  get_memory_dir,
+  get_registry_dir,
+  get_tech_specs_dir,
+)
+from supekku.scripts.lib.core.spec_utils import dump_markdown_file_create
+
+GENERATED_DATE = "2026-01-01"
+
+# Vocabulary for generated titles and prose; varied enough for search.
+_WORDS = (
+  "registry", "adapter", "cache", "schema", "validator", "delta", "phase",
+  "requirement", "coverage", "sync", "index", "parser", "renderer", "workspace",
+  "backlog", "decision", "memory", "graph", "search", "session", "config",
+  "template", "lifecycle", "audit", "revision", "policy", "standard", "contract",
+  "boundary", "module", "service", "pipeline", "event", "snapshot",
+)  # fmt: skip
+
+# Requirement code prefixes, cycled per spec.
+_REQUIREMENT_PREFIXES = ("FR", "FR", "NF")
+
+
+@dataclass(frozen=True)
+class WorkspaceShape:
+  """Artefact counts for a synthetic workspace; every count must be positive."""
+
+  specs: int
+  deltas: int
+  phases_per_delta: int
+  memories: int
+  issues: int
+  adrs: int
+  requirements_per_spec: int = 3
+
+  @classmethod
+  def for_specs(cls, specs: int) -> WorkspaceShape:
+    """Derive a proportionate shape from a spec count."""
+    return cls(
+      specs=specs,
+      deltas=max(1, specs // 4),
+      phases_per_delta=3,
+      memories=max(1, specs // 2),
+      issues=max(1, specs // 4),
+      adrs=max(1, specs // 10),
+    )
+
+  def counts(self) -> dict[str, int]:
+    """Artefact counts keyed by kind, for reporting."""
+    return {
+      "specs": self.specs,
+      "requirements": self.specs * self.requirements_per_spec,
+      "deltas": self.deltas,
+      "phases": self.deltas * self.phases_per_delta,
+      "memories": self.memories,
+      "issues": self.issues,
+      "adrs": self.adrs,
+    }
+
+
+SCALES: dict[str, WorkspaceShape] = {
+  "100": WorkspaceShape.for_specs(100),
+  "1k": WorkspaceShape.for_specs(1_000),
+  "10k": WorkspaceShape.for_specs(10_000),
+}
+
+
+def resolve_shape(scale: str) -> WorkspaceShape:
+  """Resolve a named scale (``100``, ``1k``, ``10k``) or a plain spec count.
+
+  Raises:
+    ValueError: If *scale* is neither a preset nor a positive integer.
+  """
+  if scale in SCALES:
+    return SCALES[scale]
+  try:
+    specs = int(scale)
+  except ValueError:
+    specs = 0
+  if specs <= 0:
+    presets = ", ".join(SCALES)
+    msg = f"Unknown scale {scale!r}; use one of {presets} or a spec count"
+    raise ValueError(msg)
+  return WorkspaceShape.for_specs(specs)
+
+
+def spec_id(n: int) -> str:
+  """Return the ID of the *n*-th generated spec (1-based)."""
+  return f"SPEC-{n:03d}"
+
+
+def generate_workspace(root: Path, shape: WorkspaceShape, *, seed: int = 0) -> None:
+  """Write a synthetic workspace of *shape* under *root*.
+
+  Args:
+    root: Repository root; ``.spec-driver`` is created beneath it.
+    shape: Artefact counts to generate.
+    seed: Seed for the cross-reference choices.
+
+  Raises:
+    FileExistsError: If *root* already holds a ``.spec-driver`` directory.
+  """
+  spec_driver = root / SPEC_DRIVER_DIR
+  if spec_driver.exists():
+    msg = f"refusing to generate into existing workspace: {spec_driver}"
+    raise FileExistsError(msg)
+  get_registry_dir(root).mkdir(parents=True)
+
+  rng = random.Random(seed)
+  _Generator(root, shape, rng).run()
+
+
+class _Generator:
+  """Writes one workspace; holds the shared RNG and derived IDs."""
+
+  def __init__(self, root: Path, shape: WorkspaceShape, rng: random.Random) -> None:
+    self.root = root
+    self.shape = shape
+    self.rng = rng
+    self.spec_ids = [spec_id(n) for n in range(1, shape.specs + 1)]
+    self.adr_ids = [f"ADR-{n:03d}" for n in range(1, shape.adrs + 1)]
+
+  def run(self) -> None:
+    get_decisions_dir(self.root).mkdir(parents=True, exist_ok=True)
+    get_memory_dir(self.root).mkdir(parents=True, exist_ok=True)
+    for n in range(1, self.shape.specs + 1):
+      self._write_spec(n)
+    for n in range(1, self.shape.deltas + 1):
+      self._write_delta(n)
+    for n in range(1, self.shape.adrs + 1):
+      self._write_adr(n)
+    for n in range(1, self.shape.memories + 1):
+      self._write_memory(n)
+    for n in range(1, self.shape.issues + 1):
+      self._write_issue(n)
+
+  # --- helpers ---
+
+  def _phrase(self, words: int = 3) -> str:
+    return " ".join(self.rng.sample(_WORDS, words))
+
+  def _paragraph(self, sentences: int = 3) -> str:
+    return " ".join(
+      f"The {self._phrase()} must stay consistent with the {self._phrase(2)}."
+      for _ in range(sentences)
+    )
+
+  def _others(self, ids: list[str], own: str, k: int) -> list[str]:
+    pool = [i for i in self.rng.sample(ids, min(len(ids), k + 1)) if i != own]
+    return sorted(pool[:k])
+
+  def _requirement_codes(self) -> list[str]:
+    codes = []
+    counters: dict[str, int] = {}
+    for i in range(self.shape.requirements_per_spec):
+      prefix = _REQUIREMENT_PREFIXES[i % len(_REQUIREMENT_PREFIXES)]
+      counters[prefix] = counters.get(prefix, 0) + 1
+      codes.append(f"{prefix}-{counters[prefix]:03d}")
+    return codes
+
+  # --- artefacts ---
+
+  def _write_spec(self, n: int) -> None:
+    sid = spec_id(n)
+    slug = f"bench-{n:05d}"
+    module = f"bench/module_{n:05d}"
+    codes = self._requirement_codes()
+    requirements: list[dict[str, Any]] = [
+      {
+        "id": code,
+        "title": f"{self._phrase().capitalize()} is validated",
+        "kind": "functional" if code.startswith("FR") else "non-functional",
+        "description": self._paragraph(1),
+        "acceptance_criteria": [f"{self._phrase().capitalize()} is checked"],
+      }
+      for code in codes
+    ]
+    interactions = [
+      {"type": "uses", "spec": other} for other in self._others(self.spec_ids, sid, 2)
+    ]
+    frontmatter = {
+      "id": sid,
+      "slug": slug,
+      "name": f"{module} Specification",
+      "created": GENERATED_DATE,
+      "updated": GENERATED_DATE,
+      "status": "draft",
+      "kind": "spec",
+      "category": "unit" if n % 5 else "assembly",
+      "c4_level": "code" if n % 5 else "component",
+      "responsibilities": [f"Own the {self._phrase()}"],
+      "aliases": [],
+      "sources": [
+        {
+          "language": "python",
+          "identifier": module,
+          "module": module.replace("/", "."),
+          "variants": [],
+        }
+      ],
+      "owners": [],
+      "auditers": [],
+      "relations": [],
+      "tags": [self.rng.choice(_WORDS)],
+    }
+    body = "\n\n".join(
+      [
+        f"# {sid} – {module}",
+        render_spec_requirements_block(sid, requirements=requirements),
+        render_spec_relationships_block(
+          sid,
+          primary_requirements=codes,
+          interactions=interactions,
+        ),
+        render_spec_capabilities_block(
+          sid,
+          capabilities=[
+            {
+              "id": f"{slug}-core",
+              "name": f"{self._phrase().capitalize()}",
+              "responsibilities": [f"Maintain the {self._phrase()}"],
+              "requirements": codes,
+              "summary": self._paragraph(1),
+              "success_criteria": [],
+            }
+          ],
+        ),
+        "## Overview",
+        self._paragraph(),
+        "## Requirements",
+        "\n".join(
+          f"- **{code}**: {req['title']}"
+          for code, req in zip(codes, requirements, strict=True)
+        ),
+      ]
+    )
+    spec_dir = get_tech_specs_dir(self.root) / sid
+    spec_dir.mkdir(parents=True)
+    dump_markdown_file_create(
+      spec_dir / f"{sid}.md", frontmatter, body + "\n", kind="spec"
+    )
+
+  def _write_delta(self, n: int) -> None:
+    delta_id = f"DE-{n:03d}"
+    plan_id = f"IP-{n:03d}"
+    slug = f"bench-change-{n:05d}"
+    primary = sorted(self.rng.sample(self.spec_ids, min(2, len(self.spec_ids))))
+    codes = self._requirement_codes()
+    implements = [f"{sid}.{self.rng.choice(codes)}" for sid in primary]
+    phase_ids = [
+      f"{plan_id}-P{k:02d}" for k in range(1, self.shape.phases_per_delta + 1)
+    ]
+    status = self.rng.choice(("draft", "in-progress", "completed"))
+
+    delta_dir = get_deltas_dir(self.root) / f"{delta_id}-{slug}"
+    (delta_dir / "phases").mkdir(parents=True)
+
+    name = f"{self._phrase().capitalize()} rework"
+    dump_markdown_file_create(
+      delta_dir / f"{delta_id}.md",
+      {
+        "id": delta_id,
+        "slug": slug,
+        "name": f"Delta - {name}",
+        "created": GENERATED_DATE,
+        "updated": GENERATED_DATE,
+        "status": status,
+        "kind": "delta",
+      },
+      "\n\n".join(
+        [
+          f"# {delta_id} – {name}",
+          render_delta_relationships_block(
+            delta_id,
+            primary_specs=primary,
+            implements_requirements=implements,
+            phases=phase_ids,
+          ),
+          "## Motivation",
+          self._paragraph(),
+        ]
+      )
+      + "\n",
+      kind="delta",
+    )
+
+    # The renderer lists only the first phase; append the rest.
+    plan_block = render_plan_overview_block(
+      plan_id,
+      delta_id,
+      primary_specs=primary,
+      target_requirements=implements,
+      first_phase_id=phase_ids[0],
+    ).removesuffix("```")
+    plan_block += "".join(f"  - id: {pid}\n" for pid in phase_ids[1:]) + "```"
+    dump_markdown_file_create(
+      delta_dir / f"{plan_id}.md",
+      {
+        "id": plan_id,
+        "slug": slug,
+        "name": f"Implementation Plan - {name}",
+        "created": GENERATED_DATE,
+        "updated": GENERATED_DATE,
+        "status": status,
+        "kind": "plan",
+      },
+      f"{plan_block}\n\n# {plan_id}\n\n{self._paragraph()}\n",
+      kind="plan",
+    )
+
+    for k, phase_id in enumerate(phase_ids, start=1):
+      dump_markdown_file_create(
+        delta_dir / "phases" / f"phase-{k:02d}.md",
+        {
+          "id": phase_id,
+          "slug": f"{slug}-phase-{k:02d}",
+          "name": f"{plan_id} Phase {k:02d}",
+          "created": GENERATED_DATE,
+          "updated": GENERATED_DATE,
+          "status": status,
+          "kind": "phase",
+        },
+        render_phase_overview_block(
+          phase_id,
+          plan_id,
+          delta_id,
+          objective=f"Deliver the {self._phrase()}.",
+          entrance_criteria=[f"{delta_id} approved"],
+          exit_criteria=[f"{self._phrase().capitalize()} verified"],
+        )
+        + f"\n\n# Phase {k:02d}\n\n{self._paragraph(2)}\n",
+        kind="phase",
+      )
+
+    (delta_dir / "notes.md").write_text(
+      f"# Notes for {delta_id}\n\n{self._paragraph()}\n",
+      encoding="utf-8",
+    )
+
+  def _write_adr(self, n: int) -> None:
+    adr_id = self.adr_ids[n - 1]
+    title = f"{self._phrase().capitalize()} strategy"
+    slug = title.lower().replace(" ", "-")
+    related = self.adr_ids[: n - 1]
+    frontmatter = {
+      "id": adr_id,
+      "title": f"{adr_id}: {title}",
+      "status": self.rng.choice(("accepted", "proposed", "superseded")),
+      "created": GENERATED_DATE,
+      "updated": GENERATED_DATE,
+      "reviewed": GENERATED_DATE,
+      "owners": [],
+      "supersedes": [],
+      "superseded_by": [],
+      "policies": [],
+      "specs": sorted(self.rng.sample(self.spec_ids, min(3, len(self.spec_ids)))),
+      "requirements": [],
+      "deltas": [],
+      "revisions": [],
+      "audits": [],
+      "related_decisions": sorted(self.rng.sample(related, min(2, len(related)))),
+      "related_policies": [],
+      "tags": [self.rng.choice(_WORDS)],
+      "summary": self._paragraph(1),
+    }
+    body = "\n\n".join(
+      [
+        f"# {adr_id}: {title}",
+        "## Context",
+        self._paragraph(),
+        "## Decision",
+        self._paragraph(2),
+        "## Consequences",
+        self._paragraph(2),
+      ]
+    )
+    dump_markdown_file_create(
+      get_decisions_dir(self.root) / f"{adr_id}-{slug}.md",
+      frontmatter,
+      body + "\n",
+      kind="adr",
+    )
+
+  def _write_memory(self, n: int) -> None:
+    memory_type = ("fact", "pattern", "concept", "signpost")[n % 4]
+    memory_id = f"mem.{memory_type}.bench.item-{n:05d}"
+    specs = self.rng.sample(self.spec_ids, min(2, len(self.spec_ids)))
+    links = [f"[[{sid}]]" for sid in specs]
+    if self.adr_ids:
+      links.append(f"[[{self.rng.choice(self.adr_ids)}]]")
+    module = f"bench/module_{self.rng.randint(1, self.shape.specs):05d}"
+    name = f"{self._phrase().capitalize()} caveat"
+    frontmatter = {
+      "id": memory_id,
+      "name": name,
+      "kind": "memory",
+      "status": "active",
+      "memory_type": memory_type,
+      "created": GENERATED_DATE,
+      "updated": GENERATED_DATE,
+      "verified": GENERATED_DATE,
+      "confidence": self.rng.choice(("low", "medium", "high")),
+      "tags": [self.rng.choice(_WORDS)],
+      "summary": self._paragraph(1),
+      "scope": {"paths": [f"{module}.py"], "globs": [f"{module}/**"]},
+    }
+    body = f"# {name}\n\n{self._paragraph()}\n\nSee {', '.join(links)}.\n"
+    dump_markdown_file_create(
+      get_memory_dir(self.root) / f"{memory_id}.md",
+      frontmatter,
+      body,
+      kind="memory",
+    )
+
+  def _write_issue(self, n: int) -> None:
+    issue_id = f"ISSUE-{n:03d}"
+    name = f"{self._phrase().capitalize()} misbehaves"
+    slug = name.lower().replace(" ", "-")
+    frontmatter = {
+      "id": issue_id,
+      "name": name,
+      "created": GENERATED_DATE,
+      "updated": GENERATED_DATE,
+      "status": self.rng.choice(("open", "in-progress", "resolved")),
+      "kind": "issue",
+      "categories": [],
+      "severity": self.rng.choice(("p1", "p2", "p3")),
+      "impact": "user",
+    }
+    related = self.rng.choice(self.spec_ids)
+    body = f"# {name}\n\n{self._paragraph(2)}\n\nAffects {related}.\n"
+    issue_dir = get_backlog_dir(self.root) / "issues" / f"{issue_id}-{slug}"
+    issue_dir.mkdir(parents=True)
+    dump_markdown_file_create(
+      issue_dir / f"{issue_id}.md", frontmatter, body, kind="issue"
+    )
+
+
+__all__ = [
+  "GENERATED_DATE",
+  "SCALES",
+  "WorkspaceShape",
+  "generate_workspace",
+  "resolve_shape",
+  "spec_id",
+]
@@ -0,0 +1,80 @@
+"""Tests for the synthetic workspace generator."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from supekku.scripts.lib.core.artifact_view import _REGISTRY_FACTORIES, ArtifactType
+
+from .workspace_gen import SCALES, WorkspaceShape, generate_workspace, resolve_shape
+
+SHAPE = WorkspaceShape(
+  specs=6,
+  deltas=3,
+  phases_per_delta=2,
+  memories=4,
+  issues=2,
+  adrs=2,
+)
+
+
+def _collect(root: Path, art_type: ArtifactType) -> dict:
+  return _REGISTRY_FACTORIES[art_type](root).collect()
+
+
+def _snapshot(root: Path) -> dict[str, str]:
+  return {
+    str(path.relative_to(root)): path.read_text(encoding="utf-8")
+    for path in sorted(root.rglob("*.md"))
+  }
+
+
+def test_registries_load_generated_artefacts(tmp_path: Path) -> None:
+  """Every generated artefact is picked up by its registry."""
+  generate_workspace(tmp_path, SHAPE)
+
+  assert len(_collect(tmp_path, ArtifactType.SPEC)) == 6
+  assert len(_collect(tmp_path, ArtifactType.DELTA)) == 3
+  assert len(_collect(tmp_path, ArtifactType.ADR)) == 2
+  assert len(_collect(tmp_path, ArtifactType.MEMORY)) == 4
+  assert len(_collect(tmp_path, ArtifactType.BACKLOG)) == 2
+
+
+def test_deltas_reference_spec_requirements(tmp_path: Path) -> None:
+  """Deltas implement requirements of the specs they name as primary."""
+  generate_workspace(tmp_path, SHAPE)
+
+  delta = _collect(tmp_path, ArtifactType.DELTA)["DE-001"]
+  primary = delta.applies_to["specs"]
+  assert primary
+  assert all(req.split(".")[0] in primary for req in delta.applies_to["requirements"])
+  assert [p["phase"] for p in delta.plan["phases"]] == ["IP-001-P01", "IP-001-P02"]
+
+
+def test_output_is_deterministic(tmp_path: Path) -> None:
+  """The same shape and seed produce identical files."""
+  generate_workspace(tmp_path / "a", SHAPE, seed=7)
+  generate_workspace(tmp_path / "b", SHAPE, seed=7)
+  generate_workspace(tmp_path / "c", SHAPE, seed=8)
+
+  assert _snapshot(tmp_path / "a") == _snapshot(tmp_path / "b")
+  assert _snapshot(tmp_path / "a") != _snapshot(tmp_path / "c")
+
+
+def test_refuses_existing_workspace(tmp_path: Path) -> None:
+  """Generating over a workspace is an error, not a merge."""
+  generate_workspace(tmp_path, SHAPE)
+
+  with pytest.raises(FileExistsError):
+    generate_workspace(tmp_path, SHAPE)
+
+
+def test_resolve_shape() -> None:
+  """Presets resolve by name; plain counts derive a proportionate shape."""
+  assert resolve_shape("1k") is SCALES["1k"]
+  assert resolve_shape("40") == WorkspaceShape.for_specs(40)
+  for bad in ("huge", "0"):
+    with pytest.raises(ValueError, match="Unknown scale"):
+      resolve_shape(bad)
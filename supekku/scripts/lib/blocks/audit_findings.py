@@ -7,7 +7,7 @@ from typing import Any
 
 import yaml
 
-from supekku.scripts.lib.blocks.yaml_utils import make_block_pattern
+from supekku.scripts.lib.blocks.yaml_utils import scan_blocks
 
 AUDIT_FINDINGS_MARKER = "supekku:audit.findings@v1"
 AUDIT_FINDINGS_SCHEMA = "supekku.audit.findings"
@@ -22,22 +22,19 @@ class AuditFindingsBlock:
   data: dict[str, Any]
 
 
-_AUDIT_FINDINGS_PATTERN = make_block_pattern(AUDIT_FINDINGS_MARKER)
-
-
 def extract_audit_findings(text: str) -> AuditFindingsBlock | None:
   """Extract a single audit findings block from markdown content.
 
   Returns None if no block found. Raises ValueError on malformed YAML,
   multiple blocks, or audit field mismatch.
   """
-  matches = list(_AUDIT_FINDINGS_PATTERN.finditer(text))
-  if not matches:
+  raws = scan_blocks(text).raws(AUDIT_FINDINGS_MARKER)
+  if not raws:
     return None
-  if len(matches) > 1:
+  if len(raws) > 1:
     msg = "multiple audit.findings blocks found; exactly one is allowed"
     raise ValueError(msg)
-  raw = matches[0].group(1)
+  raw = raws[0]
   try:
     data = yaml.safe_load(raw) or {}
   except yaml.YAMLError as exc:
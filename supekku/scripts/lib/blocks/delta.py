@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 import yaml
 
-from .yaml_utils import format_yaml_list, make_block_pattern
+from .yaml_utils import format_yaml_list, scan_blocks
 
 if TYPE_CHECKING:
   from pathlib import Path
@@ -49,17 +49,11 @@ class DeltaRiskRegisterBlock:
   data: dict[str, Any]
 
 
-_BLOCK_PATTERN = make_block_pattern(DELTA_RELATIONSHIPS_MARKER)
-_CONTEXT_INPUTS_PATTERN = make_block_pattern(DELTA_CONTEXT_INPUTS_MARKER)
-_RISK_REGISTER_PATTERN = make_block_pattern(DELTA_RISK_REGISTER_MARKER)
-
-
 def extract_delta_relationships(text: str) -> DeltaRelationshipsBlock | None:
   """Extract delta relationships block from markdown text."""
-  match = _BLOCK_PATTERN.search(text)
-  if not match:
+  raw = scan_blocks(text).raw(DELTA_RELATIONSHIPS_MARKER)
+  if raw is None:
     return None
-  raw = match.group(1)
   try:
     data = yaml.safe_load(raw) or {}
   except yaml.YAMLError as exc:  # pragma: no cover
@@ -73,10 +67,9 @@ def extract_delta_relationships(text: str) -> DeltaRelationshipsBlock | None:
 
 def extract_delta_context_inputs(text: str) -> DeltaContextInputsBlock | None:
   """Extract delta context_inputs block from markdown text."""
-  match = _CONTEXT_INPUTS_PATTERN.search(text)
-  if not match:
+  raw = scan_blocks(text).raw(DELTA_CONTEXT_INPUTS_MARKER)
+  if raw is None:
     return None
-  raw = match.group(1)
   try:
     data = yaml.safe_load(raw) or {}
   except yaml.YAMLError as exc:
@@ -90,10 +83,9 @@ def extract_delta_context_inputs(text: str) -> DeltaContextInputsBlock | None:
 
 def extract_delta_risk_register(text: str) -> DeltaRiskRegisterBlock | None:
   """Extract delta risk_register block from markdown text."""
-  match = _RISK_REGISTER_PATTERN.search(text)
-  if not match:
+  raw = scan_blocks(text).raw(DELTA_RISK_REGISTER_MARKER)
+  if raw is None:
     return None
-  raw = match.group(1)
   try:
     data = yaml.safe_load(raw) or {}
   except yaml.YAMLError as exc:
@@ -0,0 +1,116 @@
+"""Tests for compiling BlockMetadata into validation closures."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import patch
+
+from . import compiler
+from .schema import BlockMetadata, ConditionalRule, FieldMetadata
+from .validator import SEVERITY_ERROR, SEVERITY_WARNING, MetadataValidator
+
+
+def _relations_block() -> BlockMetadata:
+  return BlockMetadata(
+    version=1,
+    schema_id="test.relations",
+    fields={
+      "kind": FieldMetadata(type="enum", enum_values=["a", "b"], required=True),
+      "items": FieldMetadata(
+        type="array",
+        items=FieldMetadata(
+          type="object",
+          field_aliases={"ref": "id", "target": "id"},
+          properties={
+            "id": FieldMetadata(type="string", required=True, pattern=r"^X-\d+$"),
+            "meta": FieldMetadata(
+              type="object",
+              properties={"rev": FieldMetadata(type="int")},
+            ),
+          },
+          conditional_rules=[
+            ConditionalRule(
+              condition_field="meta.rev",
+              condition_value=2,
+              requires=["note"],
+            ),
+          ],
+        ),
+      ),
+    },
+  )
+
+
+def test_metadata_compiled_once_per_validator() -> None:
+  """Compilation happens on first validate and is reused afterwards."""
+  validator = MetadataValidator(_relations_block())
+  with patch.object(
+    compiler,
+    "compile_metadata",
+    wraps=compiler.compile_metadata,
+  ) as compile_spy:
+    for _ in range(3):
+      validator.validate({"kind": "a"})
+  assert compile_spy.call_count == 1
+
+
+def test_value_found_under_last_present_alias() -> None:
+  """With several aliases present, the last declared one supplies the value."""
+  validator = MetadataValidator(_relations_block())
+  errors = validator.validate(
+    {"kind": "a", "items": [{"ref": "X-1", "target": "bad"}]},
+    strict=True,
+  )
+  assert [(e.path, e.message, e.severity) for e in errors] == [
+    ("items[0].ref", "field name 'ref' is an alias for 'id'", SEVERITY_WARNING),
+    ("items[0].target", "field name 'target' is an alias for 'id'", SEVERITY_WARNING),
+    ("items[0].id", "does not match required pattern", SEVERITY_ERROR),
+  ]
+
+
+def test_nested_diagnostics_in_document_order() -> None:
+  """Aliases, fields, unknown keys, then conditional rules, per object."""
+  validator = MetadataValidator(_relations_block())
+  errors = validator.validate(
+    {
+      "kind": "c",
+      "items": [{"id": "X-1", "meta": {"rev": 2}, "extra": 1}, {"meta": []}],
+      "bogus": True,
+    },
+    strict=True,
+  )
+  assert [(e.path, e.message) for e in errors] == [
+    ("kind", "must be one of allowed values"),
+    ("items[0].extra", "unknown key"),
+    ("items[0].note", "is required when meta.rev=2"),
+    ("items[1].id", "is required"),
+    ("items[1].meta", "must be an object"),
+    ("bogus", "unknown key"),
+  ]
+
+
+def test_shared_validator_is_thread_safe() -> None:
+  """Concurrent strict and tolerant calls do not leak options into each other."""
+  validator = MetadataValidator(_relations_block())
+  data = {"kind": "c", "items": [{"ref": "X-1"}]}
+  expected = {
+    True: validator.validate(data, strict=True),
+    False: validator.validate(data, strict=False),
+  }
+  mismatches: list[bool] = []
+  barrier = threading.Barrier(4)
+
+  def worker(strict: bool) -> None:
+    barrier.wait(timeout=5)
+    for _ in range(200):
+      if validator.validate(data, strict=strict) != expected[strict]:
+        mismatches.append(strict)
+
+  threads = [threading.Thread(target=worker, args=(i % 2 == 0,)) for i in range(4)]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+
+  assert expected[True] != expected[False]
+  assert mismatches == []
@@ -41,12 +41,14 @@ from typing import Any
 
 import yaml
 
-from supekku.scripts.lib.blocks.schema_registry import BLOCK_SCHEMAS, BlockSchema
-from supekku.scripts.lib.blocks.yaml_utils import make_block_pattern
+from supekku.scripts.lib.blocks.schema_registry import (
+  BLOCK_SCHEMAS,
+  BlockSchema,
+  get_block_validator,
+)
+from supekku.scripts.lib.blocks.yaml_utils import scan_blocks
 from supekku.scripts.lib.core.spec_utils import load_markdown_file
 
-from .validator import MetadataValidator
-
 # Adapter signature: (data: dict, frontmatter_id: str | None) -> list[str of errors]
 HandRolledAdapter = Callable[[dict[str, Any], str | None], list[str]]
 
@@ -136,10 +138,9 @@ def _scan_file(
     text = file.read_text(encoding="utf-8")
   except OSError:
     return
+  scan = scan_blocks(text)
   for block_type, schema in BLOCK_SCHEMAS.items():
-    pattern = make_block_pattern(schema.marker)
-    for match in pattern.finditer(text):
-      raw = match.group(1)
+    for raw in scan.raws(schema.marker):
       try:
         parsed = yaml.safe_load(raw) or {}
       except yaml.YAMLError as exc:
@@ -170,12 +171,11 @@ def compare_block(
 ) -> Disagreement | None:
   """Dual-validate a single block; return ``Disagreement`` on verdict mismatch."""
   adapter = HAND_ROLLED_ADAPTERS.get(block_type)
-  if adapter is None or schema.metadata is None:
+  validator = get_block_validator(block_type)
+  if adapter is None or validator is None:
     return None
   hand_rolled_errors = adapter(data, frontmatter_id)
-  metadata_errors = [
-    str(e) for e in MetadataValidator(schema.metadata).validate(data, strict=True)
-  ]
+  metadata_errors = [str(e) for e in validator.validate(data, strict=True)]
   hand_rolled_passed = not hand_rolled_errors
   metadata_passed = not metadata_errors
   if hand_rolled_passed != metadata_passed:
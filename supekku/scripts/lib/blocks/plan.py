@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 import yaml
 
-from .yaml_utils import format_yaml_list, make_block_pattern
+from .yaml_utils import format_yaml_list, scan_blocks
 
 if TYPE_CHECKING:
   from pathlib import Path
@@ -49,11 +49,6 @@ class PhaseTrackingBlock:
   data: dict[str, Any]
 
 
-_PLAN_PATTERN = make_block_pattern(PLAN_MARKER)
-_PHASE_PATTERN = make_block_pattern(PHASE_MARKER)
-_TRACKING_PATTERN = make_block_pattern(TRACKING_MARKER)
-
-
 def _format_yaml_error(
   error: yaml.YAMLError,
   yaml_content: str,
@@ -92,10 +87,9 @@ def extract_plan_overview(
   source_path: Path | None = None,
 ) -> PlanOverviewBlock | None:
   """Extract and parse plan overview YAML block from markdown text."""
-  match = _PLAN_PATTERN.search(text)
-  if not match:
+  raw = scan_blocks(text).raw(PLAN_MARKER)
+  if raw is None:
     return None
-  raw = match.group(1)
   try:
     data = yaml.safe_load(raw) or {}
   except yaml.YAMLError as e:
@@ -112,10 +106,9 @@ def extract_phase_overview(
   source_path: Path | None = None,
 ) -> PhaseOverviewBlock | None:
   """Extract and parse phase overview YAML block from markdown text."""
-  match = _PHASE_PATTERN.search(text)
-  if not match:
+  raw = scan_blocks(text).raw(PHASE_MARKER)
+  if raw is None:
     return None
-  raw = match.group(1)
   try:
     data = yaml.safe_load(raw) or {}
   except yaml.YAMLError as e:
@@ -140,10 +133,9 @@ def extract_phase_tracking(
   Returns:
     PhaseTrackingBlock if found, None otherwise (for backward compatibility).
   """
-  match = _TRACKING_PATTERN.search(text)
-  if not match:
+  raw = scan_blocks(text).raw(TRACKING_MARKER)
+  if raw is None:
     return None
-  raw = match.group(1)
   try:
     data = yaml.safe_load(raw) or {}
   except yaml.YAMLError as e:
@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING, Any
 
 import yaml
 
-from .yaml_utils import format_yaml_list, make_block_pattern
+from .yaml_utils import format_yaml_list, scan_blocks
 
 if TYPE_CHECKING:
   from pathlib import Path
@@ -69,12 +69,6 @@ class SpecDecisionsBlock:
   data: dict[str, Any]
 
 
-_RELATIONSHIPS_PATTERN = make_block_pattern(SPEC_RELATIONSHIPS_MARKER)
-_CONCERNS_PATTERN = make_block_pattern(CONCERNS_MARKER)
-_HYPOTHESES_PATTERN = make_block_pattern(HYPOTHESES_MARKER)
-_DECISIONS_PATTERN = make_block_pattern(DECISIONS_MARKER)
-
-
 def extract_relationships(block: str) -> RelationshipsBlock | None:
   """Extract and parse relationships block from markdown content.
 
@@ -87,10 +81,9 @@ def extract_relationships(block: str) -> RelationshipsBlock | None:
   Raises:
     ValueError: If YAML is invalid or doesn't parse to a mapping.
   """
-  match = _RELATIONSHIPS_PATTERN.search(block)
-  if not match:
+  raw = scan_blocks(block).raw(SPEC_RELATIONSHIPS_MARKER)
+  if raw is None:
     return None
-  raw = match.group(1)
   try:
     data = yaml.safe_load(raw) or {}
   except yaml.YAMLError as exc:  # pragma: no cover
@@ -241,10 +234,9 @@ def render_spec_capabilities_block(
 
 def extract_spec_concerns(text: str) -> SpecConcernsBlock | None:
   """Extract spec concerns block from markdown text."""
-  match = _CONCERNS_PATTERN.search(text)
-  if not match:
+  raw = scan_blocks(text).raw(CONCERNS_MARKER)
+  if raw is None:
     return None
-  raw = match.group(1)
   try:
     data = yaml.safe_load(raw) or {}
   except yaml.YAMLError as exc:
@@ -258,10 +250,9 @@ def extract_spec_concerns(text: str) -> SpecConcernsBlock | None:
 
 def extract_spec_hypotheses(text: str) -> SpecHypothesesBlock | None:
   """Extract spec hypotheses block from markdown text."""
-  match = _HYPOTHESES_PATTERN.search(text)
-  if not match:
+  raw = scan_blocks(text).raw(HYPOTHESES_MARKER)
+  if raw is None:
     return None
-  raw = match.group(1)
   try:
     data = yaml.safe_load(raw) or {}
   except yaml.YAMLError as exc:
@@ -275,10 +266,9 @@ def extract_spec_hypotheses(text: str) -> SpecHypothesesBlock | None:
 
 def extract_spec_decisions(text: str) -> SpecDecisionsBlock | None:
   """Extract spec decisions block from markdown text."""
-  match = _DECISIONS_PATTERN.search(text)
-  if not match:
+  raw = scan_blocks(text).raw(DECISIONS_MARKER)
+  if raw is None:
     return None
-  raw = match.group(1)
   try:
     data = yaml.safe_load(raw) or {}
   except yaml.YAMLError as exc:
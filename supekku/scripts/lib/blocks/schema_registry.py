@@ -7,6 +7,8 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from .metadata.validator import MetadataValidator
+
 if TYPE_CHECKING:
   from .metadata.schema import BlockMetadata
 
@@ -63,6 +65,9 @@ class BlockSchema:
 # Registry mapping block type -> schema
 BLOCK_SCHEMAS: dict[str, BlockSchema] = {}
 
+# Block type -> validator for its schema's metadata, compiled on first use
+_VALIDATORS: dict[str, MetadataValidator] = {}
+
 
 def register_block_schema(block_type: str, schema: BlockSchema) -> None:
   """Register a block schema.
@@ -72,6 +77,7 @@ def register_block_schema(block_type: str, schema: BlockSchema) -> None:
     schema: BlockSchema instance to register
   """
   BLOCK_SCHEMAS[block_type] = schema
+  _VALIDATORS.pop(block_type, None)
 
 
 def get_block_schema(block_type: str) -> BlockSchema | None:
@@ -86,6 +92,28 @@ def get_block_schema(block_type: str) -> BlockSchema | None:
   return BLOCK_SCHEMAS.get(block_type)
 
 
+def get_block_validator(block_type: str) -> MetadataValidator | None:
+  """Get the shared validator for a block type's metadata.
+
+  The validator is created once per registered schema, so its metadata is
+  compiled once per process however many blocks are validated.
+
+  Args:
+    block_type: Block type identifier
+
+  Returns:
+    MetadataValidator, or None if the block type is unknown or has no
+    metadata
+  """
+  schema = BLOCK_SCHEMAS.get(block_type)
+  if schema is None or schema.metadata is None:
+    return None
+  validator = _VALIDATORS.get(block_type)
+  if validator is None or validator.metadata is not schema.metadata:
+    validator = _VALIDATORS[block_type] = MetadataValidator(schema.metadata)
+  return validator
+
+
 def list_block_types() -> list[str]:
   """List all registered block types.
 
@@ -99,6 +127,7 @@ __all__ = [
   "BLOCK_SCHEMAS",
   "BlockSchema",
   "get_block_schema",
+  "get_block_validator",
   "list_block_types",
   "register_block_schema",
 ]
@@ -5,7 +5,12 @@ from __future__ import annotations
 import unittest
 
 from .metadata.schema import BlockMetadata, FieldMetadata
-from .schema_registry import BlockSchema
+from .schema_registry import (
+  BLOCK_SCHEMAS,
+  BlockSchema,
+  get_block_validator,
+  register_block_schema,
+)
 
 
 def _stub_renderer(spec_id: str) -> str:
@@ -57,5 +62,62 @@ class BlockSchemaRendererOptionalTest(unittest.TestCase):
     assert schema.metadata is metadata
 
 
+class GetBlockValidatorTest(unittest.TestCase):
+  """``get_block_validator`` shares one compiled validator per schema."""
+
+  def setUp(self) -> None:
+    self._saved = dict(BLOCK_SCHEMAS)
+    self.addCleanup(self._restore)
+
+  def _restore(self) -> None:
+    BLOCK_SCHEMAS.clear()
+    BLOCK_SCHEMAS.update(self._saved)
+
+  def _register(self, pattern: str) -> None:
+    metadata = BlockMetadata(
+      version=1,
+      schema_id="test.validator",
+      fields={"id": FieldMetadata(type="string", required=True, pattern=pattern)},
+    )
+    register_block_schema(
+      "test.validator",
+      BlockSchema(
+        name="test.validator",
+        marker="supekku:test.validator@v1",
+        version=1,
+        description="d",
+        metadata=metadata,
+      ),
+    )
+
+  def test_validator_is_reused(self) -> None:
+    """Repeated lookups return the same validator instance."""
+    self._register(r"^X-\d+$")
+    validator = get_block_validator("test.validator")
+    assert validator is not None
+    assert validator is get_block_validator("test.validator")
+    assert validator.validate({"id": "X-1"}) == []
+
+  def test_reregistration_replaces_validator(self) -> None:
+    """Registering a new schema for the type drops the cached validator."""
+    self._register(r"^X-\d+$")
+    validator = get_block_validator("test.validator")
+    assert validator is not None
+    assert validator.validate({"id": "Y-1"})
+    self._register(r"^Y-\d+$")
+    validator = get_block_validator("test.validator")
+    assert validator is not None
+    assert validator.validate({"id": "Y-1"}) == []
+
+  def test_unknown_or_metadata_less_type(self) -> None:
+    """Types without metadata have no validator."""
+    register_block_schema(
+      "test.no_metadata",
+      BlockSchema(name="x", marker="m", version=1, description="d"),
+    )
+    assert get_block_validator("test.no_metadata") is None
+    assert get_block_validator("test.unregistered") is None
+
+
 if __name__ == "__main__":
   unittest.main()
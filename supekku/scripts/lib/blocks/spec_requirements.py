@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 import yaml
 
-from supekku.scripts.lib.blocks.yaml_utils import make_block_pattern
+from supekku.scripts.lib.blocks.yaml_utils import scan_blocks
 
 if TYPE_CHECKING:
   from pathlib import Path
@@ -25,22 +25,19 @@ class SpecRequirementsBlock:
   data: dict[str, Any]
 
 
-_REQUIREMENTS_PATTERN = make_block_pattern(REQUIREMENTS_MARKER)
-
-
 def extract_spec_requirements(text: str) -> SpecRequirementsBlock | None:
   """Extract a single spec requirements block from markdown content.
 
   Returns None if no block found. Raises ValueError on malformed YAML
   or if multiple blocks are present (DEC-140-15).
   """
-  matches = list(_REQUIREMENTS_PATTERN.finditer(text))
-  if not matches:
+  raws = scan_blocks(text).raws(REQUIREMENTS_MARKER)
+  if not raws:
     return None
-  if len(matches) > 1:
+  if len(raws) > 1:
     msg = "multiple spec.requirements blocks found; exactly one is allowed"
     raise ValueError(msg)
-  raw = matches[0].group(1)
+  raw = raws[0]
   try:
     data = yaml.safe_load(raw) or {}
   except yaml.YAMLError as exc:
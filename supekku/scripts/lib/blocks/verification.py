@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 import yaml
 
-from supekku.scripts.lib.blocks.yaml_utils import make_block_pattern
+from supekku.scripts.lib.blocks.yaml_utils import scan_blocks
 
 if TYPE_CHECKING:
   from pathlib import Path
@@ -37,9 +37,6 @@ class VerificationCoverageBlock:
   data: dict[str, Any]
 
 
-_COVERAGE_PATTERN = make_block_pattern(COVERAGE_MARKER)
-
-
 def extract_coverage_blocks(text: str) -> list[VerificationCoverageBlock]:
   """Extract and parse all coverage blocks from markdown content.
 
@@ -53,8 +50,7 @@ def extract_coverage_blocks(text: str) -> list[VerificationCoverageBlock]:
     ValueError: If YAML is invalid or doesn't parse to a mapping.
   """
   blocks: list[VerificationCoverageBlock] = []
-  for match in _COVERAGE_PATTERN.finditer(text):
-    raw = match.group(1)
+  for raw in scan_blocks(text).raws(COVERAGE_MARKER):
     try:
       data = yaml.safe_load(raw) or {}
     except yaml.YAMLError as exc:  # pragma: no cover
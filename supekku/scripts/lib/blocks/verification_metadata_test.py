@@ -14,6 +14,9 @@ from supekku.scripts.lib.blocks.metadata import (
   metadata_to_json_schema,
 )
 
+# Import the parser first, as the sibling *_metadata tests do: it registers
+# the block schema and imports this metadata module in turn.
+from . import verification  # noqa: F401
 from .verification_metadata import VERIFICATION_COVERAGE_METADATA
 
 
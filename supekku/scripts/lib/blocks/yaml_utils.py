@@ -1,8 +1,16 @@
-"""Utilities for formatting YAML blocks."""
+"""Utilities for locating and formatting fenced YAML blocks."""
 
 from __future__ import annotations
 
+import functools
 import re
+from typing import Any
+
+import yaml
+
+# Opening fence of any marked block: ```yaml <marker>\n
+_FENCE_OPEN_PATTERN = re.compile(r"```(?:yaml|yml)\s+(\S+)\n")
+_FENCE = "```"
 
 
 def make_block_pattern(marker: str) -> re.Pattern[str]:
@@ -28,6 +36,73 @@ def make_block_pattern(marker: str) -> re.Pattern[str]:
   )
 
 
+class BlockScan:
+  """Raw text of every marked fenced YAML block in a document.
+
+  Built by :func:`scan_blocks` in a single pass over the text, so a
+  document carrying several block kinds is scanned once rather than once
+  per marker. For each marker the blocks found are exactly those
+  ``make_block_pattern(marker).finditer(text)`` would yield. YAML is only
+  parsed when :meth:`load` is called.
+  """
+
+  __slots__ = ("_blocks",)
+
+  def __init__(self, text: str) -> None:
+    blocks: dict[str, list[str]] = {}
+    ends: dict[str, int] = {}
+    for match in _FENCE_OPEN_PATTERN.finditer(text):
+      marker = match.group(1)
+      # A per-marker regex resumes after the previous block's closing fence.
+      if match.start() < ends.get(marker, 0):
+        continue
+      body_start = match.end()
+      close = text.find(_FENCE, body_start)
+      if close < 0:
+        break
+      blocks.setdefault(marker, []).append(text[body_start:close])
+      ends[marker] = close + len(_FENCE)
+    self._blocks = {marker: tuple(raws) for marker, raws in blocks.items()}
+
+  @property
+  def markers(self) -> tuple[str, ...]:
+    """Markers present in the document, in order of first appearance."""
+    return tuple(self._blocks)
+
+  def raws(self, marker: str) -> tuple[str, ...]:
+    """Return the bodies of all blocks tagged *marker*, in document order."""
+    return self._blocks.get(marker, ())
+
+  def raw(self, marker: str) -> str | None:
+    """Return the body of the first block tagged *marker*, if any."""
+    raws = self._blocks.get(marker)
+    return raws[0] if raws else None
+
+  def load(self, marker: str) -> Any:
+    """Parse the first block tagged *marker* as YAML.
+
+    Parsed data is not cached, so callers may mutate the result.
+
+    Returns:
+      The parsed YAML, or None if no such block exists.
+
+    Raises:
+      yaml.YAMLError: If the block body is not valid YAML.
+    """
+    raw = self.raw(marker)
+    return None if raw is None else yaml.safe_load(raw)
+
+
+@functools.lru_cache(maxsize=64)
+def scan_blocks(text: str) -> BlockScan:
+  """Scan *text* once for every marked fenced YAML block.
+
+  Results are memoised by document text, so extractors called in turn on
+  the same body (relationships, plan, tracking, ...) share one scan.
+  """
+  return BlockScan(text)
+
+
 def format_yaml_list(key: str, values: list[str] | None, level: int = 0) -> str:
   """Format a YAML list with proper indentation.
 
@@ -55,4 +130,4 @@ def format_yaml_list(key: str, values: list[str] | None, level: int = 0) -> str:
   return "\n".join(lines)
 
 
-__all__ = ["format_yaml_list", "make_block_pattern"]
+__all__ = ["BlockScan", "format_yaml_list", "make_block_pattern", "scan_blocks"]
@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
-from supekku.scripts.lib.blocks.yaml_utils import make_block_pattern
+import pytest
+import yaml
+
+from supekku.scripts.lib.blocks.yaml_utils import (
+  BlockScan,
+  make_block_pattern,
+  scan_blocks,
+)
 
 
 class TestMakeBlockPattern:
@@ -43,3 +50,55 @@ class TestMakeBlockPattern:
     m1 = make_block_pattern("marker-a")
     m2 = make_block_pattern("marker-b")
     assert m1.pattern != m2.pattern
+
+
+A = "supekku:a.block@v1"
+B = "supekku:b.block@v1"
+
+SCAN_CASES = [
+  "no blocks here",
+  f"```yaml {A}\nx: 1\n```\n\n```yml {B}\ny: 2\n```\n",
+  f"```yaml {A}\nfirst: 1\n```\ntext\n```yaml {A}\nsecond: 2\n```\n",
+  f"```yaml\n{A}\nx: 1\n```",
+  f"```yaml {A}\nunclosed: true\n",
+  f"```yaml {A}\n```yaml {B}\ny: 2\n```",
+  f"```yaml {A}  \nx: 1\n```",
+  f"```yaml {A} extra\nx: 1\n```",
+  f"```python\nprint(1)\n```\n```yaml {B}\n```\n",
+  f"```yaml {A}\na: 1\n``````yaml {A}\nb: 2\n```",
+]
+
+
+class TestScanBlocks:
+  """scan_blocks finds what make_block_pattern finds, for every marker."""
+
+  @pytest.mark.parametrize("text", SCAN_CASES)
+  def test_matches_per_marker_regex(self, text):
+    scan = BlockScan(text)
+    for marker in (A, B):
+      expected = [m.group(1) for m in make_block_pattern(marker).finditer(text)]
+      assert list(scan.raws(marker)) == expected
+      assert scan.raw(marker) == (expected[0] if expected else None)
+
+  def test_markers_in_document_order(self):
+    scan = BlockScan(SCAN_CASES[1])
+    assert scan.markers == (A, B)
+
+  def test_load_parses_on_demand(self):
+    scan = BlockScan(SCAN_CASES[1])
+    assert scan.load(A) == {"x": 1}
+    assert scan.load("supekku:missing@v1") is None
+
+  def test_load_returns_fresh_data(self):
+    scan = BlockScan(SCAN_CASES[1])
+    scan.load(A)["x"] = 99
+    assert scan.load(A) == {"x": 1}
+
+  def test_load_raises_on_invalid_yaml(self):
+    scan = BlockScan(f"```yaml {A}\nkey: [unclosed\n```")
+    with pytest.raises(yaml.YAMLError):
+      scan.load(A)
+
+  def test_scan_is_shared_for_same_text(self):
+    text = SCAN_CASES[2] + "\n<!-- shared -->"
+    assert scan_blocks(text) is scan_blocks(text)
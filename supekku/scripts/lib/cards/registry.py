@@ -9,6 +9,7 @@ from pathlib import Path
 
 from supekku.scripts.lib.core import slugify
 from supekku.scripts.lib.core.ids import next_sequential_id
+from supekku.scripts.lib.core.profiling import profiled
 from supekku.scripts.lib.core.templates import get_package_templates_dir
 
 from .models import Card
@@ -75,6 +76,7 @@ class CardRegistry:
 
   # ------------------------------------------------------------------
 
+  @profiled("registry.card")
   def all_cards(self) -> list[Card]:
     """Discover all cards in kanban directory.
 
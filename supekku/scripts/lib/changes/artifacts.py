@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from functools import partial
+from typing import TYPE_CHECKING, Any, overload
 
 from rich.console import Console
 
@@ -22,11 +23,14 @@ from supekku.scripts.lib.blocks.revision import (
 )
 from supekku.scripts.lib.changes.phase_model import PhaseSheet
 from supekku.scripts.lib.core.spec_utils import load_markdown_file
-from supekku.scripts.lib.relations.manager import list_relations
+from supekku.scripts.lib.relations.manager import relations_from_frontmatter
 
 from .lifecycle import CHANGE_STATUSES
 
 if TYPE_CHECKING:
+  from collections.abc import Callable
+
+  PlanPayload = dict[str, Any] | None
   from pathlib import Path
 
 
@@ -128,6 +132,43 @@ def _derive_revision_applies_to(
   return dict(fm) if isinstance(fm, dict) else {}
 
 
+class _DeferredPlan:
+  """Data descriptor behind ``ChangeArtifact.plan``.
+
+  Holds the plan payload, or a zero-argument loader installed by
+  :meth:`defer` that is called — once — on first access. Listing deltas then
+  reads only the DE files unless a caller actually looks at plans and phases.
+  """
+
+  def __set_name__(self, owner: type, name: str) -> None:
+    self._attr = f"_{name}"
+
+  @overload
+  def __get__(self, obj: None, objtype: type | None = None) -> None: ...
+
+  @overload
+  def __get__(self, obj: object, objtype: type | None = None) -> PlanPayload: ...
+
+  def __get__(self, obj: object, objtype: type | None = None) -> PlanPayload:
+    if obj is None:
+      return None  # the dataclass field default
+    source: PlanPayload | Callable[[], PlanPayload] = vars(obj)[self._attr]
+    if source is None or isinstance(source, dict):
+      return source
+    plan = vars(obj)[self._attr] = source()
+    return plan
+
+  def __set__(self, obj: object, value: PlanPayload) -> None:
+    vars(obj)[self._attr] = value
+
+  def defer(self, obj: object, loader: Callable[[], PlanPayload]) -> None:
+    """Have *obj*'s plan come from *loader* on first access."""
+    vars(obj)[self._attr] = loader
+
+
+_PLAN = _DeferredPlan()
+
+
 @dataclass(frozen=True)
 class ChangeArtifact:
   """Represents a change artifact with metadata and relationships."""
@@ -142,7 +183,11 @@ class ChangeArtifact:
   tags: list[str] = field(default_factory=list)
   applies_to: dict[str, Any] = field(default_factory=dict)
   relations: list[dict[str, Any]] = field(default_factory=list)
-  plan: dict[str, Any] | None = None
+  if TYPE_CHECKING:
+    plan: dict[str, Any] | None = None
+  else:
+    # Loaded on first access for deltas; see _DeferredPlan.
+    plan: _DeferredPlan = _PLAN
   ext_id: str = ""
   ext_url: str = ""
   audit_gate: str | None = None
@@ -184,6 +229,84 @@ class ChangeArtifact:
     return data
 
 
+def _load_delta_plan(path: Path, plan_id: str) -> dict[str, Any] | None:
+  """Read a delta's implementation plan and phase sheets.
+
+  Args:
+    path: Path to the delta markdown file; the plan and ``phases/``
+      directory live alongside it.
+    plan_id: Plan ID (``IP-*``) derived from the delta ID.
+
+  Returns:
+    Plan payload with ``id``, ``overview`` and ``phases``, or None when the
+    delta has neither a plan overview nor phase sheets.
+  """
+  plan_path = path.parent / f"{plan_id}.md"
+  plan_block = None
+  if plan_path.exists():
+    try:
+      plan_block = extract_plan_overview(
+        plan_path.read_text(encoding="utf-8"),
+        source_path=plan_path,
+      )
+    except ValueError:
+      plan_block = None
+
+  phases_data: list[dict[str, Any]] = []
+  phase_lookup: dict[str, dict[str, Any]] = {}
+  if plan_block:
+    for entry in plan_block.data.get("phases", []) or []:
+      if isinstance(entry, dict) and entry.get("id"):
+        phase_lookup[str(entry["id"])] = entry
+
+  phases_dir = path.parent / "phases"
+  if phases_dir.exists():
+    for phase_file in sorted(phases_dir.glob("*.md")):
+      try:
+        fm_data, _ = load_markdown_file(phase_file)
+      except (ValueError, OSError) as exc:
+        Console(stderr=True).print(
+          f"[yellow]WARNING:[/yellow] Skipping phase file: {exc}"
+        )
+        continue
+
+      # Prefer frontmatter when canonical fields are present (DR-106)
+      sheet = PhaseSheet(**fm_data) if fm_data else PhaseSheet()
+      if sheet.has_canonical_fields():
+        phase_entry = sheet.to_phase_entry()
+        # Carry base frontmatter fields that downstream consumers expect
+        phase_entry.setdefault("phase", fm_data.get("id"))
+        phase_entry.setdefault("status", fm_data.get("status"))
+      else:
+        # Legacy fallback: extract from phase.overview block
+        try:
+          content = phase_file.read_text(encoding="utf-8")
+          phase_block = extract_phase_overview(content, source_path=phase_file)
+        except ValueError:
+          continue
+        if not phase_block:
+          continue
+        phase_entry = phase_block.data.copy()
+        phase_entry.setdefault("phase", phase_entry.get("id"))
+
+      phases_data.append(phase_entry)
+      phase_id = str(phase_entry.get("phase", ""))
+      phase_lookup.pop(phase_id, None)
+
+  for phase_data in phase_lookup.values():
+    phase_copy = phase_data.copy()
+    phase_copy.setdefault("phase", phase_copy.get("id"))
+    phases_data.append(phase_copy)
+
+  if not plan_block and not phases_data:
+    return None
+  return {
+    "id": plan_id,
+    "overview": plan_block.data if plan_block else {},
+    "phases": phases_data,
+  }
+
+
 def load_change_artifact(path: Path) -> ChangeArtifact | None:
   """Load and parse a change artifact from markdown file.
 
@@ -221,8 +344,8 @@ def load_change_artifact(path: Path) -> ChangeArtifact | None:
   tags_list = [str(tag) for tag in tags] if isinstance(tags, list) else []
   applies_to = frontmatter.get("applies_to")
   applies_to_mapping = dict(applies_to) if isinstance(applies_to, dict) else {}
-  relations = [rel.__dict__ for rel in list_relations(path)]
-  plan_payload: dict[str, Any] | None = None
+  relations = [rel.__dict__ for rel in relations_from_frontmatter(frontmatter)]
+  plan_loader: Callable[[], PlanPayload] | None = None
 
   if kind == "delta":
     block: DeltaRelationshipsBlock | None = None
@@ -233,70 +356,7 @@ def load_change_artifact(path: Path) -> ChangeArtifact | None:
     applies_to_mapping = _derive_applies_to(block, frontmatter)
     relations.extend(_derive_revision_link_relations(block))
 
-    plan_id = artifact_id.replace("DE", "IP")
-    plan_path = path.parent / f"{plan_id}.md"
-    plan_block = None
-    if plan_path.exists():
-      try:
-        plan_block = extract_plan_overview(
-          plan_path.read_text(encoding="utf-8"),
-          source_path=plan_path,
-        )
-      except ValueError:
-        plan_block = None
-
-    phases_data: list[dict[str, Any]] = []
-    phase_lookup: dict[str, dict[str, Any]] = {}
-    if plan_block:
-      for entry in plan_block.data.get("phases", []) or []:
-        if isinstance(entry, dict) and entry.get("id"):
-          phase_lookup[str(entry["id"])] = entry
-
-    phases_dir = path.parent / "phases"
-    if phases_dir.exists():
-      for phase_file in sorted(phases_dir.glob("*.md")):
-        try:
-          fm_data, _ = load_markdown_file(phase_file)
-        except (ValueError, OSError) as exc:
-          Console(stderr=True).print(
-            f"[yellow]WARNING:[/yellow] Skipping phase file: {exc}"
-          )
-          continue
-
-        # Prefer frontmatter when canonical fields are present (DR-106)
-        sheet = PhaseSheet(**fm_data) if fm_data else PhaseSheet()
-        if sheet.has_canonical_fields():
-          phase_entry = sheet.to_phase_entry()
-          # Carry base frontmatter fields that downstream consumers expect
-          phase_entry.setdefault("phase", fm_data.get("id"))
-          phase_entry.setdefault("status", fm_data.get("status"))
-        else:
-          # Legacy fallback: extract from phase.overview block
-          try:
-            content = phase_file.read_text(encoding="utf-8")
-            phase_block = extract_phase_overview(content, source_path=phase_file)
-          except ValueError:
-            continue
-          if not phase_block:
-            continue
-          phase_entry = phase_block.data.copy()
-          phase_entry.setdefault("phase", phase_entry.get("id"))
-
-        phases_data.append(phase_entry)
-        phase_id = str(phase_entry.get("phase", ""))
-        phase_lookup.pop(phase_id, None)
-
-    for phase_data in phase_lookup.values():
-      phase_copy = phase_data.copy()
-      phase_copy.setdefault("phase", phase_copy.get("id"))
-      phases_data.append(phase_copy)
-
-    if plan_block or phases_data:
-      plan_payload = {
-        "id": plan_id,
-        "overview": plan_block.data if plan_block else {},
-        "phases": phases_data,
-      }
+    plan_loader = partial(_load_delta_plan, path, artifact_id.replace("DE", "IP"))
 
   elif kind == "revision":
     # applies_to derived from the change block, never read from FM scope keys
@@ -306,7 +366,7 @@ def load_change_artifact(path: Path) -> ChangeArtifact | None:
       extract_revision_blocks(body), frontmatter
     )
 
-  return ChangeArtifact(
+  artifact = ChangeArtifact(
     id=artifact_id,
     kind=kind,
     status=status,
@@ -317,7 +377,6 @@ def load_change_artifact(path: Path) -> ChangeArtifact | None:
     tags=tags_list,
     applies_to=applies_to_mapping,
     relations=relations,
-    plan=plan_payload,
     ext_id=str(frontmatter.get("ext_id", "")),
     ext_url=str(frontmatter.get("ext_url", "")),
     audit_gate=(
@@ -328,6 +387,9 @@ def load_change_artifact(path: Path) -> ChangeArtifact | None:
       str(frontmatter["delta_ref"]).strip() if frontmatter.get("delta_ref") else None
     ),
   )
+  if plan_loader is not None:
+    _PLAN.defer(artifact, plan_loader)
+  return artifact
 
 
 __all__ = ["ChangeArtifact", "load_change_artifact"]
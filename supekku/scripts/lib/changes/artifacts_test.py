@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import pytest
 import yaml
 
 from supekku.scripts.lib.blocks.delta import DeltaRelationshipsBlock
@@ -12,7 +13,9 @@ from supekku.scripts.lib.blocks.revision import (
   RevisionChangeBlock,
   render_revision_change_block,
 )
+from supekku.scripts.lib.changes import artifacts
 from supekku.scripts.lib.changes.artifacts import (
+  ChangeArtifact,
   _derive_applies_to,
   _derive_revision_applies_to,
   _derive_revision_link_relations,
@@ -369,6 +372,97 @@ def test_phase_falls_back_to_block_when_no_canonical_frontmatter(
   assert phase["objective"] == "Legacy block objective."
 
 
+def _write_delta_with_phase(tmp_path: Path) -> Path:
+  delta_dir = tmp_path / "DE-030"
+  phases_dir = delta_dir / "phases"
+  phases_dir.mkdir(parents=True)
+  dump_markdown_file_update(
+    delta_dir / "DE-030.md",
+    {
+      "id": "DE-030",
+      "slug": "lazy",
+      "name": "Delta – Lazy",
+      "created": "2024-01-01",
+      "updated": "2024-01-01",
+      "status": "draft",
+      "kind": "delta",
+      "relations": [{"type": "implements", "target": "SPEC-500.FR-001"}],
+    },
+    "# DE-030\n",
+  )
+  dump_markdown_file_update(
+    phases_dir / "phase-01.md",
+    {
+      "id": "IP-030.PHASE-01",
+      "slug": "phase-01",
+      "name": "Phase 01",
+      "created": "2024-01-01",
+      "updated": "2024-01-01",
+      "status": "completed",
+      "kind": "phase",
+      "plan": "IP-030",
+      "delta": "DE-030",
+    },
+    "# Phase 01\n",
+  )
+  return delta_dir / "DE-030.md"
+
+
+def test_delta_file_read_once_and_plan_deferred(
+  tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+  """Loading reads only the DE file; plan and phases load on first access."""
+  path = _write_delta_with_phase(tmp_path)
+  reads: list[str] = []
+  real_load = artifacts.load_markdown_file
+
+  def _counting_load(target):
+    reads.append(target.name)
+    return real_load(target)
+
+  monkeypatch.setattr(artifacts, "load_markdown_file", _counting_load)
+
+  artifact = load_change_artifact(path)
+  assert artifact
+  assert reads == ["DE-030.md"]
+  assert artifact.relations == [
+    {"type": "implements", "target": "SPEC-500.FR-001", "attributes": {}},
+  ]
+
+  assert artifact.plan is not None
+  assert artifact.plan["phases"][0]["phase"] == "IP-030.PHASE-01"
+  assert reads == ["DE-030.md", "phase-01.md"]
+
+  # Resolved once, then held.
+  assert artifact.plan is artifact.plan
+  assert reads == ["DE-030.md", "phase-01.md"]
+
+
+def test_deferred_plan_resolves_to_none_without_plan(tmp_path: Path) -> None:
+  """A delta without plan or phases still reports ``plan`` as None."""
+  path = _write_delta(tmp_path, "# DE-010\n")
+  artifact = load_change_artifact(path)
+  assert artifact
+  assert artifact.plan is None
+  assert "plan" not in artifact.to_dict(tmp_path)
+
+
+def test_plan_accepts_eager_payload(tmp_path: Path) -> None:
+  """Constructing with a plan dict keeps it as-is; the default is None."""
+  plan = {"id": "IP-001", "overview": {}, "phases": []}
+  common: dict[str, Any] = {
+    "id": "DE-001",
+    "kind": "delta",
+    "status": "draft",
+    "name": "Delta",
+    "slug": "delta",
+    "path": tmp_path / "DE-001.md",
+    "updated": None,
+  }
+  assert ChangeArtifact(**common, plan=plan).plan is plan
+  assert ChangeArtifact(**common).plan is None
+
+
 def test_ext_id_and_ext_url_loaded_from_frontmatter(tmp_path: Path) -> None:
   """VT-067-001: ext_id and ext_url are loaded from frontmatter."""
   path = tmp_path / "DE-030.md"
@@ -15,12 +15,13 @@ from supekku.scripts.lib.core.paths import (
   get_registry_dir,
   get_revisions_dir,
 )
+from supekku.scripts.lib.core.profiling import profile_phase
 from supekku.scripts.lib.core.repo import find_repo_root
 
 from .artifacts import ChangeArtifact, load_change_artifact
 
 if TYPE_CHECKING:
-  from collections.abc import Iterator
+  from collections.abc import Iterable, Iterator
   from pathlib import Path
 
 _KIND_TO_DIR_NAME = {
@@ -43,7 +44,13 @@ _KIND_TO_PREFIX = {
 
 
 class ChangeRegistry:
-  """Registry for managing change artifacts of specific types."""
+  """Registry for managing change artifacts of specific types.
+
+  Artifacts are scanned from disk once, on first access, and held in an
+  in-memory index alongside secondary indexes by status, tag, applies-to spec
+  and applies-to requirement. Call ``reload()`` after writing change files through
+  another path to pick up the changes; ``sync()`` always reloads first.
+  """
 
   def __init__(self, *, root: Path | None = None, kind: str) -> None:
     if kind not in _KIND_TO_DIR_HELPER:
@@ -53,49 +60,123 @@ class ChangeRegistry:
     self.root = find_repo_root(root)
     self.directory = _KIND_TO_DIR_HELPER[kind](self.root)
     self.output_path = get_registry_dir(self.root) / f"{_KIND_TO_DIR_NAME[kind]}.yaml"
+    self._artifacts: dict[str, ChangeArtifact] | None = None
+    self._by_status: dict[str, list[str]] = {}
+    self._by_tag: dict[str, list[str]] = {}
+    self._by_spec: dict[str, list[str]] = {}
+    self._by_requirement: dict[str, list[str]] = {}
+
+  def reload(self) -> None:
+    """Reload all change artifacts from the filesystem and rebuild indexes."""
+    self.invalidate()
+    self._loaded()
+
+  def invalidate(self) -> None:
+    """Drop the in-memory index; the next lookup re-scans the directory."""
+    self._artifacts = None
+    self._by_status = {}
+    self._by_tag = {}
+    self._by_spec = {}
+    self._by_requirement = {}
+
+  def _loaded(self) -> dict[str, ChangeArtifact]:
+    """Return the primary index, scanning the directory on first use."""
+    artifacts = self._artifacts
+    if artifacts is None:
+      artifacts = self._artifacts = self._scan()
+      self._build_indexes(artifacts)
+    return artifacts
+
+  def _scan(self) -> dict[str, ChangeArtifact]:
+    """Walk the kind directory and load one artifact per bundle."""
+    artifacts: dict[str, ChangeArtifact] = {}
+    if not self.directory.exists():
+      return artifacts
+    with profile_phase(f"registry.{self.kind}"):
+      for bundle in self.directory.iterdir():
+        artifact = self._load_bundle(bundle)
+        if artifact:
+          artifacts[artifact.id] = artifact
+    return artifacts
+
+  def _load_bundle(self, bundle: Path) -> ChangeArtifact | None:
+    """Load the primary artifact of one bundle directory (or loose file)."""
+    if bundle.is_dir():
+      candidate_files = sorted(bundle.glob("*.md"))
+    elif bundle.is_file() and bundle.suffix == ".md":
+      candidate_files = [bundle]
+    else:
+      return None
+    prefix = _KIND_TO_PREFIX[self.kind]
+    selected: Path | None = None
+    for file in candidate_files:
+      if file.name.startswith(prefix):
+        selected = file
+        break
+    if selected is None and candidate_files:
+      selected = candidate_files[0]
+    if not selected:
+      return None
+    try:
+      return load_change_artifact(selected)
+    except ValueError as e:
+      # Print validation error and continue with remaining artifacts
+      console = Console(stderr=True)
+      rel_path = selected.relative_to(self.root)
+      console.print(f"[yellow]WARNING:[/yellow] Skipping {rel_path}: {e}")
+      return None
+
+  def collect_path(self, path: Path) -> dict[str, ChangeArtifact]:
+    """Reload only the bundle containing *path* (watch-driven refresh).
+
+    Any file inside a bundle (plan, phase, notes) maps to the bundle's
+    primary artifact. Returns an empty dict if *path* is outside this
+    registry's directory or the bundle no longer loads. The memoized
+    index is invalidated.
+    """
+    try:
+      rel = path.relative_to(self.directory)
+    except ValueError:
+      return {}
+    if not rel.parts:
+      return {}
+    self.invalidate()
+    artifact = self._load_bundle(self.directory / rel.parts[0])
+    return {artifact.id: artifact} if artifact else {}
+
+  def _build_indexes(self, artifacts: dict[str, ChangeArtifact]) -> None:
+    """Populate secondary indexes, preserving collection order per key."""
+    by_status: dict[str, list[str]] = {}
+    by_tag: dict[str, list[str]] = {}
+    by_spec: dict[str, list[str]] = {}
+    by_requirement: dict[str, list[str]] = {}
+    for artifact_id, artifact in artifacts.items():
+      by_status.setdefault(artifact.status, []).append(artifact_id)
+      for tag in dict.fromkeys(artifact.tags):
+        by_tag.setdefault(tag, []).append(artifact_id)
+      applies_to = artifact.applies_to or {}
+      for spec_id in _as_id_list(applies_to.get("specs")):
+        by_spec.setdefault(spec_id, []).append(artifact_id)
+      for req_id in _as_id_list(applies_to.get("requirements")):
+        by_requirement.setdefault(req_id, []).append(artifact_id)
+    self._by_status = by_status
+    self._by_tag = by_tag
+    self._by_spec = by_spec
+    self._by_requirement = by_requirement
 
   def collect(self) -> dict[str, ChangeArtifact]:
     """Collect all change artifacts from directory.
 
     Returns:
-      Dictionary mapping artifact IDs to ChangeArtifact objects.
+      Dictionary mapping artifact IDs to ChangeArtifact objects
+      (a copy of the in-memory index).
     """
-    artifacts: dict[str, ChangeArtifact] = {}
-    if not self.directory.exists():
-      return artifacts
-    prefix = _KIND_TO_PREFIX[self.kind]
-    for bundle in self.directory.iterdir():
-      if bundle.is_dir():
-        candidate_files = sorted(bundle.glob("*.md"))
-      elif bundle.is_file() and bundle.suffix == ".md":
-        candidate_files = [bundle]
-      else:
-        continue
-      selected: Path | None = None
-      for file in candidate_files:
-        if file.name.startswith(prefix):
-          selected = file
-          break
-      if selected is None and candidate_files:
-        selected = candidate_files[0]
-      if not selected:
-        continue
-      try:
-        artifact = load_change_artifact(selected)
-      except ValueError as e:
-        # Print validation error and continue with remaining artifacts
-        console = Console(stderr=True)
-        rel_path = selected.relative_to(self.root)
-        console.print(f"[yellow]WARNING:[/yellow] Skipping {rel_path}: {e}")
-        continue
-      if not artifact:
-        continue
-      artifacts[artifact.id] = artifact
-    return artifacts
+    return dict(self._loaded())
 
   def sync(self) -> None:
     """Synchronize registry file with artifacts found in directory."""
-    artifacts = self.collect()
+    self.reload()
+    artifacts = self._loaded()
     serialised = {
       _KIND_TO_DIR_NAME[self.kind]: {
         artifact_id: artifact.to_dict(self.root)
@@ -112,7 +193,7 @@ class ChangeRegistry:
     Returns:
       ChangeArtifact or None if not found.
     """
-    return self.collect().get(artifact_id)
+    return self._loaded().get(artifact_id)
 
   def iter(self, *, status: str | None = None) -> Iterator[ChangeArtifact]:
     """Iterate over change artifacts, optionally filtered by status.
@@ -123,9 +204,12 @@ class ChangeRegistry:
     Yields:
       ChangeArtifact instances.
     """
-    for artifact in self.collect().values():
-      if status is None or artifact.status == status:
-        yield artifact
+    artifacts = self._loaded()
+    if status is None:
+      yield from list(artifacts.values())
+      return
+    for artifact_id in list(self._by_status.get(status, ())):
+      yield artifacts[artifact_id]
 
   def filter(self, *, status: str | None = None) -> list[ChangeArtifact]:
     """Filter change artifacts by status (AND logic).
@@ -138,6 +222,74 @@ class ChangeRegistry:
     """
     return list(self.iter(status=status))
 
+  def find_many(self, artifact_ids: Iterable[str]) -> list[ChangeArtifact]:
+    """Find change artifacts by ID, in the order given; unknown IDs are skipped.
+
+    Before the directory has been scanned, only the bundles whose names
+    start with a requested ID are read (the ``DE-001-slug`` convention).
+    IDs not found that way trigger the full scan.
+    """
+    wanted = list(dict.fromkeys(artifact_ids))
+    if self._artifacts is None and self.directory.exists():
+      found: dict[str, ChangeArtifact] = {}
+      for bundle in self.directory.iterdir():
+        if any(_bundle_matches(bundle.name, aid) for aid in wanted):
+          artifact = self._load_bundle(bundle)
+          if artifact and artifact.id in wanted:
+            found[artifact.id] = artifact
+      if len(found) == len(wanted):
+        return [found[aid] for aid in wanted]
+    artifacts = self._loaded()
+    return [artifacts[aid] for aid in wanted if aid in artifacts]
+
+  def select(
+    self,
+    *,
+    ids: Iterable[str] | None = None,
+    statuses: Iterable[str] | None = None,
+    exclude_statuses: Iterable[str] | None = None,
+    tags: Iterable[str] | None = None,
+  ) -> list[ChangeArtifact]:
+    """Select artifacts through the secondary indexes.
+
+    Criteria combine with AND; values within ``statuses`` and ``tags`` with
+    OR. Statuses are matched exactly against the stored (canonical) value.
+
+    Args:
+      ids: Restrict to these IDs (see :meth:`find_many`).
+      statuses: Keep artifacts with any of these statuses.
+      exclude_statuses: Drop artifacts with any of these statuses.
+      tags: Keep artifacts carrying any of these tags.
+
+    Returns:
+      Matching artifacts, in ``ids`` order when given, else collection order.
+    """
+    status_set = set(statuses) if statuses else None
+    excluded = set(exclude_statuses) if exclude_statuses else set()
+    tag_list = list(tags) if tags else None
+    if ids is not None:
+      return [
+        artifact
+        for artifact in self.find_many(ids)
+        if (status_set is None or artifact.status in status_set)
+        and artifact.status not in excluded
+        and (tag_list is None or any(t in artifact.tags for t in tag_list))
+      ]
+
+    artifacts = self._loaded()
+    keep: set[str] | None = None
+    if status_set is not None:
+      keep = {aid for s in status_set for aid in self._by_status.get(s, ())}
+    if tag_list is not None:
+      tagged = {aid for t in tag_list for aid in self._by_tag.get(t, ())}
+      keep = tagged if keep is None else keep & tagged
+    dropped = {aid for s in excluded for aid in self._by_status.get(s, ())}
+    return [
+      artifact
+      for aid, artifact in artifacts.items()
+      if (keep is None or aid in keep) and aid not in dropped
+    ]
+
   def find_by_implements(self, requirement_id: str | None) -> list[ChangeArtifact]:
     """Find change artifacts that implement a specific requirement.
 
@@ -151,20 +303,36 @@ class ChangeRegistry:
     """
     if not requirement_id:
       return []
+    artifacts = self._loaded()
+    return [artifacts[aid] for aid in self._by_requirement.get(requirement_id, ())]
 
-    artifacts = self.collect()
-    matches: list[ChangeArtifact] = []
+  def find_by_spec(self, spec_id: str | None) -> list[ChangeArtifact]:
+    """Find change artifacts whose ``applies_to.specs`` includes a spec.
 
-    for artifact in artifacts.values():
-      # Check applies_to field - it's a dict with 'requirements' and 'specs' keys
-      if not artifact.applies_to:
-        continue
+    Args:
+      spec_id: The spec ID to search for (e.g., "SPEC-110").
+               Returns empty list if None or empty string.
 
-      requirements = artifact.applies_to.get("requirements", [])
-      if requirement_id in requirements:
-        matches.append(artifact)
+    Returns:
+      List of matching ChangeArtifact objects in collection order.
+    """
+    if not spec_id:
+      return []
+    artifacts = self._loaded()
+    return [artifacts[aid] for aid in self._by_spec.get(spec_id, ())]
 
-    return matches
+
+def _bundle_matches(name: str, artifact_id: str) -> bool:
+  """Return whether a bundle (or loose file) name belongs to *artifact_id*."""
+  return name == artifact_id or name.startswith((f"{artifact_id}-", f"{artifact_id}."))
+
+
+def _as_id_list(value: Any) -> list[str]:
+  """Normalise an ``applies_to`` entry (list or scalar) to unique string IDs."""
+  if not value:
+    return []
+  items = value if isinstance(value, list | tuple) else [value]
+  return list(dict.fromkeys(str(item) for item in items))
 
 
 @dataclass(frozen=True)
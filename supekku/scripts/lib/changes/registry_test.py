@@ -4,21 +4,23 @@ from __future__ import annotations
 
 import os
 import unittest
-from typing import TYPE_CHECKING
+from pathlib import Path
+from unittest.mock import patch
 
+from supekku.scripts.lib.changes import registry as registry_module
 from supekku.scripts.lib.changes.registry import ChangeRegistry
 from supekku.scripts.lib.core.paths import (
   DELTAS_SUBDIR,
   SPEC_DRIVER_DIR,
   get_registry_dir,
 )
-from supekku.scripts.lib.core.spec_utils import dump_markdown_file_update
+from supekku.scripts.lib.core.spec_utils import (
+  dump_markdown_file_update,
+  load_markdown_file,
+)
 from supekku.scripts.lib.relations.manager import add_relation
 from supekku.scripts.lib.test_base import RepoTestCase
 
-if TYPE_CHECKING:
-  from pathlib import Path
-
 
 class ChangeRegistryTest(RepoTestCase):
   """Test cases for ChangeRegistry functionality."""
@@ -75,6 +77,60 @@ class ChangeRegistryTest(RepoTestCase):
     assert "DE-101" in output
     assert "SPEC-010.FR-001" in output
 
+  def test_lookups_share_one_scan_until_reload(self) -> None:
+    """find/iter/filter reuse the in-memory index; reload() re-scans."""
+    root = self._create_repo()
+    self._write_change(root, "deltas", "DE-101")
+    registry = ChangeRegistry(root=root, kind="delta")
+
+    calls: list[Path] = []
+    original = registry_module.load_change_artifact
+
+    def _counting_load(path: Path):
+      calls.append(path)
+      return original(path)
+
+    with patch.object(registry_module, "load_change_artifact", _counting_load):
+      assert registry.find("DE-101") is not None
+      assert registry.find("DE-999") is None
+      assert [a.id for a in registry.iter(status="draft")] == ["DE-101"]
+      assert registry.filter(status="completed") == []
+      assert len(calls) == 1
+
+      self._write_change(root, "deltas", "DE-102")
+      assert registry.find("DE-102") is None
+      registry.reload()
+      assert registry.find("DE-102") is not None
+      assert len(calls) == 3
+
+  def test_sync_reloads_before_writing(self) -> None:
+    """sync() picks up artifacts written after the first lookup."""
+    root = self._create_repo()
+    self._write_change(root, "deltas", "DE-101")
+    registry = ChangeRegistry(root=root, kind="delta")
+    registry.collect()
+
+    self._write_change(root, "deltas", "DE-102")
+    registry.sync()
+
+    output = (get_registry_dir(root) / "deltas.yaml").read_text()
+    assert "DE-102" in output
+    assert registry.find("DE-102") is not None
+
+  def test_find_by_spec_uses_applies_to_index(self) -> None:
+    """find_by_spec returns artifacts whose applies_to lists the spec."""
+    root = self._create_repo()
+    self._write_change(root, "deltas", "DE-101")
+    registry = ChangeRegistry(root=root, kind="delta")
+    path = next((root / SPEC_DRIVER_DIR / "deltas").glob("*/DE-101.md"))
+    frontmatter, body = load_markdown_file(path)
+    frontmatter["applies_to"]["specs"] = ["SPEC-010"]
+    dump_markdown_file_update(path, frontmatter, body)
+
+    assert [a.id for a in registry.find_by_spec("SPEC-010")] == ["DE-101"]
+    assert registry.find_by_spec("SPEC-999") == []
+    assert registry.find_by_spec(None) == []
+
 
 class TestChangeRegistryReverseQueries(RepoTestCase):
   """Test reverse relationship query methods for ChangeRegistry."""
@@ -278,6 +334,7 @@ class TestChangeRegistryStandardSurface(RepoTestCase):
     delta_id: str,
     *,
     status: str = "draft",
+    tags: list[str] | None = None,
   ) -> None:
     bundle_dir = root / SPEC_DRIVER_DIR / DELTAS_SUBDIR / f"{delta_id}-sample"
     bundle_dir.mkdir(parents=True, exist_ok=True)
@@ -291,6 +348,7 @@ class TestChangeRegistryStandardSurface(RepoTestCase):
       "status": status,
       "kind": "delta",
       "applies_to": {"requirements": [], "specs": []},
+      "tags": tags or [],
     }
     dump_markdown_file_update(path, frontmatter, f"# {delta_id}\n")
 
@@ -356,6 +414,61 @@ class TestChangeRegistryStandardSurface(RepoTestCase):
     registry = ChangeRegistry(root=root, kind="delta")
     assert registry.filter(status="completed") == []
 
+  # -- select() / find_many() -----------------------------------------------
+
+  def test_select_combines_indexed_criteria(self) -> None:
+    root = self._create_repo()
+    self._write_delta(root, "DE-101", status="draft", tags=["api"])
+    self._write_delta(root, "DE-102", status="in-progress", tags=["api", "ui"])
+    self._write_delta(root, "DE-103", status="completed", tags=["api"])
+    self._write_delta(root, "DE-104", status="draft")
+    registry = ChangeRegistry(root=root, kind="delta")
+
+    def select(**criteria) -> set[str]:
+      return {a.id for a in registry.select(**criteria)}
+
+    assert select() == {"DE-101", "DE-102", "DE-103", "DE-104"}
+    assert select(statuses=["draft", "in-progress"]) == {
+      "DE-101",
+      "DE-102",
+      "DE-104",
+    }
+    assert select(tags=["ui", "missing"]) == {"DE-102"}
+    assert select(tags=["api"], exclude_statuses=["completed"]) == {
+      "DE-101",
+      "DE-102",
+    }
+    assert select(ids=["DE-104", "DE-101"], statuses=["draft"]) == {
+      "DE-101",
+      "DE-104",
+    }
+
+  def test_find_many_reads_only_requested_bundles(self) -> None:
+    root = self._create_repo()
+    self._write_delta(root, "DE-101")
+    self._write_delta(root, "DE-102")
+    registry = ChangeRegistry(root=root, kind="delta")
+
+    with patch.object(
+      registry_module,
+      "load_change_artifact",
+      wraps=registry_module.load_change_artifact,
+    ) as loader:
+      found = registry.find_many(["DE-102"])
+
+    assert [a.id for a in found] == ["DE-102"]
+    assert loader.call_count == 1
+
+  def test_find_many_falls_back_to_full_scan(self) -> None:
+    root = self._create_repo()
+    self._write_delta(root, "DE-101")
+    # Bundle named off-convention: found only by the full scan.
+    renamed = root / SPEC_DRIVER_DIR / DELTAS_SUBDIR / "misc"
+    (root / SPEC_DRIVER_DIR / DELTAS_SUBDIR / "DE-101-sample").rename(renamed)
+    registry = ChangeRegistry(root=root, kind="delta")
+
+    assert [a.id for a in registry.find_many(["DE-101", "DE-999"])] == ["DE-101"]
+
 
 if __name__ == "__main__":
   unittest.main()
@@ -12,6 +12,7 @@ from spec_driver.orchestration.artifact_view import (
   ArtifactSnapshot,
   ArtifactType,
   ArtifactTypeMeta,
+  PathRefresh,
   _collect_safe,
   _detect_bundle_dir,
   adapt_record,
@@ -31,6 +32,7 @@ __all__ = [
   "ArtifactSnapshot",
   "ArtifactType",
   "ArtifactTypeMeta",
+  "PathRefresh",
   "adapt_record",
   "path_to_artifact_type",
 ]
@@ -17,8 +17,14 @@ from supekku.scripts.lib.core.artifact_view import (
   _detect_bundle_dir,
   adapt_record,
 )
-from supekku.scripts.lib.core.paths import BACKLOG_DIR, DRIFT_SUBDIR, SPEC_DRIVER_DIR
+from supekku.scripts.lib.core.paths import (
+  BACKLOG_DIR,
+  DRIFT_SUBDIR,
+  MEMORY_DIR,
+  SPEC_DRIVER_DIR,
+)
 from supekku.scripts.lib.drift.registry import DriftLedgerRegistry
+from supekku.scripts.lib.memory.registry import MemoryRegistry
 
 
 class TestArtifactEntry:
@@ -489,3 +495,79 @@ class TestDriftLedgerIntegration:
     assert "DL-001" in drift_entries
     assert drift_entries["DL-001"].title == "Test"
     assert drift_entries["DL-001"].status == "open"
+
+
+class TestRefreshPaths:
+  """ArtifactSnapshot.refresh_paths() re-reads only changed files."""
+
+  @staticmethod
+  def _write_memory(root: Path, mem_id: str, name: str) -> Path:
+    mem_dir = root / SPEC_DRIVER_DIR / MEMORY_DIR
+    mem_dir.mkdir(parents=True, exist_ok=True)
+    path = mem_dir / f"{mem_id}.md"
+    path.write_text(
+      f"---\nid: {mem_id}\nname: {name}\nstatus: active\n"
+      "memory_type: fact\n---\n\nBody\n",
+      encoding="utf-8",
+    )
+    return path
+
+  def test_edit_updates_only_changed_record(self, tmp_path, monkeypatch):
+    (tmp_path / ".git").mkdir()
+    self._write_memory(tmp_path, "mem.fact.a", "A")
+    path_b = self._write_memory(tmp_path, "mem.fact.b", "B")
+    snapshot = ArtifactSnapshot(root=tmp_path)
+    untouched = snapshot.entries[ArtifactType.MEMORY]["mem.fact.a"]
+
+    def _no_collect(_self):
+      raise AssertionError("collect() must not run for per-path refresh")
+
+    monkeypatch.setattr(MemoryRegistry, "collect", _no_collect)
+    self._write_memory(tmp_path, "mem.fact.b", "B2")
+    refresh = snapshot.refresh_paths(ArtifactType.MEMORY, [path_b])
+
+    assert refresh is not None
+    assert set(refresh.records) == {"mem.fact.b"}
+    assert refresh.removed == frozenset()
+    entries = snapshot.entries[ArtifactType.MEMORY]
+    assert entries["mem.fact.b"].title == "B2"
+    assert entries["mem.fact.a"] is untouched
+
+  def test_deleted_file_is_dropped(self, tmp_path):
+    (tmp_path / ".git").mkdir()
+    self._write_memory(tmp_path, "mem.fact.a", "A")
+    path_b = self._write_memory(tmp_path, "mem.fact.b", "B")
+    snapshot = ArtifactSnapshot(root=tmp_path)
+
+    path_b.unlink()
+    refresh = snapshot.refresh_paths(ArtifactType.MEMORY, [path_b])
+
+    assert refresh is not None
+    assert refresh.removed == frozenset({"mem.fact.b"})
+    assert set(snapshot.entries[ArtifactType.MEMORY]) == {"mem.fact.a"}
+
+  def test_bundle_file_change_reloads_owning_delta(self, tmp_path):
+    (tmp_path / ".git").mkdir()
+    bundle = tmp_path / SPEC_DRIVER_DIR / "deltas" / "DE-001-sample"
+    bundle.mkdir(parents=True)
+    (bundle / "DE-001.md").write_text(
+      "---\nid: DE-001\nslug: sample\nname: Sample\ncreated: 2024-06-01\n"
+      "updated: 2024-06-01\nstatus: draft\nkind: delta\n---\n\n# DE-001\n",
+      encoding="utf-8",
+    )
+    snapshot = ArtifactSnapshot(root=tmp_path)
+    assert "DE-001" in snapshot.entries[ArtifactType.DELTA]
+
+    notes = bundle / "notes.md"
+    notes.write_text("# Notes\n", encoding="utf-8")
+    refresh = snapshot.refresh_paths(ArtifactType.DELTA, [notes])
+
+    assert refresh is not None
+    assert set(refresh.records) == {"DE-001"}
+    assert snapshot.entries[ArtifactType.DELTA]["DE-001"].bundle_dir == bundle
+
+  def test_unsupported_type_falls_back_to_full_refresh(self, tmp_path):
+    (tmp_path / ".git").mkdir()
+    snapshot = ArtifactSnapshot(root=tmp_path)
+
+    assert snapshot.refresh_paths(ArtifactType.SPEC, [tmp_path / "x.md"]) is None
@@ -8,6 +8,7 @@ from spec_driver.core.events import (  # noqa: F401
   emit_event,
   mark_command_invoked,
   record_artifact,
+  reset_command_state,
 )
 
 __all__ = [
@@ -18,4 +19,5 @@ __all__ = [
   "emit_event",
   "mark_command_invoked",
   "record_artifact",
+  "reset_command_state",
 ]
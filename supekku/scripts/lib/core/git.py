@@ -3,9 +3,15 @@
 from spec_driver.core.git import (
   DEFAULT_SHORT_SHA_LENGTH,
   SHA_HEX_PATTERN,
+  GitFacts,
+  GitStatus,
+  activate_git_facts,
+  deactivate_git_facts,
   get_branch,
   get_changed_files,
+  get_git_facts,
   get_head_sha,
+  get_tracked_files,
   has_staged_changes,
   has_uncommitted_changes,
   short_sha,
@@ -14,9 +20,15 @@ from spec_driver.core.git import (
 __all__ = [
   "DEFAULT_SHORT_SHA_LENGTH",
   "SHA_HEX_PATTERN",
+  "GitFacts",
+  "GitStatus",
+  "activate_git_facts",
+  "deactivate_git_facts",
   "get_branch",
   "get_changed_files",
+  "get_git_facts",
   "get_head_sha",
+  "get_tracked_files",
   "has_staged_changes",
   "has_uncommitted_changes",
   "short_sha",
@@ -3,6 +3,7 @@
 from spec_driver.core.paths import (  # noqa: F401
   AUDITS_SUBDIR,
   BACKLOG_DIR,
+  CACHE_DIR_ENV_VAR,
   DECISIONS_SUBDIR,
   DELTAS_SUBDIR,
   DRIFT_SUBDIR,
@@ -21,6 +22,7 @@ from spec_driver.core.paths import (  # noqa: F401
   get_agents_dir,
   get_audits_dir,
   get_backlog_dir,
+  get_cache_dir,
   get_decisions_dir,
   get_deltas_dir,
   get_drift_dir,
@@ -42,6 +44,7 @@ from spec_driver.core.paths import (  # noqa: F401
 __all__ = [
   "AUDITS_SUBDIR",
   "BACKLOG_DIR",
+  "CACHE_DIR_ENV_VAR",
   "DECISIONS_SUBDIR",
   "DELTAS_SUBDIR",
   "DRIFT_SUBDIR",
@@ -60,6 +63,7 @@ __all__ = [
   "get_agents_dir",
   "get_audits_dir",
   "get_backlog_dir",
+  "get_cache_dir",
   "get_decisions_dir",
   "get_deltas_dir",
   "get_drift_dir",
@@ -0,0 +1,27 @@
+"""Legacy re-export shim — see spec_driver.core.profiling."""
+
+from spec_driver.core.profiling import (  # noqa: F401
+  PROFILE_DUMP_ENV_VAR,
+  PROFILE_ENV_VAR,
+  activate_profiling,
+  deactivate_profiling,
+  format_profile,
+  instrument,
+  profile_phase,
+  profiled,
+  profiling_active,
+  profiling_requested,
+)
+
+__all__ = [
+  "PROFILE_DUMP_ENV_VAR",
+  "PROFILE_ENV_VAR",
+  "activate_profiling",
+  "deactivate_profiling",
+  "format_profile",
+  "instrument",
+  "profile_phase",
+  "profiled",
+  "profiling_active",
+  "profiling_requested",
+]
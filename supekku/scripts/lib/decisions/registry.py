@@ -12,6 +12,7 @@ import yaml
 
 from supekku.scripts.lib.core.dates import parse_date
 from supekku.scripts.lib.core.paths import get_decisions_dir, get_registry_dir
+from supekku.scripts.lib.core.profiling import profiled
 from supekku.scripts.lib.core.repo import find_repo_root
 from supekku.scripts.lib.core.spec_utils import extract_h1_title, load_markdown_file
 from supekku.scripts.lib.decisions.lifecycle import ADR_STATUSES
@@ -125,6 +126,7 @@ class DecisionRegistry:
     """Load existing registry from YAML file."""
     return cls(root=root)
 
+  @profiled("registry.adr")
   def collect(self) -> dict[str, DecisionRecord]:
     """Collect all ADR files and parse them into DecisionRecords."""
     decisions: dict[str, DecisionRecord] = {}
@@ -144,6 +146,21 @@ class DecisionRegistry:
 
     return decisions
 
+  def collect_path(self, path: Path) -> dict[str, DecisionRecord]:
+    """Parse the single ADR-*.md file at *path* (watch-driven refresh).
+
+    Returns an empty dict if the file is outside this registry, no longer
+    exists, or fails to parse.
+    """
+    path = Path(path)
+    if path.parent != self.directory or not path.match("ADR-*.md"):
+      return {}
+    try:
+      decision = self._parse_adr_file(path)
+    except (ValueError, KeyError, FileNotFoundError):
+      return {}
+    return {decision.id: decision} if decision else {}
+
   def _parse_adr_file(self, adr_path: Path) -> DecisionRecord | None:
     """Parse an individual ADR file into a DecisionRecord."""
     frontmatter, content = load_markdown_file(adr_path)
@@ -209,12 +226,24 @@ class DecisionRegistry:
       path=str(adr_path),
     )
 
-  def write(self, path: Path | None = None) -> None:
-    """Write registry to YAML file."""
+  def write(
+    self,
+    path: Path | None = None,
+    *,
+    decisions: dict[str, DecisionRecord] | None = None,
+  ) -> None:
+    """Write registry to YAML file.
+
+    Args:
+        path: Output path. Defaults to ``self.output_path``.
+        decisions: Pre-collected records from ``collect()``; collected
+            afresh when ``None``.
+    """
     if path is None:
       path = self.output_path
 
-    decisions = self.collect()
+    if decisions is None:
+      decisions = self.collect()
 
     # Build backlinks from policies and standards
     self._build_backlinks(decisions)
@@ -300,9 +329,19 @@ class DecisionRegistry:
 
     return results
 
-  def rebuild_status_symlinks(self) -> None:
-    """Rebuild all status-based symlink directories."""
-    decisions = self.collect()
+  def rebuild_status_symlinks(
+    self,
+    *,
+    decisions: dict[str, DecisionRecord] | None = None,
+  ) -> None:
+    """Rebuild all status-based symlink directories.
+
+    Args:
+        decisions: Pre-collected records from ``collect()``; collected
+            afresh when ``None``.
+    """
+    if decisions is None:
+      decisions = self.collect()
     decisions_dir = get_decisions_dir(self.root)
 
     # First, clean up all existing status directories
@@ -348,11 +387,21 @@ class DecisionRegistry:
         relative_target = Path("..") / source_file.name
         link_name.symlink_to(relative_target)
 
-  def sync_with_symlinks(self) -> None:
-    """Sync registry and rebuild symlinks in one operation."""
-    self.collect()  # Ensure data is loaded
-    self.write(self.output_path)
-    self.rebuild_status_symlinks()
+  def sync_with_symlinks(
+    self,
+    *,
+    decisions: dict[str, DecisionRecord] | None = None,
+  ) -> None:
+    """Sync registry and rebuild symlinks from a single collection.
+
+    Args:
+        decisions: Pre-collected records from ``collect()``; collected
+            afresh when ``None``.
+    """
+    if decisions is None:
+      decisions = self.collect()
+    self.write(self.output_path, decisions=decisions)
+    self.rebuild_status_symlinks(decisions=decisions)
 
 
 __all__ = ["DecisionRecord", "DecisionRegistry"]
@@ -4,8 +4,11 @@ This package provides a clean API for generating documentation from Python AST,
 designed for integration with multi-language specification sync adapters.
 """
 
+import functools
 import hashlib
+import multiprocessing
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from .analyzer import DeterministicPythonModuleAnalyzer
@@ -47,6 +50,75 @@ def write_file_with_status(output_file: Path, content: str) -> str:
   return status
 
 
+@functools.cache
+def _worker_cache(cache_dir: Path | None) -> ParseCache:
+  """Open the parse cache once per worker process."""
+  return ParseCache(cache_dir) if cache_dir else ParseCache()
+
+
+def _analyze_file(
+  file_path: Path,
+  base_path: Path,
+  cache_dir: Path | None,
+) -> dict:
+  """Analyze one file in a worker process."""
+  cache = _worker_cache(cache_dir)
+  return DeterministicPythonModuleAnalyzer(file_path, base_path, cache).analyze()
+
+
+def analyze_files(
+  files: Iterable[Path],
+  base_path: Path,
+  *,
+  cache: ParseCache,
+  cache_dir: Path | None = None,
+  jobs: int = 1,
+) -> dict[Path, dict | Exception]:
+  """Analyze each file once.
+
+  Args:
+    files: Files to analyze; duplicates are analyzed once.
+    base_path: Base path for module name resolution
+    cache: Parse cache used for in-process analysis
+    cache_dir: Cache directory re-opened by worker processes
+    jobs: Worker processes; 1 analyzes in-process
+
+  Returns:
+    Mapping of file to its analysis, or to the exception analysis raised.
+  """
+  unique = list(dict.fromkeys(files))
+  analyses: dict[Path, dict | Exception] = {}
+
+  if jobs > 1 and len(unique) > 1:
+    # spawn, not fork: sync may call this from worker threads.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+      max_workers=min(jobs, len(unique)),
+      mp_context=context,
+    ) as pool:
+      futures = {
+        file_path: pool.submit(_analyze_file, file_path, base_path, cache_dir)
+        for file_path in unique
+      }
+      for file_path, future in futures.items():
+        try:
+          analyses[file_path] = future.result()
+        except Exception as e:  # noqa: BLE001 — reported per variant
+          analyses[file_path] = e
+    return analyses
+
+  for file_path in unique:
+    try:
+      analyses[file_path] = DeterministicPythonModuleAnalyzer(
+        file_path,
+        base_path,
+        cache,
+      ).analyze()
+    except Exception as e:  # noqa: BLE001 — reported per variant
+      analyses[file_path] = e
+  return analyses
+
+
 def generate_docs(
   unit: Path,
   variants: Iterable[VariantSpec],
@@ -55,9 +127,13 @@ def generate_docs(
   output_root: Path,
   cache_dir: Path | None = None,
   base_path: Path | None = None,
+  jobs: int = 1,
 ) -> list[DocResult]:
   """Generate documentation for Python code unit.
 
+  Every file is analyzed once, however many variants include it; the
+  analysis is then filtered and rendered per variant in memory.
+
   Args:
     unit: Path to Python file or package directory
     variants: Iterable of VariantSpec defining documentation variants to generate
@@ -65,6 +141,7 @@ def generate_docs(
     output_root: Root directory for generated documentation
     cache_dir: Optional custom cache directory
     base_path: Optional base path for module name resolution
+    jobs: Worker processes for analysis (1: analyze in-process)
 
   Returns:
     List of DocResult objects with generation results and metadata
@@ -78,15 +155,43 @@ def generate_docs(
   if base_path is None:
     base_path = unit.parent if unit.is_file() else unit
 
-  # Process each variant
+  # Resolve the files of every variant up front
+  variant_files: list[tuple[VariantSpec, list[Path] | FileNotFoundError]] = []
   for variant_spec in variants:
-    # Get files to process for this variant
     try:
       files_to_process = VariantCoordinator.get_files_for_variant(
         unit,
         variant_spec,
       )
     except FileNotFoundError as e:
+      variant_files.append((variant_spec, e))
+      continue
+
+    # Sort files for deterministic processing order
+    files_to_process.sort(
+      key=lambda p: PathNormalizer.normalize_path_for_id(p, base_path),
+    )
+    variant_files.append((variant_spec, files_to_process))
+
+  try:
+    analyses = analyze_files(
+      (
+        file_path
+        for _spec, files in variant_files
+        if isinstance(files, list)
+        for file_path in files
+      ),
+      base_path,
+      cache=cache,
+      cache_dir=cache_dir,
+      jobs=jobs,
+    )
+  finally:
+    cache.close()
+
+  # Render each variant from the shared analyses
+  for variant_spec, files_to_process in variant_files:
+    if isinstance(files_to_process, FileNotFoundError):
       results.append(
         DocResult(
           variant=variant_spec.variant_type.value,
@@ -94,26 +199,17 @@ def generate_docs(
           hash="",
           status="error",
           module_identifier="",
-          error_message=str(e),
+          error_message=str(files_to_process),
         ),
       )
       continue
 
-    # Sort files for deterministic processing order
-    files_to_process.sort(
-      key=lambda p: PathNormalizer.normalize_path_for_id(p, base_path),
-    )
-
     # Process each file for this variant
     for file_path in files_to_process:
       try:
-        # Analyze file
-        analyzer = DeterministicPythonModuleAnalyzer(
-          file_path,
-          base_path,
-          cache,
-        )
-        analysis = analyzer.analyze()
+        analysis = analyses[file_path]
+        if isinstance(analysis, Exception):
+          raise analysis
 
         if "error" in analysis:
           results.append(
@@ -201,5 +297,6 @@ __all__ = [
   "PathNormalizer",
   "VariantCoordinator",
   "VariantSpec",
+  "analyze_files",
   "generate_docs",
 ]
@@ -1,12 +1,23 @@
 """AST-based Python module analyzer."""
 
 import ast
+from functools import cached_property
 from pathlib import Path
 
 from .cache import ParseCache
 from .comments import CommentExtractor
 from .path_utils import PathNormalizer
 
+# Statements that end the module-level comment preamble.
+_SIGNIFICANT_STATEMENTS = (
+  ast.ClassDef,
+  ast.FunctionDef,
+  ast.AsyncFunctionDef,
+  ast.Import,
+  ast.ImportFrom,
+  ast.Assign,
+)
+
 
 class DeterministicPythonModuleAnalyzer:
   """Analyzes Python module AST to extract documentation information."""
@@ -25,12 +36,15 @@ class DeterministicPythonModuleAnalyzer:
     with open(self.file_path, encoding="utf-8") as f:
       self.source_code = f.read()
 
-    self.comment_extractor = CommentExtractor(self.source_code)
+  @cached_property
+  def comment_extractor(self) -> CommentExtractor:
+    """Comments by line, extracted only when analysis misses the cache."""
+    return CommentExtractor(self.source_code)
 
   def analyze(self) -> dict:
     """Analyze the Python file and extract documentation info with caching."""
     # Try cache first
-    if self.cache:
+    if self.cache is not None:
       cached_result = self.cache.get(self.file_path)
       if cached_result is not None:
         return cached_result
@@ -53,11 +67,16 @@ class DeterministicPythonModuleAnalyzer:
       "functions": [],
       "constants": [],
       "imports": [],
-      "module_comments": self._get_module_level_comments(tree),
+      "module_comments": [],
     }
+    first_stmt_line = None
 
-    # Collect all elements
+    # Collect all elements (and the first significant statement) in one walk
     for node in ast.walk(tree):
+      if isinstance(node, _SIGNIFICANT_STATEMENTS) and (
+        first_stmt_line is None or node.lineno < first_stmt_line
+      ):
+        first_stmt_line = node.lineno
       if isinstance(node, ast.ClassDef):
         analysis["classes"].append(self._analyze_class(node))
       elif (
@@ -70,6 +89,8 @@ class DeterministicPythonModuleAnalyzer:
       elif isinstance(node, (ast.Import, ast.ImportFrom)):
         analysis["imports"].append(self._analyze_import(node))
 
+    analysis["module_comments"] = self._get_module_level_comments(first_stmt_line)
+
     # DETERMINISTIC SORTING: Sort all elements by name for consistent output
     analysis["classes"].sort(key=lambda x: x["name"])
     analysis["functions"].sort(key=lambda x: x["name"])
@@ -83,30 +104,14 @@ class DeterministicPythonModuleAnalyzer:
       class_info["methods"].sort(key=lambda x: (x["is_private"], x["name"]))
 
     # Cache successful analysis
-    if self.cache:
+    if self.cache is not None:
       self.cache.put(self.file_path, analysis)
 
     return analysis
 
-  def _get_module_level_comments(self, tree: ast.AST) -> list[str]:
+  def _get_module_level_comments(self, first_stmt_line: int | None) -> list[str]:
     """Get comments that appear before the first significant statement."""
     comments = []
-    first_stmt_line = None
-
-    # Find the first significant statement
-    for node in ast.walk(tree):
-      if isinstance(
-        node,
-        (
-          ast.ClassDef,
-          ast.FunctionDef,
-          ast.AsyncFunctionDef,
-          ast.Import,
-          ast.ImportFrom,
-          ast.Assign,
-        ),
-      ) and (first_stmt_line is None or node.lineno < first_stmt_line):
-        first_stmt_line = node.lineno
 
     # Collect comments before first statement
     for line_num, comment in sorted(self.comment_extractor.comments.items()):
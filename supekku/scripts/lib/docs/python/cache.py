@@ -1,18 +1,72 @@
-"""File-based caching for AST parsing with mtime and hash validation."""
+"""Consolidated on-disk cache of AST analyses.
 
+All analyses live in one SQLite store per cache directory. A lookup first
+compares the source file's ``mtime_ns``, size and inode with the stored
+entry and only reads and hashes the file when those differ, so a touched
+but unchanged file is still a hit.
+
+Entries are keyed on ``ANALYZER_VERSION``: rows written by another analyzer
+version are dropped when the store is opened. The store is bounded by
+``max_bytes`` of serialized analysis and evicts least-recently-used entries
+beyond it. SQLite's locking lets worker processes share one store.
+
+All persistence is fail-silent — a broken or unwritable store degrades to
+cache misses, never to an error.
+"""
+
+import contextlib
 import hashlib
 import json
 import os
+import re
+import sqlite3
+import threading
 import time
 from pathlib import Path
 
-from .path_utils import PathNormalizer
+# Bump whenever DeterministicPythonModuleAnalyzer output changes shape.
+ANALYZER_VERSION = 2
+
+CACHE_FILENAME = "analysis.sqlite3"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Per-file JSON entries written by earlier versions of this cache.
+_LEGACY_ENTRY = re.compile(r"[0-9a-f]{16}\.json")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+  key TEXT PRIMARY KEY,
+  version INTEGER NOT NULL,
+  mtime_ns INTEGER NOT NULL,
+  size INTEGER NOT NULL,
+  inode INTEGER NOT NULL,
+  content_hash TEXT NOT NULL,
+  analysis TEXT NOT NULL,
+  nbytes INTEGER NOT NULL,
+  accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
 
 
 class ParseCache:
-  """File-based caching for AST parsing with mtime and hash validation."""
+  """SQLite-backed cache of AST analyses with stat-first validation.
+
+  Args:
+    cache_dir: Directory holding the store; defaults to the platform cache
+      directory.
+    max_bytes: Upper bound on stored analysis JSON; least-recently-used
+      entries are evicted beyond it.
+    version: Analyzer version entries are keyed on.
+  """
 
-  def __init__(self, cache_dir: Path | None = None) -> None:
+  def __init__(
+    self,
+    cache_dir: Path | None = None,
+    *,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    version: int = ANALYZER_VERSION,
+  ) -> None:
     """Initialize cache with optional custom directory."""
     if cache_dir:
       self.cache_dir = cache_dir
@@ -24,95 +78,182 @@ class ParseCache:
       self.cache_dir = cache_base / "deterministic_ast_doc_generator"
 
     self.cache_dir.mkdir(parents=True, exist_ok=True)
+    self.cache_path = self.cache_dir / CACHE_FILENAME
+    self.max_bytes = max_bytes
+    self.version = version
     self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+    self._lock = threading.Lock()
+    self._conn = self._open()
 
-  def _get_cache_key(self, file_path: Path) -> str:
-    """Generate stable cache key for file."""
-    normalized = PathNormalizer.normalize_path_for_id(file_path)
-    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+  # --- persistence ---
 
-  def _get_cache_file(self, file_path: Path) -> Path:
-    """Get cache file path for given source file."""
-    cache_key = self._get_cache_key(file_path)
-    return self.cache_dir / f"{cache_key}.json"
-
-  def _get_file_info(self, file_path: Path) -> tuple[float, str]:
-    """Get file modification time and content hash."""
-    stat = file_path.stat()
-    mtime = stat.st_mtime
-
-    # Calculate content hash
-    with open(file_path, "rb") as f:
-      content_hash = hashlib.sha256(f.read()).hexdigest()
+  def _connect(self) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+      self.cache_path,
+      timeout=30,
+      isolation_level=None,
+      check_same_thread=False,
+    )
+    try:
+      conn.execute("PRAGMA journal_mode=WAL")
+      conn.execute("PRAGMA synchronous=NORMAL")
+      conn.executescript(_SCHEMA)
+      conn.execute("DELETE FROM entries WHERE version != ?", (self.version,))
+    except sqlite3.Error:
+      conn.close()
+      raise
+    return conn
 
-    return mtime, content_hash
+  def _open(self) -> sqlite3.Connection | None:
+    """Open the store, rebuilding it once if it is corrupt."""
+    fresh = not self.cache_path.exists()
+    try:
+      conn = self._connect()
+    except sqlite3.DatabaseError:
+      self._remove_store()
+      try:
+        conn = self._connect()
+      except sqlite3.Error:
+        return None
+    if fresh:
+      self._remove_legacy_entries()
+    return conn
 
-  def get(self, file_path: Path) -> dict | None:
-    """Get cached analysis if valid, None otherwise."""
-    cache_file = self._get_cache_file(file_path)
+  def _remove_store(self) -> None:
+    for suffix in ("", "-wal", "-shm"):
+      with contextlib.suppress(OSError):
+        Path(f"{self.cache_path}{suffix}").unlink(missing_ok=True)
 
-    if not cache_file.exists():
-      self.stats["misses"] += 1
-      return None
+  def _remove_legacy_entries(self) -> None:
+    with contextlib.suppress(OSError):
+      for path in self.cache_dir.glob("*.json"):
+        if _LEGACY_ENTRY.fullmatch(path.name):
+          path.unlink(missing_ok=True)
 
-    try:
-      # Check if source file still exists
-      if not file_path.exists():
-        self.stats["misses"] += 1
-        return None
+  def _execute(self, sql: str, params: tuple = ()) -> list[tuple]:
+    """Run *sql*, returning its rows; store errors yield no rows."""
+    if self._conn is None:
+      return []
+    with self._lock:
+      try:
+        return self._conn.execute(sql, params).fetchall()
+      except sqlite3.Error:
+        return []
 
-      current_mtime, current_hash = self._get_file_info(file_path)
+  # --- lookup ---
 
-      # Load cached data
-      with open(cache_file, encoding="utf-8") as f:
-        cached_data = json.load(f)
+  @staticmethod
+  def _get_cache_key(file_path: Path) -> str:
+    """Generate stable cache key for file (its absolute path)."""
+    return str(file_path.absolute())
 
-      cached_mtime = cached_data.get("mtime")
-      cached_hash = cached_data.get("content_hash")
+  @staticmethod
+  def _content_hash(file_path: Path) -> str:
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
 
-      # Validate cache with both mtime and hash
-      if cached_mtime == current_mtime and cached_hash == current_hash:
-        self.stats["hits"] += 1
-        return cached_data.get("analysis")
-      self.stats["invalidations"] += 1
-      # Remove stale cache
-      cache_file.unlink(missing_ok=True)
+  def get(self, file_path: Path) -> dict | None:
+    """Get cached analysis if valid, None otherwise."""
+    key = self._get_cache_key(file_path)
+    rows = self._execute(
+      "SELECT mtime_ns, size, inode, content_hash, analysis FROM entries "
+      "WHERE key = ? AND version = ?",
+      (key, self.version),
+    )
+    if not rows:
+      self.stats["misses"] += 1
       return None
 
-    except (json.JSONDecodeError, KeyError, OSError):
+    mtime_ns, size, inode, content_hash, analysis = rows[0]
+    try:
+      stat = file_path.stat()
+      if (stat.st_mtime_ns, stat.st_size, stat.st_ino) != (mtime_ns, size, inode):
+        # Stat changed: only a content change invalidates the entry.
+        if self._content_hash(file_path) != content_hash:
+          self.stats["invalidations"] += 1
+          self._execute("DELETE FROM entries WHERE key = ?", (key,))
+          return None
+        self._execute(
+          "UPDATE entries SET mtime_ns = ?, size = ?, inode = ? WHERE key = ?",
+          (stat.st_mtime_ns, stat.st_size, stat.st_ino, key),
+        )
+      cached = json.loads(analysis)
+    except (OSError, ValueError):
       self.stats["misses"] += 1
-      # Remove corrupted cache
-      cache_file.unlink(missing_ok=True)
+      self._execute("DELETE FROM entries WHERE key = ?", (key,))
       return None
 
+    self.stats["hits"] += 1
+    self._execute(
+      "UPDATE entries SET accessed = ? WHERE key = ?",
+      (time.time(), key),
+    )
+    return cached
+
   def put(self, file_path: Path, analysis: dict) -> None:
-    """Store analysis in cache with metadata."""
+    """Store analysis in cache, evicting least-recently-used entries."""
     try:
-      mtime, content_hash = self._get_file_info(file_path)
-      cache_file = self._get_cache_file(file_path)
+      stat = file_path.stat()
+      content_hash = self._content_hash(file_path)
+      payload = json.dumps(analysis, separators=(",", ":"))
+    except (OSError, TypeError, ValueError):
+      # Ignore cache write failures
+      return
 
-      cache_data = {
-        "mtime": mtime,
-        "content_hash": content_hash,
-        "cached_at": time.time(),
-        "file_path": str(file_path),
-        "analysis": analysis,
-      }
+    nbytes = len(payload.encode("utf-8"))
+    if nbytes > self.max_bytes:
+      return
+    self._execute(
+      "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+      (
+        self._get_cache_key(file_path),
+        self.version,
+        stat.st_mtime_ns,
+        stat.st_size,
+        stat.st_ino,
+        content_hash,
+        payload,
+        nbytes,
+        time.time(),
+      ),
+    )
+    self._evict()
 
-      with open(cache_file, "w", encoding="utf-8") as f:
-        json.dump(cache_data, f, indent=2)
-
-    except OSError:
-      # Ignore cache write failures
-      pass
+  def _evict(self) -> None:
+    """Drop least-recently-used entries until the store fits ``max_bytes``."""
+    rows = self._execute("SELECT COALESCE(SUM(nbytes), 0) FROM entries")
+    excess = rows[0][0] - self.max_bytes if rows else 0
+    if excess <= 0:
+      return
+    victims: list[tuple[str]] = []
+    for key, nbytes in self._execute(
+      "SELECT key, nbytes FROM entries ORDER BY accessed",
+    ):
+      victims.append((key,))
+      excess -= nbytes
+      if excess <= 0:
+        break
+    if self._conn is None:
+      return
+    with self._lock, contextlib.suppress(sqlite3.Error):
+      self._conn.executemany("DELETE FROM entries WHERE key = ?", victims)
 
   def clear(self) -> None:
     """Clear all cached data."""
-    if self.cache_dir.exists():
-      for cache_file in self.cache_dir.glob("*.json"):
-        cache_file.unlink(missing_ok=True)
+    self._execute("DELETE FROM entries")
+    self._remove_legacy_entries()
     self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
 
+  def close(self) -> None:
+    """Close the underlying store."""
+    with self._lock:
+      if self._conn is not None:
+        self._conn.close()
+        self._conn = None
+
+  def __len__(self) -> int:
+    rows = self._execute("SELECT COUNT(*) FROM entries")
+    return rows[0][0] if rows else 0
+
   def get_stats(self) -> dict[str, int]:
     """Get cache performance statistics."""
     total = self.stats["hits"] + self.stats["misses"]
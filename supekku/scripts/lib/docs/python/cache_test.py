@@ -0,0 +1,117 @@
+"""Tests for the consolidated AST analysis cache."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from .cache import CACHE_FILENAME, ParseCache
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Iterator[ParseCache]:
+  store = ParseCache(tmp_path / "cache")
+  yield store
+  store.close()
+
+
+def _source(tmp_path: Path, name: str = "mod.py", text: str = "x = 1\n") -> Path:
+  path = tmp_path / name
+  path.write_text(text, encoding="utf-8")
+  return path
+
+
+def test_single_store_per_directory(cache: ParseCache, tmp_path: Path) -> None:
+  """Every analysis lands in one store, not one file per source."""
+  for name in ("a.py", "b.py", "c.py"):
+    cache.put(_source(tmp_path, name), {"module_name": name})
+
+  assert len(cache) == 3
+  assert not list(cache.cache_dir.glob("*.json"))
+  assert (cache.cache_dir / CACHE_FILENAME).exists()
+
+
+def test_stat_match_skips_hashing(cache: ParseCache, tmp_path: Path) -> None:
+  """Unchanged mtime, size and inode is a hit without reading the file."""
+  source = _source(tmp_path)
+  cache.put(source, {"module_name": "mod"})
+
+  with patch.object(ParseCache, "_content_hash", side_effect=AssertionError):
+    assert cache.get(source) == {"module_name": "mod"}
+
+
+def test_touched_file_with_same_content_hits(
+  cache: ParseCache,
+  tmp_path: Path,
+) -> None:
+  """A stat mismatch falls back to the content hash."""
+  source = _source(tmp_path)
+  cache.put(source, {"module_name": "mod"})
+  stat = source.stat()
+  os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+  assert cache.get(source) == {"module_name": "mod"}
+  assert cache.stats["invalidations"] == 0
+
+
+def test_changed_content_invalidates(cache: ParseCache, tmp_path: Path) -> None:
+  """New content with a new stat is an invalidation."""
+  source = _source(tmp_path)
+  cache.put(source, {"module_name": "mod"})
+  source.write_text("x = 22\n", encoding="utf-8")
+
+  assert cache.get(source) is None
+  assert cache.stats["invalidations"] == 1
+  assert len(cache) == 0
+
+
+def test_other_analyzer_version_is_dropped(tmp_path: Path) -> None:
+  """Entries written by another analyzer version are purged on open."""
+  source = _source(tmp_path)
+  old = ParseCache(tmp_path / "cache", version=1)
+  old.put(source, {"module_name": "mod"})
+  old.close()
+
+  new = ParseCache(tmp_path / "cache", version=2)
+  try:
+    assert len(new) == 0
+    assert new.get(source) is None
+  finally:
+    new.close()
+
+
+def test_lru_eviction_bounds_store(tmp_path: Path) -> None:
+  """Least-recently-used entries are evicted beyond max_bytes."""
+  cache = ParseCache(tmp_path / "cache", max_bytes=120)
+  try:
+    a, b, c = (_source(tmp_path, f"{n}.py") for n in "abc")
+    cache.put(a, {"pad": "a" * 40})
+    cache.put(b, {"pad": "b" * 40})
+    assert cache.get(a) is not None  # a is now more recent than b
+    cache.put(c, {"pad": "c" * 40})
+
+    assert len(cache) == 2
+    assert cache.get(b) is None
+    assert cache.get(a) is not None
+    assert cache.get(c) is not None
+  finally:
+    cache.close()
+
+
+def test_legacy_json_entries_removed(tmp_path: Path) -> None:
+  """Per-file JSON entries from the old cache layout are cleaned up."""
+  cache_dir = tmp_path / "cache"
+  cache_dir.mkdir()
+  legacy = cache_dir / "0123456789abcdef.json"
+  legacy.write_text("{}", encoding="utf-8")
+  unrelated = cache_dir / "notes.json"
+  unrelated.write_text("{}", encoding="utf-8")
+
+  ParseCache(cache_dir).close()
+
+  assert not legacy.exists()
+  assert unrelated.exists()
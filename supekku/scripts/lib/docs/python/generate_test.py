@@ -0,0 +1,110 @@
+"""Tests for analyze-once, render-many contract generation."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from supekku.scripts.lib.ast_doc_test_fixtures import (
+  COMMENT_VARIATIONS,
+  SIMPLE_CLASS,
+  TEST_MODULE,
+)
+from supekku.scripts.lib.docs.python import (
+  ParseCache,
+  VariantSpec,
+  analyze_files,
+  generate_docs,
+)
+from supekku.scripts.lib.docs.python.analyzer import DeterministicPythonModuleAnalyzer
+
+VARIANTS = [VariantSpec.public(), VariantSpec.all_symbols(), VariantSpec.tests()]
+
+
+@pytest.fixture
+def package(tmp_path: Path) -> Path:
+  pkg = tmp_path / "pkg"
+  pkg.mkdir()
+  (pkg / "__init__.py").write_text("")
+  (pkg / "calculator.py").write_text(SIMPLE_CLASS)
+  (pkg / "comments.py").write_text(COMMENT_VARIATIONS)
+  (pkg / "calculator_test.py").write_text(TEST_MODULE)
+  return pkg
+
+
+def _generate(package: Path, tmp_path: Path, **kwargs) -> list:
+  return generate_docs(
+    package,
+    VARIANTS,
+    output_root=tmp_path / "out",
+    cache_dir=tmp_path / "cache",
+    base_path=package.parent,
+    **kwargs,
+  )
+
+
+def test_each_file_analyzed_once(package: Path, tmp_path: Path) -> None:
+  """public and all share their files' analyses."""
+  analyzed: list[str] = []
+  original = DeterministicPythonModuleAnalyzer.analyze
+
+  def _counting(self):
+    analyzed.append(self.file_path.name)
+    return original(self)
+
+  with patch.object(DeterministicPythonModuleAnalyzer, "analyze", _counting):
+    results = _generate(package, tmp_path)
+
+  assert sorted(analyzed) == ["calculator.py", "calculator_test.py", "comments.py"]
+  assert [(r.variant, r.module_identifier) for r in results] == [
+    ("public", "pkg.calculator"),
+    ("public", "pkg.comments"),
+    ("all", "pkg.calculator"),
+    ("all", "pkg.comments"),
+    ("tests", "pkg.calculator_test"),
+  ]
+  assert all(r.status == "created" for r in results)
+
+
+def test_analysis_failure_reported_per_variant(
+  package: Path,
+  tmp_path: Path,
+) -> None:
+  """A file whose analysis raises yields an error result in each variant."""
+  original = DeterministicPythonModuleAnalyzer.analyze
+
+  def _failing(self):
+    if self.file_path.name == "comments.py":
+      raise ValueError("boom")
+    return original(self)
+
+  with patch.object(DeterministicPythonModuleAnalyzer, "analyze", _failing):
+    results = _generate(package, tmp_path)
+
+  errors = [(r.variant, r.error_message) for r in results if r.status == "error"]
+  assert errors == [("public", "boom"), ("all", "boom")]
+
+
+def test_process_pool_matches_in_process(package: Path, tmp_path: Path) -> None:
+  """jobs > 1 analyzes in worker processes with identical output."""
+  serial = _generate(package, tmp_path / "serial")
+  pooled = _generate(package, tmp_path / "pooled", jobs=2)
+
+  assert [(r.variant, r.module_identifier, r.hash) for r in pooled] == [
+    (r.variant, r.module_identifier, r.hash) for r in serial
+  ]
+
+
+def test_cache_hit_skips_comment_extraction(package: Path, tmp_path: Path) -> None:
+  """Comments are only extracted when the analysis is not cached."""
+  cache = ParseCache(tmp_path / "cache")
+  source = package / "comments.py"
+  analyze_files([source], package.parent, cache=cache)
+
+  analyzer = DeterministicPythonModuleAnalyzer(source, package.parent, cache)
+  analysis = analyzer.analyze()
+
+  assert analysis["module_comments"]
+  assert "comment_extractor" not in vars(analyzer)
@@ -14,6 +14,7 @@ from collections.abc import Iterator
 from pathlib import Path
 
 from supekku.scripts.lib.core.paths import get_drift_dir
+from supekku.scripts.lib.core.profiling import profiled
 from supekku.scripts.lib.core.spec_utils import load_markdown_file
 
 from .models import DriftLedger
@@ -35,6 +36,7 @@ class DriftLedgerRegistry:
     self._root = root
     self._ledgers: dict[str, DriftLedger] | None = None
 
+  @profiled("registry.drift_ledger")
   def _load(self) -> dict[str, DriftLedger]:
     """Discover and parse all drift ledger files."""
     if self._ledgers is not None:
@@ -59,6 +61,20 @@ class DriftLedgerRegistry:
     """Return all discovered drift ledgers, keyed by ID."""
     return dict(self._load())
 
+  def collect_path(self, path: Path) -> dict[str, DriftLedger]:
+    """Load the single ledger file at *path* (watch-driven refresh).
+
+    Returns an empty dict if the file is not a ledger in the drift
+    directory or no longer exists.
+    """
+    path = Path(path)
+    if path.parent != get_drift_dir(self._root) or not _LEDGER_FILE_RE.match(path.name):
+      return {}
+    if not path.is_file():
+      return {}
+    ledger = _load_ledger(path)
+    return {ledger.id: ledger} if ledger is not None else {}
+
   def find(self, ledger_id: str) -> DriftLedger | None:
     """Find a single drift ledger by ID."""
     return self._load().get(ledger_id)
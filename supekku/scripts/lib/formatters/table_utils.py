@@ -15,6 +15,7 @@ from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 
+from supekku.scripts.lib.core.profiling import profiled
 from supekku.scripts.lib.formatters.theme import SPEC_DRIVER_THEME
 
 if TYPE_CHECKING:
@@ -138,6 +139,7 @@ def add_row_with_truncation(
   table.add_row(*truncated)
 
 
+@profiled("format")
 def render_table(table: Table) -> str:
   """Render a rich Table to string with spec-driver theme.
 
@@ -153,6 +155,7 @@ def render_table(table: Table) -> str:
   return capture.get()
 
 
+@profiled("format")
 def format_as_json(items: Sequence[dict[str, Any]]) -> str:
   """Format items as JSON array with standard structure.
 
@@ -165,6 +168,7 @@ def format_as_json(items: Sequence[dict[str, Any]]) -> str:
   return json.dumps({"items": list(items)}, indent=2, default=str)
 
 
+@profiled("format")
 def format_as_tsv(rows: Sequence[Sequence[str]]) -> str:
   """Format data as tab-separated values.
 
@@ -177,6 +181,7 @@ def format_as_tsv(rows: Sequence[Sequence[str]]) -> str:
   return "\n".join("\t".join(str(cell) for cell in row) for row in rows)
 
 
+@profiled("format")
 def format_list_table(
   items: Sequence[Any],
   *,
@@ -11,11 +11,13 @@ from supekku.scripts.lib.memory.ids import (
 from supekku.scripts.lib.memory.links import (
   LinkGraphNode,
   LinkResolutionResult,
+  MemoryLinkGraph,
   MissingLink,
   ParsedLink,
   ResolvedLink,
   compute_backlinks,
   expand_link_graph,
+  forward_links,
   links_to_frontmatter,
   parse_links,
   resolve_all_links,
@@ -37,6 +39,7 @@ __all__: list[str] = [
   "LinkGraphNode",
   "LinkResolutionResult",
   "MatchContext",
+  "MemoryLinkGraph",
   "MemoryRecord",
   "MemoryRegistry",
   "MissingLink",
@@ -47,6 +50,7 @@ __all__: list[str] = [
   "is_surfaceable",
   "compute_backlinks",
   "expand_link_graph",
+  "forward_links",
   "links_to_frontmatter",
   "matches_scope",
   "normalize_memory_id",
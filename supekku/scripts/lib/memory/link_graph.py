@@ -0,0 +1,120 @@
+"""Persistent memory link graph (forward links and backlinks).
+
+``[[...]]`` links are extracted from memory bodies once and kept in
+``.spec-driver/run/cache/memory_links.json`` together with the
+``mtime_ns`` and size of the file they came from. Loading the graph stats
+every ``mem.*.md`` file and re-parses only those that are new or changed,
+so ``list memories --links-to`` and ``show memory --links-depth`` cost
+dict lookups rather than a re-tokenization of the corpus.
+
+All persistence is fail-silent — an unreadable or unwritable cache
+degrades to parsing every file.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from spec_driver.core.io import read_json_cache, write_json_cache
+from supekku.scripts.lib.core.paths import get_cache_dir
+from supekku.scripts.lib.core.profiling import profile_phase
+
+from .links import MemoryLinkGraph, forward_links
+
+if TYPE_CHECKING:
+  from .registry import MemoryRegistry
+
+MEMORY_LINKS_FILENAME = "memory_links.json"
+MEMORY_LINKS_VERSION = 1
+
+# Per-file entry: [mtime_ns, size, memory_id | None, [target, ...]].
+FileEntry = list[Any]
+
+
+def get_memory_links_path(root: Path) -> Path:
+  """Return the on-disk memory link graph location."""
+  return get_cache_dir(root) / MEMORY_LINKS_FILENAME
+
+
+def load_memory_link_graph(registry: MemoryRegistry) -> MemoryLinkGraph:
+  """Return the link graph of *registry*'s memories, updating the cache.
+
+  Args:
+    registry: Registry whose directory holds the memory files.
+
+  Returns:
+    MemoryLinkGraph with an entry in ``forward`` for every parseable memory.
+  """
+  cache_path = get_memory_links_path(registry.root)
+  directory = registry.directory.as_posix()
+  with profile_phase("memory_links"):
+    payload = _read_cache(cache_path, directory)
+    previous: dict[str, FileEntry] = payload["files"] if payload else {}
+    files: dict[str, FileEntry] = {}
+    changed = payload is None
+
+    if registry.directory.exists():
+      for mem_file in registry.directory.glob("mem.*.md"):
+        try:
+          st = mem_file.stat()
+        except OSError:
+          continue
+        entry = previous.get(mem_file.name)
+        if entry is None or entry[:2] != [st.st_mtime_ns, st.st_size]:
+          # Stat taken before the parse: a concurrent edit leaves the entry
+          # stale, so the next load parses the file again.
+          entry = [st.st_mtime_ns, st.st_size, *_parse_links(registry, mem_file)]
+          changed = True
+        files[mem_file.name] = entry
+
+    if payload is not None and not changed and files.keys() == previous.keys():
+      return MemoryLinkGraph(
+        forward=_forward(files),
+        backlinks=payload["backlinks"],
+      )
+
+    graph = MemoryLinkGraph.from_forward(_forward(files))
+    write_json_cache(
+      cache_path,
+      MEMORY_LINKS_VERSION,
+      {"files": files, "backlinks": graph.backlinks},
+      stamp={"directory": directory},
+    )
+    return graph
+
+
+def _parse_links(registry: MemoryRegistry, path: Path) -> tuple[str | None, list[str]]:
+  """Return (memory ID, forward links) for *path*; ID is None if unparseable."""
+  try:
+    record, body = registry.load_memory_file(path)
+  except (ValueError, KeyError, FileNotFoundError):
+    return None, []
+  if record is None:
+    return None, []
+  return record.id, forward_links(record.id, body)
+
+
+def _forward(files: dict[str, FileEntry]) -> dict[str, list[str]]:
+  """Forward-link map in directory order; a later duplicate ID wins."""
+  return {
+    memory_id: targets for _, _, memory_id, targets in files.values() if memory_id
+  }
+
+
+def _read_cache(path: Path, directory: str) -> dict[str, Any] | None:
+  data = read_json_cache(path, MEMORY_LINKS_VERSION, stamp={"directory": directory})
+  if (
+    data is None
+    or not isinstance(data.get("files"), dict)
+    or not isinstance(data.get("backlinks"), dict)
+  ):
+    return None
+  return data
+
+
+__all__ = [
+  "MEMORY_LINKS_FILENAME",
+  "get_memory_links_path",
+  "load_memory_link_graph",
+]
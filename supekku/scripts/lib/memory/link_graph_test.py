@@ -0,0 +1,123 @@
+"""Tests for the persistent memory link graph."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from supekku.scripts.lib.core.paths import MEMORY_DIR, SPEC_DRIVER_DIR
+from supekku.scripts.lib.memory.link_graph import get_memory_links_path
+from supekku.scripts.lib.memory.links import MemoryLinkGraph
+from supekku.scripts.lib.memory.registry import MemoryRegistry
+
+
+def _mem(mem_id: str, body: str) -> str:
+  return f"""\
+---
+id: {mem_id}
+name: {mem_id}
+kind: memory
+status: active
+memory_type: fact
+---
+
+{body}
+"""
+
+
+@pytest.fixture
+def registry(tmp_path: Path) -> MemoryRegistry:
+  (tmp_path / ".git").mkdir()
+  mem_dir = tmp_path / SPEC_DRIVER_DIR / MEMORY_DIR
+  mem_dir.mkdir(parents=True)
+  files = {
+    "mem.fact.a": "See [[mem.fact.b]] and [[fact.c]].",
+    "mem.fact.b": "Back to [[mem:fact.a]]; also `[[mem.fact.z]]` in code.",
+    "mem.fact.c": "Leaf.",
+  }
+  for mem_id, body in files.items():
+    (mem_dir / f"{mem_id}.md").write_text(_mem(mem_id, body), encoding="utf-8")
+  return MemoryRegistry(root=tmp_path)
+
+
+@pytest.fixture
+def parses(registry: MemoryRegistry, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+  """Record the name of every memory file parsed."""
+  calls: list[str] = []
+  real = registry.load_memory_file
+
+  def counting(path: Path) -> tuple:
+    calls.append(path.name)
+    return real(path)
+
+  monkeypatch.setattr(registry, "load_memory_file", counting)
+  return calls
+
+
+def _rewrite(path: Path, text: str) -> None:
+  """Write *text* and bump the mtime past timestamp granularity."""
+  path.write_text(text, encoding="utf-8")
+  st = path.stat()
+  os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_matches_graph_built_from_bodies(registry: MemoryRegistry) -> None:
+  """The cached graph agrees with parsing collect_bodies() directly."""
+  expected = MemoryLinkGraph.from_bodies(registry.collect_bodies())
+
+  graph = registry.link_graph()
+
+  assert graph == expected
+  assert graph.backlinks["mem.fact.a"] == ["mem.fact.b"]
+  assert "mem.fact.z" not in graph.backlinks
+
+
+def test_unchanged_corpus_is_not_reparsed(
+  registry: MemoryRegistry,
+  parses: list[str],
+) -> None:
+  """A second load is served from the cache without parsing any file."""
+  first = registry.link_graph()
+  assert len(parses) == 3
+  assert get_memory_links_path(registry.root).is_file()
+
+  assert registry.link_graph() == first
+  assert len(parses) == 3
+
+
+def test_only_changed_file_is_reparsed(
+  registry: MemoryRegistry,
+  parses: list[str],
+) -> None:
+  """Editing one memory re-parses just that file and updates backlinks."""
+  registry.link_graph()
+  parses.clear()
+  _rewrite(registry.directory / "mem.fact.c.md", _mem("mem.fact.c", "[[fact.a]]"))
+
+  graph = registry.link_graph()
+
+  assert parses == ["mem.fact.c.md"]
+  assert graph.forward["mem.fact.c"] == ["mem.fact.a"]
+  assert graph.backlinks["mem.fact.a"] == ["mem.fact.b", "mem.fact.c"]
+
+
+def test_deleted_file_drops_its_edges(registry: MemoryRegistry) -> None:
+  """Removing a memory removes it and its outgoing links from the graph."""
+  registry.link_graph()
+  (registry.directory / "mem.fact.b.md").unlink()
+
+  graph = registry.link_graph()
+
+  assert "mem.fact.b" not in graph.forward
+  assert "mem.fact.a" not in graph.backlinks
+  assert graph.backlinks["mem.fact.b"] == ["mem.fact.a"]
+
+
+def test_corrupt_cache_is_rebuilt(registry: MemoryRegistry) -> None:
+  """An unreadable cache file degrades to a full parse."""
+  expected = registry.link_graph()
+  get_memory_links_path(registry.root).write_text("{not json", encoding="utf-8")
+
+  assert registry.link_graph() == expected
@@ -4,7 +4,8 @@ Pure functions for extracting [[...]] wikilinks from memory body content,
 resolving them against a known artifact index, and serializing results
 for frontmatter storage.
 
-Also provides graph operations: backlink computation and depth expansion.
+Also provides graph operations: backlink computation and depth expansion,
+either from body text or from a precomputed ``MemoryLinkGraph``.
 
 No I/O — callers provide the body text and artifact index.
 """
@@ -13,6 +14,7 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 
 from supekku.scripts.lib.core.artifact_ids import classify_artifact_id
@@ -347,6 +349,43 @@ def _normalize_link_target(target: str) -> str:
     return t
 
 
+def forward_links(source_id: str, body: str) -> list[str]:
+  """Return the canonical IDs that *body* links to, in document order.
+
+  Targets are normalized via ``_normalize_link_target`` and deduplicated;
+  self-links are excluded.
+
+  Args:
+    source_id: ID of the memory the body belongs to.
+    body: Markdown body text.
+
+  Returns:
+    List of unique target IDs.
+  """
+  targets: dict[str, None] = {}
+  for link in parse_links(body):
+    target = _normalize_link_target(link.target)
+    if target != source_id:
+      targets[target] = None
+  return list(targets)
+
+
+def invert_links(forward: dict[str, list[str]]) -> dict[str, list[str]]:
+  """Compute reverse edges from a forward-link map.
+
+  Args:
+    forward: Mapping of source ID to the target IDs it links to.
+
+  Returns:
+    Dict mapping target ID to sorted list of source IDs that link to it.
+  """
+  backlinks: dict[str, list[str]] = defaultdict(list)
+  for source_id, targets in forward.items():
+    for target in targets:
+      backlinks[target].append(source_id)
+  return {k: sorted(v) for k, v in backlinks.items()}
+
+
 def compute_backlinks(bodies: dict[str, str]) -> dict[str, list[str]]:
   """Compute reverse edges from forward links in memory bodies.
 
@@ -359,16 +398,51 @@ def compute_backlinks(bodies: dict[str, str]) -> dict[str, list[str]]:
   Returns:
     Dict mapping target ID to sorted list of source IDs that link to it.
   """
-  backlinks: dict[str, list[str]] = defaultdict(list)
+  return invert_links(
+    {source_id: forward_links(source_id, body) for source_id, body in bodies.items()},
+  )
 
-  for source_id, body in bodies.items():
-    links = parse_links(body)
-    for link in links:
-      target = _normalize_link_target(link.target)
-      if target != source_id:
-        backlinks[target].append(source_id)
 
-  return {k: sorted(v) for k, v in backlinks.items()}
+@dataclass(frozen=True)
+class MemoryLinkGraph:
+  """Precomputed forward links and backlinks of a memory corpus.
+
+  ``forward`` holds an entry for every memory, linking or not, so
+  membership doubles as "is a known memory" during expansion.
+  """
+
+  forward: dict[str, list[str]]
+  backlinks: dict[str, list[str]]
+
+  @classmethod
+  def from_forward(cls, forward: dict[str, list[str]]) -> MemoryLinkGraph:
+    """Build a graph from forward links, deriving the backlinks."""
+    return cls(forward=forward, backlinks=invert_links(forward))
+
+  @classmethod
+  def from_bodies(cls, bodies: dict[str, str]) -> MemoryLinkGraph:
+    """Build a graph by parsing every body once."""
+    return cls.from_forward(
+      {source_id: forward_links(source_id, body) for source_id, body in bodies.items()},
+    )
+
+  def expand(
+    self,
+    root_id: str,
+    names: dict[str, str],
+    types: dict[str, str],
+    *,
+    max_depth: int = 1,
+  ) -> list[LinkGraphNode]:
+    """Expand outgoing links from *root_id*; see ``expand_link_graph``."""
+    return _expand(
+      root_id,
+      lambda node_id: self.forward.get(node_id, ()),
+      self.forward.__contains__,
+      names,
+      types,
+      max_depth=max_depth,
+    )
 
 
 def expand_link_graph(
@@ -395,6 +469,26 @@ def expand_link_graph(
   Returns:
     List of LinkGraphNode in BFS order (root at depth 0).
   """
+  return _expand(
+    root_id,
+    lambda node_id: forward_links(node_id, bodies.get(node_id, "")),
+    bodies.__contains__,
+    names,
+    types,
+    max_depth=max_depth,
+  )
+
+
+def _expand(
+  root_id: str,
+  links_of: Callable[[str], Iterable[str]],
+  is_known: Callable[[str], bool],
+  names: dict[str, str],
+  types: dict[str, str],
+  *,
+  max_depth: int,
+) -> list[LinkGraphNode]:
+  """BFS over ``links_of``, expanding only nodes for which ``is_known``."""
   max_depth = min(max_depth, _MAX_LINK_DEPTH)
 
   root_name = names.get(root_id, root_id)
@@ -414,13 +508,7 @@ def expand_link_graph(
     if current_depth >= max_depth:
       continue
 
-    body = bodies.get(current_id, "")
-    if not body:
-      continue
-
-    links = parse_links(body)
-    for link in links:
-      target = _normalize_link_target(link.target)
+    for target in links_of(current_id):
       if target in visited:
         continue
       visited.add(target)
@@ -436,7 +524,7 @@ def expand_link_graph(
       )
       result.append(node)
 
-      if target in bodies:
+      if is_known(target):
         queue.append((target, current_depth + 1))
 
   return result
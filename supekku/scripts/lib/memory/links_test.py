@@ -5,11 +5,13 @@ from __future__ import annotations
 from supekku.scripts.lib.memory.links import (
   LinkGraphNode,
   LinkResolutionResult,
+  MemoryLinkGraph,
   MissingLink,
   ParsedLink,
   ResolvedLink,
   compute_backlinks,
   expand_link_graph,
+  forward_links,
   links_to_frontmatter,
   parse_links,
   resolve_all_links,
@@ -643,6 +645,12 @@ class TestComputeBacklinks:
     bl = compute_backlinks(bodies)
     assert bl["mem.target"] == ["mem.a", "mem.m", "mem.z"]
 
+  def test_aliases_of_one_target_count_once(self) -> None:
+    """Shorthand and canonical links to the same memory are one edge."""
+    bodies = {"mem.a": "[[mem.fact.b]], [[fact.b]] and [[mem:fact.b]]."}
+    assert forward_links("mem.a", bodies["mem.a"]) == ["mem.fact.b"]
+    assert compute_backlinks(bodies) == {"mem.fact.b": ["mem.a"]}
+
 
 # ── expand_link_graph tests ──────────────────────────────────
 
@@ -774,3 +782,35 @@ class TestExpandLinkGraph:
     )
     assert len(nodes) == 1
     assert nodes[0].id == "mem.missing"
+
+
+# ── MemoryLinkGraph tests ────────────────────────────────────
+
+
+class TestMemoryLinkGraph:
+  """A precomputed graph answers the same queries as the body-based helpers."""
+
+  def test_backlinks_match_compute_backlinks(self) -> None:
+    graph = MemoryLinkGraph.from_bodies(_graph_bodies())
+    assert graph.backlinks == compute_backlinks(_graph_bodies())
+
+  def test_expand_matches_expand_link_graph(self) -> None:
+    bodies = {**_graph_bodies(), "mem.c": "To [[mem.unknown]] and [[mem.root]]."}
+    graph = MemoryLinkGraph.from_bodies(bodies)
+    for depth in range(4):
+      assert graph.expand(
+        "mem.root",
+        _graph_names(),
+        _graph_types(),
+        max_depth=depth,
+      ) == expand_link_graph(
+        "mem.root",
+        bodies,
+        _graph_names(),
+        _graph_types(),
+        max_depth=depth,
+      )
+
+  def test_from_forward_derives_backlinks(self) -> None:
+    graph = MemoryLinkGraph.from_forward({"mem.a": ["mem.b"], "mem.b": []})
+    assert graph.backlinks == {"mem.b": ["mem.a"]}
@@ -6,14 +6,23 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from supekku.scripts.lib.core.paths import get_memory_dir
+from supekku.scripts.lib.core.profiling import profiled
 from supekku.scripts.lib.core.repo import find_repo_root
 from supekku.scripts.lib.core.spec_utils import load_markdown_file
 
+from .link_graph import load_memory_link_graph
 from .models import MemoryRecord
+from .selection import ScopeIndex
 
 if TYPE_CHECKING:
   from collections.abc import Iterator
 
+  from .links import MemoryLinkGraph
+
+# Memory directory → (file stat signature, index); shared by registries on
+# the same directory so a long-lived process builds each index once.
+_scope_indexes: dict[Path, tuple[frozenset[tuple[str, int, int]], ScopeIndex]] = {}
+
 
 class MemoryRegistry:
   """Registry for discovering and querying memory artifact files.
@@ -38,22 +47,43 @@ class MemoryRegistry:
     Returns:
       Dictionary mapping memory ID to MemoryRecord.
     """
-    records: dict[str, MemoryRecord] = {}
+    return {mem_id: record for mem_id, (record, _) in self._collect_parsed().items()}
+
+  @profiled("registry.memory")
+  def _collect_parsed(self) -> dict[str, tuple[MemoryRecord, str]]:
+    """Parse every mem.*.md file once, keeping frontmatter and body."""
+    parsed: dict[str, tuple[MemoryRecord, str]] = {}
     if not self.directory.exists():
-      return records
+      return parsed
 
     for mem_file in self.directory.glob("mem.*.md"):
       try:
-        record = self._parse_memory_file(mem_file)
-        if record:
-          records[record.id] = record
+        record, body = self.load_memory_file(mem_file)
       except (ValueError, KeyError, FileNotFoundError):
         continue
+      if record:
+        parsed[record.id] = (record, body)
+
+    return parsed
 
-    return records
+  def collect_path(self, path: Path) -> dict[str, MemoryRecord]:
+    """Parse the single memory file at *path* (watch-driven refresh).
 
-  def _parse_memory_file(self, path: Path) -> MemoryRecord | None:
-    """Parse a single memory file into a MemoryRecord.
+    Returns:
+      ``{id: record}`` for that file, or an empty dict if the file is not a
+      memory file of this registry, no longer exists, or fails to parse.
+    """
+    path = Path(path)
+    if path.parent != self.directory or not path.match("mem.*.md"):
+      return {}
+    try:
+      record, _ = self.load_memory_file(path)
+    except (ValueError, KeyError, FileNotFoundError):
+      return {}
+    return {record.id: record} if record else {}
+
+  def load_memory_file(self, path: Path) -> tuple[MemoryRecord | None, str]:
+    """Parse a single memory file into a MemoryRecord and its body.
 
     Frontmatter ``id`` is authoritative. Falls back to filename stem
     if frontmatter has no ``id`` field.
@@ -62,34 +92,66 @@ class MemoryRegistry:
       path: Path to a mem.*.md file.
 
     Returns:
-      MemoryRecord or None if the file can't be parsed.
+      Tuple of (MemoryRecord or None if the file has no frontmatter, body).
     """
-    frontmatter, _ = load_markdown_file(path)
+    frontmatter, body = load_markdown_file(path)
     if not frontmatter:
-      return None
+      return None, body
 
     # Frontmatter ID is primary; filename stem is fallback
     if not frontmatter.get("id"):
       frontmatter["id"] = path.stem
 
-    return MemoryRecord(**frontmatter, path=str(path))
+    return MemoryRecord(**frontmatter, path=str(path)), body
 
   def collect_bodies(self) -> dict[str, str]:
     """Collect body text for all memory records.
 
-    Reads each memory file, strips frontmatter, and returns the body.
-    Useful for graph operations (backlinks, link expansion).
+    Bodies come from the same parse as the records, so each file is read
+    once. Useful for graph operations (backlinks, link expansion).
 
     Returns:
       Dictionary mapping memory ID to body text.
     """
-    records = self.collect()
-    bodies: dict[str, str] = {}
-    for mem_id, record in records.items():
-      _, body = load_markdown_file(Path(record.path))
-      if body:
-        bodies[mem_id] = body
-    return bodies
+    return {
+      mem_id: body for mem_id, (_, body) in self._collect_parsed().items() if body
+    }
+
+  def link_graph(self) -> MemoryLinkGraph:
+    """Return forward links and backlinks for all memory records.
+
+    Served from the on-disk link graph cache; only memory files changed
+    since it was written are re-parsed.
+    """
+    return load_memory_link_graph(self)
+
+  def scope_index(self) -> ScopeIndex:
+    """Return a ScopeIndex over all memory records, for ``select(index=...)``.
+
+    The index is kept per memory directory and rebuilt only when a
+    mem.*.md file is added, removed or changes mtime or size.
+    """
+    # Stat before collecting: a concurrent edit leaves the signature stale,
+    # so the next call rebuilds.
+    signature = self._file_signature()
+    memo = _scope_indexes.get(self.directory)
+    if memo is not None and memo[0] == signature:
+      return memo[1]
+    index = ScopeIndex(self.collect().values())
+    _scope_indexes[self.directory] = (signature, index)
+    return index
+
+  def _file_signature(self) -> frozenset[tuple[str, int, int]]:
+    if not self.directory.exists():
+      return frozenset()
+    signature = set()
+    for mem_file in self.directory.glob("mem.*.md"):
+      try:
+        st = mem_file.stat()
+      except OSError:
+        continue
+      signature.add((mem_file.name, st.st_mtime_ns, st.st_size))
+    return frozenset(signature)
 
   def find(self, memory_id: str) -> MemoryRecord | None:
     """Find a specific memory record by ID.
@@ -6,8 +6,10 @@ import tempfile
 import unittest
 from datetime import date
 from pathlib import Path
+from unittest.mock import patch
 
 from supekku.scripts.lib.core.paths import MEMORY_DIR, SPEC_DRIVER_DIR
+from supekku.scripts.lib.core.spec_utils import load_markdown_file
 from supekku.scripts.lib.memory.registry import MemoryRegistry
 
 # ── Fixture content ─────────────────────────────────────────────
@@ -511,6 +513,24 @@ memory_type: fact
       self.assertNotIn("---", body)
       self.assertNotIn("id:", body)
 
+  def test_collect_bodies_parses_each_file_once(self) -> None:
+    """collect_bodies takes records and bodies from a single parse."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+      root = _setup_repo(
+        tmpdir,
+        files={
+          "mem.fact.test.md": MINIMAL_MEM,
+          "mem.signpost.auth.prereading.md": FULL_MEM,
+        },
+      )
+      registry = MemoryRegistry(root=root)
+      with patch(
+        "supekku.scripts.lib.memory.registry.load_markdown_file",
+        wraps=load_markdown_file,
+      ) as loader:
+        registry.collect_bodies()
+      self.assertEqual(loader.call_count, 2)
+
   def test_to_dict_integration(self) -> None:
     """Records produced by collect serialize correctly via to_dict."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -529,6 +549,29 @@ memory_type: fact
       self.assertEqual(d["memory_type"], "fact")
       self.assertTrue(d["path"].startswith(".spec-driver/memory/"))
 
+  def test_scope_index_reused_until_files_change(self) -> None:
+    """scope_index is built once and shared until a memory file changes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+      root = _setup_repo(tmpdir, files={"mem.fact.test.md": MINIMAL_MEM})
+      index = MemoryRegistry(root=root).scope_index()
+      self.assertEqual([r.id for r in index.records], ["mem.fact.test"])
+
+      with patch(
+        "supekku.scripts.lib.memory.registry.ScopeIndex",
+      ) as built:
+        self.assertIs(MemoryRegistry(root=root).scope_index(), index)
+        self.assertIs(MemoryRegistry(root=root).scope_index(), index)
+      self.assertEqual(built.call_count, 0)
+
+      mem_dir = root / SPEC_DRIVER_DIR / MEMORY_DIR
+      (mem_dir / "mem.signpost.auth.prereading.md").write_text(
+        FULL_MEM,
+        encoding="utf-8",
+      )
+      rebuilt = MemoryRegistry(root=root).scope_index()
+      self.assertIsNot(rebuilt, index)
+      self.assertEqual(len(rebuilt.records), 2)
+
 
 if __name__ == "__main__":
   unittest.main()
@@ -1,6 +1,8 @@
 """Memory selection — scope matching, specificity scoring, and path normalization.
 
-Pure functions for deterministic filtering and ordering of memory records.
+Pure functions for deterministic filtering and ordering of memory records,
+plus ``ScopeIndex``, which precompiles record scopes so ``select`` only
+evaluates candidate records.
 Implements MEM-FR-003 per JAMMS §5 and design-phase-04-selection.md.
 """
 
@@ -8,8 +10,9 @@ from __future__ import annotations
 
 import contextlib
 import fnmatch
+import re
 import shlex
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import PurePosixPath
@@ -250,6 +253,161 @@ def scope_specificity(
   return score
 
 
+# --- Scope index ---
+
+
+def _compile_glob(pattern: str) -> Callable[[str], bool]:
+  """Compile a scope glob into a predicate equivalent to ``_glob_match``.
+
+  ``*`` and ``?`` stay within one segment and ``**`` spans zero or more
+  segments. Patterns with ``[seq]`` classes keep the segment matcher (a
+  negated class must not match ``/``), with the pattern split once.
+  """
+  parts = pattern.split("/")
+  if "[" in pattern:
+    return lambda path: _match_segments(path.split("/"), 0, parts, 0)
+  if all(part == "**" for part in parts):
+    return lambda _path: True
+
+  regex: list[str] = []
+  need_sep = False
+  previous = None
+  for part in parts:
+    if part == "**":
+      if previous != "**":
+        regex.append("(?:/[^/]*)*" if need_sep else "(?:[^/]*/)*")
+    else:
+      if need_sep:
+        regex.append("/")
+      regex.extend(
+        "[^/]*" if char == "*" else "[^/]" if char == "?" else re.escape(char)
+        for char in part
+      )
+      need_sep = True
+    previous = part
+  compiled = re.compile("".join(regex))
+  return lambda path: compiled.fullmatch(path) is not None
+
+
+class _PathNode:
+  """One path segment in the scope-path trie."""
+
+  __slots__ = ("children", "exact", "prefix")
+
+  def __init__(self) -> None:
+    self.children: dict[str, _PathNode] = {}
+    self.exact: list[int] = []
+    self.prefix: list[int] = []
+
+
+class ScopeIndex:
+  """Precompiled scope lookup over a fixed list of memory records.
+
+  Matching a context costs time proportional to the context and the
+  candidate records rather than to every record:
+
+  - ``scope.paths`` live in a path-segment trie: exact paths at their
+    node, trailing-``/`` prefixes covering the node's subtree.
+  - ``scope.globs`` are compiled once and grouped by their first literal
+    segment; globs starting with a wildcard are tried for every path.
+  - ``scope.commands`` are keyed by their first token, tags by value.
+
+  ``match`` agrees with ``matches_scope`` and ``scope_specificity``.
+  """
+
+  def __init__(self, records: Iterable[MemoryRecord]) -> None:
+    self.records = list(records)
+    self._paths = _PathNode()
+    self._globs: dict[str, list[tuple[int, Callable[[str], bool]]]] = {}
+    self._floating_globs: list[tuple[int, Callable[[str], bool]]] = []
+    self._commands: dict[str, list[tuple[int, list[str]]]] = {}
+    self._tags: dict[str, list[int]] = {}
+    for position, record in enumerate(self.records):
+      self._add(position, record)
+
+  def _add(self, position: int, record: MemoryRecord) -> None:
+    scope = record.scope
+    for scope_path in scope.get("paths") or []:
+      if scope_path.endswith("/"):
+        self._path_node(scope_path.rstrip("/")).prefix.append(position)
+      else:
+        self._path_node(scope_path).exact.append(position)
+
+    for pattern in scope.get("globs") or []:
+      entry = (position, _compile_glob(pattern))
+      first = pattern.split("/", 1)[0]
+      if any(char in first for char in "*?["):
+        self._floating_globs.append(entry)
+      else:
+        self._globs.setdefault(first, []).append(entry)
+
+    for scope_cmd in scope.get("commands") or []:
+      tokens = _tokenize_command(scope_cmd)
+      if tokens:
+        self._commands.setdefault(tokens[0], []).append((position, tokens))
+
+    for tag in dict.fromkeys(record.tags or []):
+      self._tags.setdefault(tag, []).append(position)
+
+  def _path_node(self, path: str) -> _PathNode:
+    node = self._paths
+    for segment in path.split("/"):
+      child = node.children.get(segment)
+      if child is None:
+        child = node.children[segment] = _PathNode()
+      node = child
+    return node
+
+  def match(self, context: MatchContext) -> list[tuple[MemoryRecord, int]]:
+    """Return the records whose scope matches *context*, in input order.
+
+    Each record is paired with its ``scope_specificity``; records matched
+    through tags alone score 0.
+    """
+    specificity: dict[int, int] = {}
+
+    if context.paths:
+      for position in self._path_candidates(context.paths):
+        if _matches_paths(self.records[position].scope["paths"], context.paths):
+          specificity[position] = 3
+      for ctx_path in context.paths:
+        bucket = self._globs.get(ctx_path.split("/", 1)[0], ())
+        for position, matches in (*bucket, *self._floating_globs):
+          if position not in specificity and matches(ctx_path):
+            specificity[position] = 2
+
+    if context.command:
+      ctx_tokens = _tokenize_command(context.command)
+      if ctx_tokens:
+        for position, tokens in self._commands.get(ctx_tokens[0], ()):
+          if (
+            position not in specificity
+            and len(tokens) <= len(ctx_tokens)
+            and ctx_tokens[: len(tokens)] == tokens
+          ):
+            specificity[position] = 1
+
+    for tag in dict.fromkeys(context.tags):
+      for position in self._tags.get(tag, ()):
+        specificity.setdefault(position, 0)
+
+    return [(self.records[pos], specificity[pos]) for pos in sorted(specificity)]
+
+  def _path_candidates(self, context_paths: list[str]) -> set[int]:
+    """Records with a scope path on the trie walk of any context path."""
+    candidates: set[int] = set()
+    for ctx_path in context_paths:
+      node: _PathNode | None = self._paths
+      for segment in ctx_path.split("/"):
+        node = node.children.get(segment)
+        if node is None:
+          break
+        candidates.update(node.prefix)
+      if node is not None:
+        candidates.update(node.exact)
+    return candidates
+
+
 _SEVERITY_RANK: dict[str, int] = {
   "critical": 0,
   "high": 1,
@@ -286,14 +444,23 @@ def sort_key(
   Returns:
     5-tuple usable as a sort key.
   """
+  specificity = scope_specificity(record, context) if context else 0
+  return _sort_key(record, specificity, today=today)
+
+
+def _sort_key(
+  record: MemoryRecord,
+  specificity: int,
+  *,
+  today: date | None,
+) -> tuple[int, int, int, int, str]:
+  """``sort_key`` with the scope specificity already known."""
   priority = record.priority
   severity = priority.get("severity", "none") if priority else "none"
   severity_rank = _SEVERITY_RANK.get(severity, _SEVERITY_DEFAULT)
 
   weight = priority.get("weight", 0) if priority else 0
 
-  specificity = scope_specificity(record, context) if context else 0
-
   if record.verified:
     ref = today or date.today()
     verified_days = (ref - record.verified).days
@@ -380,6 +547,7 @@ def select(
   thread_recency_days: int = 14,
   limit: int | None = None,
   today: date | None = None,
+  index: ScopeIndex | None = None,
 ) -> list[MemoryRecord]:
   """Filter, match, and order memory records deterministically.
 
@@ -389,6 +557,10 @@ def select(
     3. Sort by sort_key
     4. Apply limit
 
+  With a context, steps 1–2 run only on the records a ``ScopeIndex``
+  matches, and the specificity it computes feeds the sort. Pass *index*
+  (e.g. ``MemoryRegistry.scope_index()``) to reuse one across calls.
+
   Args:
     records: Input memory records.
     context: Optional match context for scope filtering.
@@ -398,16 +570,28 @@ def select(
     thread_recency_days: Max days since verified for thread inclusion.
     limit: Maximum number of results (None = unlimited).
     today: Reference date; defaults to date.today().
+    index: Prebuilt index covering *records*; its matches are narrowed to
+      the IDs in *records*. Built from *records* when None.
 
   Returns:
     Sorted list of matching memory records.
   """
   ref_today = today or date.today()
 
+  # Step 2 first when there is a context: only scope-matched records can be
+  # selected (threads included), so surfaceability is checked on those alone.
+  if context and index is not None:
+    wanted = {r.id for r in records}
+    candidates = [pair for pair in index.match(context) if pair[0].id in wanted]
+  elif context:
+    candidates = ScopeIndex(records).match(context)
+  else:
+    candidates = [(r, 0) for r in records]
+
   # Step 1: surfaceability filter
   surfaceable = [
-    r
-    for r in records
+    (r, specificity)
+    for r, specificity in candidates
     if is_surfaceable(
       r,
       context,
@@ -418,16 +602,9 @@ def select(
     )
   ]
 
-  # Step 2: scope filter (if context provided)
-  if context:
-    matched = [
-      r for r in surfaceable if r.memory_type == "thread" or matches_scope(r, context)
-    ]
-  else:
-    matched = surfaceable
-
   # Step 3: deterministic sort
-  matched.sort(key=lambda r: sort_key(r, context, today=ref_today))
+  surfaceable.sort(key=lambda pair: _sort_key(pair[0], pair[1], today=ref_today))
+  matched = [r for r, _specificity in surfaceable]
 
   # Step 4: limit
   if limit is not None:
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import itertools
+import random
 import unittest
 from datetime import date
 from pathlib import Path
+from unittest.mock import patch
 
 from supekku.scripts.lib.memory.models import MemoryRecord
 from supekku.scripts.lib.memory.selection import (
   MatchContext,
+  ScopeIndex,
+  _compile_glob,
+  _glob_match,
   is_surfaceable,
   matches_scope,
   normalize_path,
@@ -681,5 +687,98 @@ class TestSelect(unittest.TestCase):
       self.assertEqual(result, first)
 
 
+# -- ScopeIndex ---------------------------------------------------------------
+
+
+_SEGMENTS = ["src", "auth", "cache.ts", "a.py", "docs", ""]
+_PATTERN_SEGMENTS = ["src", "auth", "*", "**", "*.py", "?", "a?py", "[ab]*", "[!s]*"]
+
+
+def _random_path(rng: random.Random, segments: list[str]) -> str:
+  return "/".join(rng.choice(segments) for _ in range(rng.randint(1, 4)))
+
+
+class TestCompileGlob(unittest.TestCase):
+  """Compiled globs agree with the segment matcher."""
+
+  def test_equivalent_to_glob_match(self) -> None:
+    rng = random.Random(7)
+    patterns = [_random_path(rng, _PATTERN_SEGMENTS) for _ in range(300)]
+    paths = [_random_path(rng, _SEGMENTS) for _ in range(100)] + ["", "src/"]
+    for pattern, path in itertools.product(patterns, paths):
+      self.assertEqual(
+        _compile_glob(pattern)(path),
+        _glob_match(path, pattern),
+        f"{pattern!r} vs {path!r}",
+      )
+
+
+class TestScopeIndex(unittest.TestCase):
+  """ScopeIndex.match agrees with matches_scope and scope_specificity."""
+
+  def _random_records(self, rng: random.Random, count: int) -> list[MemoryRecord]:
+    records = []
+    for n in range(count):
+      scope: dict = {}
+      if rng.random() < 0.5:
+        scope["paths"] = [
+          _random_path(rng, _SEGMENTS) + rng.choice(["", "/"])
+          for _ in range(rng.randint(1, 2))
+        ]
+      if rng.random() < 0.5:
+        scope["globs"] = [_random_path(rng, _PATTERN_SEGMENTS)]
+      if rng.random() < 0.3:
+        scope["commands"] = [rng.choice(["test", "test auth", "lint", "'a b' c"])]
+      tags = rng.sample(["auth", "ui", "db"], rng.randint(0, 2))
+      records.append(_record(record_id=f"mem.fact.{n:03d}", scope=scope, tags=tags))
+    return records
+
+  def test_agrees_with_matches_scope(self) -> None:
+    rng = random.Random(11)
+    records = self._random_records(rng, 200)
+    index = ScopeIndex(records)
+    for _ in range(150):
+      ctx = MatchContext(
+        paths=[_random_path(rng, _SEGMENTS) for _ in range(rng.randint(0, 3))],
+        command=rng.choice([None, "test", "test auth --verbose", "lint x", "a b c"]),
+        tags=rng.sample(["auth", "ui", "db"], rng.randint(0, 1)),
+      )
+      expected = [
+        (r.id, scope_specificity(r, ctx)) for r in records if matches_scope(r, ctx)
+      ]
+      actual = [(r.id, specificity) for r, specificity in index.match(ctx)]
+      self.assertEqual(actual, expected, ctx)
+
+  def test_select_orders_as_sort_key(self) -> None:
+    """select keeps the sort_key ordering over index-matched records."""
+    rng = random.Random(3)
+    records = self._random_records(rng, 100)
+    ctx = MatchContext(paths=["src/auth/cache.ts", "docs/"], tags=["ui"])
+    today = date(2026, 3, 2)
+
+    expected = sorted(
+      (r for r in records if matches_scope(r, ctx)),
+      key=lambda r: sort_key(r, ctx, today=today),
+    )
+    self.assertEqual(select(records, ctx, today=today), expected)
+
+  def test_select_reuses_prebuilt_index(self) -> None:
+    """A prebuilt index is used as-is and narrowed to the given records."""
+    rng = random.Random(5)
+    records = self._random_records(rng, 100)
+    ctx = MatchContext(paths=["src/auth/cache.ts"], tags=["auth"])
+    today = date(2026, 3, 2)
+    index = ScopeIndex(records)
+    subset = records[::2]
+
+    with patch("supekku.scripts.lib.memory.selection.ScopeIndex") as built:
+      for _ in range(3):
+        self.assertEqual(
+          select(subset, ctx, today=today, index=index),
+          select(subset, ctx, today=today, index=ScopeIndex(subset)),
+        )
+      self.assertEqual(built.call_count, 0)
+
+
 if __name__ == "__main__":
   unittest.main()
@@ -7,12 +7,13 @@ all scoped memories (DEC-086-06).
 
 from __future__ import annotations
 
-import subprocess
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from supekku.scripts.lib.core.git import GitFacts, get_git_facts
+
 if TYPE_CHECKING:
   from supekku.scripts.lib.memory.models import MemoryRecord
 
@@ -163,32 +164,12 @@ def _query_git_log(
   oldest_sha = _find_oldest_sha(attested)
   all_pathspecs = _collect_all_pathspecs(attested)
 
-  cmd = [
-    "git",
-    "log",
-    "--oneline",
-    "--name-only",
-    f"{oldest_sha}..HEAD",
-    "--",
-    *all_pathspecs,
-  ]
-
-  try:
-    result = subprocess.run(  # noqa: S603, S607
-      cmd,
-      capture_output=True,
-      text=True,
-      timeout=30,
-      cwd=root,
-      check=False,
-    )
-  except (FileNotFoundError, subprocess.TimeoutExpired):
-    return None
-
-  if result.returncode != 0:
+  facts = get_git_facts(root) or GitFacts(root)
+  output = facts.log_name_only(f"{oldest_sha}..HEAD", all_pathspecs)
+  if output is None:
     return None
 
-  return _parse_git_log_output(result.stdout)
+  return _parse_git_log_output(output)
 
 
 def _parse_git_log_output(output: str) -> list[_CommitEntry]:
@@ -16,6 +16,7 @@ import yaml
 
 from supekku.scripts.lib.core.dates import parse_date
 from supekku.scripts.lib.core.paths import get_policies_dir, get_registry_dir
+from supekku.scripts.lib.core.profiling import profiled
 from supekku.scripts.lib.core.repo import find_repo_root
 from supekku.scripts.lib.core.spec_utils import extract_h1_title, load_markdown_file
 
@@ -116,6 +117,7 @@ class PolicyRegistry:
     """Load existing registry from YAML file."""
     return cls(root=root)
 
+  @profiled("registry.policy")
   def collect(self) -> dict[str, PolicyRecord]:
     """Collect all policy files and parse them into PolicyRecords."""
     policies: dict[str, PolicyRecord] = {}
@@ -135,6 +137,21 @@ class PolicyRegistry:
 
     return policies
 
+  def collect_path(self, path: Path) -> dict[str, PolicyRecord]:
+    """Parse the single POL-*.md file at *path* (watch-driven refresh).
+
+    Returns an empty dict if the file is outside this registry, no longer
+    exists, or fails to parse.
+    """
+    path = Path(path)
+    if path.parent != self.directory or not path.match("POL-*.md"):
+      return {}
+    try:
+      policy = self._parse_policy_file(path)
+    except (ValueError, KeyError, FileNotFoundError):
+      return {}
+    return {policy.id: policy} if policy else {}
+
   def _parse_policy_file(self, policy_path: Path) -> PolicyRecord | None:
     """Parse an individual policy file into a PolicyRecord."""
     frontmatter, content = load_markdown_file(policy_path)
@@ -195,6 +212,7 @@ class PolicyRegistry:
     path: Path | None = None,
     *,
     decision_sources: dict[str, Any] | None = None,
+    policies: dict[str, PolicyRecord] | None = None,
   ) -> None:
     """Write registry to YAML file.
 
@@ -204,11 +222,14 @@ class PolicyRegistry:
             When provided, backlinks are computed from these records.
             ``None`` means skip backlink population — registries never
             fall back to sibling instantiation.
+        policies: Pre-collected records from ``collect()``; collected
+            afresh when ``None``.
     """
     if path is None:
       path = self.output_path
 
-    policies = self.collect()
+    if policies is None:
+      policies = self.collect()
     self._build_backlinks(policies, decision_sources=decision_sources)
 
     registry_data = {
@@ -249,14 +270,20 @@ class PolicyRegistry:
       "decisions",
     )
 
-  def sync(self, *, decision_sources: dict[str, Any] | None = None) -> None:
+  def sync(
+    self,
+    *,
+    decision_sources: dict[str, Any] | None = None,
+    policies: dict[str, PolicyRecord] | None = None,
+  ) -> None:
     """Sync registry by collecting policies and writing to YAML.
 
     Args:
         decision_sources: Pre-collected decision records for backlink
             computation. ``None`` skips backlink population.
+        policies: Pre-collected policy records; collected when ``None``.
     """
-    self.write(decision_sources=decision_sources)
+    self.write(decision_sources=decision_sources, policies=policies)
 
   def iter(self, status: str | None = None) -> Iterator[PolicyRecord]:
     """Iterate over policies, optionally filtered by status."""
@@ -10,8 +10,12 @@ Design reference: DR-097, DR-125.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any  # noqa: F401
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+from spec_driver.core import paths
+from spec_driver.core.io import read_json_cache, write_json_cache
 from spec_driver.domain.relations.graph import (  # noqa: F401
   GraphEdge,
   ReferenceGraph,
@@ -28,6 +32,10 @@ if TYPE_CHECKING:
   from supekku.scripts.lib.workspace import Workspace
 
 
+GRAPH_SNAPSHOT_FILENAME = "reference_graph.json"
+GRAPH_SNAPSHOT_VERSION = 1
+
+
 def build_reference_graph(workspace: Workspace) -> ReferenceGraph:
   """Build a reference graph from all workspace registries.
 
@@ -64,34 +72,8 @@ def _collect_workspace_artifacts(
   out: list[tuple[str, str, Any]],
 ) -> None:
   """Collect artifacts from registries exposed as Workspace properties."""
-  # Decisions
-  for dec_id, dec in workspace.decisions.collect().items():
-    out.append((dec_id, "adr", dec))
-
-  # Specs
-  for spec in workspace.specs.all_specs():
-    out.append((spec.id, "spec", spec))
-
-  # Changes (delta, revision, audit)
-  for registry in (
-    workspace.delta_registry,
-    workspace.revision_registry,
-    workspace.audit_registry,
-  ):
-    for art_id, art in registry.collect().items():
-      out.append((art_id, registry.kind, art))
-
-  # Requirements
-  for req_id, req in workspace.requirements.records.items():
-    out.append((req_id, "requirement", req))
-
-  # Policies
-  for pol_id, pol in workspace.policies.collect().items():
-    out.append((pol_id, "policy", pol))
-
-  # Standards
-  for std_id, std in workspace.standards.collect().items():
-    out.append((std_id, "standard", std))
+  for source in _WORKSPACE_SOURCES:
+    out.extend(_SOURCE_COLLECTORS[source](workspace))
 
 
 def _collect_standalone_registry_artifacts(
@@ -99,19 +81,233 @@ def _collect_standalone_registry_artifacts(
   out: list[tuple[str, str, Any]],
 ) -> None:
   """Collect artifacts from registries not exposed on Workspace."""
-  # pylint: disable=import-outside-toplevel
+  out.extend(_collect_memory(root))
+  out.extend(_collect_backlog(root))
+  out.extend(_collect_drift(root))
+
+
+# ── Per-source collectors ────────────────────────────────────
+# Each source is one registry; a snapshot refresh re-collects only the
+# sources whose files changed.
+
+
+def _collect_decisions(workspace: Workspace) -> list[tuple[str, str, Any]]:
+  return [(dec_id, "adr", dec) for dec_id, dec in workspace.decisions.collect().items()]
+
+
+def _collect_specs(workspace: Workspace) -> list[tuple[str, str, Any]]:
+  return [(spec.id, "spec", spec) for spec in workspace.specs.all_specs()]
+
+
+def _change_collector(attr: str) -> Callable[[Workspace], list[tuple[str, str, Any]]]:
+  def _collect(workspace: Workspace) -> list[tuple[str, str, Any]]:
+    registry = getattr(workspace, attr)
+    return [(art_id, registry.kind, art) for art_id, art in registry.collect().items()]
+
+  return _collect
+
+
+def _collect_requirements(workspace: Workspace) -> list[tuple[str, str, Any]]:
+  return [
+    (req_id, "requirement", req)
+    for req_id, req in workspace.requirements.records.items()
+  ]
+
+
+def _collect_policies(workspace: Workspace) -> list[tuple[str, str, Any]]:
+  return [
+    (pol_id, "policy", pol) for pol_id, pol in workspace.policies.collect().items()
+  ]
+
+
+def _collect_standards(workspace: Workspace) -> list[tuple[str, str, Any]]:
+  return [
+    (std_id, "standard", std) for std_id, std in workspace.standards.collect().items()
+  ]
+
+
+def _collect_memory(root: Any) -> list[tuple[str, str, Any]]:
+  from supekku.scripts.lib.memory.registry import MemoryRegistry  # noqa: PLC0415
+
+  return [
+    (mem_id, "memory", mem)
+    for mem_id, mem in MemoryRegistry(root=root).collect().items()
+  ]
+
+
+def _collect_backlog(root: Any) -> list[tuple[str, str, Any]]:
   from supekku.scripts.lib.backlog.registry import BacklogRegistry  # noqa: PLC0415
+
+  return [
+    (item_id, item.kind, item)
+    for item_id, item in BacklogRegistry(root=root).collect().items()
+  ]
+
+
+def _collect_drift(root: Any) -> list[tuple[str, str, Any]]:
   from supekku.scripts.lib.drift.registry import DriftLedgerRegistry  # noqa: PLC0415
-  from supekku.scripts.lib.memory.registry import MemoryRegistry  # noqa: PLC0415
 
-  for mem_id, mem in MemoryRegistry(root=root).collect().items():
-    out.append((mem_id, "memory", mem))
+  return [
+    (dl_id, "drift_ledger", dl)
+    for dl_id, dl in DriftLedgerRegistry(root=root).collect().items()
+  ]
+
+
+_WORKSPACE_SOURCES = (
+  "decisions",
+  "specs",
+  "deltas",
+  "revisions",
+  "audits",
+  "requirements",
+  "policies",
+  "standards",
+)
+
+_SOURCE_COLLECTORS: dict[str, Callable[[Workspace], list[tuple[str, str, Any]]]] = {
+  "decisions": _collect_decisions,
+  "specs": _collect_specs,
+  "deltas": _change_collector("delta_registry"),
+  "revisions": _change_collector("revision_registry"),
+  "audits": _change_collector("audit_registry"),
+  "requirements": _collect_requirements,
+  "policies": _collect_policies,
+  "standards": _collect_standards,
+  "memory": lambda workspace: _collect_memory(workspace.root),
+  "backlog": lambda workspace: _collect_backlog(workspace.root),
+  "drift": lambda workspace: _collect_drift(workspace.root),
+}
+
+
+def _source_locations(root: Path) -> dict[str, list[Path]]:
+  """Map each graph source to the files/directories it is loaded from."""
+  return {
+    "decisions": [paths.get_decisions_dir(root)],
+    "specs": [paths.get_tech_specs_dir(root), paths.get_product_specs_dir(root)],
+    "deltas": [paths.get_deltas_dir(root)],
+    "revisions": [paths.get_revisions_dir(root)],
+    "audits": [paths.get_audits_dir(root)],
+    "requirements": [paths.get_registry_dir(root) / "requirements.yaml"],
+    "policies": [paths.get_policies_dir(root)],
+    "standards": [paths.get_standards_dir(root)],
+    "memory": [paths.get_memory_dir(root)],
+    "backlog": [paths.get_backlog_dir(root)],
+    "drift": [paths.get_drift_dir(root)],
+  }
+
+
+def _fingerprint_sources(root: Path) -> dict[str, dict[str, list[int]]]:
+  """Return ``{source: {relpath: [mtime_ns, size]}}`` for every source file.
+
+  Directory sources contribute every ``*.md`` / ``*.yaml`` beneath them.
+  Only ``stat`` calls — no file contents are read.
+  """
+  fingerprints: dict[str, dict[str, list[int]]] = {}
+  for source, locations in _source_locations(root).items():
+    files: dict[str, list[int]] = {}
+    for location in locations:
+      if location.is_file():
+        candidates = [location]
+      elif location.is_dir():
+        candidates = [p for p in location.rglob("*") if p.suffix in {".md", ".yaml"}]
+      else:
+        continue
+      for candidate in candidates:
+        try:
+          st = candidate.stat()
+        except OSError:
+          continue
+        rel = candidate.relative_to(root).as_posix()
+        files[rel] = [st.st_mtime_ns, st.st_size]
+    fingerprints[source] = files
+  return fingerprints
+
+
+def get_graph_snapshot_path(root: Path) -> Path:
+  """Return the on-disk reference graph snapshot location."""
+  return paths.get_cache_dir(root) / GRAPH_SNAPSHOT_FILENAME
+
+
+def _read_snapshot(path: Path) -> dict[str, Any] | None:
+  data = read_json_cache(path, GRAPH_SNAPSHOT_VERSION)
+  if data is None or not isinstance(data.get("graph"), dict):
+    return None
+  return data
+
+
+def _write_snapshot(
+  path: Path,
+  graph: ReferenceGraph,
+  node_sources: dict[str, str],
+  fingerprints: dict[str, dict[str, list[int]]],
+) -> None:
+  """Persist the graph snapshot (fail-silent)."""
+  payload = {
+    "graph": graph.to_dict(),
+    "node_sources": node_sources,
+    "fingerprints": fingerprints,
+  }
+  write_json_cache(path, GRAPH_SNAPSHOT_VERSION, payload)
+
+
+def load_reference_graph(workspace: Workspace) -> ReferenceGraph:
+  """Return the workspace reference graph, reusing the on-disk snapshot.
+
+  The snapshot under ``.spec-driver/run/cache/`` records a stat
+  fingerprint of every source file. Sources whose files are unchanged are
+  not collected at all; changed sources are re-collected and patched into
+  the graph in one ``apply_changes`` batch. Falls back to a
+  full build when no usable snapshot exists.
+
+  Unlike ``build_reference_graph``, this reads registries from disk and
+  ignores in-memory edits made to ``workspace`` registries — use the full
+  build when validating modified in-memory state.
+  """
+  root = Path(workspace.root)
+  snapshot_path = get_graph_snapshot_path(root)
+  fingerprints = _fingerprint_sources(root)
+  snapshot = _read_snapshot(snapshot_path)
+
+  if snapshot is None:
+    node_sources: dict[str, str] = {}
+    artifacts: list[tuple[str, str, Any]] = []
+    for source, collect in _SOURCE_COLLECTORS.items():
+      for triple in collect(workspace):
+        node_sources[triple[0]] = source
+        artifacts.append(triple)
+    graph = build_reference_graph_from_artifacts(artifacts)
+    _write_snapshot(snapshot_path, graph, node_sources, fingerprints)
+    return graph
+
+  graph = ReferenceGraph.from_dict(snapshot["graph"])
+  node_sources = dict(snapshot.get("node_sources", {}))
+  previous = snapshot.get("fingerprints", {})
+  changed = [
+    source
+    for source in _SOURCE_COLLECTORS
+    if fingerprints.get(source) != previous.get(source)
+  ]
+  if not changed:
+    return graph
 
-  for item_id, item in BacklogRegistry(root=root).collect().items():
-    out.append((item_id, item.kind, item))
+  upserts: list[tuple[str, str, Any]] = []
+  removals: list[str] = []
+  for source in changed:
+    seen: set[str] = set()
+    for triple in _SOURCE_COLLECTORS[source](workspace):
+      upserts.append(triple)
+      node_sources[triple[0]] = source
+      seen.add(triple[0])
+    for art_id in [n for n, s in node_sources.items() if s == source]:
+      if art_id not in seen:
+        removals.append(art_id)
+        del node_sources[art_id]
+  # An ID that moved between sources is removed from one and upserted by
+  # the other; keep it.
+  graph.apply_changes(upserts, [n for n in removals if n not in node_sources])
 
-  for dl_id, dl in DriftLedgerRegistry(root=root).collect().items():
-    out.append((dl_id, "drift_ledger", dl))
+  _write_snapshot(snapshot_path, graph, node_sources, fingerprints)
+  return graph
 
 
 __all__ = [
@@ -120,6 +316,8 @@ __all__ = [
   "build_reference_graph",
   "build_reference_graph_from_artifacts",
   "find_unresolved_references",
+  "get_graph_snapshot_path",
+  "load_reference_graph",
   "query_forward",
   "query_inverse",
   "query_neighbourhood",
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
+import pytest
+
+from supekku.scripts.lib.relations import graph as graph_module
 from supekku.scripts.lib.relations.graph import (
+  ReferenceGraph,
+  build_reference_graph,
   build_reference_graph_from_artifacts,
   find_unresolved_references,
+  get_graph_snapshot_path,
+  load_reference_graph,
   query_forward,
   query_inverse,
   query_neighbourhood,
@@ -261,3 +271,195 @@ class TestGraphNormalization:
     ]
     graph = build_reference_graph_from_artifacts(arts)
     assert len(graph.diagnostics) == 0
+
+
+# ── Incremental updates ──────────────────────────────────────
+
+
+class TestIncrementalUpdates:
+  """upsert_artifact / remove_artifact / apply_changes match a full rebuild."""
+
+  @staticmethod
+  def _edge_set(graph: Any) -> set[tuple[str, str, str, str]]:
+    return {(e.source, e.target, e.source_slot, e.detail) for e in graph.edges}
+
+  def test_upsert_changes_only_edited_artifact(self) -> None:
+    arts = _make_artifacts()
+    graph = build_reference_graph_from_artifacts(arts)
+    edited = FakeArtifact(
+      id="DE-097",
+      relations=[{"type": "relates_to", "target": "ISSUE-031"}],
+    )
+    graph.upsert_artifact("DE-097", "delta", edited)
+
+    arts[0] = ("DE-097", "delta", edited)
+    expected = build_reference_graph_from_artifacts(arts)
+    assert self._edge_set(graph) == self._edge_set(expected)
+    assert query_inverse(graph, "DE-045") == []
+    assert [e.source for e in query_inverse(graph, "DE-097")] == ["DR-097"]
+
+  def test_new_artifact_adopts_dangling_edges(self) -> None:
+    arts = [
+      (
+        "DE-001",
+        "delta",
+        FakeArtifact(
+          id="DE-001",
+          relations=[{"type": "relates_to", "target": "ADR-11"}],
+        ),
+      ),
+    ]
+    graph = build_reference_graph_from_artifacts(arts)
+    assert find_unresolved_references(graph)
+
+    graph.upsert_artifact("ADR-011", "adr", FakeArtifact(id="ADR-011"))
+
+    assert query_forward(graph, "DE-001")[0].target == "ADR-011"
+    assert [e.source for e in query_inverse(graph, "ADR-011")] == ["DE-001"]
+    assert find_unresolved_references(graph) == []
+    assert len(graph.diagnostics) == 1
+
+  def test_remove_artifact_unresolves_inbound_edges(self) -> None:
+    graph = build_reference_graph_from_artifacts(_make_artifacts())
+
+    graph.remove_artifact("DE-045")
+
+    assert "DE-045" not in graph.nodes
+    unresolved = find_unresolved_references(graph)
+    assert [(e.source, e.target) for e in unresolved] == [("DE-097", "DE-045")]
+    graph.remove_artifact("DE-045")  # idempotent
+
+  def test_apply_changes_matches_full_rebuild(self) -> None:
+    arts = _make_artifacts()
+    graph = build_reference_graph_from_artifacts(arts)
+    arts[0] = (
+      "DE-097",
+      "delta",
+      FakeArtifact(id="DE-097", relations=[{"type": "relates_to", "target": "ADR-11"}]),
+    )
+    arts.append(("ADR-011", "adr", FakeArtifact(id="ADR-011")))
+    removed = arts.pop(1)
+
+    graph.apply_changes(arts, [removed[0]])
+
+    expected = build_reference_graph_from_artifacts(arts)
+    assert self._edge_set(graph) == self._edge_set(expected)
+    assert graph.nodes == expected.nodes
+    assert sorted(graph.diagnostics) == sorted(expected.diagnostics)
+
+  def test_reapplying_unchanged_artifacts_is_a_noop(
+    self, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
+    arts = _make_artifacts()
+    graph = build_reference_graph_from_artifacts(arts)
+    edges = graph.edges
+
+    def _fail() -> None:
+      raise AssertionError("derived state should not be rebuilt")
+
+    monkeypatch.setattr(graph, "_refresh_derived", _fail)
+    graph.apply_changes(arts)
+
+    assert graph.edges is edges
+
+  def test_round_trip_preserves_queries(self) -> None:
+    graph = build_reference_graph_from_artifacts(_make_artifacts())
+    restored = ReferenceGraph.from_dict(graph.to_dict())
+
+    assert restored.nodes == graph.nodes
+    assert restored.edges == graph.edges
+    assert query_inverse(restored, "DE-097") == query_inverse(graph, "DE-097")
+
+
+# ── Workspace snapshot ───────────────────────────────────────
+
+
+class TestLoadReferenceGraph:
+  """load_reference_graph reuses and patches the on-disk snapshot."""
+
+  @staticmethod
+  def _write_delta(root: Path, delta_id: str, targets: list[str]) -> Path:
+    from supekku.scripts.lib.core.spec_utils import (  # noqa: PLC0415
+      dump_markdown_file_update,
+    )
+
+    bundle = root / ".spec-driver" / "deltas" / f"{delta_id}-sample"
+    bundle.mkdir(parents=True, exist_ok=True)
+    path = bundle / f"{delta_id}.md"
+    frontmatter = {
+      "id": delta_id,
+      "slug": delta_id.lower(),
+      "name": f"Delta {delta_id}",
+      "created": "2024-06-01",
+      "updated": "2024-06-02",
+      "status": "draft",
+      "kind": "delta",
+      "relations": [{"type": "relates_to", "target": t} for t in targets],
+    }
+    dump_markdown_file_update(path, frontmatter, f"# {delta_id}\n")
+    return path
+
+  @staticmethod
+  def _load(root: Path) -> Any:
+    from supekku.scripts.lib.workspace import Workspace  # noqa: PLC0415
+
+    return load_reference_graph(Workspace(root=root))
+
+  def test_first_load_matches_full_build_and_writes_snapshot(
+    self, tmp_path: Path
+  ) -> None:
+    from supekku.scripts.lib.workspace import Workspace  # noqa: PLC0415
+
+    self._write_delta(tmp_path, "DE-001", [])
+    self._write_delta(tmp_path, "DE-002", ["DE-001"])
+
+    graph = self._load(tmp_path)
+
+    expected = build_reference_graph(Workspace(root=tmp_path))
+    assert graph.nodes == expected.nodes
+    assert graph.edges == expected.edges
+    assert get_graph_snapshot_path(tmp_path).exists()
+
+  def test_unchanged_workspace_skips_collection(
+    self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
+    self._write_delta(tmp_path, "DE-001", [])
+    self._write_delta(tmp_path, "DE-002", ["DE-001"])
+    self._load(tmp_path)
+
+    def _fail(_workspace: Any) -> list[Any]:
+      raise AssertionError("collector should not run")
+
+    for source in list(graph_module._SOURCE_COLLECTORS):
+      monkeypatch.setitem(graph_module._SOURCE_COLLECTORS, source, _fail)
+
+    graph = self._load(tmp_path)
+    assert [e.source for e in query_inverse(graph, "DE-001")] == ["DE-002"]
+
+  def test_changed_source_is_patched(self, tmp_path: Path) -> None:
+    self._write_delta(tmp_path, "DE-001", [])
+    self._write_delta(tmp_path, "DE-002", ["DE-001"])
+    self._load(tmp_path)
+
+    self._write_delta(tmp_path, "DE-003", ["DE-002"])
+    path = self._write_delta(tmp_path, "DE-002", [])
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    graph = self._load(tmp_path)
+
+    assert set(graph.nodes) == {"DE-001", "DE-002", "DE-003"}
+    assert query_inverse(graph, "DE-001") == []
+    assert [e.source for e in query_inverse(graph, "DE-002")] == ["DE-003"]
+
+    shutil.rmtree(path.parent)
+    graph = self._load(tmp_path)
+    assert "DE-002" not in graph.nodes
+    assert [e.target for e in find_unresolved_references(graph)] == ["DE-002"]
+
+  def test_corrupt_snapshot_falls_back_to_full_build(self, tmp_path: Path) -> None:
+    self._write_delta(tmp_path, "DE-001", [])
+    snapshot = get_graph_snapshot_path(tmp_path)
+    snapshot.parent.mkdir(parents=True)
+    snapshot.write_text("{not json", encoding="utf-8")
+
+    assert set(self._load(tmp_path).nodes) == {"DE-001"}
@@ -4,11 +4,13 @@
 from spec_driver.domain.relations.manager import (
   add_relation,
   list_relations,
+  relations_from_frontmatter,
   remove_relation,
 )
 
 __all__ = [
   "add_relation",
   "list_relations",
+  "relations_from_frontmatter",
   "remove_relation",
 ]
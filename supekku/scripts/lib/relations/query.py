@@ -15,6 +15,7 @@ from spec_driver.domain.relations.query import (
   find_related_to,
   matches_related_to,
   matches_relation,
+  partition_by_reference_targets,
   partition_by_reverse_references,
 )
 
@@ -32,5 +33,6 @@ __all__ = [
   "find_related_to",
   "matches_related_to",
   "matches_relation",
+  "partition_by_reference_targets",
   "partition_by_reverse_references",
 ]
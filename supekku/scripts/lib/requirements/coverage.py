@@ -24,6 +24,8 @@ from .models import RequirementRecord
 if TYPE_CHECKING:
   from pathlib import Path
 
+  from .fingerprints import SourceFingerprints
+
 
 def _check_coverage_drift(
   req_id: str,
@@ -118,44 +120,69 @@ def _compute_status_from_coverage(
   return None
 
 
+def _coverage_entries(source_file: Path) -> list[dict[str, Any]]:
+  """Return the coverage entries declared in one artifact file.
+
+  Entries with unknown statuses are still returned (for transparency in
+  coverage_entries) but a warning is emitted.  The downstream
+  _compute_status_from_coverage() independently filters unknown statuses
+  so they never influence derived requirement state.
+  """
+  try:
+    blocks = load_coverage_blocks(source_file)
+  except (ValueError, OSError):
+    return []
+  entries: list[dict[str, Any]] = []
+  for block in blocks:
+    for entry in block.data.get("entries", []):
+      req_id = entry.get("requirement")
+      if not req_id:
+        continue
+      status = entry.get("status")
+      if status and status not in VERIFICATION_STATUSES:
+        print(
+          f"WARNING: Coverage entry for {req_id} has unknown status "
+          f"{status!r} in {source_file.name}; "
+          f"entry will not influence derived requirement status; "
+          f"valid: {sorted(VERIFICATION_STATUSES)}",
+          file=sys.stderr,
+        )
+      entries.append(
+        {
+          "requirement": req_id,
+          "artefact": entry.get("artefact"),
+          "status": status,
+          "kind": entry.get("kind"),
+        }
+      )
+  return entries
+
+
 def _extract_coverage_entries(
   files: Iterable[Path],
   coverage_map: dict[str, list[dict[str, Any]]],
+  *,
+  fingerprints: SourceFingerprints | None = None,
 ) -> None:
   """Extract coverage entries from a set of artifact files into coverage_map.
 
-  Entries with unknown statuses are still recorded (for transparency in
-  coverage_entries) but a warning is emitted.  The downstream
-  _compute_status_from_coverage() independently filters unknown statuses
-  so they never influence derived requirement state.
+  With *fingerprints*, entries recorded for unchanged files are replayed
+  instead of re-parsing their coverage blocks.
   """
   for source_file in files:
-    try:
-      blocks = load_coverage_blocks(source_file)
-    except (ValueError, OSError):
-      continue
-    for block in blocks:
-      for entry in block.data.get("entries", []):
-        req_id = entry.get("requirement")
-        if not req_id:
-          continue
-        status = entry.get("status")
-        if status and status not in VERIFICATION_STATUSES:
-          print(
-            f"WARNING: Coverage entry for {req_id} has unknown status "
-            f"{status!r} in {source_file.name}; "
-            f"entry will not influence derived requirement status; "
-            f"valid: {sorted(VERIFICATION_STATUSES)}",
-            file=sys.stderr,
-          )
-        coverage_map[req_id].append(
-          {
-            "source": source_file,
-            "artefact": entry.get("artefact"),
-            "status": status,
-            "kind": entry.get("kind"),
-          }
-        )
+    if fingerprints is None:
+      entries = _coverage_entries(source_file)
+    else:
+      entries = fingerprints.lookup(source_file, "coverage", _coverage_entries)
+    for entry in entries:
+      coverage_map[entry["requirement"]].append(
+        {
+          "source": source_file,
+          "artefact": entry["artefact"],
+          "status": entry["status"],
+          "kind": entry["kind"],
+        }
+      )
 
 
 def _apply_coverage_blocks(
@@ -164,6 +191,8 @@ def _apply_coverage_blocks(
   delta_files: Iterable[Path],
   plan_files: Iterable[Path],
   audit_files: Iterable[Path],
+  *,
+  fingerprints: SourceFingerprints | None = None,
 ) -> None:
   """Apply verification coverage blocks to update requirement lifecycle.
 
@@ -185,7 +214,7 @@ def _apply_coverage_blocks(
   coverage_map: dict[str, list[dict[str, Any]]] = defaultdict(list)
 
   for files in (spec_files, delta_files, plan_files, audit_files):
-    _extract_coverage_entries(files, coverage_map)
+    _extract_coverage_entries(files, coverage_map, fingerprints=fingerprints)
 
   # Rebuild from current sources
   for req_id, entries in coverage_map.items():
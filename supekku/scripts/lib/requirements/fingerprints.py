@@ -0,0 +1,193 @@
+"""Per-source fingerprints for incremental requirements sync.
+
+An incremental ``RequirementsRegistry.sync`` records every file it reads —
+specs, deltas, plans, revisions, audits, backlog items — with a content
+digest and the facts extracted from it: the requirement UIDs a spec
+yields, the requirements a delta implements, the coverage entries it
+carries, and so on. The record is kept in
+``.spec-driver/run/cache/requirements_sources.json`` next to a digest of
+the ``requirements.yaml`` it was saved with.
+
+The next incremental sync re-reads only files whose digest changed and
+replays the recorded facts for the rest, so relation, revision, coverage
+and pruning steps still see the whole workspace without re-parsing it. A
+registry file changed by anything else (a full sync, a checkout) voids the
+record. Full syncs neither compute nor save fingerprints.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from spec_driver.core.io import read_json_cache, write_json_cache
+from supekku.scripts.lib.core.paths import get_cache_dir
+
+# Bump when the shape or meaning of recorded facts changes; a mismatch
+# discards every recorded fact and the next sync re-reads everything.
+FINGERPRINT_VERSION = 1
+
+FINGERPRINTS_FILENAME = "requirements_sources.json"
+
+
+def source_digest(paths: Iterable[Path]) -> str:
+  """Digest the bytes of *paths*, in order."""
+  digest = hashlib.sha256()
+  for source in paths:
+    try:
+      digest.update(source.read_bytes())
+    except OSError:
+      digest.update(b"<missing>")
+    digest.update(b"\0")
+  return digest.hexdigest()[:16]
+
+
+def spec_dependencies(spec_path: Path) -> list[Path]:
+  """Breakout requirement files whose frontmatter feeds spec extraction."""
+  requirements_dir = spec_path.parent / "requirements"
+  if not requirements_dir.is_dir():
+    return []
+  return sorted(requirements_dir.glob("*.md"))
+
+
+def get_fingerprints_path(root: Path) -> Path:
+  """Return the on-disk source fingerprint location."""
+  return get_cache_dir(root) / FINGERPRINTS_FILENAME
+
+
+def load_fingerprints(root: Path, registry_path: Path) -> dict[str, Any] | None:
+  """Return the fingerprints saved with the current *registry_path*, if any."""
+  return read_json_cache(
+    get_fingerprints_path(root),
+    FINGERPRINT_VERSION,
+    stamp={"registry": source_digest([registry_path])},
+  )
+
+
+def save_fingerprints(fingerprints: SourceFingerprints, registry_path: Path) -> None:
+  """Persist *fingerprints* for the just-written *registry_path* (fail-silent)."""
+  write_json_cache(
+    get_fingerprints_path(fingerprints.repo_root),
+    FINGERPRINT_VERSION,
+    fingerprints.to_metadata(),
+    stamp={"registry": source_digest([registry_path])},
+  )
+
+
+class SourceFingerprints:
+  """Digests and extracted facts for the sources of one sync run.
+
+  Args:
+    repo_root: Root used to key sources by repository-relative path.
+    previous: Mapping loaded by :func:`load_fingerprints`. Facts are
+      reused only from a matching :data:`FINGERPRINT_VERSION`; pass None
+      to re-read every source.
+    record: Digest and record sources. False (a full sync) makes every
+      lookup extract and nothing is hashed or kept.
+  """
+
+  def __init__(
+    self,
+    repo_root: Path,
+    previous: Mapping[str, Any] | None = None,
+    *,
+    record: bool = True,
+  ) -> None:
+    self.repo_root = repo_root
+    self.record = record
+    self._resolved_root = repo_root.resolve()
+    self._keys: dict[Path, str] = {}
+    self._previous: Mapping[str, Any] = {}
+    if previous and previous.get("version") == FINGERPRINT_VERSION:
+      sources = previous.get("sources")
+      if isinstance(sources, Mapping):
+        self._previous = sources
+    self._current: dict[str, dict[str, Any]] = {}
+    self._read: set[str] = set()
+
+  def _key(self, path: Path) -> str:
+    key = self._keys.get(path)
+    if key is None:
+      try:
+        key = path.resolve().relative_to(self._resolved_root).as_posix()
+      except ValueError:
+        key = path.as_posix()
+      self._keys[path] = key
+    return key
+
+  def _entry(self, path: Path) -> dict[str, Any]:
+    key = self._key(path)
+    entry = self._current.get(key)
+    if entry is None:
+      entry = {"digest": source_digest([path])}
+      self._current[key] = entry
+    return entry
+
+  def get(self, path: Path, fact: str) -> Any | None:
+    """Return *fact* recorded for *path* if the file is unchanged, else None."""
+    if not self.record:
+      return None
+    key = self._key(path)
+    entry = self._entry(path)
+    if fact in entry:
+      return entry[fact]
+    previous = self._previous.get(key)
+    if (
+      not isinstance(previous, Mapping)
+      or previous.get("digest") != entry["digest"]
+      or fact not in previous
+    ):
+      return None
+    entry[fact] = previous[fact]
+    return entry[fact]
+
+  def put(self, path: Path, fact: str, value: Any) -> Any:
+    """Record freshly extracted *fact* for *path* and return *value*."""
+    if not self.record:
+      return value
+    self._entry(path)[fact] = value
+    self._read.add(self._key(path))
+    return value
+
+  def lookup(self, path: Path, fact: str, extract: Callable[[Path], Any]) -> Any:
+    """Return *fact* for *path*, calling ``extract(path)`` if it changed."""
+    value = self.get(path, fact)
+    if value is None:
+      value = self.put(path, fact, extract(path))
+    return value
+
+  @property
+  def read(self) -> int:
+    """Number of sources (re-)read this run."""
+    return len(self._read)
+
+  @property
+  def reused(self) -> int:
+    """Number of unchanged sources whose recorded facts were replayed."""
+    return len(self._current) - len(self._read)
+
+  @property
+  def removed(self) -> int:
+    """Number of sources recorded last sync but not visited this run."""
+    return len(set(self._previous) - set(self._current))
+
+  def to_metadata(self) -> dict[str, Any]:
+    """Serialise the sources visited this run."""
+    return {
+      "version": FINGERPRINT_VERSION,
+      "sources": {key: self._current[key] for key in sorted(self._current)},
+    }
+
+
+__all__ = [
+  "FINGERPRINTS_FILENAME",
+  "FINGERPRINT_VERSION",
+  "SourceFingerprints",
+  "get_fingerprints_path",
+  "load_fingerprints",
+  "save_fingerprints",
+  "source_digest",
+  "spec_dependencies",
+]
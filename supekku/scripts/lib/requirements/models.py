@@ -118,3 +118,11 @@ class SyncStats:
   updated: int = 0
   pruned: int = 0
   warnings: int = 0
+  sources_read: int = 0
+  sources_reused: int = 0
+  sources_removed: int = 0
+
+  @property
+  def sources_changed(self) -> bool:
+    """Whether any requirement source changed since the last sync."""
+    return bool(self.sources_read or self.sources_removed)
@@ -4,14 +4,22 @@ from __future__ import annotations
 
 import fnmatch
 import logging
-from collections.abc import Iterable, Iterator
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
+from supekku.scripts.lib.core.profiling import profiled
 from supekku.scripts.lib.core.repo import find_repo_root
 
 from .coverage import _apply_coverage_blocks
+from .fingerprints import (
+  SourceFingerprints,
+  load_fingerprints,
+  save_fingerprints,
+  source_digest,
+  spec_dependencies,
+)
 from .lifecycle import (
   REQUIREMENT_STATUSES,
   RequirementStatus,
@@ -23,13 +31,14 @@ from .parser import (
   records_from_spec,
 )
 from .sync import (
+  _add_to_field,
   _apply_audit_relations,
   _apply_delta_relations,
   _apply_revision_blocks,
   _apply_revision_relations,
-  _apply_spec_relationships,
   _iter_change_files,
   _iter_spec_files,
+  _spec_relationship_targets,
   _sync_backlog_requirements,
   _upsert_record,
 )
@@ -72,6 +81,8 @@ class RequirementsRegistry:
       registry_path = get_registry_dir(root) / "requirements.yaml"
     self.registry_path = registry_path
     self.records: dict[str, RequirementRecord] = {}
+    # Fingerprints of an incremental sync, saved by save() (see fingerprints.py).
+    self._fingerprints: SourceFingerprints | None = None
     self._load()
 
   # -- ADR-009 standard surface --------------------------------------------
@@ -111,6 +122,7 @@ class RequirementsRegistry:
     return results
 
   # ------------------------------------------------------------------
+  @profiled("registry.requirement")
   def _load(self) -> None:
     if not self.registry_path.exists():
       return
@@ -121,7 +133,10 @@ class RequirementsRegistry:
       self.records[uid] = record
 
   def save(self) -> None:
-    """Save requirements registry to YAML file."""
+    """Save requirements registry to YAML file.
+
+    After an incremental sync, its source fingerprints are saved too.
+    """
     payload = {
       "requirements": {
         uid: record.to_dict() for uid, record in sorted(self.records.items())
@@ -130,6 +145,9 @@ class RequirementsRegistry:
     self.registry_path.parent.mkdir(parents=True, exist_ok=True)
     text = yaml.safe_dump(payload, sort_keys=False, allow_unicode=False)
     self.registry_path.write_text(text, encoding="utf-8")
+    if self._fingerprints is not None:
+      save_fingerprints(self._fingerprints, self.registry_path)
+      self._fingerprints = None
 
   # ------------------------------------------------------------------
   def sync(
@@ -142,12 +160,27 @@ class RequirementsRegistry:
     audit_dirs: Iterable[Path] | None = None,
     plan_dirs: Iterable[Path] | None = None,
     backlog_registry: BacklogRegistry | None = None,
+    incremental: bool = False,
   ) -> SyncStats:
-    """Sync requirements from specs, change artifacts, and backlog items."""
+    """Sync requirements from specs, change artifacts, and backlog items.
+
+    With *incremental*, every source is fingerprinted (see
+    :mod:`.fingerprints`; :meth:`save` persists them) and sources unchanged
+    since the last incremental sync are not re-read: the requirement UIDs,
+    relations and coverage entries recorded for them are replayed, so
+    relation, revision, coverage and pruning steps still see the whole
+    workspace. Warnings are only reported for sources that are actually
+    re-read.
+    """
     repo_root = spec_registry.root if spec_registry else find_repo_root()
     stats = SyncStats()
     seen: set[str] = set()
     yielded_ids: set[str] = set()
+    fingerprints = SourceFingerprints(
+      repo_root,
+      load_fingerprints(repo_root, self.registry_path) if incremental else None,
+      record=incremental,
+    )
 
     # Per-spec extracted UIDs for post-relation pruning (DR-129 §1.3).
     # Distinct from ``seen`` which tracks *all* UIDs (including backlog-sourced)
@@ -156,83 +189,113 @@ class RequirementsRegistry:
     # relation/revision/coverage steps complete.
     spec_extractions: dict[str, set[str]] = {}
 
-    # Collect (spec_id, body) pairs for deferred relationship application.
-    deferred_relationships: list[tuple[str, str]] = []
+    # Collect (spec_id, relationship targets) for deferred application.
+    deferred_relationships: list[tuple[str, list[str]]] = []
 
+    registry_paths: set[Path] = set()
     if spec_registry:
       for spec in spec_registry.all_specs():
-        records = list(
-          records_from_spec(
-            spec.id,
-            spec.frontmatter,
-            spec.body,
-            spec.path,
-            repo_root,
-            stats=stats,
-          ),
+        registry_paths.add(spec.path)
+        extracted_uids = self._sync_spec_source(
+          fingerprints,
+          spec.path,
+          spec.id,
+          lambda spec=spec: (spec.frontmatter, spec.body),
+          repo_root,
+          seen,
+          stats,
         )
-        extracted_uids: set[str] = set()
-        for record in records:
-          _upsert_record(self.records, record, seen, stats)
-          extracted_uids.add(record.uid)
+        if extracted_uids:
           yielded_ids.add(spec.id)
         spec_extractions[spec.id] = extracted_uids
-
-        deferred_relationships.append((spec.id, spec.body))
+        deferred_relationships.append(
+          (
+            spec.id,
+            fingerprints.lookup(
+              spec.path,
+              "relationships",
+              lambda _path, spec=spec: _spec_relationship_targets(spec.id, spec.body),
+            ),
+          )
+        )
 
     directories = list(spec_dirs or [])
     if directories:
-      for spec_file in _iter_spec_files(directories):
-        from supekku.scripts.lib.core.spec_utils import (  # noqa: PLC0415
-          load_markdown_file,
-        )
+      from supekku.scripts.lib.core.spec_utils import (  # noqa: PLC0415
+        load_markdown_file,
+      )
 
-        frontmatter, body = load_markdown_file(spec_file)
-        spec_id = str(frontmatter.get("id", "")).strip()
+      for spec_file in _iter_spec_files(directories):
+        # Already extracted above from the registry's parsed copy.
+        if spec_file in registry_paths:
+          continue
+        parsed: list[tuple[Any, str]] = []
+
+        def _parsed(
+          spec_file: Path = spec_file,
+          parsed: list[tuple[Any, str]] = parsed,
+        ) -> tuple[Any, str]:
+          if not parsed:
+            parsed.append(load_markdown_file(spec_file))
+          return parsed[0]
+
+        cached = fingerprints.get(spec_file, "spec")
+        if cached is not None:
+          spec_id = cached["id"]
+        else:
+          spec_id = str(_parsed()[0].get("id", "")).strip()
         if not spec_id or spec_id in yielded_ids:
           continue
-        records = list(
-          records_from_spec(
-            spec_id,
-            frontmatter,
-            body,
-            spec_file,
-            repo_root,
-            stats=stats,
-          ),
+
+        extracted_uids = self._sync_spec_source(
+          fingerprints,
+          spec_file,
+          spec_id,
+          _parsed,
+          repo_root,
+          seen,
+          stats,
         )
-        extracted_uids = set()
-        for record in records:
-          _upsert_record(self.records, record, seen, stats)
-          extracted_uids.add(record.uid)
         spec_extractions[spec_id] = extracted_uids
-
-        try:
-          body = spec_file.read_text(encoding="utf-8")
-        except OSError:
-          body = ""
-        deferred_relationships.append((spec_id, body))
+        deferred_relationships.append(
+          (
+            spec_id,
+            fingerprints.lookup(
+              spec_file,
+              "relationships",
+              lambda _path, spec_id=spec_id, parsed=_parsed: (
+                _spec_relationship_targets(spec_id, parsed()[1])
+              ),
+            ),
+          )
+        )
 
     # Apply all relationship blocks now that every requirement exists.
-    for spec_id, body in deferred_relationships:
-      _apply_spec_relationships(self.records, spec_id, body)
+    for spec_id, targets in deferred_relationships:
+      _add_to_field(self.records, targets, "specs", spec_id)
 
     if delta_dirs:
       _apply_delta_relations(
         self.records,
         delta_dirs,
         repo_root,
+        fingerprints=fingerprints,
       )
     if revision_dirs:
-      _apply_revision_relations(self.records, revision_dirs)
+      _apply_revision_relations(
+        self.records,
+        revision_dirs,
+        fingerprints=fingerprints,
+      )
       _apply_revision_blocks(
         self.records,
         revision_dirs,
         spec_registry=spec_registry,
         stats=stats,
+        fingerprints=fingerprints,
       )
     if audit_dirs:
-      _apply_audit_relations(self.records, audit_dirs)
+      _apply_audit_relations(self.records, audit_dirs, fingerprints=fingerprints)
 
     # Sync requirements from backlog items
     if backlog_registry:
@@ -242,6 +305,7 @@ class RequirementsRegistry:
         repo_root,
         seen,
         stats,
+        fingerprints=fingerprints,
       )
 
     # Apply coverage blocks to update lifecycle from verification entries
@@ -270,6 +334,7 @@ class RequirementsRegistry:
         delta_files=delta_files,
         plan_files=plan_files,
         audit_files=audit_files,
+        fingerprints=fingerprints,
       )
 
     # -- Post-relation stale requirement pruning (DR-129 §1.3) -----------
@@ -315,6 +380,18 @@ class RequirementsRegistry:
     if spec_registry:
       _validate_extraction(spec_registry, seen)
 
+    stats.sources_read = fingerprints.read
+    stats.sources_reused = fingerprints.reused
+    stats.sources_removed = fingerprints.removed
+    if incremental:
+      self._fingerprints = fingerprints
+      logger.info(
+        "Incremental sync: %d sources re-read, %d unchanged, %d removed",
+        stats.sources_read,
+        stats.sources_reused,
+        stats.sources_removed,
+      )
+
     # -- Summary line (DR-129 §1.8) ----------------------------------------
     if stats.warnings or stats.pruned:
       logger.warning(
@@ -337,6 +414,52 @@ class RequirementsRegistry:
 
   sync_from_specs = sync  # Deprecated alias — use sync() instead.
 
+  def _sync_spec_source(
+    self,
+    fingerprints: SourceFingerprints,
+    path: Path,
+    spec_id: str,
+    parsed: Callable[[], tuple[Any, str]],
+    repo_root: Path,
+    seen: set[str],
+    stats: SyncStats,
+  ) -> set[str]:
+    """Upsert the requirements extracted from one spec; return their UIDs.
+
+    A spec unchanged since the last sync (breakout requirement files
+    included) whose requirements are all still registered is not
+    re-extracted.
+    """
+    breakout = source_digest(spec_dependencies(path))
+    cached = fingerprints.get(path, "spec")
+    if (
+      cached is not None
+      and cached.get("id") == spec_id
+      and cached.get("breakout") == breakout
+      and all(uid in self.records for uid in cached["requirements"])
+    ):
+      seen.update(cached["requirements"])
+      return set(cached["requirements"])
+
+    frontmatter, body = parsed()
+    extracted_uids: set[str] = set()
+    for record in records_from_spec(
+      spec_id,
+      frontmatter,
+      body,
+      path,
+      repo_root,
+      stats=stats,
+    ):
+      _upsert_record(self.records, record, seen, stats)
+      extracted_uids.add(record.uid)
+    fingerprints.put(
+      path,
+      "spec",
+      {"id": spec_id, "breakout": breakout, "requirements": sorted(extracted_uids)},
+    )
+    return extracted_uids
+
   # ------------------------------------------------------------------
   def move_requirement(
     self,
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable, Iterator, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import replace
 from typing import TYPE_CHECKING, Any
 
@@ -25,9 +25,40 @@ if TYPE_CHECKING:
   from supekku.scripts.lib.backlog.registry import BacklogRegistry
   from supekku.scripts.lib.specs.registry import SpecRegistry
 
+  from .fingerprints import SourceFingerprints
+
 logger = logging.getLogger(__name__)
 
 
+def _source_facts(
+  fingerprints: SourceFingerprints | None,
+  path: Path,
+  fact: str,
+  extract: Callable[[Path], Any],
+) -> Any:
+  """Extract *fact* from *path*, or replay it when the file is unchanged."""
+  if fingerprints is None:
+    return extract(path)
+  return fingerprints.lookup(path, fact, extract)
+
+
+def _add_to_field(
+  records: dict[str, RequirementRecord],
+  targets: Iterable[str],
+  field_name: str,
+  artifact_id: str,
+) -> None:
+  """Add *artifact_id* to a sorted list field of each targeted record."""
+  for target in targets:
+    record = records.get(target)
+    if not record:
+      continue
+    values: list[str] = getattr(record, field_name)
+    if artifact_id not in values:
+      values.append(artifact_id)
+      values.sort()
+
+
 def _upsert_record(
   records: dict[str, RequirementRecord],
   record: RequirementRecord,
@@ -67,9 +98,20 @@ def _sync_backlog_requirements(
   repo_root: Path,
   seen: set[str],
   stats: SyncStats,
+  *,
+  fingerprints: SourceFingerprints | None = None,
 ) -> None:
-  """Extract and upsert requirements from backlog items."""
+  """Extract and upsert requirements from backlog items.
+
+  With *fingerprints*, unchanged items whose requirements are all still
+  registered are not re-read.
+  """
   for item in backlog_registry.iter():
+    if fingerprints is not None:
+      cached = fingerprints.get(item.path, "requirements")
+      if cached is not None and all(uid in records for uid in cached):
+        seen.update(cached)
+        continue
     try:
       frontmatter, body = load_markdown_file(item.path)
     except OSError:
@@ -94,6 +136,8 @@ def _sync_backlog_requirements(
         source_kind=item.kind,
         source_type="backlog",
       )
+    if fingerprints is not None:
+      fingerprints.put(item.path, "requirements", [r.uid for r in extracted])
 
 
 def _iter_spec_files(spec_dirs: Iterable[Path]) -> Iterator[Path]:
@@ -122,78 +166,92 @@ def _iter_change_files(dirs: Iterable[Path], prefix: str) -> Iterator[Path]:
           yield file
 
 
+def _delta_implements(file: Path) -> dict[str, Any]:
+  """Return a delta's ID and every requirement it claims to implement.
+
+  Collects ``applies_to.requirements``, ``implements`` relations and the
+  structured relationships block, in that order.
+  """
+  frontmatter, _ = load_markdown_file(file)
+  delta_id = str(frontmatter.get("id", "")).strip() or file.stem
+  targets: list[str] = []
+
+  applies_to = frontmatter.get("applies_to") or {}
+  req_list = applies_to.get("requirements") if isinstance(applies_to, Mapping) else None
+  if isinstance(req_list, Iterable):
+    targets.extend(str(req).strip() for req in req_list)
+
+  targets.extend(
+    relation.target.strip()
+    for relation in list_relations(file)
+    if relation.type.lower() == "implements"
+  )
+
+  # Structured relationships block
+  try:
+    block = extract_delta_relationships(file.read_text(encoding="utf-8"))
+  except ValueError:
+    block = None
+  if block and not validate_delta_relationships(block, delta_id=delta_id):
+    requirements = block.data.get("requirements") or {}
+    implements = requirements.get("implements") or []
+    targets.extend(req for req in implements if isinstance(req, str))
+
+  return {"id": delta_id, "implements": list(dict.fromkeys(targets))}
+
+
 def _apply_delta_relations(
   records: dict[str, RequirementRecord],
   delta_dirs: Iterable[Path],
   _repo_root: Path,
+  *,
+  fingerprints: SourceFingerprints | None = None,
 ) -> None:
   """Apply delta relationship blocks to requirement records."""
   for file in _iter_change_files(delta_dirs, prefix="DE-"):
-    frontmatter, _ = load_markdown_file(file)
-    delta_id = str(frontmatter.get("id", "")).strip() or file.stem
-    if not delta_id:
-      continue
+    facts = _source_facts(fingerprints, file, "delta", _delta_implements)
+    _add_to_field(records, facts["implements"], "implemented_by", facts["id"])
 
-    applies_to = frontmatter.get("applies_to") or {}
-    req_list = (
-      applies_to.get("requirements") if isinstance(applies_to, Mapping) else None
-    )
-    if isinstance(req_list, Iterable):
-      for req in req_list:
-        target = str(req).strip()
-        record = records.get(target)
-        if not record:
-          continue
-        if delta_id not in record.implemented_by:
-          record.implemented_by.append(delta_id)
-          record.implemented_by.sort()
-
-    for relation in list_relations(file):
-      if relation.type.lower() != "implements":
-        continue
-      target = relation.target.strip()
-      record = records.get(target)
-      if not record:
-        continue
-      if delta_id not in record.implemented_by:
-        record.implemented_by.append(delta_id)
-        record.implemented_by.sort()
 
-    # Structured relationships block
-    try:
-      block = extract_delta_relationships(file.read_text(encoding="utf-8"))
-    except ValueError:
-      block = None
-    if block and not validate_delta_relationships(block, delta_id=delta_id):
-      requirements = block.data.get("requirements") or {}
-      implements = requirements.get("implements") or []
-      for req in implements:
-        record = records.get(req)
-        if not record:
-          continue
-        if delta_id not in record.implemented_by:
-          record.implemented_by.append(delta_id)
-          record.implemented_by.sort()
+def _revision_introduces(file: Path) -> dict[str, Any]:
+  """Return a revision's ID and the requirements it introduces or moves."""
+  frontmatter, _ = load_markdown_file(file)
+  revision_id = str(frontmatter.get("id", "")).strip() or file.stem
+  targets = [
+    relation.target.strip()
+    for relation in list_relations(file)
+    if relation.type.lower() in {"introduces", "moves", "reparented"}
+  ]
+  return {"id": revision_id, "introduces": targets}
 
 
 def _apply_revision_relations(
   records: dict[str, RequirementRecord],
   revision_dirs: Iterable[Path],
+  *,
+  fingerprints: SourceFingerprints | None = None,
 ) -> None:
   """Apply revision relation entries to requirement records."""
   for file in _iter_change_files(revision_dirs, prefix="RE-"):
-    frontmatter, _ = load_markdown_file(file)
-    revision_id = str(frontmatter.get("id", "")).strip() or file.stem
-    if not revision_id:
-      continue
-    for relation in list_relations(file):
-      target = relation.target.strip()
+    facts = _source_facts(fingerprints, file, "revision", _revision_introduces)
+    for target in facts["introduces"]:
       record = records.get(target)
-      if not record:
-        continue
-      rel_type = relation.type.lower()
-      if rel_type in {"introduces", "moves", "reparented"} and not record.introduced:
-        record.introduced = revision_id
+      if record and not record.introduced:
+        record.introduced = facts["id"]
+
+
+def _revision_changes(file: Path) -> list[Any]:
+  """Return the requirement entries of a revision's valid change blocks."""
+  changes: list[Any] = []
+  for block in load_revision_blocks(file):
+    try:
+      data = block.parse()
+    except ValueError:
+      continue
+    if validate_revision_change(data):
+      continue
+    changes.extend(data.get("requirements", []) or [])
+  return changes
 
 
 def _apply_revision_blocks(
@@ -202,86 +260,76 @@ def _apply_revision_blocks(
   *,
   spec_registry: SpecRegistry | None,
   stats: SyncStats,
+  fingerprints: SourceFingerprints | None = None,
 ) -> None:
   """Apply structured revision blocks to requirement records."""
   for file in _iter_change_files(revision_dirs, prefix="RE-"):
-    blocks = load_revision_blocks(file)
-    for block in blocks:
-      try:
-        data = block.parse()
-      except ValueError:
-        continue
-      if validate_revision_change(data):
-        continue
-      for requirement in data.get("requirements", []) or []:
-        created, updated = _apply_revision_requirement(
-          records,
-          requirement,
-          spec_registry=spec_registry,
-        )
-        stats.created += created
-        stats.updated += updated
+    changes = _source_facts(fingerprints, file, "revision_changes", _revision_changes)
+    for requirement in changes:
+      created, updated = _apply_revision_requirement(
+        records,
+        requirement,
+        spec_registry=spec_registry,
+      )
+      stats.created += created
+      stats.updated += updated
+
+
+def _audit_verifies(file: Path) -> dict[str, Any]:
+  """Return an audit's ID and the requirements it verifies."""
+  frontmatter, _ = load_markdown_file(file)
+  audit_id = str(frontmatter.get("id", "")).strip() or file.stem
+  targets = [
+    relation.target.strip()
+    for relation in list_relations(file)
+    if relation.type.lower() == "verifies"
+  ]
+  return {"id": audit_id, "verifies": targets}
 
 
 def _apply_audit_relations(
   records: dict[str, RequirementRecord],
   audit_dirs: Iterable[Path],
+  *,
+  fingerprints: SourceFingerprints | None = None,
 ) -> None:
   """Apply audit relation entries to requirement records."""
   for file in _iter_change_files(audit_dirs, prefix="AUD-"):
-    frontmatter, _ = load_markdown_file(file)
-    audit_id = str(frontmatter.get("id", "")).strip() or file.stem
-    if not audit_id:
-      continue
-    for relation in list_relations(file):
-      if relation.type.lower() != "verifies":
-        continue
-      target = relation.target.strip()
-      record = records.get(target)
-      if not record:
-        continue
-      if audit_id not in record.verified_by:
-        record.verified_by.append(audit_id)
-        record.verified_by.sort()
+    facts = _source_facts(fingerprints, file, "audit", _audit_verifies)
+    _add_to_field(records, facts["verifies"], "verified_by", facts["id"])
 
 
-def _apply_spec_relationships(
-  records: dict[str, RequirementRecord],
-  spec_id: str,
-  body: str,
-) -> None:
-  """Apply spec relationship blocks to requirement records."""
+def _spec_relationship_targets(spec_id: str, body: str) -> list[str]:
+  """Return the requirements a spec's relationships block names.
+
+  Both primary and collaborator requirements are returned; an absent,
+  malformed or invalid block names none.
+  """
   if not body:
-    return
+    return []
   try:
     block = extract_relationships(body)
   except ValueError:
-    return
+    return []
   if not block:
-    return
+    return []
   if validate_spec_relationships(block, spec_id=spec_id):
-    return
+    return []
 
   data = block.data
   requirements = data.get("requirements") or {}
   primary = requirements.get("primary") or []
   collaborators = requirements.get("collaborators") or []
+  return [req for req in [*primary, *collaborators] if isinstance(req, str)]
 
-  for req_id in list(primary):
-    record = records.get(req_id)
-    if not record:
-      continue
-    if spec_id not in record.specs:
-      record.specs.append(spec_id)
-      record.specs.sort()
 
-  for req_id in list(collaborators):
-    record = records.get(req_id)
-    if not record:
-      continue
-    if spec_id not in record.specs:
-      record.specs.append(spec_id)
-      record.specs.sort()
+def _apply_spec_relationships(
+  records: dict[str, RequirementRecord],
+  spec_id: str,
+  body: str,
+) -> None:
+  """Apply spec relationship blocks to requirement records."""
+  _add_to_field(records, _spec_relationship_targets(spec_id, body), "specs", spec_id)
 
 
 def _apply_revision_requirement(
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import io
+import json
 import os
 import sys
 import tempfile
@@ -11,6 +12,8 @@ import unittest
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import yaml
+
 from supekku.scripts.lib.core.paths import (
   AUDITS_SUBDIR,
   DELTAS_SUBDIR,
@@ -22,6 +25,10 @@ from supekku.scripts.lib.core.paths import (
 from supekku.scripts.lib.core.spec_utils import dump_markdown_file_update
 from supekku.scripts.lib.relations.manager import add_relation
 from supekku.scripts.lib.requirements.coverage import _compute_status_from_coverage
+from supekku.scripts.lib.requirements.fingerprints import (
+  get_fingerprints_path,
+  load_fingerprints,
+)
 from supekku.scripts.lib.requirements.lifecycle import (
   STATUS_ACTIVE,
   STATUS_IN_PROGRESS,
@@ -1933,5 +1940,166 @@ class TestWarningCounting(unittest.TestCase):
     assert stats.warnings >= 1
 
 
+class TestIncrementalSync(unittest.TestCase):
+  """Incremental sync re-reads only sources whose digest changed."""
+
+  def setUp(self) -> None:
+    self._cwd = Path.cwd()
+    tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+    self.addCleanup(tmpdir.cleanup)
+    self.root = Path(tmpdir.name)
+    (self.root / ".git").mkdir()
+    os.chdir(self.root)
+    self.registry_path = get_registry_dir(self.root) / "requirements.yaml"
+    self.spec_path = self._write_spec(
+      "SPEC-001",
+      "# SPEC-001\n\n- **FR-001**: First requirement\n",
+    )
+    self._write_spec("SPEC-002", "# SPEC-002\n\n- **FR-001**: Other requirement\n")
+    bundle = self.root / SPEC_DRIVER_DIR / DELTAS_SUBDIR / "DE-001-example"
+    bundle.mkdir(parents=True)
+    self.delta_path = bundle / "DE-001.md"
+    dump_markdown_file_update(
+      self.delta_path,
+      {
+        "id": "DE-001",
+        "slug": "de-001",
+        "name": "DE-001",
+        "created": "2024-06-01",
+        "updated": "2024-06-01",
+        "status": "draft",
+        "kind": "delta",
+        "relations": [],
+      },
+      "# DE-001\n",
+    )
+    add_relation(self.delta_path, relation_type="implements", target="SPEC-001.FR-001")
+    add_relation(self.delta_path, relation_type="implements", target="SPEC-001.FR-002")
+
+  def tearDown(self) -> None:
+    os.chdir(self._cwd)
+
+  def _write_spec(self, spec_id: str, body: str) -> Path:
+    spec_dir = self.root / SPEC_DRIVER_DIR / TECH_SPECS_SUBDIR / spec_id.lower()
+    spec_dir.mkdir(parents=True, exist_ok=True)
+    spec_path = spec_dir / f"{spec_id}.md"
+    dump_markdown_file_update(
+      spec_path,
+      {
+        "id": spec_id,
+        "slug": spec_id.lower(),
+        "name": f"Spec {spec_id}",
+        "created": "2024-06-01",
+        "updated": "2024-06-01",
+        "status": "draft",
+        "kind": "spec",
+      },
+      body,
+    )
+    return spec_path
+
+  def _sync(self, *, incremental: bool) -> tuple[RequirementsRegistry, SyncStats]:
+    registry = RequirementsRegistry(self.registry_path)
+    stats = registry.sync(
+      spec_registry=SpecRegistry(self.root),
+      delta_dirs=[self.root / SPEC_DRIVER_DIR / DELTAS_SUBDIR],
+      incremental=incremental,
+    )
+    registry.save()
+    return registry, stats
+
+  def _records(self) -> dict[str, dict]:
+    registry = RequirementsRegistry(self.registry_path)
+    return {uid: record.to_dict() for uid, record in registry.records.items()}
+
+  def test_full_sync_records_nothing(self) -> None:
+    _, stats = self._sync(incremental=False)
+
+    assert stats.sources_read == 0
+    assert not get_fingerprints_path(self.root).exists()
+    assert "metadata" not in yaml.safe_load(self.registry_path.read_text())
+
+  def test_incremental_sync_records_sources_in_run_cache(self) -> None:
+    _, stats = self._sync(incremental=True)
+
+    assert stats.sources_read == 3
+    assert stats.sources_reused == 0
+    cached = load_fingerprints(self.root, self.registry_path)
+    assert cached is not None
+    delta_key = self.delta_path.relative_to(self.root).as_posix()
+    assert cached["sources"][delta_key]["delta"]["implements"] == [
+      "SPEC-001.FR-001",
+      "SPEC-001.FR-002",
+    ]
+    assert "metadata" not in yaml.safe_load(self.registry_path.read_text())
+
+  def test_unchanged_workspace_reads_nothing(self) -> None:
+    self._sync(incremental=True)
+    before = self._records()
+
+    _, stats = self._sync(incremental=True)
+
+    assert stats.sources_read == 0
+    assert stats.sources_reused == 3
+    assert not stats.sources_changed
+    assert self._records() == before
+
+  def test_changed_spec_is_reread_with_cached_delta_relations(self) -> None:
+    self._sync(incremental=True)
+    self._write_spec(
+      "SPEC-001",
+      "# SPEC-001\n\n- **FR-001**: First requirement\n"
+      "- **FR-002**: Added requirement\n",
+    )
+
+    registry, stats = self._sync(incremental=True)
+
+    assert stats.sources_read == 1
+    assert stats.created == 1
+    # DE-001 was not re-read; its recorded relations reach the new requirement.
+    assert registry.records["SPEC-001.FR-002"].implemented_by == ["DE-001"]
+    assert registry.records["SPEC-002.FR-001"].implemented_by == []
+
+  def test_removed_requirement_is_pruned(self) -> None:
+    self._sync(incremental=True)
+    self._write_spec("SPEC-002", "# SPEC-002\n")
+
+    registry, stats = self._sync(incremental=True)
+
+    assert stats.pruned == 1
+    assert "SPEC-002.FR-001" not in registry.records
+    assert "SPEC-001.FR-001" in registry.records
+
+  def test_matches_full_sync_after_delta_removal(self) -> None:
+    self._sync(incremental=True)
+    self.delta_path.unlink()
+
+    _, stats = self._sync(incremental=True)
+    incremental = self._records()
+    self._sync(incremental=False)
+
+    assert stats.sources_removed == 1
+    assert incremental == self._records()
+
+  def test_registry_edited_elsewhere_rereads_everything(self) -> None:
+    self._sync(incremental=True)
+    self.registry_path.write_text("requirements: {}\n", encoding="utf-8")
+
+    _, stats = self._sync(incremental=True)
+
+    assert stats.sources_read == 3
+
+  def test_version_mismatch_rereads_everything(self) -> None:
+    self._sync(incremental=True)
+    path = get_fingerprints_path(self.root)
+    data = json.loads(path.read_text())
+    data["version"] = -1
+    path.write_text(json.dumps(data))
+
+    _, stats = self._sync(incremental=True)
+
+    assert stats.sources_read == 3
+
+
 if __name__ == "__main__":
   unittest.main()
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import yaml
+from supekku.scripts.lib.core.spec_utils import MarkdownLoadError, load_markdown_file
+
+if TYPE_CHECKING:
+  from collections.abc import Iterator
 
 
 @dataclass
@@ -19,7 +24,11 @@ class SpecIndexEntry:
 
 
 class SpecIndexBuilder:
-  """Builds and manages specification indices using symlinks."""
+  """Builds and manages specification indices using symlinks.
+
+  ``rebuild`` computes the full set of desired links and diffs it against
+  the links on disk, so only links that changed are created or removed.
+  """
 
   def __init__(self, base_dir: Path) -> None:
     self.base_dir = base_dir
@@ -29,32 +38,32 @@ class SpecIndexBuilder:
     self.c4_level_dir = base_dir / "by-c4-level"
 
   def rebuild(self) -> None:
-    """Rebuild the specification index by creating symlinks."""
-    if self.slug_dir.exists():
-      for entry in self.slug_dir.iterdir():
-        if entry.is_symlink() or entry.is_file():
-          entry.unlink()
-    else:
-      self.slug_dir.mkdir()
+    """Bring the symlink indices in line with the specs' frontmatter."""
+    desired = self._desired_links()
+    existing = self._existing_links()
 
-    # Clean up by-language directory
-    if self.language_dir.exists():
-      for entry in self.language_dir.rglob("*"):
-        if entry.is_symlink() or entry.is_file():
-          entry.unlink()
-      for entry in sorted(
-        {p.parent for p in self.language_dir.glob("**/*") if p.is_dir()},
-        reverse=True,
-      ):
-        if entry != self.language_dir and not any(entry.iterdir()):
-          entry.rmdir()
-    else:
-      self.language_dir.mkdir()
-
-    # Clean up taxonomy view directories
-    self._clean_flat_view_dir(self.category_dir)
-    self._clean_flat_view_dir(self.c4_level_dir)
+    stale = [link for link, target in existing.items() if desired.get(link) != target]
+    for link in stale:
+      link.unlink()
+    self._prune_empty_dirs(stale)
+
+    for link, target in desired.items():
+      if link in existing and existing[link] == target:
+        continue
+      link.parent.mkdir(parents=True, exist_ok=True)
+      link.symlink_to(target)
 
+    # Create convenience alias directory symlinks
+    self._ensure_alias(self.base_dir / "assemblies", Path("by-category/assembly"))
+    self._ensure_alias(self.base_dir / "units", Path("by-category/unit"))
+    self._ensure_alias(self.base_dir / "c4", Path("by-c4-level"))
+
+  def _view_dirs(self) -> tuple[Path, ...]:
+    return (self.slug_dir, self.language_dir, self.category_dir, self.c4_level_dir)
+
+  def _desired_links(self) -> dict[Path, Path]:
+    """Map every index link that should exist to its relative target."""
+    desired: dict[Path, Path] = {}
     for entry in sorted(self.base_dir.glob("SPEC-*/")):
       spec_file = entry / f"{entry.name}.md"
       if not spec_file.exists():
@@ -62,25 +71,15 @@ class SpecIndexBuilder:
       frontmatter = self._read_frontmatter(spec_file)
       slug = frontmatter.get("slug")
       if slug:
-        target = self.slug_dir / slug
-        if target.exists() or target.is_symlink():
-          target.unlink()
-        target.symlink_to(Path("..") / entry.name)
+        desired[self.slug_dir / slug] = Path("..") / entry.name
 
-      # Create by-language symlinks for sources
+      # by-language/{language}/{identifier}/spec for each source
       sources = frontmatter.get("sources") or []
       for source in sources:
         language = source.get("language")
         identifier = source.get("identifier")
 
         if language and identifier:
-          # Create language-specific symlink path
-          lang_path = self.language_dir / language / identifier / "spec"
-          lang_path.parent.mkdir(parents=True, exist_ok=True)
-
-          if lang_path.exists() or lang_path.is_symlink():
-            lang_path.unlink()
-
           # Calculate relative path depth
           # by-language/go/cmd/spec -> ../../../SPEC-003
           # From spec location, need to go up:
@@ -90,73 +89,76 @@ class SpecIndexBuilder:
           for _ in range(depth - 1):
             rel /= ".."
           rel /= entry.name
-          lang_path.symlink_to(rel)
+          desired[self.language_dir / language / identifier / "spec"] = rel
 
       # Create taxonomy view symlinks
       # by-category/{unit,assembly,unknown}/SPEC-XXX → ../../SPEC-XXX
       cat = frontmatter.get("category") or "unknown"
-      self._create_flat_view_link(self.category_dir, cat, entry.name)
+      desired[self.category_dir / cat / entry.name] = Path("..") / ".." / entry.name
 
       # by-c4-level/{code,component,...,unknown}/SPEC-XXX → ../../SPEC-XXX
       level = frontmatter.get("c4_level") or "unknown"
-      self._create_flat_view_link(self.c4_level_dir, level, entry.name)
-
-    # Create convenience alias directory symlinks
-    self._ensure_alias(self.base_dir / "assemblies", Path("by-category/assembly"))
-    self._ensure_alias(self.base_dir / "units", Path("by-category/unit"))
-    self._ensure_alias(self.base_dir / "c4", Path("by-c4-level"))
+      desired[self.c4_level_dir / level / entry.name] = Path("..") / ".." / entry.name
+    return desired
+
+  def _existing_links(self) -> dict[Path, Path | None]:
+    """Map every entry in the index views to its link target.
+
+    Plain files (never written by the builder) map to None so that they
+    are always removed. Views that do not exist yet are created.
+    """
+    existing: dict[Path, Path | None] = {}
+    for view_dir in self._view_dirs():
+      if not view_dir.exists():
+        view_dir.mkdir()
+        continue
+      # by-slug is flat; the other views nest links in subdirectories.
+      recurse = view_dir != self.slug_dir
+      for entry in self._scan(view_dir, recurse=recurse):
+        path = Path(entry.path)
+        existing[path] = path.readlink() if entry.is_symlink() else None
+    return existing
+
+  @classmethod
+  def _scan(cls, directory: Path, *, recurse: bool) -> Iterator[os.DirEntry]:
+    """Yield the symlinks and files below *directory*."""
+    with os.scandir(directory) as entries:
+      for entry in entries:
+        if entry.is_symlink() or entry.is_file():
+          yield entry
+        elif recurse and entry.is_dir():
+          yield from cls._scan(Path(entry.path), recurse=True)
+
+  def _prune_empty_dirs(self, removed: list[Path]) -> None:
+    """Remove directories left empty by *removed*, up to their view root."""
+    roots = set(self._view_dirs())
+    parents = {link.parent for link in removed}
+    for parent in sorted(parents, key=lambda p: len(p.parts), reverse=True):
+      directory = parent
+      while directory not in roots and directory.is_dir():
+        if any(directory.iterdir()):
+          break
+        directory.rmdir()
+        directory = directory.parent
 
   @staticmethod
   def _ensure_alias(link: Path, target: Path) -> None:
     """Create or replace a directory alias symlink."""
+    if link.is_symlink() and link.readlink() == target:
+      return
     if link.is_symlink() or link.exists():
       link.unlink()
     link.symlink_to(target)
 
-  @staticmethod
-  def _clean_flat_view_dir(view_dir: Path) -> None:
-    """Remove all symlinks and empty subdirectories in a flat view."""
-    if view_dir.exists():
-      for entry in view_dir.rglob("*"):
-        if entry.is_symlink() or entry.is_file():
-          entry.unlink()
-      for entry in sorted(
-        (p for p in view_dir.iterdir() if p.is_dir()),
-        reverse=True,
-      ):
-        if not any(entry.iterdir()):
-          entry.rmdir()
-    else:
-      view_dir.mkdir()
-
-  @staticmethod
-  def _create_flat_view_link(
-    view_dir: Path,
-    bucket: str,
-    spec_name: str,
-  ) -> None:
-    """Create a symlink: view_dir/bucket/spec_name → ../../spec_name."""
-    bucket_dir = view_dir / bucket
-    bucket_dir.mkdir(parents=True, exist_ok=True)
-    link = bucket_dir / spec_name
-    if link.exists() or link.is_symlink():
-      link.unlink()
-    link.symlink_to(Path("..") / ".." / spec_name)
-
   def _read_frontmatter(self, path: Path) -> dict:
     """Extract YAML frontmatter from a markdown file."""
-    content = path.read_text(encoding="utf-8")
-    if not content.startswith("---"):
-      return {}
-    parts = content.split("---", 2)
-    if len(parts) < 3:
-      return {}
     try:
-      return yaml.safe_load(parts[1]) or {}
-    except yaml.YAMLError as e:
+      frontmatter, _body = load_markdown_file(path)
+    except MarkdownLoadError as e:
       # Warn about malformed YAML and return empty dict
       print(f"Warning: Malformed YAML frontmatter in {path}: {e}")
       return {}
+    return frontmatter
 
 
 __all__ = ["SpecIndexBuilder", "SpecIndexEntry"]
@@ -547,6 +547,50 @@ class TestSpecIndexBuilder(unittest.TestCase):
     assert (self.base_dir / "assemblies").is_symlink()
     assert (self.base_dir / "assemblies").readlink() == Path("by-category/assembly")
 
+  def test_rebuild_only_touches_changed_links(self) -> None:
+    """Links of unchanged specs are left in place across rebuilds."""
+    self._create_spec_with_frontmatter(
+      "SPEC-060",
+      {"slug": "stable", "category": "unit"},
+    )
+    self._create_spec_with_frontmatter(
+      "SPEC-061",
+      {"slug": "moving", "category": "unit"},
+    )
+    self.builder.rebuild()
+    stable_link = self.builder.slug_dir / "stable"
+    stable_ino = stable_link.lstat().st_ino
+
+    self._create_spec_with_frontmatter(
+      "SPEC-061",
+      {"slug": "moved", "category": "assembly"},
+    )
+    self.builder.rebuild()
+
+    assert stable_link.lstat().st_ino == stable_ino
+    assert not (self.builder.slug_dir / "moving").is_symlink()
+    assert (self.builder.slug_dir / "moved").readlink() == Path("../SPEC-061")
+    assert not (self.builder.category_dir / "unit" / "SPEC-061").is_symlink()
+    assert (self.builder.category_dir / "assembly" / "SPEC-061").is_symlink()
+
+  def test_rebuild_prunes_emptied_directories(self) -> None:
+    """Directories left empty by removed links are removed."""
+    self._create_spec_with_frontmatter(
+      "SPEC-062",
+      {
+        "slug": "pruned",
+        "sources": [{"language": "python", "identifier": "pkg/deep/mod"}],
+      },
+    )
+    self.builder.rebuild()
+    assert (self.builder.language_dir / "python/pkg/deep/mod/spec").is_symlink()
+
+    self._create_spec_with_frontmatter("SPEC-062", {"slug": "pruned"})
+    self.builder.rebuild()
+
+    assert not (self.builder.language_dir / "python").exists()
+    assert self.builder.language_dir.is_dir()
+
 
 if __name__ == "__main__":
   unittest.main()
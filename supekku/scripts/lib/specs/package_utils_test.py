@@ -28,6 +28,7 @@ KNOWN_LEAF_PACKAGES = {
   "supekku/cli/list",
   "supekku/scripts/cli",
   "supekku/scripts/lib/backlog",
+  "supekku/scripts/lib/benchmarks",
   "supekku/scripts/lib/blocks/metadata",
   "supekku/scripts/lib/cards",
   "supekku/scripts/lib/changes/blocks",
@@ -6,6 +6,7 @@ import warnings
 from typing import TYPE_CHECKING
 
 from supekku.scripts.lib.core.paths import get_product_specs_dir, get_tech_specs_dir
+from supekku.scripts.lib.core.profiling import profiled
 from supekku.scripts.lib.core.repo import find_repo_root
 from supekku.scripts.lib.core.spec_utils import load_validated_markdown_file
 
@@ -26,6 +27,7 @@ class SpecRegistry:
     self._specs: dict[str, Spec] = {}
     self.reload()
 
+  @profiled("registry.spec")
   def reload(self) -> None:
     """Reload all specs from the filesystem."""
     self._specs.clear()
@@ -150,16 +152,28 @@ class SpecRegistry:
     yield from directory.glob(f"{prefix}*.md")
 
   def _register_spec(self, path: Path, expected_kind: str) -> None:
-    frontmatter, body = load_validated_markdown_file(path, kind=expected_kind)
-    spec_id = frontmatter.id
-    if not spec_id:
-      return
-    self._specs[spec_id] = Spec(
-      id=spec_id,
-      path=path,
-      frontmatter=frontmatter,
-      body=body,
-    )
+    spec = load_spec_file(path, kind=expected_kind)
+    if spec is not None:
+      self._specs[spec.id] = spec
+
+
+def load_spec_file(path: Path, *, kind: str | None = None) -> Spec | None:
+  """Load the single spec file at *path* without scanning the spec tree.
+
+  Args:
+    path: A ``SPEC-*.md`` or ``PROD-*.md`` file.
+    kind: Expected frontmatter kind; inferred from the filename prefix
+      (``PROD-`` → ``prod``, otherwise ``spec``) when omitted.
+
+  Returns:
+    The Spec, or None if its frontmatter has no ID.
+  """
+  if kind is None:
+    kind = "prod" if path.name.startswith("PROD-") else "spec"
+  frontmatter, body = load_validated_markdown_file(path, kind=kind)
+  if not frontmatter.id:
+    return None
+  return Spec(id=frontmatter.id, path=path, frontmatter=frontmatter, body=body)
 
 
-__all__ = ["SpecRegistry"]
+__all__ = ["SpecRegistry", "load_spec_file"]
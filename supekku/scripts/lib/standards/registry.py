@@ -18,6 +18,7 @@ import yaml
 
 from supekku.scripts.lib.core.dates import parse_date
 from supekku.scripts.lib.core.paths import get_registry_dir, get_standards_dir
+from supekku.scripts.lib.core.profiling import profiled
 from supekku.scripts.lib.core.repo import find_repo_root
 from supekku.scripts.lib.core.spec_utils import extract_h1_title, load_markdown_file
 
@@ -125,6 +126,7 @@ class StandardRegistry:
     """Load existing registry from YAML file."""
     return cls(root=root)
 
+  @profiled("registry.standard")
   def collect(self) -> dict[str, StandardRecord]:
     """Collect all standard files and parse them into StandardRecords."""
     standards: dict[str, StandardRecord] = {}
@@ -144,6 +146,21 @@ class StandardRegistry:
 
     return standards
 
+  def collect_path(self, path: Path) -> dict[str, StandardRecord]:
+    """Parse the single STD-*.md file at *path* (watch-driven refresh).
+
+    Returns an empty dict if the file is outside this registry, no longer
+    exists, or fails to parse.
+    """
+    path = Path(path)
+    if path.parent != self.directory or not path.match("STD-*.md"):
+      return {}
+    try:
+      standard = self._parse_standard_file(path)
+    except (ValueError, KeyError, FileNotFoundError):
+      return {}
+    return {standard.id: standard} if standard else {}
+
   def _parse_standard_file(self, standard_path: Path) -> StandardRecord | None:
     """Parse an individual standard file into a StandardRecord."""
     frontmatter, content = load_markdown_file(standard_path)
@@ -205,6 +222,7 @@ class StandardRegistry:
     *,
     decision_sources: dict[str, Any] | None = None,
     policy_sources: dict[str, Any] | None = None,
+    standards: dict[str, StandardRecord] | None = None,
   ) -> None:
     """Write registry to YAML file.
 
@@ -215,11 +233,14 @@ class StandardRegistry:
             When provided, backlinks are computed from these records.
             ``None`` means skip that backlink category — registries never
             fall back to sibling instantiation.
+        standards: Pre-collected records from ``collect()``; collected
+            afresh when ``None``.
     """
     if path is None:
       path = self.output_path
 
-    standards = self.collect()
+    if standards is None:
+      standards = self.collect()
     self._build_backlinks(
       standards,
       decision_sources=decision_sources,
@@ -283,6 +304,7 @@ class StandardRegistry:
     *,
     decision_sources: dict[str, Any] | None = None,
     policy_sources: dict[str, Any] | None = None,
+    standards: dict[str, StandardRecord] | None = None,
   ) -> None:
     """Sync registry by collecting standards and writing to YAML.
 
@@ -291,10 +313,12 @@ class StandardRegistry:
             computation. ``None`` skips.
         policy_sources: Pre-collected policy records for backlink
             computation. ``None`` skips.
+        standards: Pre-collected standard records; collected when ``None``.
     """
     self.write(
       decision_sources=decision_sources,
       policy_sources=policy_sources,
+      standards=standards,
     )
 
   def iter(self, status: str | None = None) -> Iterator[StandardRecord]:
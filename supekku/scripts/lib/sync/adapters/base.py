@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import subprocess
 from abc import ABC, abstractmethod
 from pathlib import Path
-from shutil import which
 from typing import TYPE_CHECKING, ClassVar
 
+from supekku.scripts.lib.core.git import get_tracked_files
 from supekku.scripts.lib.sync.models import (
   DocVariant,
   SourceDescriptor,
@@ -33,45 +32,21 @@ class LanguageAdapter(ABC):
   def __init__(self, repo_root: Path) -> None:
     """Initialize adapter with repository root."""
     self.repo_root = repo_root
-    self._git_tracked_files: set[Path] | None = None
+    self._git_tracked_files: frozenset[Path] | None = None
 
-  def _get_git_tracked_files(self) -> set[Path]:
+  def _get_git_tracked_files(self) -> frozenset[Path]:
     """Get set of git-tracked files (cached).
 
+    While a git facts session is active the listing is shared with every
+    other adapter and caller for the same repository.
+
     Returns:
         Set of absolute paths to git-tracked files
 
     """
-    if self._git_tracked_files is not None:
-      return self._git_tracked_files
-
-    tracked_files = set()
-
-    # Check if git is available and this is a git repo
-    if not which("git"):
-      self._git_tracked_files = tracked_files
-      return tracked_files
-
-    try:
-      result = subprocess.run(
-        ["git", "-C", str(self.repo_root), "ls-files"],
-        check=True,
-        capture_output=True,
-        text=True,
-        timeout=30,
-      )
-      for line in result.stdout.splitlines():
-        if line.strip():
-          tracked_files.add(self.repo_root / line.strip())
-    except (
-      subprocess.CalledProcessError,
-      subprocess.TimeoutExpired,
-      FileNotFoundError,
-    ):
-      pass
-
-    self._git_tracked_files = tracked_files
-    return tracked_files
+    if self._git_tracked_files is None:
+      self._git_tracked_files = get_tracked_files(self.repo_root)
+    return self._git_tracked_files
 
   def _should_skip_path(self, path: Path) -> bool:
     """Check if a path should be skipped (shared across all adapters).
@@ -264,6 +239,13 @@ class LanguageAdapter(ABC):
 
     """
 
+  def close(self) -> None:  # noqa: B027 — optional hook, not abstract
+    """Release long-lived resources (toolchain workers) held by the adapter.
+
+    Called once a sync run has finished with the adapter. The default
+    adapter holds none.
+    """
+
   @abstractmethod
   def supports_identifier(self, identifier: str) -> bool:
     """Check if this adapter can handle the given identifier format.
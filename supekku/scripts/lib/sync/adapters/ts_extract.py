@@ -0,0 +1,201 @@
+"""Long-lived ts-doc-extract workers speaking JSON lines.
+
+One-shot extraction starts Node (and re-initialises the ts-morph project)
+for every file and variant. A batch worker is started once per package
+root and answers requests over stdin/stdout, one JSON object per line::
+
+  -> {"id": 1, "file": "/abs/src/index.ts", "variant": "public"}
+  <- {"id": 1, "ast": {"module": "index", "exports": [...], ...}}
+  <- {"id": 2, "error": "Cannot parse file"}
+
+The ``ast`` payload is exactly what one-shot ``ts-doc-extract <file>
+--variant=<v>`` prints. A worker exits when its stdin is closed.
+
+The worker command is configured with ``[sync] ts_extract_server`` in
+workflow.toml. Left empty, ``ts_extract_server.mjs`` (shipped next to this
+module) is run with the ``node`` on PATH: it loads ts-morph once — from the
+package root or the ts-doc-extract installation — and keeps one project
+for all requests. Without Node or ts-morph the adapter falls back to
+one-shot extraction. :mod:`.ts_extract_stub` is a dependency-free
+reference server used by the tests.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import queue
+import subprocess
+import threading
+from pathlib import Path
+from shutil import which
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+  from collections.abc import Sequence
+
+DEFAULT_REQUEST_TIMEOUT = 30.0
+BUNDLED_SERVER = Path(__file__).with_name("ts_extract_server.mjs")
+
+
+def bundled_server_command() -> list[str]:
+  """Argv of the bundled Node server, or ``[]`` when Node is not on PATH."""
+  node = which("node")
+  return [node, str(BUNDLED_SERVER)] if node else []
+
+
+class TsExtractWorkerError(RuntimeError):
+  """The worker could not be started, died, or stopped answering."""
+
+
+class TsExtractRequestError(RuntimeError):
+  """The worker is healthy but reported an error for one request."""
+
+
+class TsExtractWorker:
+  """Client for one long-lived extraction server.
+
+  Requests are serialised per worker, so a worker may be shared by
+  threads generating contracts for units of the same package.
+
+  Args:
+    command: Server argv.
+    cwd: Package root the server runs in.
+    timeout: Seconds to wait for each response.
+  """
+
+  def __init__(
+    self,
+    command: Sequence[str],
+    cwd: Path,
+    *,
+    timeout: float = DEFAULT_REQUEST_TIMEOUT,
+  ) -> None:
+    self.command = list(command)
+    self.cwd = cwd
+    self.timeout = timeout
+    self._lock = threading.Lock()
+    self._process: subprocess.Popen[str] | None = None
+    # Replaced on every start: a dead reader leaves its end-of-stream
+    # marker behind in the old queue.
+    self._lines: queue.Queue[str | None] = queue.Queue()
+    self._next_id = 0
+
+  @property
+  def alive(self) -> bool:
+    """True while the server process is running."""
+    return self._process is not None and self._process.poll() is None
+
+  def _start(self) -> subprocess.Popen[str]:
+    try:
+      process = subprocess.Popen(
+        self.command,
+        cwd=self.cwd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        encoding="utf-8",
+        bufsize=1,
+      )
+    except OSError as exc:
+      msg = f"cannot start ts-doc-extract server {self.command!r}: {exc}"
+      raise TsExtractWorkerError(msg) from exc
+    self._lines = queue.Queue()
+    threading.Thread(
+      target=self._pump,
+      args=(process, self._lines),
+      name="ts-extract-reader",
+      daemon=True,
+    ).start()
+    self._process = process
+    return process
+
+  @staticmethod
+  def _pump(process: subprocess.Popen[str], lines: queue.Queue[str | None]) -> None:
+    """Move response lines to *lines*; ``None`` marks end of stream."""
+    assert process.stdout is not None
+    for line in process.stdout:
+      lines.put(line)
+    lines.put(None)
+
+  def extract(self, file_path: Path, variant: str) -> dict[str, Any]:
+    """Return the AST for *file_path*, starting the server if needed.
+
+    Raises:
+      TsExtractRequestError: If the server reports an error for this file.
+      TsExtractWorkerError: If the server is unusable; it is stopped.
+    """
+    with self._lock:
+      process = self._process
+      if process is None or process.poll() is not None:
+        process = self._start()
+      self._next_id += 1
+      request_id = self._next_id
+      request = {"id": request_id, "file": str(file_path), "variant": variant}
+      try:
+        assert process.stdin is not None
+        process.stdin.write(json.dumps(request) + "\n")
+        process.stdin.flush()
+        response = self._await(request_id)
+      except (OSError, TsExtractWorkerError) as exc:
+        self._stop()
+        if isinstance(exc, TsExtractWorkerError):
+          raise
+        msg = f"ts-doc-extract server pipe closed: {exc}"
+        raise TsExtractWorkerError(msg) from exc
+
+    if "error" in response:
+      raise TsExtractRequestError(str(response["error"]))
+    ast = response.get("ast")
+    if not isinstance(ast, dict):
+      msg = f"ts-doc-extract server sent no AST for {file_path}"
+      raise TsExtractRequestError(msg)
+    return ast
+
+  def _await(self, request_id: int) -> dict[str, Any]:
+    while True:
+      try:
+        line = self._lines.get(timeout=self.timeout)
+      except queue.Empty:
+        msg = f"ts-doc-extract server timed out after {self.timeout:g}s"
+        raise TsExtractWorkerError(msg) from None
+      if line is None:
+        msg = "ts-doc-extract server exited"
+        raise TsExtractWorkerError(msg)
+      try:
+        response = json.loads(line)
+      except json.JSONDecodeError as exc:
+        msg = f"Invalid JSON from ts-doc-extract server: {exc}"
+        raise TsExtractWorkerError(msg) from exc
+      # Responses to abandoned (timed-out) requests are skipped.
+      if isinstance(response, dict) and response.get("id") == request_id:
+        return response
+
+  def _stop(self) -> None:
+    process, self._process = self._process, None
+    if process is None:
+      return
+    with contextlib.suppress(OSError):
+      if process.stdin is not None:
+        process.stdin.close()
+    try:
+      process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+      process.kill()
+      process.wait()
+
+  def close(self) -> None:
+    """Close the server's stdin and wait for it to exit."""
+    with self._lock:
+      self._stop()
+
+
+__all__ = [
+  "BUNDLED_SERVER",
+  "DEFAULT_REQUEST_TIMEOUT",
+  "TsExtractRequestError",
+  "TsExtractWorker",
+  "TsExtractWorkerError",
+  "bundled_server_command",
+]
@@ -0,0 +1,280 @@
+#!/usr/bin/env node
+// Batch ts-doc-extract server bundled with spec-driver.
+//
+// Speaks the JSON-lines protocol documented in ts_extract.py: one request
+// per stdin line, one response per stdout line, exit when stdin closes.
+//
+//   -> {"id": 1, "file": "/abs/src/index.ts", "variant": "public"}
+//   <- {"id": 1, "ast": {"module": "index", "exports": [...], ...}}
+//
+// ts-morph is loaded once and a single Project is kept for the life of the
+// process; each request re-reads its file from disk. ts-morph is resolved
+// from the package root (cwd), then from the ts-doc-extract installation
+// (local, or the one on PATH) whose dependency it is. When it cannot be
+// found the server exits with status 1 and the adapter falls back to
+// one-shot ts-doc-extract.
+//
+// The AST carries the fields TypeScriptAdapter renders: module, filePath,
+// exports (kind, name, signature, jsDoc, leadingComments, parameters,
+// returnType, isAsync, baseClass, interfaces, members, enumValues),
+// imports and metadata.
+
+import { existsSync, realpathSync } from "node:fs";
+import { createRequire } from "node:module";
+import path from "node:path";
+import readline from "node:readline";
+
+function onPath(command) {
+  for (const dir of (process.env.PATH ?? "").split(path.delimiter)) {
+    const candidate = path.join(dir, command);
+    if (dir && existsSync(candidate)) {
+      return realpathSync(candidate);
+    }
+  }
+  return null;
+}
+
+function loadTsMorph() {
+  const local = createRequire(path.join(process.cwd(), "package.json"));
+  const bases = [local];
+  try {
+    bases.push(createRequire(local.resolve("ts-doc-extract/package.json")));
+  } catch {
+    // not installed locally
+  }
+  const bin = onPath("ts-doc-extract");
+  if (bin) {
+    bases.push(createRequire(bin));
+  }
+  for (const base of bases) {
+    try {
+      return base("ts-morph");
+    } catch {
+      // try the next location
+    }
+  }
+  return null;
+}
+
+const tsMorph = loadTsMorph();
+if (tsMorph === null) {
+  process.stderr.write("ts-extract-server: cannot resolve ts-morph\n");
+  process.exit(1);
+}
+
+const { Node, Project, SyntaxKind } = tsMorph;
+
+const project = new Project({
+  compilerOptions: { allowJs: true },
+  skipAddingFilesFromTsConfig: true,
+  skipFileDependencyResolution: true,
+});
+
+function sourceFile(file) {
+  const existing = project.getSourceFile(file);
+  if (existing) {
+    existing.refreshFromFileSystemSync();
+    return existing;
+  }
+  return project.addSourceFileAtPath(file);
+}
+
+// JSDoc and comments of a variable live on its statement.
+function commentHost(node) {
+  return Node.isVariableDeclaration(node) ? node.getVariableStatement() : node;
+}
+
+function jsDoc(node) {
+  const host = commentHost(node);
+  const docs = host && Node.isJSDocable(host) ? host.getJsDocs() : [];
+  const doc = docs.at(-1);
+  if (!doc) {
+    return undefined;
+  }
+  const tags = doc.getTags().map((tag) => {
+    const comment = (tag.getCommentText() ?? "").trim();
+    const text = Node.isJSDocParameterTag(tag)
+      ? [tag.getName(), comment].filter(Boolean).join(" - ")
+      : comment;
+    return { name: tag.getTagName(), text };
+  });
+  return { description: (doc.getDescription() ?? "").trim(), tags };
+}
+
+function leadingComments(node) {
+  const host = commentHost(node);
+  if (!host) {
+    return [];
+  }
+  return host.getLeadingCommentRanges().map((range) => {
+    const text = range.getText();
+    let type = "line";
+    if (text.startsWith("/**")) {
+      type = "jsdoc";
+    } else if (range.getKind() === SyntaxKind.MultiLineCommentTrivia) {
+      type = "block";
+    }
+    return { type, text };
+  });
+}
+
+function typeText(node) {
+  return node.getType().getText(node);
+}
+
+function parameters(node) {
+  return node.getParameters().map((param) => ({
+    name: param.getName(),
+    type: typeText(param),
+    optional: param.isOptional(),
+  }));
+}
+
+function callSignature(name, node) {
+  const params = parameters(node)
+    .map((p) => `${p.name}${p.optional ? "?" : ""}: ${p.type}`)
+    .join(", ");
+  return `${name}(${params}): ${node.getReturnType().getText(node)}`;
+}
+
+function members(cls, variant) {
+  const visible = (member) =>
+    variant === "internal" ||
+    (member.getScope() !== "private" && !member.getName().startsWith("#"));
+  const props = cls.getProperties().filter(visible).map((prop) => ({
+    kind: "property",
+    name: prop.getName(),
+    visibility: prop.getScope(),
+    isStatic: prop.isStatic(),
+    signature: `${prop.getName()}: ${typeText(prop)}`,
+  }));
+  const methods = cls.getMethods().filter(visible).map((method) => ({
+    kind: "method",
+    name: method.getName(),
+    visibility: method.getScope(),
+    isStatic: method.isStatic(),
+    isAsync: method.isAsync(),
+    signature: callSignature(method.getName(), method),
+    jsDoc: jsDoc(method),
+  }));
+  return [...props, ...methods];
+}
+
+function describe(name, node, variant) {
+  const common = { name, jsDoc: jsDoc(node), leadingComments: leadingComments(node) };
+  if (Node.isFunctionDeclaration(node)) {
+    return {
+      kind: "function",
+      ...common,
+      signature: callSignature(name, node),
+      parameters: parameters(node).map(({ name: param, type }) => ({
+        name: param,
+        type,
+      })),
+      returnType: node.getReturnType().getText(node),
+      isAsync: node.isAsync(),
+    };
+  }
+  if (Node.isClassDeclaration(node)) {
+    return {
+      kind: "class",
+      ...common,
+      signature: `class ${name}`,
+      baseClass: node.getExtends()?.getText(),
+      interfaces: node.getImplements().map((impl) => impl.getText()),
+      members: members(node, variant),
+    };
+  }
+  if (Node.isInterfaceDeclaration(node)) {
+    return { kind: "interface", ...common, signature: node.getText() };
+  }
+  if (Node.isTypeAliasDeclaration(node)) {
+    return { kind: "type", ...common, signature: node.getText() };
+  }
+  if (Node.isEnumDeclaration(node)) {
+    return {
+      kind: "enum",
+      ...common,
+      signature: `enum ${name}`,
+      enumValues: node.getMembers().map((member) => ({
+        name: member.getName(),
+        value: member.getValue() ?? null,
+      })),
+    };
+  }
+  if (Node.isVariableDeclaration(node)) {
+    return { kind: "const", ...common, signature: `${name}: ${typeText(node)}` };
+  }
+  return null;
+}
+
+function declarations(file, variant) {
+  const found = new Map();
+  for (const [name, nodes] of file.getExportedDeclarations()) {
+    found.set(name, nodes[0]);
+  }
+  if (variant === "internal") {
+    const locals = [
+      ...file.getFunctions(),
+      ...file.getClasses(),
+      ...file.getInterfaces(),
+      ...file.getTypeAliases(),
+      ...file.getEnums(),
+      ...file.getVariableDeclarations(),
+    ];
+    for (const node of locals) {
+      const name = node.getName();
+      if (name && !found.has(name)) {
+        found.set(name, node);
+      }
+    }
+  }
+  return found;
+}
+
+function extract(file, variant) {
+  const source = sourceFile(file);
+  const exports = [];
+  for (const [name, node] of declarations(source, variant)) {
+    const entry = describe(name, node, variant);
+    if (entry) {
+      exports.push(entry);
+    }
+  }
+  const imports = source.getImportDeclarations().map((decl) => ({
+    module: decl.getModuleSpecifierValue(),
+    names: decl.getNamedImports().map((named) => named.getName()),
+    defaultImport: decl.getDefaultImport()?.getText(),
+  }));
+  return {
+    module: path.basename(file).replace(/\.[^.]+$/, ""),
+    filePath: file,
+    exports,
+    imports,
+    metadata: { variant, exportCount: exports.length },
+  };
+}
+
+function respond(message) {
+  process.stdout.write(`${JSON.stringify(message)}\n`);
+}
+
+const lines = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+for await (const line of lines) {
+  if (!line.trim()) {
+    continue;
+  }
+  let request;
+  try {
+    request = JSON.parse(line);
+  } catch (error) {
+    respond({ id: null, error: `invalid request: ${error.message}` });
+    continue;
+  }
+  try {
+    const ast = extract(request.file, request.variant ?? "public");
+    respond({ id: request.id, ast });
+  } catch (error) {
+    respond({ id: request.id, error: String(error?.message ?? error) });
+  }
+}
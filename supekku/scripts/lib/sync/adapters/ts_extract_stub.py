@@ -0,0 +1,60 @@
+"""Reference ts-doc-extract server for tests (no Node required).
+
+Speaks the JSON-lines protocol of :mod:`.ts_extract` but "parses" sources
+with a regular expression: every ``export function name(...)`` becomes a
+function export, and the ``internal`` variant also includes non-exported
+functions. Run with ``python -m supekku.scripts.lib.sync.adapters.ts_extract_stub``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, TextIO
+
+_FUNCTION = re.compile(r"^(export\s+)?function\s+(\w+)\s*\(", re.MULTILINE)
+
+
+def extract(file_path: Path, variant: str) -> dict[str, Any]:
+  """Build a minimal ts-doc-extract AST for *file_path*."""
+  text = file_path.read_text(encoding="utf-8")
+  exports = [
+    {
+      "kind": "function",
+      "name": match.group(2),
+      "signature": match.group(0),
+      "parameters": [],
+      "returnType": "void",
+    }
+    for match in _FUNCTION.finditer(text)
+    if match.group(1) or variant == "internal"
+  ]
+  return {
+    "module": file_path.stem,
+    "filePath": str(file_path),
+    "exports": exports,
+    "imports": [],
+    "metadata": {"exportCount": len(exports), "pid": os.getpid()},
+  }
+
+
+def serve(stdin: TextIO, stdout: TextIO) -> None:
+  """Answer requests until *stdin* is closed."""
+  for line in stdin:
+    request = json.loads(line)
+    try:
+      response = {
+        "id": request["id"],
+        "ast": extract(Path(request["file"]), request.get("variant", "public")),
+      }
+    except OSError as exc:
+      response = {"id": request["id"], "error": str(exc)}
+    stdout.write(json.dumps(response) + "\n")
+    stdout.flush()
+
+
+if __name__ == "__main__":
+  serve(sys.stdin, sys.stdout)
@@ -0,0 +1,128 @@
+"""Tests for the JSON-lines ts-doc-extract worker client."""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from .ts_extract import (
+  BUNDLED_SERVER,
+  TsExtractRequestError,
+  TsExtractWorker,
+  TsExtractWorkerError,
+  bundled_server_command,
+)
+
+STUB = [sys.executable, "-m", "supekku.scripts.lib.sync.adapters.ts_extract_stub"]
+
+
+class TestTsExtractWorker(unittest.TestCase):
+  """Run the worker against the reference stub server."""
+
+  def setUp(self) -> None:
+    self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+    self.root = Path(self.tmpdir.name)
+    self.source = self.root / "index.ts"
+    self.source.write_text(
+      "export function greet() {}\nfunction helper() {}\n",
+      encoding="utf-8",
+    )
+    self.worker = TsExtractWorker(STUB, Path.cwd(), timeout=10)
+
+  def tearDown(self) -> None:
+    self.worker.close()
+    self.tmpdir.cleanup()
+
+  def test_one_process_serves_many_requests(self) -> None:
+    """The server starts once and answers each variant."""
+    public = self.worker.extract(self.source, "public")
+    internal = self.worker.extract(self.source, "internal")
+
+    assert [e["name"] for e in public["exports"]] == ["greet"]
+    assert [e["name"] for e in internal["exports"]] == ["greet", "helper"]
+    assert public["metadata"]["pid"] == internal["metadata"]["pid"]
+
+  def test_request_error_keeps_worker(self) -> None:
+    """A per-file error is reported without stopping the server."""
+    with pytest.raises(TsExtractRequestError):
+      self.worker.extract(self.root / "missing.ts", "public")
+
+    assert self.worker.alive
+    assert self.worker.extract(self.source, "public")["module"] == "index"
+
+  def test_close_stops_server(self) -> None:
+    """close() ends the process; the next request starts a new one."""
+    first = self.worker.extract(self.source, "public")["metadata"]["pid"]
+    self.worker.close()
+
+    assert not self.worker.alive
+    second = self.worker.extract(self.source, "public")["metadata"]["pid"]
+    assert second != first
+
+  def test_restart_after_server_exits_by_itself(self) -> None:
+    """A server that exits between requests is replaced transparently."""
+    one_shot = (
+      "import json, sys; r = json.loads(sys.stdin.readline()); "
+      "print(json.dumps({'id': r['id'], 'ast': {'module': 'index'}}), flush=True)"
+    )
+    worker = TsExtractWorker([sys.executable, "-c", one_shot], Path.cwd(), timeout=10)
+    try:
+      assert worker.extract(self.source, "public") == {"module": "index"}
+      deadline = time.monotonic() + 10
+      while worker.alive and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+      assert not worker.alive
+      assert worker.extract(self.source, "public") == {"module": "index"}
+    finally:
+      worker.close()
+
+  def test_dead_server_raises_worker_error(self) -> None:
+    """A server that exits without answering is a worker failure."""
+    worker = TsExtractWorker([sys.executable, "-c", "pass"], Path.cwd(), timeout=10)
+
+    with pytest.raises(TsExtractWorkerError):
+      worker.extract(self.source, "public")
+    assert not worker.alive
+
+  def test_missing_command_raises_worker_error(self) -> None:
+    """An unstartable server is a worker failure."""
+    worker = TsExtractWorker(["/nonexistent/ts-extract-server"], Path.cwd())
+
+    with pytest.raises(TsExtractWorkerError, match="cannot start"):
+      worker.extract(self.source, "public")
+
+
+class TestBundledServer(unittest.TestCase):
+  """The Node server shipped with the adapter."""
+
+  def test_command_runs_bundled_script_with_node(self) -> None:
+    with patch("supekku.scripts.lib.sync.adapters.ts_extract.which") as which:
+      which.return_value = "/usr/bin/node"
+      assert bundled_server_command() == ["/usr/bin/node", str(BUNDLED_SERVER)]
+      which.return_value = None
+      assert bundled_server_command() == []
+    assert BUNDLED_SERVER.is_file()
+
+  @pytest.mark.skipif(not bundled_server_command(), reason="node not on PATH")
+  def test_exits_without_ts_morph(self) -> None:
+    """No resolvable ts-morph is a worker failure, so callers fall back."""
+    with tempfile.TemporaryDirectory() as tmp:
+      root = Path(tmp)
+      (root / "package.json").write_text("{}", encoding="utf-8")
+      source = root / "index.ts"
+      source.write_text("export const x = 1;\n", encoding="utf-8")
+      worker = TsExtractWorker(bundled_server_command(), root, timeout=10)
+      # An empty PATH hides any global ts-doc-extract (and its ts-morph).
+      with patch.dict(os.environ, {"PATH": tmp}), pytest.raises(TsExtractWorkerError):
+        worker.extract(source, "public")
+      assert not worker.alive
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import hashlib
 import json
+import logging
 import subprocess
+import threading
 from pathlib import Path
 from shutil import which
 from typing import TYPE_CHECKING, ClassVar
@@ -28,10 +30,18 @@ from supekku.scripts.lib.sync.models import (
 )
 
 from .base import LanguageAdapter
+from .ts_extract import (
+  TsExtractRequestError,
+  TsExtractWorker,
+  TsExtractWorkerError,
+  bundled_server_command,
+)
 
 if TYPE_CHECKING:
   from collections.abc import Sequence
 
+logger = logging.getLogger(__name__)
+
 
 class TypeScriptExtractionError(RuntimeError):
   """Raised when ts-doc-extract fails to extract AST."""
@@ -55,11 +65,37 @@ class TypeScriptAdapter(LanguageAdapter):
 
   language: ClassVar[str] = "typescript"
 
-  def __init__(self, repo_root: Path) -> None:
-    """Initialize TypeScriptAdapter with caching for npm_utils calls."""
+  def __init__(
+    self,
+    repo_root: Path,
+    *,
+    extract_server: Sequence[str] | None = None,
+  ) -> None:
+    """Initialize TypeScriptAdapter with caching for npm_utils calls.
+
+    Args:
+        repo_root: Repository root directory
+        extract_server: Argv of a batch extraction server (see
+            :mod:`.ts_extract`). None reads ``[sync] ts_extract_server``
+            from workflow.toml, falling back to the bundled Node server;
+            empty runs ts-doc-extract once per file.
+
+    """
     super().__init__(repo_root)
     self._pm_info: PackageManagerInfo | None = None
     self._ts_doc_extract_available: bool | None = None
+    if extract_server is None:
+      from supekku.scripts.lib.core.config import (  # noqa: PLC0415
+        load_workflow_config,
+      )
+
+      config = load_workflow_config(repo_root)
+      extract_server = (
+        config.get("sync", {}).get("ts_extract_server") or bundled_server_command()
+      )
+    self._extract_server = [str(arg) for arg in extract_server]
+    self._workers: dict[Path, TsExtractWorker | None] = {}
+    self._workers_lock = threading.Lock()
 
   @staticmethod
   def is_node_available() -> bool:
@@ -380,6 +416,43 @@ class TypeScriptAdapter(LanguageAdapter):
       # If no package.json, use parent directory
       package_root = file_path.parent
 
+    worker = self._batch_worker(package_root)
+    if worker is not None:
+      try:
+        return worker.extract(file_path, variant)
+      except TsExtractRequestError as e:
+        msg = f"ts-doc-extract failed: {e}"
+        raise TypeScriptExtractionError(msg) from e
+      except TsExtractWorkerError as e:
+        logger.debug("falling back to one-shot ts-doc-extract: %s", e)
+        with self._workers_lock:
+          self._workers[package_root] = None
+
+    return self._extract_ast_oneshot(file_path, variant, package_root)
+
+  def _batch_worker(self, package_root: Path) -> TsExtractWorker | None:
+    """Return the batch worker for *package_root*, if one is configured.
+
+    Workers start lazily on first request; a worker that fails is not
+    retried for the rest of the run (the package falls back to one-shot).
+    """
+    if not self._extract_server:
+      return None
+    with self._workers_lock:
+      if package_root not in self._workers:
+        self._workers[package_root] = TsExtractWorker(
+          self._extract_server,
+          package_root,
+        )
+      return self._workers[package_root]
+
+  def _extract_ast_oneshot(
+    self,
+    file_path: Path,
+    variant: str,
+    package_root: Path,
+  ) -> dict:
+    """Run ts-doc-extract once for a single file and variant."""
     npx_cmd = self._get_npx_command(package_root)
 
     # Build command (npx_cmd already includes the package name)
@@ -411,6 +484,14 @@ class TypeScriptAdapter(LanguageAdapter):
       msg = f"ts-doc-extract timed out after 30s: {file_path}"
       raise TypeScriptExtractionError(msg) from e
 
+  def close(self) -> None:
+    """Stop batch extraction workers started during this run."""
+    with self._workers_lock:
+      workers = [w for w in self._workers.values() if w is not None]
+      self._workers.clear()
+    for worker in workers:
+      worker.close()
+
   def describe(self, unit: SourceUnit) -> SourceDescriptor:
     """Describe how a TypeScript/JavaScript module should be processed.
 
@@ -3,6 +3,8 @@
 
 import json
 import shutil
+import sys
+import tempfile
 import unittest
 from pathlib import Path
 from subprocess import CalledProcessError
@@ -13,6 +15,7 @@ import pytest
 from supekku.scripts.lib.core import PackageManagerInfo
 from supekku.scripts.lib.sync.models import SourceUnit
 
+from .ts_extract import bundled_server_command
 from .typescript import (
   NodeRuntimeNotAvailableError,
   TypeScriptAdapter,
@@ -26,7 +29,7 @@ class TestTypeScriptAdapter(unittest.TestCase):  # pylint: disable=too-many-publ
   def setUp(self) -> None:
     """Set up test fixtures."""
     self.repo_root = Path("/test/repo")
-    self.adapter = TypeScriptAdapter(self.repo_root)
+    self.adapter = TypeScriptAdapter(self.repo_root, extract_server=[])
 
   def test_language_identifier(self) -> None:
     """Test that TypeScriptAdapter has correct language identifier."""
@@ -671,3 +674,96 @@ class TestTypeScriptAdapter(unittest.TestCase):  # pylint: disable=too-many-publ
         shutil.rmtree(test_repo)
       if output_dir.exists():
         shutil.rmtree(output_dir)
+
+
+class TestTypeScriptBatchExtraction(unittest.TestCase):
+  """Batch-mode extraction through a long-lived server per package root."""
+
+  def setUp(self) -> None:
+    self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+    self.repo_root = Path(self.tmpdir.name)
+    self.package = self.repo_root / "web"
+    (self.package / "src").mkdir(parents=True)
+    (self.package / "package.json").write_text("{}", encoding="utf-8")
+    for name in ("a", "b"):
+      (self.package / "src" / f"{name}.ts").write_text(
+        f"export function {name}() {{}}\nfunction {name}Helper() {{}}\n",
+        encoding="utf-8",
+      )
+
+  def tearDown(self) -> None:
+    self.tmpdir.cleanup()
+
+  def _generate(self, adapter: TypeScriptAdapter, name: str) -> list:
+    unit = SourceUnit(
+      language="typescript",
+      identifier=f"web/src/{name}.ts",
+      root=self.repo_root,
+    )
+    outputs = {
+      "api": self.repo_root / "out" / f"{name}-api.md",
+      "internal": self.repo_root / "out" / f"{name}-internal.md",
+    }
+    with (
+      patch.object(TypeScriptAdapter, "is_node_available", return_value=True),
+      patch.object(
+        TypeScriptAdapter, "_ensure_ts_doc_extract_available", return_value=True
+      ),
+    ):
+      return adapter.generate(unit, variant_outputs=outputs)
+
+  def test_one_server_per_package_root(self) -> None:
+    """Every file and variant in a package is served by one process."""
+    stub = [sys.executable, "-m", "supekku.scripts.lib.sync.adapters.ts_extract_stub"]
+    adapter = TypeScriptAdapter(self.repo_root, extract_server=stub)
+
+    try:
+      with patch("subprocess.run") as mock_run:
+        for name in ("a", "b"):
+          variants = self._generate(adapter, name)
+          assert [v.name for v in variants] == ["api", "internal"]
+          assert all(v.hash for v in variants)
+      mock_run.assert_not_called()
+      assert list(adapter._workers) == [self.package]
+      worker = adapter._workers[self.package]
+      assert worker is not None
+      assert worker.alive
+    finally:
+      adapter.close()
+    assert adapter._workers == {}
+    api = (self.repo_root / "out" / "b-api.md").read_text(encoding="utf-8")
+    assert "### b" in api
+    assert "bHelper" not in api
+
+  def test_falls_back_to_one_shot_when_server_fails(self) -> None:
+    """An unusable server is dropped and ts-doc-extract runs per file."""
+    adapter = TypeScriptAdapter(
+      self.repo_root, extract_server=["/nonexistent/ts-extract-server"]
+    )
+    ast = {"module": "a", "exports": []}
+
+    with (
+      patch.object(
+        adapter, "_get_npx_command", return_value=["npx", "--yes", "ts-doc-extract"]
+      ),
+      patch("subprocess.run", return_value=Mock(stdout=json.dumps(ast))) as run,
+    ):
+      self._generate(adapter, "a")
+
+    assert run.call_count == 2
+    assert adapter._workers == {self.package: None}
+
+  def test_server_read_from_workflow_config(self) -> None:
+    """Without an explicit argument the server comes from workflow.toml."""
+    config_dir = self.repo_root / ".spec-driver"
+    config_dir.mkdir()
+    (config_dir / "workflow.toml").write_text(
+      '[sync]\nts_extract_server = ["ts-extract-server", "--stdio"]\n',
+      encoding="utf-8",
+    )
+
+    adapter = TypeScriptAdapter(self.repo_root)
+
+    assert adapter._extract_server == ["ts-extract-server", "--stdio"]
+    default = TypeScriptAdapter(Path("/test/repo"))._extract_server
+    assert default == bundled_server_command()
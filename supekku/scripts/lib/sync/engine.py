@@ -11,7 +11,8 @@ from .adapters import (
   TypeScriptAdapter,
   ZigAdapter,
 )
-from .models import SourceUnit, SyncOutcome
+from .executor import map_units
+from .models import DocVariant, SourceUnit, SyncOutcome
 
 if TYPE_CHECKING:
   from collections.abc import Mapping, Sequence
@@ -60,6 +61,7 @@ class SpecSyncEngine:
     languages: Sequence[str] | None = None,
     targets: Sequence[str] | None = None,
     check: bool = False,
+    jobs: int | None = 1,
   ) -> SyncOutcome:
     """Synchronize specifications across multiple languages.
 
@@ -70,6 +72,8 @@ class SpecSyncEngine:
             (format: "lang:identifier")
         check: If True, only check if docs would change (don't write
             files)
+        jobs: Worker threads generating docs per language (None or 0:
+            one per CPU). Results are aggregated in discovery order.
 
     Returns:
         SyncOutcome with results of the synchronization operation
@@ -98,6 +102,7 @@ class SpecSyncEngine:
         language_targets.get(language),
         check,
         outcome,
+        jobs,
       )
 
     return outcome
@@ -173,6 +178,7 @@ class SpecSyncEngine:
     lang_targets: list[str] | None,
     check: bool,
     outcome: SyncOutcome,
+    jobs: int | None = 1,
   ) -> None:
     """Process all source units for a single language."""
     adapter = self.adapters[language]
@@ -189,39 +195,49 @@ class SpecSyncEngine:
         )
         return
 
-      for unit in source_units:
-        self._process_source_unit(unit, adapter, check, outcome)
+      results = map_units(
+        lambda unit: self._generate_unit(unit, adapter, check),
+        source_units,
+        jobs=jobs,
+      )
+      for result in results:
+        self._record_unit_result(result.unit, result.error, check, outcome)
 
     except Exception as e:
       outcome.errors.append(f"Error processing language {language}: {e!s}")
+    finally:
+      adapter.close()
 
-  def _process_source_unit(
-    self,
+  @staticmethod
+  def _generate_unit(
     unit: SourceUnit,
     adapter: LanguageAdapter,
     check: bool,
+  ) -> list[DocVariant]:
+    """Describe and generate one source unit (safe to run on a worker)."""
+    adapter.describe(unit)
+    return adapter.generate(unit, check=check)
+
+  @staticmethod
+  def _record_unit_result(
+    unit: SourceUnit,
+    error: Exception | None,
+    check: bool,
     outcome: SyncOutcome,
   ) -> None:
-    """Process a single source unit."""
-    try:
-      # Get unit description for spec creation
-      adapter.describe(unit)
-
-      # Generate documentation variants
-      adapter.generate(unit, check=check)
-
-      # Track successful processing
-      outcome.processed_units.append(unit)
+    """Fold one unit's result into *outcome* (called in discovery order)."""
+    if error is not None:
+      outcome.errors.append(f"Error processing {unit.identifier}: {error!s}")
+      outcome.skipped_units.append(f"{unit.identifier} (error)")
+      return
 
-      if not check:
-        # Simulate spec creation
-        unit_key = f"{unit.language}:{unit.identifier}"
-        spec_id = f"SPEC-{len(outcome.created_specs) + 900:03d}"
-        outcome.created_specs[unit_key] = spec_id
+    outcome.processed_units.append(unit)
 
-    except Exception as e:
-      outcome.errors.append(f"Error processing {unit.identifier}: {e!s}")
-      outcome.skipped_units.append(f"{unit.identifier} (error)")
+    if not check:
+      # Simulate spec creation
+      unit_key = f"{unit.language}:{unit.identifier}"
+      spec_id = f"SPEC-{len(outcome.created_specs) + 900:03d}"
+      outcome.created_specs[unit_key] = spec_id
 
   def get_supported_languages(self) -> list[str]:
     """Get list of supported languages.
@@ -299,6 +299,34 @@ class TestSpecSyncEngine(unittest.TestCase):
     assert "Error processing internal/test: Description error" in result.errors
     assert "internal/test (error)" in result.skipped_units
 
+  def test_synchronize_parallel_matches_serial(self) -> None:
+    """Parallel generation aggregates outcomes in discovery order."""
+    units = [
+      SourceUnit(language="go", identifier=f"internal/pkg{i}", root=self.repo_root)
+      for i in range(6)
+    ]
+    self.mock_go_adapter.discover_targets.return_value = units
+
+    def generate(unit: SourceUnit, *, check: bool = False) -> list[DocVariant]:
+      if unit.identifier == "internal/pkg3":
+        raise RuntimeError("gomarkdoc failed")
+      return []
+
+    self.mock_go_adapter.generate.side_effect = generate
+
+    serial = self.engine.synchronize(languages=["go"], jobs=1)
+    parallel = self.engine.synchronize(languages=["go"], jobs=4)
+
+    assert parallel == serial
+    assert [u.identifier for u in parallel.processed_units] == [
+      "internal/pkg0",
+      "internal/pkg1",
+      "internal/pkg2",
+      "internal/pkg4",
+      "internal/pkg5",
+    ]
+    assert parallel.errors == ["Error processing internal/pkg3: gomarkdoc failed"]
+
 
 if __name__ == "__main__":
   unittest.main()
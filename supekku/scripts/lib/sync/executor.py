@@ -0,0 +1,84 @@
+"""Bounded worker pool for per-unit spec sync work.
+
+Contract generation is dominated by external toolchains (gomarkdoc,
+ts-doc-extract, zig) that run as subprocesses, so a thread pool overlaps
+them without pickling adapters across processes. Work that mutates shared
+state — spec ID allocation, registry writes — stays with the caller; only
+the per-unit function passed to :func:`map_units` runs on workers.
+
+Results are returned in input order regardless of completion order, so
+aggregated output (CLI report, :class:`SyncOutcome`) is deterministic.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+# Upper bound for the automatic default; external toolchains are memory
+# hungry and most repos have far fewer units than cores anyway.
+MAX_DEFAULT_JOBS = 8
+
+
+def resolve_jobs(jobs: int | None) -> int:
+  """Normalise ``--jobs``: None or 0 means one per CPU, up to the default cap.
+
+  Raises:
+    ValueError: If *jobs* is negative.
+  """
+  if jobs is None or jobs == 0:
+    return min(os.cpu_count() or 1, MAX_DEFAULT_JOBS)
+  if jobs < 0:
+    msg = f"jobs must be >= 0, got {jobs}"
+    raise ValueError(msg)
+  return jobs
+
+
+@dataclass(frozen=True)
+class UnitResult[U, R]:
+  """Outcome of running the work function on one unit."""
+
+  unit: U
+  value: R | None = None
+  error: Exception | None = None
+
+  @property
+  def ok(self) -> bool:
+    """True if the work function returned without raising."""
+    return self.error is None
+
+
+def map_units[U, R](
+  work: Callable[[U], R],
+  units: Sequence[U],
+  *,
+  jobs: int | None = 1,
+) -> list[UnitResult[U, R]]:
+  """Apply *work* to each unit on up to *jobs* threads.
+
+  Exceptions raised by *work* are captured per unit rather than aborting
+  the remaining units. With one job (or one unit) the work runs inline.
+
+  Returns:
+    One :class:`UnitResult` per unit, in the order of *units*.
+  """
+
+  def _run(unit: U) -> UnitResult[U, R]:
+    try:
+      return UnitResult(unit=unit, value=work(unit))
+    except Exception as exc:  # noqa: BLE001 — reported per unit by the caller
+      return UnitResult(unit=unit, error=exc)
+
+  workers = min(resolve_jobs(jobs), len(units))
+  if workers <= 1:
+    return [_run(unit) for unit in units]
+  with ThreadPoolExecutor(
+    max_workers=workers,
+    thread_name_prefix="spec-sync",
+  ) as pool:
+    return list(pool.map(_run, units))
+
+
+__all__ = ["MAX_DEFAULT_JOBS", "UnitResult", "map_units", "resolve_jobs"]
@@ -0,0 +1,78 @@
+"""Tests for the spec sync worker pool."""
+
+import threading
+import time
+import unittest
+
+import pytest
+
+from .executor import MAX_DEFAULT_JOBS, map_units, resolve_jobs
+
+
+class TestResolveJobs(unittest.TestCase):
+  """Test --jobs normalisation."""
+
+  def test_auto_is_bounded(self) -> None:
+    """None and 0 pick a CPU-based default within the cap."""
+    assert 1 <= resolve_jobs(None) <= MAX_DEFAULT_JOBS
+    assert resolve_jobs(0) == resolve_jobs(None)
+
+  def test_explicit_value_is_kept(self) -> None:
+    """An explicit worker count is used as-is."""
+    assert resolve_jobs(3) == 3
+
+  def test_negative_rejected(self) -> None:
+    """Negative values are invalid."""
+    with pytest.raises(ValueError, match="jobs"):
+      resolve_jobs(-1)
+
+
+class TestMapUnits(unittest.TestCase):
+  """Test map_units ordering, error capture and concurrency."""
+
+  def test_results_follow_input_order(self) -> None:
+    """Results come back in input order even when later units finish first."""
+
+    def work(n: int) -> int:
+      time.sleep(0.01 * (5 - n))
+      return n * n
+
+    results = map_units(work, [1, 2, 3, 4], jobs=4)
+
+    assert [r.unit for r in results] == [1, 2, 3, 4]
+    assert [r.value for r in results] == [1, 4, 9, 16]
+    assert all(r.ok for r in results)
+
+  def test_errors_are_captured_per_unit(self) -> None:
+    """A failing unit does not stop the others."""
+
+    def work(n: int) -> int:
+      if n == 2:
+        raise RuntimeError("boom")
+      return n
+
+    results = map_units(work, [1, 2, 3], jobs=2)
+
+    assert [r.ok for r in results] == [True, False, True]
+    assert str(results[1].error) == "boom"
+    assert results[2].value == 3
+
+  def test_units_overlap_on_workers(self) -> None:
+    """With several jobs, units run concurrently."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    results = map_units(lambda n: barrier.wait() is not None, [1, 2, 3], jobs=3)
+
+    assert all(r.ok for r in results)
+
+  def test_single_job_runs_inline(self) -> None:
+    """jobs=1 runs on the calling thread."""
+    caller = threading.get_ident()
+
+    results = map_units(lambda _n: threading.get_ident(), [1, 2], jobs=1)
+
+    assert {r.value for r in results} == {caller}
+
+
+if __name__ == "__main__":
+  unittest.main()
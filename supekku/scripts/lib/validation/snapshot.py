@@ -0,0 +1,162 @@
+"""Workspace state shared by the workspace validation checks.
+
+``WorkspaceValidator`` checks declare the inputs they read by name
+(``"specs"``, ``"deltas"``, ``"phase_files"`` …). Before any check runs,
+the validator loads the union of those inputs into one
+:class:`WorkspaceSnapshot`; checks then only read from it.
+
+Markdown files are parsed through :meth:`WorkspaceSnapshot.markdown`, which
+memoizes the result so checks that read the same delta, audit or phase
+file share a single parse.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from supekku.scripts.lib.backlog.registry import discover_backlog_items
+from supekku.scripts.lib.core.frontmatter_metadata.audit import (
+  AUDIT_MODE_CONFORMANCE,
+)
+from supekku.scripts.lib.core.paths import (
+  get_backlog_dir,
+  get_deltas_dir,
+  get_drift_dir,
+  get_memory_dir,
+)
+from supekku.scripts.lib.core.spec_utils import load_markdown_file
+
+if TYPE_CHECKING:
+  from supekku.scripts.lib.workspace import Workspace
+
+BACKLOG_KIND_DIRS = ("issues", "problems", "improvements", "risks")
+
+
+class WorkspaceSnapshot:
+  """Registries and file lists loaded once per validation run.
+
+  Inputs are loaded on first access and then kept; ``load`` fetches a set
+  of them up front in a fixed order.
+  """
+
+  def __init__(self, workspace: Workspace) -> None:
+    self.workspace = workspace
+    self._values: dict[str, Any] = {}
+    self._markdown: dict[Path, tuple[dict[str, Any], str]] = {}
+
+  def load(self, names: Iterable[str]) -> None:
+    """Load *names* in input declaration order.
+
+    Raises:
+      KeyError: If a name is not a known input.
+    """
+    wanted = set(names)
+    unknown = wanted - _INPUTS.keys()
+    if unknown:
+      msg = f"unknown validation inputs: {sorted(unknown)}"
+      raise KeyError(msg)
+    for name in _INPUTS:
+      if name in wanted:
+        self[name]  # noqa: B018 — loads and keeps the value
+
+  def __getitem__(self, name: str) -> Any:
+    try:
+      return self._values[name]
+    except KeyError:
+      value = self._values[name] = _INPUTS[name](self)
+      return value
+
+  def markdown(self, path: Path) -> tuple[dict[str, Any], str]:
+    """Return ``load_markdown_file(path)``, parsing each file at most once.
+
+    Parse errors propagate and are not cached. The frontmatter dict is
+    shared between callers and must not be mutated.
+    """
+    cached = self._markdown.get(path)
+    if cached is None:
+      cached = self._markdown[path] = load_markdown_file(path)
+    return cached
+
+
+# -- Inputs ----------------------------------------------------------------
+# Declaration order is load order; later inputs may read earlier ones.
+
+
+def _requirement_ids(snapshot: WorkspaceSnapshot) -> set[str]:
+  return set(snapshot["requirements"].records.keys())
+
+
+def _backlog_ids(snapshot: WorkspaceSnapshot) -> set[str]:
+  # Backlog items (ISSUE-*, IMPR-*, etc.) are valid relation targets
+  return {item.id for item in discover_backlog_items(root=snapshot.workspace.root)}
+
+
+def _conformance_audits(
+  snapshot: WorkspaceSnapshot,
+) -> dict[str, list[tuple[str, dict, str]]]:
+  """Index completed conformance audits by delta_ref."""
+  result: dict[str, list[tuple[str, dict, str]]] = {}
+  for audit_id, audit in snapshot["audits"].items():
+    if audit.status != "completed":
+      continue
+    fm, body = snapshot.markdown(audit.path)
+    if fm.get("mode") != AUDIT_MODE_CONFORMANCE:
+      continue
+    delta_ref = fm.get("delta_ref")
+    if delta_ref:
+      result.setdefault(delta_ref, []).append((audit_id, fm, body))
+  return result
+
+
+def _phase_files(snapshot: WorkspaceSnapshot) -> list[Path]:
+  """Phase sheets of every delta bundle, in bundle then phase order."""
+  deltas_dir = get_deltas_dir(snapshot.workspace.root)
+  if not deltas_dir.exists():
+    return []
+  files: list[Path] = []
+  for delta_dir in sorted(deltas_dir.iterdir()):
+    if not delta_dir.is_dir():
+      continue
+    phases_dir = delta_dir / "phases"
+    if phases_dir.is_dir():
+      files.extend(sorted(phases_dir.glob("phase-[0-9][0-9].md")))
+  return files
+
+
+def _glob_files(directories: Iterable[Path], glob: str) -> list[Path]:
+  files: list[Path] = []
+  for directory in directories:
+    if directory.is_dir():
+      files.extend(sorted(directory.glob(glob)))
+  return files
+
+
+_INPUTS: dict[str, Callable[[WorkspaceSnapshot], Any]] = {
+  "specs": lambda s: s.workspace.specs.all_specs(),
+  "requirements": lambda s: s.workspace.requirements,
+  "requirement_ids": _requirement_ids,
+  "decisions": lambda s: s.workspace.decisions.collect(),
+  "deltas": lambda s: s.workspace.delta_registry.collect(),
+  "revisions": lambda s: s.workspace.revision_registry.collect(),
+  "audits": lambda s: s.workspace.audit_registry.collect(),
+  "backlog_ids": _backlog_ids,
+  "applies_to_ids": lambda s: s["requirement_ids"] | s["backlog_ids"],
+  "conformance_audits": _conformance_audits,
+  "phase_files": _phase_files,
+  "memory_files": lambda s: _glob_files(
+    [get_memory_dir(s.workspace.root)],
+    "mem.*.md",
+  ),
+  "backlog_files": lambda s: _glob_files(
+    [get_backlog_dir(s.workspace.root) / d for d in BACKLOG_KIND_DIRS],
+    "*.md",
+  ),
+  "drift_files": lambda s: _glob_files([get_drift_dir(s.workspace.root)], "DL-*.md"),
+}
+
+INPUT_NAMES = tuple(_INPUTS)
+
+
+__all__ = ["INPUT_NAMES", "WorkspaceSnapshot"]
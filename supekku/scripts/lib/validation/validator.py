@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -11,7 +12,6 @@ _BARE_REQUIREMENT_PATTERN = re.compile(r"^(?:FR|NF)-\d{3}$")
 _SPEC_ID_PATTERN = re.compile(r"^(?:SPEC|PROD)-\d{3}$")
 
 from supekku.scripts.lib.backlog.models import BacklogItem
-from supekku.scripts.lib.backlog.registry import discover_backlog_items
 from supekku.scripts.lib.blocks.audit_findings import load_audit_findings
 from supekku.scripts.lib.blocks.delta import (
   extract_delta_context_inputs,
@@ -40,30 +40,26 @@ from supekku.scripts.lib.changes.audit_check import resolve_audit_gate
 from supekku.scripts.lib.changes.phase_model import PhaseSheet
 from supekku.scripts.lib.core.enums import get_enum_values
 from supekku.scripts.lib.core.frontmatter_metadata.audit import (
-  AUDIT_MODE_CONFORMANCE,
   FINDING_OUTCOMES,
   VALID_OUTCOME_KINDS,
   VALID_STATUS_KIND_PAIRS,
 )
 from supekku.scripts.lib.core.frontmatter_writer import update_frontmatter_status
-from supekku.scripts.lib.core.paths import (
-  get_backlog_dir,
-  get_deltas_dir,
-  get_drift_dir,
-  get_memory_dir,
-)
-from supekku.scripts.lib.core.spec_utils import load_markdown_file
+from supekku.scripts.lib.core.profiling import profile_phase
 from supekku.scripts.lib.drift.models import DriftLedger
 from supekku.scripts.lib.memory.models import MemoryRecord
 
+from .snapshot import WorkspaceSnapshot
+
 if TYPE_CHECKING:
-  from collections.abc import Iterable
+  from collections.abc import Callable, Iterable, Sequence
   from pathlib import Path
   from typing import Any
 
   from pydantic import BaseModel
 
   from supekku.scripts.lib.changes.artifacts import ChangeArtifact
+  from supekku.scripts.lib.specs.models import Spec
   from supekku.scripts.lib.workspace import Workspace
 
 
@@ -76,8 +72,41 @@ class ValidationIssue:
   artifact: str
 
 
+@dataclass(frozen=True)
+class ValidationCheck:
+  """A named workspace check and the snapshot inputs it reads.
+
+  ``run(snapshot, units)`` reports issues through the validator. Checks
+  that walk files or artefacts set ``units`` to list them; other checks
+  run with no units.
+  """
+
+  name: str
+  inputs: frozenset[str]
+  run: Callable[[WorkspaceSnapshot, Sequence[Any]], None]
+  units: Callable[[WorkspaceSnapshot], Sequence[Any]] | None = None
+
+
+def _items(name: str) -> Callable[[WorkspaceSnapshot], Sequence[Any]]:
+  return lambda snapshot: list(snapshot[name].items())
+
+
+def _listed(name: str) -> Callable[[WorkspaceSnapshot], Sequence[Any]]:
+  return lambda snapshot: snapshot[name]
+
+
+def _values(name: str) -> Callable[[WorkspaceSnapshot], Sequence[Any]]:
+  return lambda snapshot: list(snapshot[name].values())
+
+
 class WorkspaceValidator:
-  """Validates workspace consistency and artifact relationships."""
+  """Validates workspace consistency and artifact relationships.
+
+  Each check in :meth:`checks` declares the snapshot inputs it reads.
+  ``validate`` loads those inputs once, then runs the checks in order.
+  Issues are reported in check order, then item order; :attr:`timings`
+  holds the seconds spent per check.
+  """
 
   def __init__(
     self,
@@ -89,6 +118,7 @@ class WorkspaceValidator:
   ) -> None:
     self.workspace = workspace
     self.issues: list[ValidationIssue] = []
+    self.timings: dict[str, float] = {}
     self.strict = strict
     self.fix = fix
     self.accept_tolerated = accept_tolerated
@@ -96,25 +126,154 @@ class WorkspaceValidator:
   def validate(self) -> list[ValidationIssue]:
     """Validate workspace for missing references and inconsistencies."""
     self.issues.clear()
-    _ = self.workspace.specs  # Access but don't assign
-    requirements = self.workspace.requirements
-    decisions = self.workspace.decisions.collect()
-    delta_registry = self.workspace.delta_registry.collect()
-    revision_registry = self.workspace.revision_registry.collect()
-    audit_registry = self.workspace.audit_registry.collect()
-
-    requirement_ids = set(requirements.records.keys())
-    decision_ids = set(decisions.keys())
-    delta_ids = set(delta_registry.keys())
-    revision_ids = set(revision_registry.keys())
-    audit_ids = set(audit_registry.keys())
-
-    # Backlog items (ISSUE-*, IMPR-*, etc.) are valid relation targets
-    backlog_ids = {item.id for item in discover_backlog_items(root=self.workspace.root)}
-    applies_to_ids = requirement_ids | backlog_ids
-
-    # Requirement lifecycle links
-    for req_id, record in requirements.records.items():
+    self.timings.clear()
+    checks = self.checks()
+    snapshot = WorkspaceSnapshot(self.workspace)
+    with profile_phase("validate.snapshot"):
+      snapshot.load(set().union(*(check.inputs for check in checks)))
+
+    for check in checks:
+      units = check.units(snapshot) if check.units is not None else ()
+      started = time.perf_counter()
+      with profile_phase(f"validate.{check.name}"):
+        check.run(snapshot, units)
+      self.timings[check.name] = time.perf_counter() - started
+    return list(self.issues)
+
+  def checks(self) -> list[ValidationCheck]:
+    """Return the checks run by :meth:`validate`, in reporting order."""
+    return [
+      # Requirement lifecycle links
+      ValidationCheck(
+        "requirement_links",
+        frozenset({"requirements", "deltas", "revisions", "audits"}),
+        self._validate_requirement_links,
+        units=lambda s: list(s["requirements"].records.items()),
+      ),
+      # Change artifact relation checks
+      self._relation_check("delta_relations", "deltas", "implements", "applies_to_ids"),
+      self._relation_check(
+        "revision_relations", "revisions", "introduces", "requirement_ids"
+      ),
+      self._relation_check("audit_relations", "audits", "verifies", "requirement_ids"),
+      # Decision (ADR) validation
+      ValidationCheck(
+        "decision_references",
+        frozenset({"decisions"}),
+        lambda s, _: self._validate_decision_references(
+          s["decisions"], set(s["decisions"].keys())
+        ),
+      ),
+      ValidationCheck(
+        "decision_status",
+        frozenset({"decisions"}),
+        lambda s, _: self._validate_decision_status_compatibility(s["decisions"]),
+      ),
+      # Spec taxonomy validation (warn-only)
+      ValidationCheck(
+        "spec_taxonomy",
+        frozenset({"specs"}),
+        lambda _, specs: self._validate_spec_taxonomy(specs),
+        units=_listed("specs"),
+      ),
+      # Audit disposition and gate coverage (DE-079 phase 3)
+      ValidationCheck(
+        "audit_disposition",
+        frozenset({"audits"}),
+        self._validate_audit_disposition,
+        units=_items("audits"),
+      ),
+      ValidationCheck(
+        "audit_gate_coverage",
+        frozenset({"deltas", "conformance_audits"}),
+        self._validate_audit_gate_coverage,
+        units=_items("deltas"),
+      ),
+      # Cross-artifact unresolved reference check (DE-097). Builds its own
+      # graph (and reports failure to do so), so it declares no inputs.
+      ValidationCheck(
+        "unresolved_references",
+        frozenset(),
+        lambda _s, _: self._validate_unresolved_references(),
+      ),
+      # Phase status validation (DE-104)
+      ValidationCheck(
+        "phase_statuses",
+        frozenset({"phase_files"}),
+        self._validate_phase_statuses,
+        units=_listed("phase_files"),
+      ),
+      # Delta block schema validation (DE-138 P04 — DEC-138-14)
+      ValidationCheck(
+        "delta_blocks",
+        frozenset({"deltas"}),
+        self._validate_delta_blocks,
+        units=_items("deltas"),
+      ),
+      # Spec block schema validation (DE-139 P04)
+      ValidationCheck(
+        "spec_blocks",
+        frozenset({"specs"}),
+        lambda _, specs: self._validate_spec_blocks(specs),
+        units=_listed("specs"),
+      ),
+      # Spec requirements block validation (DE-140 P03)
+      ValidationCheck(
+        "spec_requirements_blocks",
+        frozenset({"specs"}),
+        lambda _, specs: self._validate_spec_requirements_blocks(specs),
+        units=_listed("specs"),
+      ),
+      # Kind-aware frontmatter validation (DE-112)
+      self._kind_check("memory_frontmatter", MemoryRecord, "Memory", "memory_files"),
+      self._kind_check("backlog_frontmatter", BacklogItem, "Backlog", "backlog_files"),
+      self._kind_check("drift_frontmatter", DriftLedger, "Drift", "drift_files"),
+    ]
+
+  def _relation_check(
+    self,
+    name: str,
+    artifacts: str,
+    expected_type: str,
+    targets: str,
+  ) -> ValidationCheck:
+    """Check *expected_type* relations of the *artifacts* input against *targets*."""
+    return ValidationCheck(
+      name,
+      frozenset({artifacts, targets, "applies_to_ids"}),
+      lambda s, units: self._validate_change_relations(
+        units,
+        s[targets],
+        applies_to_ids=s["applies_to_ids"],
+        expected_type=expected_type,
+      ),
+      units=_values(artifacts),
+    )
+
+  def _kind_check(
+    self,
+    name: str,
+    model_cls: type[BaseModel],
+    label: str,
+    files: str,
+  ) -> ValidationCheck:
+    """Check the frontmatter of the *files* input against *model_cls*."""
+    return ValidationCheck(
+      name,
+      frozenset({files}),
+      lambda s, units: self._validate_kind_frontmatter(s, model_cls, label, units),
+      units=_listed(files),
+    )
+
+  def _validate_requirement_links(
+    self,
+    snapshot: WorkspaceSnapshot,
+    records: Iterable[tuple[str, Any]],
+  ) -> None:
+    delta_ids = snapshot["deltas"]
+    revision_ids = snapshot["revisions"]
+    audit_ids = snapshot["audits"]
+    for req_id, record in records:
       for delta_id in record.implemented_by:
         if delta_id not in delta_ids:
           self._error(
@@ -168,76 +327,6 @@ class WorkspaceValidator:
       #   # Check if >30 days since introduced
       #   pass
 
-    # Change artifact relation checks
-    self._validate_change_relations(
-      delta_registry.values(),
-      requirement_ids | backlog_ids,
-      applies_to_ids=applies_to_ids,
-      expected_type="implements",
-    )
-    self._validate_change_relations(
-      revision_registry.values(),
-      requirement_ids,
-      applies_to_ids=applies_to_ids,
-      expected_type="introduces",
-    )
-    self._validate_change_relations(
-      audit_registry.values(),
-      requirement_ids,
-      applies_to_ids=applies_to_ids,
-      expected_type="verifies",
-    )
-
-    # Decision (ADR) validation
-    self._validate_decision_references(decisions, decision_ids)
-    self._validate_decision_status_compatibility(decisions)
-
-    # Spec taxonomy validation (warn-only)
-    self._validate_spec_taxonomy()
-
-    # Audit disposition and gate coverage (DE-079 phase 3)
-    self._validate_audit_disposition(audit_registry)
-    self._validate_audit_gate_coverage(delta_registry)
-
-    # Cross-artifact unresolved reference check (DE-097)
-    self._validate_unresolved_references()
-
-    # Phase status validation (DE-104)
-    self._validate_phase_statuses()
-
-    # Delta block schema validation (DE-138 P04 — DEC-138-14)
-    self._validate_delta_blocks(delta_registry)
-
-    # Spec block schema validation (DE-139 P04)
-    self._validate_spec_blocks()
-
-    # Spec requirements block validation (DE-140 P03)
-    self._validate_spec_requirements_blocks()
-
-    # Kind-aware frontmatter validation (DE-112)
-    memory_dir = get_memory_dir(self.workspace.root)
-    backlog_dir = get_backlog_dir(self.workspace.root)
-    drift_dir = get_drift_dir(self.workspace.root)
-    self._validate_kind_frontmatter(
-      MemoryRecord,
-      "Memory",
-      [memory_dir],
-      glob="mem.*.md",
-    )
-    self._validate_kind_frontmatter(
-      BacklogItem,
-      "Backlog",
-      [backlog_dir / d for d in ("issues", "problems", "improvements", "risks")],
-    )
-    self._validate_kind_frontmatter(
-      DriftLedger,
-      "Drift",
-      [drift_dir],
-      glob="DL-*.md",
-    )
-
-    return list(self.issues)
-
   # --------------------------------------------------------------
   def _validate_change_relations(
     self,
@@ -286,7 +375,8 @@ class WorkspaceValidator:
 
   def _validate_delta_blocks(
     self,
-    delta_registry: dict[str, ChangeArtifact],
+    snapshot: WorkspaceSnapshot,
+    deltas: Iterable[tuple[str, ChangeArtifact]],
   ) -> None:
     """Validate per-delta context_inputs and risk_register block schemas.
 
@@ -295,9 +385,9 @@ class WorkspaceValidator:
     reported by the underlying ``MetadataValidator`` so warnings stay warnings
     unless ``--strict`` promotes them at the exit-code layer.
     """
-    for delta_id, artifact in delta_registry.items():
+    for delta_id, artifact in deltas:
       try:
-        _, body = load_markdown_file(artifact.path)
+        _, body = snapshot.markdown(artifact.path)
       except (OSError, ValueError):
         continue
 
@@ -327,7 +417,7 @@ class WorkspaceValidator:
         ):
           self._block_issue(delta_id, "risk_register", err)
 
-  def _validate_spec_blocks(self) -> None:
+  def _validate_spec_blocks(self, specs: Iterable[Spec]) -> None:
     """Validate per-spec concerns, hypotheses, and decisions block schemas.
 
     Mirrors ``_validate_delta_blocks`` for spec-kind artefacts.
@@ -337,7 +427,7 @@ class WorkspaceValidator:
       ("hypotheses", extract_spec_hypotheses, SPEC_HYPOTHESES_VALIDATOR),
       ("decisions", extract_spec_decisions, SPEC_DECISIONS_VALIDATOR),
     )
-    for spec in self.workspace.specs.all_specs():
+    for spec in specs:
       body = spec.body
       for label, extractor, validator in block_defs:
         try:
@@ -353,14 +443,14 @@ class WorkspaceValidator:
           ):
             self._block_issue(spec.id, label, err)
 
-  def _validate_spec_requirements_blocks(self) -> None:
+  def _validate_spec_requirements_blocks(self, specs: Iterable[Spec]) -> None:
     """Validate per-spec requirements block schemas (DE-140 P03).
 
     Follows ``_validate_spec_blocks`` pattern: extract → schema validate →
     semantic checks. Adds spec field cross-validation and strict-mode
     trimmed-empty/blank-item rejection per DR-140 §7.
     """
-    for spec in self.workspace.specs.all_specs():
+    for spec in specs:
       body = spec.body
       try:
         block = extract_spec_requirements(body)
@@ -435,19 +525,16 @@ class WorkspaceValidator:
       self._error(artifact, message)
 
   def _error(self, artifact: str, message: str) -> None:
-    self.issues.append(
-      ValidationIssue(level="error", artifact=artifact, message=message),
-    )
+    self._emit(ValidationIssue(level="error", artifact=artifact, message=message))
 
   def _warning(self, artifact: str, message: str) -> None:
-    self.issues.append(
-      ValidationIssue(level="warning", artifact=artifact, message=message),
-    )
+    self._emit(ValidationIssue(level="warning", artifact=artifact, message=message))
 
   def _info(self, artifact: str, message: str) -> None:
-    self.issues.append(
-      ValidationIssue(level="info", artifact=artifact, message=message),
-    )
+    self._emit(ValidationIssue(level="info", artifact=artifact, message=message))
+
+  def _emit(self, issue: ValidationIssue) -> None:
+    self.issues.append(issue)
 
   def _validate_decision_references(
     self,
@@ -490,7 +577,8 @@ class WorkspaceValidator:
 
   def _validate_audit_disposition(
     self,
-    audit_registry: dict[str, ChangeArtifact],
+    snapshot: WorkspaceSnapshot,
+    audits: Iterable[tuple[str, ChangeArtifact]],
   ) -> None:
     """Validate finding dispositions in completed audits.
 
@@ -505,11 +593,11 @@ class WorkspaceValidator:
     """
     emit_strict = self._error if self.strict else self._warning
 
-    for audit_id, audit in audit_registry.items():
+    for audit_id, audit in audits:
       if audit.status != "completed":
         continue
 
-      fm, body = load_markdown_file(audit.path)
+      fm, body = snapshot.markdown(audit.path)
       findings = load_audit_findings(body, fm=fm)
       seen_ids: set[str] = set()
 
@@ -589,7 +677,8 @@ class WorkspaceValidator:
 
   def _validate_audit_gate_coverage(
     self,
-    delta_registry: dict[str, ChangeArtifact],
+    snapshot: WorkspaceSnapshot,
+    deltas: Iterable[tuple[str, ChangeArtifact]],
   ) -> None:
     """Validate audit gate coverage for qualifying deltas.
 
@@ -597,10 +686,10 @@ class WorkspaceValidator:
     conformance audit exists → warning. If multiple audits have
     colliding finding IDs → warning.
     """
-    audit_by_delta = self._build_conformance_audit_index()
+    audit_by_delta = snapshot["conformance_audits"]
 
-    for delta_id, delta in delta_registry.items():
-      fm, _ = load_markdown_file(delta.path)
+    for delta_id, delta in deltas:
+      fm, _ = snapshot.markdown(delta.path)
       gate = resolve_audit_gate(
         fm.get("audit_gate"),
         delta.applies_to.get("requirements", []),
@@ -617,22 +706,6 @@ class WorkspaceValidator:
       elif len(matching) > 1:
         self._check_finding_id_collisions(delta_id, matching)
 
-  def _build_conformance_audit_index(
-    self,
-  ) -> dict[str, list[tuple[str, dict, str]]]:
-    """Index completed conformance audits by delta_ref."""
-    result: dict[str, list[tuple[str, dict, str]]] = {}
-    for audit_id, audit in self.workspace.audit_registry.collect().items():
-      if audit.status != "completed":
-        continue
-      fm, body = load_markdown_file(audit.path)
-      if fm.get("mode") != AUDIT_MODE_CONFORMANCE:
-        continue
-      delta_ref = fm.get("delta_ref")
-      if delta_ref:
-        result.setdefault(delta_ref, []).append((audit_id, fm, body))
-    return result
-
   def _check_finding_id_collisions(
     self,
     delta_id: str,
@@ -656,13 +729,13 @@ class WorkspaceValidator:
         else:
           seen[fid] = audit_id
 
-  def _validate_spec_taxonomy(self) -> None:
+  def _validate_spec_taxonomy(self, specs: Iterable[Spec]) -> None:
     """Warn when tech specs are missing taxonomy or have inconsistent values.
 
     Scoped to tech specs (SPEC-*) only. PROD specs are excluded.
     Emits warnings only — never errors.
     """
-    for spec in self.workspace.specs.all_specs():
+    for spec in specs:
       if spec.kind != "spec":
         continue
 
@@ -734,31 +807,27 @@ class WorkspaceValidator:
   # Phase status validation (DE-104)
   # -----------------------------------------------------------
 
-  def _validate_phase_statuses(self) -> None:
+  def _validate_phase_statuses(
+    self,
+    snapshot: WorkspaceSnapshot,
+    phase_files: Iterable[Path],
+  ) -> None:
     """Validate phase frontmatter statuses across all delta bundles."""
-    deltas_dir = get_deltas_dir(self.workspace.root)
-    if not deltas_dir.exists():
-      return
     valid = get_enum_values("phase.status")
     if valid is None:
       return  # pragma: no cover — defensive; enum should always exist
-    for delta_dir in sorted(deltas_dir.iterdir()):
-      if not delta_dir.is_dir():
-        continue
-      phases_dir = delta_dir / "phases"
-      if not phases_dir.is_dir():
-        continue
-      for phase_file in sorted(phases_dir.glob("phase-[0-9][0-9].md")):
-        self._validate_single_phase(phase_file, valid)
+    for phase_file in phase_files:
+      self._validate_single_phase(snapshot, phase_file, valid)
 
   def _validate_single_phase(
     self,
+    snapshot: WorkspaceSnapshot,
     phase_file: Path,
     valid_statuses: list[str],
   ) -> None:
     """Validate a single phase file's frontmatter and structure."""
     try:
-      fm, _ = load_markdown_file(phase_file)
+      fm, body = snapshot.markdown(phase_file)
     except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
       self._warning(str(phase_file.name), "Could not parse frontmatter")
       return
@@ -789,11 +858,9 @@ class WorkspaceValidator:
     has_canonical_frontmatter = fm.get("plan") and fm.get("delta")
     if has_canonical_frontmatter:
       self._validate_phase_frontmatter(fm, artifact)
-    else:
+    elif "supekku:phase.overview" not in body:
       # Legacy: require overview block
-      content = phase_file.read_text(encoding="utf-8")
-      if "supekku:phase.overview" not in content:
-        self._warning(artifact, "Missing phase.overview block")
+      self._warning(artifact, "Missing phase.overview block")
 
   def _validate_phase_frontmatter(
     self,
@@ -816,35 +883,31 @@ class WorkspaceValidator:
 
   def _validate_kind_frontmatter(
     self,
+    snapshot: WorkspaceSnapshot,
     model_cls: type[BaseModel],
     label: str,
-    directories: Iterable[Path],
-    glob: str = "*.md",
+    files: Iterable[Path],
   ) -> None:
     """Validate frontmatter files against a Pydantic model.
 
-    Walks *directories*, globs for *glob*, parses frontmatter, and
-    attempts ``model_cls(**fm)``.  Failures emit a warning using *label*
-    (e.g. "Memory", "Backlog", "Drift").
+    Parses each of *files* and attempts ``model_cls(**fm)``.  Failures
+    emit a warning using *label* (e.g. "Memory", "Backlog", "Drift").
     """
-    for directory in directories:
-      if not directory.is_dir():
+    for md_file in files:
+      try:
+        fm, _ = snapshot.markdown(md_file)
+      except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+        self._warning(md_file.name, "Could not parse frontmatter")
         continue
-      for md_file in sorted(directory.glob(glob)):
+      if fm:
+        artifact = fm.get("id", md_file.name)
         try:
-          fm, _ = load_markdown_file(md_file)
-        except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
-          self._warning(md_file.name, "Could not parse frontmatter")
-          continue
-        if fm:
-          artifact = fm.get("id", md_file.name)
-          try:
-            model_cls(**fm)
-          except Exception:  # noqa: BLE001
-            self._warning(
-              artifact,
-              f"{label} frontmatter failed Pydantic validation",
-            )
+          model_cls(**fm)
+        except Exception:  # noqa: BLE001
+          self._warning(
+            artifact,
+            f"{label} frontmatter failed Pydantic validation",
+          )
 
 
 def validate_workspace(
@@ -856,7 +919,10 @@ def validate_workspace(
 ) -> list[ValidationIssue]:
   """Validate the given workspace and return a list of validation issues."""
   validator = WorkspaceValidator(
-    workspace, strict=strict, fix=fix, accept_tolerated=accept_tolerated
+    workspace,
+    strict=strict,
+    fix=fix,
+    accept_tolerated=accept_tolerated,
   )
   return validator.validate()
 
@@ -883,6 +949,7 @@ def check_requirements_migration_complete(
 
 
 __all__ = [
+  "ValidationCheck",
   "ValidationIssue",
   "WorkspaceValidator",
   "check_requirements_migration_complete",
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import os
 import unittest
+from collections import Counter
 from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
 
 from supekku.scripts.lib.backlog.registry import sync_backlog_registry
 from supekku.scripts.lib.core.paths import (
@@ -24,7 +26,11 @@ from supekku.scripts.lib.core.spec_utils import (
 )
 from supekku.scripts.lib.relations.manager import add_relation
 from supekku.scripts.lib.test_base import RepoTestCase
-from supekku.scripts.lib.validation.validator import validate_workspace
+from supekku.scripts.lib.validation import snapshot as snapshot_module
+from supekku.scripts.lib.validation.validator import (
+  WorkspaceValidator,
+  validate_workspace,
+)
 from supekku.scripts.lib.workspace import Workspace
 
 if TYPE_CHECKING:
@@ -1772,5 +1778,67 @@ class TestSpecBlockStrictEnforcementVTDE139FLIP001(WorkspaceValidatorTest):
     assert any("is required" in i.message for i in block_errors), block_errors
 
 
+class SnapshotValidationTest(WorkspaceValidatorTest):
+  """Checks share one snapshot and are timed individually."""
+
+  def _create_busy_repo(self) -> Path:
+    """Several artefacts per check, each carrying diagnostics."""
+    root = self._create_repo()
+    for n in range(6):
+      self._write_spec(root, f"SPEC-{700 + n}", "FR-001")
+      self._write_delta(root, f"DE-{700 + n}", f"SPEC-{700 + n}.FR-404")
+      self._write_completed_audit(
+        root,
+        f"AUD-{700 + n}",
+        delta_ref=f"DE-{700 + n}",
+        findings=[{"id": "FIND-001", "outcome": "drift"}],
+      )
+    mem_dir = root / SPEC_DRIVER_DIR / "memory"
+    mem_dir.mkdir(parents=True)
+    for n in range(6):
+      dump_markdown_file_update(
+        mem_dir / f"mem.fact.m{n}.md",
+        {"id": f"mem.fact.m{n}", "name": "m", "tags": "not-a-list"},
+        "# Memory\n",
+      )
+    return root
+
+  def test_repeat_runs_report_same_issues(self) -> None:
+    """A second run on the same validator reports the same issues."""
+    validator = WorkspaceValidator(Workspace(self._create_busy_repo()), strict=True)
+
+    first = validator.validate()
+
+    assert len(first) > 20
+    assert validator.validate() == first
+
+  def test_timings_cover_every_check(self) -> None:
+    """Each declared check gets a timing entry."""
+    validator = WorkspaceValidator(Workspace(self._create_busy_repo()))
+
+    validator.validate()
+
+    assert list(validator.timings) == [c.name for c in validator.checks()]
+    assert all(t >= 0 for t in validator.timings.values())
+
+  def test_each_file_parsed_once(self) -> None:
+    """Checks reading the same delta or audit file share one parse."""
+    ws = Workspace(self._create_busy_repo())
+    ws.delta_registry.collect()
+    ws.audit_registry.collect()
+
+    with patch.object(
+      snapshot_module,
+      "load_markdown_file",
+      wraps=snapshot_module.load_markdown_file,
+    ) as load_spy:
+      validate_workspace(ws)
+
+    parsed = Counter(call.args[0].name for call in load_spy.call_args_list)
+    assert parsed["DE-700.md"] == 1
+    assert parsed["AUD-700.md"] == 1
+    assert max(parsed.values()) == 1
+
+
 if __name__ == "__main__":
   unittest.main()
@@ -8,7 +8,6 @@ Design authority: DR-102 §7.
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
 import yaml
@@ -17,21 +16,7 @@ from supekku.scripts.lib.blocks.workflow_metadata import (
   NOTES_BRIDGE_MARKER,
   PHASE_BRIDGE_MARKER,
 )
-
-# ---------------------------------------------------------------------------
-# Extraction patterns
-# ---------------------------------------------------------------------------
-
-_NOTES_BRIDGE_PATTERN = re.compile(
-  r"```(?:yaml|yml)\s+" + re.escape(NOTES_BRIDGE_MARKER) + r"\n(.*?)```",
-  re.DOTALL,
-)
-
-_PHASE_BRIDGE_PATTERN = re.compile(
-  r"```(?:yaml|yml)\s+" + re.escape(PHASE_BRIDGE_MARKER) + r"\n(.*?)```",
-  re.DOTALL,
-)
-
+from supekku.scripts.lib.blocks.yaml_utils import scan_blocks
 
 # ---------------------------------------------------------------------------
 # Extraction
@@ -43,10 +28,9 @@ def extract_phase_bridge(text: str) -> dict[str, Any] | None:
 
   Returns parsed dict or None if no block found.
   """
-  match = _PHASE_BRIDGE_PATTERN.search(text)
-  if not match:
+  raw = scan_blocks(text).raw(PHASE_BRIDGE_MARKER)
+  if raw is None:
     return None
-  raw = match.group(1)
   try:
     data = yaml.safe_load(raw)
   except yaml.YAMLError:
@@ -61,10 +45,9 @@ def extract_notes_bridge(text: str) -> dict[str, Any] | None:
 
   Returns parsed dict or None if no block found.
   """
-  match = _NOTES_BRIDGE_PATTERN.search(text)
-  if not match:
+  raw = scan_blocks(text).raw(NOTES_BRIDGE_MARKER)
+  if raw is None:
     return None
-  raw = match.group(1)
   try:
     data = yaml.safe_load(raw)
   except yaml.YAMLError:
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .changes.registry import ChangeRegistry
 from .core.paths import (
@@ -22,9 +23,75 @@ from .specs.registry import SpecRegistry
 from .standards.registry import StandardRegistry
 
 if TYPE_CHECKING:
+  from collections.abc import Callable, Mapping
   from pathlib import Path
 
 
+@dataclass(frozen=True)
+class _SyncTask:
+  """One step of ``sync_all_registries``.
+
+  ``run`` receives the results of the steps named in ``after``.
+  """
+
+  name: str
+  run: Callable[[Mapping[str, Any]], Any]
+  after: tuple[str, ...] = ()
+
+
+def _run_sync_tasks(
+  tasks: list[_SyncTask],
+  *,
+  max_workers: int | None = None,
+) -> dict[str, Any]:
+  """Run *tasks* on a thread pool, each as soon as its dependencies finish.
+
+  After the first failure no further tasks are started; the exception is
+  re-raised once the tasks already running have settled.
+
+  Returns:
+    Mapping of task name to its return value.
+
+  Raises:
+    ValueError: If a dependency is unknown or cyclic.
+  """
+  results: dict[str, Any] = {}
+  pending = {task.name: task for task in tasks}
+  running: dict[Future[Any], str] = {}
+  error: BaseException | None = None
+
+  with ThreadPoolExecutor(
+    max_workers=max_workers,
+    thread_name_prefix="spec-driver-sync",
+  ) as pool:
+    while pending or running:
+      if error is None:
+        ready = [
+          task for task in pending.values() if all(dep in results for dep in task.after)
+        ]
+        for task in ready:
+          del pending[task.name]
+          future = pool.submit(task.run, {dep: results[dep] for dep in task.after})
+          running[future] = task.name
+      if not running:
+        if error is not None:
+          break
+        msg = f"Unsatisfiable sync dependencies: {sorted(pending)}"
+        raise ValueError(msg)
+      done, _ = wait(running, return_when=FIRST_COMPLETED)
+      for future in done:
+        name = running.pop(future)
+        exc = future.exception()
+        if exc is not None:
+          error = error or exc
+        else:
+          results[name] = future.result()
+
+  if error is not None:
+    raise error
+  return results
+
+
 @dataclass
 class Workspace:
   """Unified facade over project registries."""
@@ -60,6 +127,13 @@ class Workspace:
       self._specs = SpecRegistry(self.root)
     return self._specs
 
+  def _load_specs(self) -> SpecRegistry:
+    """Load the spec registry, reloading an existing one in place."""
+    if self._specs is None:
+      return self.specs
+    self._specs.reload()
+    return self._specs
+
   def reload_specs(self) -> None:
     """Reload spec registry from disk."""
     if self._specs is not None:
@@ -79,17 +153,24 @@ class Workspace:
       )
     return self._requirements
 
-  def sync_requirements(self) -> None:
-    """Synchronize requirements registry from specs and changes."""
+  def sync_requirements(self, *, incremental: bool = False) -> None:
+    """Synchronize requirements registry from specs and changes.
+
+    Args:
+      incremental: Re-read only sources changed since the last sync, and
+        leave the registry file untouched when none did.
+    """
     registry = self.requirements
-    registry.sync(
+    stats = registry.sync(
       [get_tech_specs_dir(self.root), get_product_specs_dir(self.root)],
       spec_registry=self.specs,
       delta_dirs=[get_deltas_dir(self.root)],
       revision_dirs=[get_revisions_dir(self.root)],
       audit_dirs=[get_audits_dir(self.root)],
+      incremental=incremental,
     )
-    registry.save()
+    if not incremental or stats.sources_changed:
+      registry.save()
 
   # Decisions --------------------------------------------------
   @property
@@ -206,26 +287,74 @@ class Workspace:
         msg = f"Unsupported change registry kind: {kind}"
         raise ValueError(msg)
 
-  def sync_all_registries(self) -> None:
+  def sync_all_registries(self, *, max_workers: int | None = None) -> None:
     """Synchronize all registries in the workspace.
 
     This is the central sync method that should be used when all registries
     need to be updated (e.g., before validation, after major changes).
 
-    Syncs in order:
-    1. Specs (reload from disk)
-    2. Decisions/ADRs (sync symlinks)
-    3. Policies (sync to YAML)
-    4. Standards (sync to YAML)
-    5. Change registries (deltas, revisions, audits)
-    6. Requirements (sync from specs and changes)
+    Each registry is collected exactly once and independent steps run
+    concurrently on a thread pool:
+
+    1. Specs reload; decisions, policies and standards collect; deltas,
+       revisions and audits sync — all independent of each other
+    2. Decisions/ADRs write and symlinks (needs decisions)
+    3. Policies write (needs decisions, policies)
+    4. Standards write (needs decisions, policies, standards)
+    5. Requirements sync (needs specs and the change registries)
+
+    Args:
+      max_workers: Thread pool size; ``1`` runs the steps sequentially.
     """
-    self.reload_specs()
-    self.sync_decisions()
-    self.sync_policies()
-    self.sync_standards()
-    self.sync_change_registries()
-    self.sync_requirements()
+    # Instantiate lazily-created registries before any worker touches them
+    # (specs load on construction, so that happens on the pool instead).
+    decisions = self.decisions
+    policies = self.policies
+    standards = self.standards
+    changes = {
+      "deltas": self.delta_registry,
+      "revisions": self.revision_registry,
+      "audits": self.audit_registry,
+    }
+
+    tasks = [
+      _SyncTask("specs", lambda _: self._load_specs()),
+      _SyncTask("decisions", lambda _: decisions.collect()),
+      _SyncTask("policies", lambda _: policies.collect()),
+      _SyncTask("standards", lambda _: standards.collect()),
+      *(
+        _SyncTask(name, lambda _, registry=registry: registry.sync())
+        for name, registry in changes.items()
+      ),
+      _SyncTask(
+        "write_decisions",
+        lambda r: decisions.sync_with_symlinks(decisions=r["decisions"]),
+        after=("decisions",),
+      ),
+      _SyncTask(
+        "write_policies",
+        lambda r: policies.sync(
+          decision_sources=r["decisions"],
+          policies=r["policies"],
+        ),
+        after=("decisions", "policies"),
+      ),
+      _SyncTask(
+        "write_standards",
+        lambda r: standards.sync(
+          decision_sources=r["decisions"],
+          policy_sources=r["policies"],
+          standards=r["standards"],
+        ),
+        after=("decisions", "policies", "standards"),
+      ),
+      _SyncTask(
+        "requirements",
+        lambda _: self.sync_requirements(),
+        after=("specs", *changes),
+      ),
+    ]
+    _run_sync_tasks(tasks, max_workers=max_workers)
 
 
 __all__ = ["Workspace"]
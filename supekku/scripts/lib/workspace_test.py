@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import os
+import threading
 import unittest
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import yaml
 
@@ -19,8 +21,9 @@ from supekku.scripts.lib.core.paths import (
 )
 from supekku.scripts.lib.core.spec_utils import dump_markdown_file_update
 from supekku.scripts.lib.decisions.registry import DecisionRegistry
+from supekku.scripts.lib.policies.registry import PolicyRegistry
 from supekku.scripts.lib.test_base import RepoTestCase
-from supekku.scripts.lib.workspace import Workspace
+from supekku.scripts.lib.workspace import Workspace, _run_sync_tasks, _SyncTask
 
 if TYPE_CHECKING:
   from pathlib import Path
@@ -351,6 +354,112 @@ applies_to:
     req_uid = "SPEC-200.FR-200"
     assert req_uid in ws.requirements.records
 
+  def _write_governance(self, root: Path) -> None:
+    """Write an ADR referencing a policy and a standard, plus both targets."""
+    base = root / SPEC_DRIVER_DIR
+    for subdir, name, body in (
+      (
+        DECISIONS_SUBDIR,
+        "ADR-099-test.md",
+        "id: ADR-099\ntitle: Test\nstatus: accepted\n"
+        "policies: [POL-001]\nstandards: [STD-001]",
+      ),
+      (POLICIES_SUBDIR, "POL-001-p.md", "id: POL-001\ntitle: P\nstatus: required"),
+      (STANDARDS_SUBDIR, "STD-001-s.md", "id: STD-001\ntitle: S\nstatus: default"),
+    ):
+      (base / subdir).mkdir(parents=True, exist_ok=True)
+      (base / subdir / name).write_text(f"---\n{body}\n---\n# T\n", encoding="utf-8")
+    get_registry_dir(root).mkdir(parents=True, exist_ok=True)
+
+  def test_sync_all_registries_collects_each_registry_once(self) -> None:
+    """Decisions and policies are parsed once and shared with dependants."""
+    root = self._create_repo()
+    self._write_spec(root)
+    self._write_governance(root)
+
+    with (
+      patch.object(
+        DecisionRegistry, "collect", autospec=True, side_effect=DecisionRegistry.collect
+      ) as decisions_collect,
+      patch.object(
+        PolicyRegistry, "collect", autospec=True, side_effect=PolicyRegistry.collect
+      ) as policies_collect,
+    ):
+      Workspace(root).sync_all_registries()
+
+    assert decisions_collect.call_count == 1
+    assert policies_collect.call_count == 1
+
+    registry_dir = get_registry_dir(root)
+    policies = yaml.safe_load((registry_dir / "policies.yaml").read_text())
+    standards = yaml.safe_load((registry_dir / "standards.yaml").read_text())
+    assert policies["policies"]["POL-001"]["backlinks"] == {"decisions": ["ADR-099"]}
+    assert standards["standards"]["STD-001"]["backlinks"] == {"decisions": ["ADR-099"]}
+    assert (root / SPEC_DRIVER_DIR / DECISIONS_SUBDIR / "accepted").is_dir()
+
+  def test_sync_all_registries_sequential_matches_parallel(self) -> None:
+    """A single worker produces the same registry files."""
+    root = self._create_repo()
+    self._write_spec(root)
+    self._write_governance(root)
+    registry_dir = get_registry_dir(root)
+
+    Workspace(root).sync_all_registries()
+    parallel = {p.name: p.read_text() for p in registry_dir.glob("*.yaml")}
+    for path in registry_dir.glob("*.yaml"):
+      path.unlink()
+    Workspace(root).sync_all_registries(max_workers=1)
+    sequential = {p.name: p.read_text() for p in registry_dir.glob("*.yaml")}
+
+    assert sequential == parallel
+
+
+class RunSyncTasksTest(unittest.TestCase):
+  """Test cases for the dependency-aware sync scheduler."""
+
+  def test_dependants_receive_upstream_results(self) -> None:
+    results = _run_sync_tasks(
+      [
+        _SyncTask("sum", lambda r: r["a"] + r["b"], after=("a", "b")),
+        _SyncTask("a", lambda _: 1),
+        _SyncTask("b", lambda _: 2),
+      ]
+    )
+
+    assert results == {"a": 1, "b": 2, "sum": 3}
+
+  def test_independent_tasks_run_concurrently(self) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+    results = _run_sync_tasks(
+      [
+        _SyncTask("a", lambda _: barrier.wait() is not None),
+        _SyncTask("b", lambda _: barrier.wait() is not None),
+      ],
+      max_workers=2,
+    )
+
+    assert results == {"a": True, "b": True}
+
+  def test_failure_stops_dependants_and_propagates(self) -> None:
+    ran: list[str] = []
+
+    def _boom(_: object) -> None:
+      msg = "boom"
+      raise RuntimeError(msg)
+
+    with self.assertRaisesRegex(RuntimeError, "boom"):
+      _run_sync_tasks(
+        [
+          _SyncTask("a", _boom),
+          _SyncTask("b", lambda _: ran.append("b"), after=("a",)),
+        ]
+      )
+    assert ran == []
+
+  def test_unknown_dependency_raises(self) -> None:
+    with self.assertRaisesRegex(ValueError, "Unsatisfiable"):
+      _run_sync_tasks([_SyncTask("a", lambda _: None, after=("missing",))])
+
 
 if __name__ == "__main__":
   unittest.main()
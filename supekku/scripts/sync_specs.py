@@ -43,6 +43,7 @@ from supekku.scripts.lib.core.spec_utils import (  # type: ignore
 from supekku.scripts.lib.registry_v2 import RegistryV2  # type: ignore
 from supekku.scripts.lib.specs.index import SpecIndexBuilder  # type: ignore
 from supekku.scripts.lib.sync.engine import SpecSyncEngine  # type: ignore
+from supekku.scripts.lib.sync.executor import map_units  # type: ignore
 from supekku.scripts.lib.sync.models import SourceUnit  # type: ignore
 
 
@@ -197,6 +198,91 @@ class MultiLanguageSpecManager:
 
     Create spec, update registry, generate docs.
     """
+    return self.process_source_units(
+      [source_unit],
+      adapter,
+      check_mode=check_mode,
+      dry_run=dry_run,
+      generate_contracts=generate_contracts,
+      create_specs=create_specs,
+    )[0]
+
+  def process_source_units(
+    self,
+    source_units,
+    adapter,
+    *,
+    check_mode: bool = False,
+    dry_run: bool = False,
+    generate_contracts: bool = True,
+    create_specs: bool = True,
+    jobs: int | None = 1,
+  ) -> list[dict]:
+    """Process source units, generating contracts on up to *jobs* threads.
+
+    Spec creation and registry updates run first, serially and in input
+    order, so spec IDs are allocated exactly as in a sequential run. Contract
+    generation — the external toolchain calls — then fans out across the
+    worker pool.
+
+    Returns:
+      One result dict per unit, in the order of *source_units*.
+    """
+    units = list(source_units)
+    results = [
+      self._prepare_source_unit(
+        unit,
+        adapter,
+        check_mode=check_mode,
+        dry_run=dry_run,
+        generate_contracts=generate_contracts,
+        create_specs=create_specs,
+      )
+      for unit in units
+    ]
+    pending = [index for index, result in enumerate(results) if not result["skipped"]]
+
+    if generate_contracts and not dry_run:
+      outcomes = map_units(
+        lambda index: self._generate_contracts(units[index], adapter, check_mode),
+        pending,
+        jobs=jobs,
+      )
+      # Staging parents are shared between Python units; prune them only
+      # once no worker can be creating a sibling staging directory.
+      for unit in units:
+        if unit.language == "python":
+          contracts_root = unit.root / ".contracts"
+          self._prune_staging_parents(
+            python_staging_dir(unit.identifier, contracts_root),
+            contracts_root,
+          )
+      for outcome in outcomes:
+        result = results[outcome.unit]
+        if outcome.error is None:
+          result["doc_variants"] = outcome.value
+        elif isinstance(outcome.error, (OSError, ValueError, RuntimeError)):
+          result["skipped"] = True
+          result["reason"] = str(outcome.error)
+        else:
+          raise outcome.error
+
+    for index in pending:
+      if not results[index]["skipped"]:
+        results[index]["processed"] = True
+    return results
+
+  def _prepare_source_unit(
+    self,
+    source_unit,
+    adapter,
+    *,
+    check_mode: bool,
+    dry_run: bool,
+    generate_contracts: bool,
+    create_specs: bool,
+  ) -> dict:
+    """Create or locate the unit's spec and register it (serial phase)."""
     result = {
       "processed": False,
       "created": False,
@@ -262,30 +348,7 @@ class MultiLanguageSpecManager:
         if not dry_run:
           self._ensure_source_in_spec(spec_file, source_unit)
 
-      # Contract generation — independent of spec existence
-      if not dry_run:
-        if generate_contracts:
-          contracts_root = source_unit.root / ".contracts"
-          variant_outputs = self._resolve_variant_outputs(
-            source_unit,
-            contracts_root,
-          )
-          doc_variants = adapter.generate(
-            source_unit,
-            variant_outputs=variant_outputs,
-            check=check_mode,
-          )
-
-          if source_unit.language == "python":
-            staging = variant_outputs["_staging_dir"]
-            doc_variants = self._distribute_python_contracts(
-              staging,
-              contracts_root,
-              doc_variants,
-            )
-
-          result["doc_variants"] = doc_variants
-      elif generate_contracts and spec_id:
+      if dry_run and generate_contracts and spec_id:
         # Dry-run with spec: show what doc paths would be created
         spec_dir = self.tech_dir / spec_id
         for variant in descriptor.variants:
@@ -293,8 +356,6 @@ class MultiLanguageSpecManager:
           result["would_create_paths"].append(str(variant_path))
         result["doc_variants"] = descriptor.variants
 
-      result["processed"] = True
-
       return result
 
     except (OSError, ValueError, RuntimeError) as e:
@@ -302,6 +363,33 @@ class MultiLanguageSpecManager:
       result["reason"] = str(e)
       return result
 
+  def _generate_contracts(self, source_unit, adapter, check_mode: bool) -> list:
+    """Generate contract docs for one unit (independent of spec existence).
+
+    Writes only to the unit's own output paths, so it is safe to run on a
+    worker thread alongside other units.
+    """
+    contracts_root = source_unit.root / ".contracts"
+    variant_outputs = self._resolve_variant_outputs(
+      source_unit,
+      contracts_root,
+    )
+    doc_variants = adapter.generate(
+      source_unit,
+      variant_outputs=variant_outputs,
+      check=check_mode,
+    )
+
+    if source_unit.language == "python":
+      staging = variant_outputs["_staging_dir"]
+      doc_variants = self._distribute_python_contracts(
+        staging,
+        contracts_root,
+        doc_variants,
+        prune_parents=False,
+      )
+    return doc_variants
+
   @staticmethod
   def _resolve_variant_outputs(
     source_unit,
@@ -329,6 +417,8 @@ class MultiLanguageSpecManager:
     staging_dir: Path,
     contracts_root: Path,
     doc_variants: list,
+    *,
+    prune_parents: bool = True,
   ) -> list:
     """Distribute staged Python contracts to canonical locations.
 
@@ -337,6 +427,10 @@ class MultiLanguageSpecManager:
     filename suffix, and moves each file to its canonical path under
     contracts_root/<view>/<module-path>.py.md.
 
+    With ``prune_parents=False`` the now-empty shared staging parents are
+    left for :meth:`_prune_staging_parents`, so concurrent units do not
+    remove a directory another unit is about to write into.
+
     Returns updated DocVariant list with canonical paths.
     """
     from supekku.scripts.lib.contracts.mirror import (  # noqa: PLC0415
@@ -408,17 +502,22 @@ class MultiLanguageSpecManager:
 
       if staging_dir.exists():
         shutil.rmtree(staging_dir)
-        # Also remove parent staging dirs if empty
-        parent = staging_dir.parent
-        while parent != contracts_root and parent.exists():
-          try:
-            parent.rmdir()  # only succeeds if empty
-            parent = parent.parent
-          except OSError:
-            break
+      if prune_parents:
+        MultiLanguageSpecManager._prune_staging_parents(staging_dir, contracts_root)
 
     return updated_variants if updated_variants else list(doc_variants)
 
+  @staticmethod
+  def _prune_staging_parents(staging_dir: Path, contracts_root: Path) -> None:
+    """Remove empty staging directories between staging_dir and contracts_root."""
+    parent = staging_dir.parent
+    while parent != contracts_root and parent.exists():
+      try:
+        parent.rmdir()  # only succeeds if empty
+        parent = parent.parent
+      except OSError:
+        break
+
   def rebuild_indices(self) -> None:
     """Rebuild symlink indices."""
     index_builder = SpecIndexBuilder(self.tech_dir)
@@ -221,5 +221,65 @@ class SyncCreatedSpecTaxonomyTest(unittest.TestCase):
     assert frontmatter["c4_level"] == "code"
 
 
+class ProcessSourceUnitsParallelTest(unittest.TestCase):
+  """Parallel contract generation keeps spec allocation deterministic."""
+
+  def setUp(self) -> None:
+    self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+    self.root = Path(self.tmpdir.name)
+    self.tech_dir = self.root / SPEC_DRIVER_DIR / TECH_SPECS_SUBDIR
+    self.tech_dir.mkdir(parents=True)
+    self.registry_path = self.tech_dir / "registry_v2.json"
+    self.registry_path.write_text(
+      json.dumps({"version": 2, "languages": {}}),
+      encoding="utf-8",
+    )
+    self.manager = MultiLanguageSpecManager(self.tech_dir, self.registry_path)
+
+  def tearDown(self) -> None:
+    self.tmpdir.cleanup()
+
+  def test_specs_allocated_in_input_order(self) -> None:
+    """Spec IDs follow input order; generation failures skip only that unit."""
+    units = [
+      SourceUnit(language="go", identifier=f"internal/pkg{i}", root=self.root)
+      for i in range(5)
+    ]
+    adapter = MagicMock()
+    adapter.describe.side_effect = lambda unit: SourceDescriptor(
+      slug_parts=unit.identifier.split("/"),
+      default_frontmatter={
+        "sources": [{"language": "go", "identifier": unit.identifier}],
+      },
+      variants=[],
+    )
+
+    def generate(unit, *, variant_outputs, check=False):
+      if unit.identifier == "internal/pkg2":
+        raise RuntimeError("gomarkdoc failed")
+      return [
+        DocVariant(
+          name="public",
+          path=variant_outputs["public"],
+          hash=unit.identifier,
+          status="created",
+        )
+      ]
+
+    adapter.generate.side_effect = generate
+
+    results = self.manager.process_source_units(units, adapter, jobs=4)
+
+    assert [r["spec_id"] for r in results] == [f"SPEC-{n:03d}" for n in range(1, 6)]
+    assert [r["processed"] for r in results] == [True, True, False, True, True]
+    assert results[2]["reason"] == "gomarkdoc failed"
+    assert [r["doc_variants"][0].hash for r in results if r["processed"]] == [
+      "internal/pkg0",
+      "internal/pkg1",
+      "internal/pkg3",
+      "internal/pkg4",
+    ]
+
+
 if __name__ == "__main__":
   unittest.main()
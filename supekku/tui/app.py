@@ -7,6 +7,7 @@ import logging
 import os
 import subprocess
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from textual.app import App
 from textual.binding import Binding
@@ -21,6 +22,9 @@ from supekku.tui.browser import BrowserScreen
 from supekku.tui.event_listener import EventListener, TrackEvent
 from supekku.tui.track import TrackScreen
 
+if TYPE_CHECKING:
+  from supekku.tui.search.scorer import SearchEngine
+
 logger = logging.getLogger(__name__)
 
 # Directories to watch for artifact changes.
@@ -69,7 +73,7 @@ class SpecDriverApp(App):
     self._listener_task: asyncio.Task | None = None
     self._browser_screen: BrowserScreen | None = None
     self._track_screen: TrackScreen | None = None
-    self._search_index: list | None = None
+    self._search_engine: SearchEngine | None = None
 
   def on_mount(self) -> None:
     """Install screens, start file watcher and event listener."""
@@ -95,20 +99,37 @@ class SpecDriverApp(App):
 
     try:
       async for changes in awatch(self._root, watch_filter=_spec_driver_filter):
-        refreshed: set[ArtifactType] = set()
+        changed: dict[ArtifactType, set[Path]] = {}
         for _change_type, path_str in changes:
-          art_type = path_to_artifact_type(Path(path_str), self._root)
-          if art_type is not None and art_type not in refreshed:
-            refreshed.add(art_type)
-            screen = self.screen
-            if isinstance(screen, BrowserScreen):
-              screen.refresh_snapshot(art_type)
-        self._invalidate_search_index()
+          path = Path(path_str)
+          art_type = path_to_artifact_type(path, self._root)
+          if art_type is not None:
+            changed.setdefault(art_type, set()).add(path)
+        for art_type, paths in changed.items():
+          self._refresh_paths(art_type, paths)
     except asyncio.CancelledError:
       pass
     except Exception:  # noqa: BLE001
       logger.debug("File watcher stopped", exc_info=True)
 
+  def _refresh_paths(self, art_type: ArtifactType, paths: set[Path]) -> None:
+    """Patch the snapshot and search index for changed files of one type.
+
+    Only the changed records are re-read; the search index is patched in
+    place, or dropped when the snapshot had to re-collect the whole type.
+    """
+    if self._snapshot is None:
+      return
+    refresh = self._snapshot.refresh_paths(art_type, paths)
+    if refresh is None:
+      self._invalidate_search_index()
+    elif self._search_engine is not None:
+      self._search_engine.patch(art_type, refresh)
+
+    screen = self.screen
+    if isinstance(screen, BrowserScreen):
+      screen.show_snapshot_changes(art_type)
+
   def action_cycle_status(self) -> None:
     """Cycle the status filter to the next value."""
     try:
@@ -119,17 +140,18 @@ class SpecDriverApp(App):
     except Exception:  # noqa: BLE001
       pass
 
-  def _build_search_index(self) -> list:
-    """Build or return cached search index."""
-    if self._search_index is None:
+  def _build_search_index(self) -> SearchEngine:
+    """Build or return the cached search engine."""
+    if self._search_engine is None:
       from supekku.tui.search.index import build_search_index  # noqa: PLC0415
+      from supekku.tui.search.scorer import SearchEngine  # noqa: PLC0415
 
-      self._search_index = build_search_index(root=self._root)
-    return self._search_index
+      self._search_engine = SearchEngine(build_search_index(root=self._root))
+    return self._search_engine
 
   def _invalidate_search_index(self) -> None:
-    """Clear cached search index so it rebuilds on next open."""
-    self._search_index = None
+    """Clear cached search engine so it rebuilds on next open."""
+    self._search_engine = None
 
   def action_global_search(self) -> None:
     """Open the cross-artifact search overlay (DEC-087-03)."""
@@ -139,7 +161,7 @@ class SpecDriverApp(App):
       if result is not None:
         self.call_later(self.action_navigate_artifact, result.id)
 
-    self.push_screen(SearchOverlay(index=self._build_search_index()), _on_result)
+    self.push_screen(SearchOverlay(engine=self._build_search_index()), _on_result)
 
   def action_focus_search(self) -> None:
     """Focus the per-type search input in the artifact list."""
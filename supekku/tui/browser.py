@@ -174,6 +174,10 @@ class BrowserScreen(Screen):
   def refresh_snapshot(self, art_type: ArtifactType) -> None:
     """Re-collect a single type and update the UI."""
     self._snapshot.refresh(art_type)
+    self.show_snapshot_changes(art_type)
+
+  def show_snapshot_changes(self, art_type: ArtifactType) -> None:
+    """Update the UI after the snapshot's *art_type* entries changed."""
     counts = self._snapshot.counts_by_type()
     type_selector = self.query_one("#type-selector", TypeSelector)
     type_selector.refresh_counts(counts)
@@ -7,9 +7,10 @@ Design reference: DR-087.
 """
 
 from supekku.tui.search.index import SearchEntry, build_search_index
-from supekku.tui.search.scorer import score_entry, search
+from supekku.tui.search.scorer import SearchEngine, score_entry, search
 
 __all__ = [
+  "SearchEngine",
   "SearchEntry",
   "build_search_index",
   "score_entry",
@@ -70,27 +70,30 @@ def build_search_index(*, root: Path) -> list[SearchEntry]:
       logger.debug("Skipping %s: registry load failed", art_type.value, exc_info=True)
       continue
     for _record_id, record in records.items():
-      try:
-        ae = adapt_record(record, art_type)
-      except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
-        logger.debug(
-          "Skipping record in %s: adapt failed",
-          art_type.value,
-          exc_info=True,
-        )
-        continue
-      fields = _extract_searchable_fields(ae, record)
-      targets = _extract_relation_targets(record)
-      entries.append(
-        SearchEntry(
-          entry=ae,
-          searchable_fields=fields,
-          relation_targets=targets,
-        )
-      )
+      search_entry = make_search_entry(record, art_type)
+      if search_entry is not None:
+        entries.append(search_entry)
   return entries
 
 
+def make_search_entry(record: Any, art_type: ArtifactType) -> SearchEntry | None:
+  """Flatten one registry record, or return None if it cannot be adapted."""
+  try:
+    ae = adapt_record(record, art_type)
+  except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+    logger.debug(
+      "Skipping record in %s: adapt failed",
+      art_type.value,
+      exc_info=True,
+    )
+    return None
+  return SearchEntry(
+    entry=ae,
+    searchable_fields=_extract_searchable_fields(ae, record),
+    relation_targets=_extract_relation_targets(record),
+  )
+
+
 def _extract_searchable_fields(ae: ArtifactEntry, record: Any) -> dict[str, str]:
   """Flatten record attributes into a scorer-friendly dict."""
   fields: dict[str, str] = {
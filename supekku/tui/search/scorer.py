@@ -1,16 +1,25 @@
 """Weighted fuzzy scorer for cross-artifact search.
 
-Pure functions — no TUI state, no side effects.
+Pure functions plus :class:`SearchEngine`, a precomputed index for
+per-keystroke search over large workspaces. No TUI state.
 
 Design reference: DR-087 DEC-087-02.
 """
 
 from __future__ import annotations
 
+import heapq
+import re
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from supekku.scripts.lib.core.artifact_view import ArtifactType, PathRefresh
 from supekku.tui.search.index import (
   FIELD_ID,
   FIELD_TITLE,
   SearchEntry,
+  make_search_entry,
 )
 
 # Scoring weights (POL-002: named constants, not magic numbers).
@@ -45,9 +54,11 @@ def _fuzzy_score(query: str, text: str) -> float:
   Otherwise returns a score based on match compactness, contiguity,
   and position.  O(n) per candidate — no combinatorial explosion.
   """
-  q_lower = query.lower()
-  t_lower = text.lower()
+  return _fuzzy_score_lower(query.lower(), text.lower())
+
 
+def _fuzzy_score_lower(q_lower: str, t_lower: str) -> float:
+  """``_fuzzy_score`` on already-lowercased inputs."""
   # Fast path: contiguous substring match.
   sub_pos = t_lower.find(q_lower)
   if sub_pos >= 0:
@@ -115,7 +126,232 @@ def search(
   if not query:
     return []
 
-  scored = [(entry, score_entry(entry, query)) for entry in index]
+  scored = ((entry, score_entry(entry, query)) for entry in index)
   hits = [(e, s) for e, s in scored if s > 0]
-  hits.sort(key=lambda pair: pair[1], reverse=True)
-  return [e for e, _s in hits[:limit]]
+  # nlargest is stable: equal scores keep index order, like a stable sort.
+  top = heapq.nlargest(limit, hits, key=lambda pair: pair[1])
+  return [e for e, _s in top]
+
+
+# ── Precomputed engine ───────────────────────────────────────
+
+# Separates haystacks inside a joined group text; never matched by a query.
+_SEP = "\x00"
+
+
+def _haystacks(entry: SearchEntry) -> list[tuple[float, str]]:
+  """Pre-lowercase every scorable text of *entry* with its weight."""
+  hay = [
+    (_field_weight(name), text.lower())
+    for name, text in entry.searchable_fields.items()
+    if text
+  ]
+  hay.extend((WEIGHT_RELATION_TARGET, t.lower()) for t in entry.relation_targets if t)
+  return hay
+
+
+def _subsequence_pattern(q_lower: str) -> re.Pattern[str]:
+  """Compile a pattern matching the greedy left-to-right subsequence scan.
+
+  Each ``[^c<sep>]*+c`` step possessively skips to the *next* occurrence
+  of ``c`` inside the same haystack — exactly what ``_fuzzy_score``'s
+  ``find(ch, start)`` loop does, without regex backtracking.
+  """
+  parts = [re.escape(q_lower[0])]
+  for ch in q_lower[1:]:
+    esc = re.escape(ch)
+    parts.append(f"[^{esc}{_SEP}]*+{esc}")
+  return re.compile("".join(parts))
+
+
+@dataclass
+class _Group:
+  """All haystacks of one weight, joined into a single searchable string."""
+
+  weight: float
+  text: str
+  starts: list[int]
+  slots: list[int]
+  chars: frozenset[str]
+
+  def haystack_at(self, pos: int) -> int:
+    return bisect_right(self.starts, pos) - 1
+
+
+class SearchEngine:
+  """Precomputed search over a set of :class:`SearchEntry` values.
+
+  Returns exactly what :func:`search` returns — same weights, same
+  scores, same tie order — but is built for per-keystroke use on large
+  indexes:
+
+  - every field and relation target is lowercased once, and all texts of
+    equal weight are joined into one string, so substring and subsequence
+    matching run as single regex scans in C rather than a Python call per
+    field;
+  - weight groups are scanned from heaviest down; scanning stops once
+    *limit* entries hold the best score still reachable (e.g. ID prefix
+    hits), and lighter groups are skipped when their best possible score
+    cannot enter the current top results;
+  - the top *limit* hits are selected with a heap instead of a full sort.
+
+  Matching is subsequence-based, so an n-gram index would wrongly drop
+  scattered matches; the joined-text scan keeps results exact instead.
+  Entries can be patched in place via :meth:`patch` as files change.
+  """
+
+  def __init__(self, entries: Iterable[SearchEntry] = ()) -> None:
+    self._reset(entries)
+
+  def _reset(self, entries: Iterable[SearchEntry]) -> None:
+    self._entries: list[SearchEntry] = []
+    self._haystacks: list[list[tuple[float, str]]] = []
+    self._dead: set[int] = set()
+    self._slots_by_key: dict[tuple[ArtifactType, str], list[int]] = {}
+    self._groups: list[_Group] | None = None
+    for entry in entries:
+      self._add(entry)
+
+  def __len__(self) -> int:
+    return len(self._entries) - len(self._dead)
+
+  @property
+  def entries(self) -> list[SearchEntry]:
+    """Live entries in index order."""
+    return [e for slot, e in enumerate(self._entries) if slot not in self._dead]
+
+  # ── Mutation ─────────────────────────────────────────────
+
+  def _add(self, entry: SearchEntry) -> None:
+    slot = len(self._entries)
+    self._entries.append(entry)
+    self._haystacks.append(_haystacks(entry))
+    key = (entry.entry.artifact_type, entry.entry.id)
+    self._slots_by_key.setdefault(key, []).append(slot)
+    self._groups = None
+
+  def patch(self, art_type: ArtifactType, refresh: PathRefresh) -> None:
+    """Apply a per-path snapshot refresh for *art_type*.
+
+    Entries that were re-read or removed are dropped; re-read records
+    are appended, so they rank after older entries on equal scores.
+    """
+    for artifact_id in refresh.removed | refresh.records.keys():
+      for slot in self._slots_by_key.pop((art_type, artifact_id), []):
+        self._dead.add(slot)
+        self._haystacks[slot] = []
+    for record in refresh.records.values():
+      entry = make_search_entry(record, art_type)
+      if entry is not None:
+        self._add(entry)
+    self._groups = None
+    # Compact once removed slots dominate.
+    if len(self._dead) > len(self) + 64:
+      self._reset(self.entries)
+
+  def _build_groups(self) -> list[_Group]:
+    by_weight: dict[float, tuple[list[str], list[int], list[int]]] = {}
+    for slot, haystacks in enumerate(self._haystacks):
+      for weight, text in haystacks:
+        texts, starts, slots = by_weight.setdefault(weight, ([], [], []))
+        starts.append(starts[-1] + len(texts[-1]) + 1 if texts else 0)
+        texts.append(text)
+        slots.append(slot)
+    groups = []
+    for weight, (texts, starts, slots) in by_weight.items():
+      text = _SEP.join(texts)
+      groups.append(_Group(weight, text, starts, slots, frozenset(text)))
+    groups.sort(key=lambda g: g.weight, reverse=True)
+    return groups
+
+  # ── Query ────────────────────────────────────────────────
+
+  def search(self, query: str, *, limit: int = _DEFAULT_LIMIT) -> list[SearchEntry]:
+    """Return up to *limit* entries with score > 0, best first."""
+    if not query:
+      return []
+    if _SEP in query:
+      return search(query, self.entries, limit=limit)
+    if self._groups is None:
+      self._groups = self._build_groups()
+
+    q_lower = query.lower()
+    q_len = len(q_lower)
+    q_chars = set(q_lower)
+    subsequence = _subsequence_pattern(q_lower) if q_len > 1 else None
+    best: dict[int, float] = {}
+
+    for group in self._groups:
+      ceiling = group.weight * (q_len * _SUBSTRING_BONUS * _PREFIX_BONUS)
+      if len(best) >= limit and ceiling < heapq.nlargest(limit, best.values())[-1]:
+        break  # groups are sorted by weight; none can enter the top results
+      if not q_chars <= group.chars:
+        continue
+      # Entries already scoring above this group's ceiling can't be displaced.
+      settled = sum(1 for v in best.values() if v > ceiling)
+      if self._scan_group(group, q_lower, subsequence, ceiling, limit - settled, best):
+        break
+
+    # Ties break on lower slot first, matching search()'s stable order.
+    top = heapq.nlargest(limit, best.items(), key=lambda kv: (kv[1], -kv[0]))
+    return [self._entries[slot] for slot, _score in top]
+
+  def _scan_group(  # noqa: PLR0913
+    self,
+    group: _Group,
+    q_lower: str,
+    subsequence: re.Pattern[str] | None,
+    ceiling: float,
+    open_places: int,
+    best: dict[int, float],
+  ) -> bool:
+    """Score every haystack of *group* that matches, into *best*.
+
+    Haystacks are scanned in slot order, so once *open_places* entries
+    have hit the group's *ceiling* score no later haystack — in this group
+    or a lighter one — can enter the top results; returns True to stop.
+    """
+    weight = group.weight
+    q_len = len(q_lower)
+    text = group.text
+    matched: set[int] = set()
+    at_ceiling = 0
+
+    # Substring pass: the first occurrence per haystack decides the prefix bonus.
+    pos = text.find(q_lower)
+    while pos >= 0:
+      hay = group.haystack_at(pos)
+      matched.add(hay)
+      raw = q_len * _SUBSTRING_BONUS
+      if pos == group.starts[hay]:
+        raw *= _PREFIX_BONUS
+      slot = group.slots[hay]
+      weighted = weight * raw
+      if weighted > best.get(slot, 0.0):
+        best[slot] = weighted
+        if weighted == ceiling:
+          at_ceiling += 1
+          if at_ceiling >= open_places:
+            return True
+      # Resume at the next haystack; later occurrences here don't count.
+      next_hay = hay + 1
+      if next_hay >= len(group.starts):
+        break
+      pos = text.find(q_lower, group.starts[next_hay])
+
+    if subsequence is None:
+      return False
+    # Subsequence pass for haystacks without a contiguous match.
+    seen: set[int] = set()
+    for match in subsequence.finditer(text):
+      hay = group.haystack_at(match.start())
+      if hay in matched or hay in seen:
+        continue
+      seen.add(hay)
+      span = match.end() - match.start()
+      compactness = q_len / span
+      slot = group.slots[hay]
+      weighted = weight * (q_len * compactness)
+      if weighted > best.get(slot, 0.0):
+        best[slot] = weighted
+    return False
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import random
 import time
+from dataclasses import dataclass
 from pathlib import Path
 
-from supekku.scripts.lib.core.artifact_view import ArtifactEntry, ArtifactType
+from supekku.scripts.lib.core.artifact_view import (
+  ArtifactEntry,
+  ArtifactType,
+  PathRefresh,
+)
 from supekku.tui.search.index import FIELD_ID, FIELD_STATUS, FIELD_TITLE, SearchEntry
 from supekku.tui.search.scorer import (
   WEIGHT_ATTRIBUTE,
   WEIGHT_OWN_ID,
   WEIGHT_RELATION_TARGET,
   WEIGHT_TITLE,
+  SearchEngine,
   _fuzzy_score,
   score_entry,
   search,
@@ -187,3 +194,78 @@ class TestSearch:
     results = search("DE-087", idx)
     ids = [r.entry.id for r in results]
     assert ids[0] == "DE-087"
+
+
+class TestSearchEngine:
+  """SearchEngine matches search() exactly while precomputing (VT-087-003)."""
+
+  @staticmethod
+  def _corpus(n: int = 300) -> list[SearchEntry]:
+    rng = random.Random(87)
+    words = ["search", "index", "delta", "memory", "spec", "graph", "cache", "sync"]
+    return [
+      _se(
+        record_id=f"{rng.choice(['DE', 'ADR', 'SPEC'])}-{i:03d}",
+        title=" ".join(rng.sample(words, 3)).title(),
+        status=rng.choice(["draft", "accepted", "in-progress"]),
+        extra_fields={"tag.0": rng.choice(words)},
+        relation_targets=tuple(f"DE-{rng.randrange(n):03d}" for _ in range(2)),
+      )
+      for i in range(n)
+    ]
+
+  def test_results_identical_to_search(self):
+    corpus = self._corpus()
+    engine = SearchEngine(corpus)
+    for query in ["de", "DE-01", "sx", "Srch", "ADR-1", "graph c", "zzz", "a", "d0"]:
+      assert engine.search(query) == search(query, corpus), query
+      assert engine.search(query, limit=5) == search(query, corpus, limit=5), query
+
+  def test_random_queries_identical_to_search(self):
+    corpus = self._corpus()
+    engine = SearchEngine(corpus)
+    rng = random.Random(3)
+    alphabet = "de-0123 sarchxgpy"
+    for _ in range(300):
+      query = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5)))
+      assert engine.search(query, limit=10) == search(query, corpus, limit=10), query
+
+  def test_empty_query_returns_empty(self):
+    assert SearchEngine([_se()]).search("") == []
+
+  def test_patch_replaces_updated_and_drops_removed(self):
+    @dataclass
+    class _Record:
+      id: str
+      name: str
+      status: str = "draft"
+      path: str = "/tmp/fake.md"
+
+    engine = SearchEngine([_se(record_id="DE-001"), _se(record_id="DE-002")])
+    engine.search("DE-00")  # prime narrowing state
+
+    engine.patch(
+      ArtifactType.DELTA,
+      PathRefresh(
+        records={"DE-001": _Record(id="DE-001", name="Renamed")},
+        removed=frozenset({"DE-002"}),
+      ),
+    )
+
+    assert len(engine) == 1
+    assert [se.entry.title for se in engine.entries] == ["Renamed"]
+    assert [se.entry.id for se in engine.search("DE-00")] == ["DE-001"]
+    assert [se.entry.id for se in engine.search("renamed")] == ["DE-001"]
+
+  def test_large_index_keystroke_latency(self):
+    """Selective queries over 50k entries stay interactive."""
+    corpus = [
+      _se(record_id=f"DE-{i:05d}", title=f"Artifact number {i}") for i in range(50_000)
+    ]
+    engine = SearchEngine(corpus)
+    start = time.perf_counter()
+    for query in ["D", "DE", "DE-", "DE-4", "DE-42", "DE-421"]:
+      engine.search(query)
+    per_keystroke = (time.perf_counter() - start) / 6
+    assert engine.search("DE-42117")[0].entry.id == "DE-42117"
+    assert per_keystroke < 0.5
@@ -22,6 +22,7 @@ from supekku.tui.widgets.preview_panel import PreviewPanel
 from supekku.tui.widgets.session_list import SessionList, SessionSelected
 from supekku.tui.widgets.track_panel import (
   TrackPanel,
+  format_duration,
   format_timestamp,
   session_colour_index,
 )
@@ -211,6 +212,20 @@ class TestFormatTimestamp:
     assert isinstance(result, str)
 
 
+class TestFormatDuration:
+  """Wall time from the profile of a profiled command."""
+
+  def test_milliseconds(self):
+    assert format_duration({"profile": {"wall_ms": 82.6}}) == "83 ms"
+
+  def test_seconds(self):
+    assert format_duration({"profile": {"wall_ms": 1530.0}}) == "1.5 s"
+
+  def test_unprofiled_event_is_blank(self):
+    assert format_duration({"cmd": "list specs"}) == ""
+    assert format_duration({"profile": {"wall_ms": "fast"}}) == ""
+
+
 # --- VT-054-07: Cross-screen navigation (find_entry) ---
 # find_entry unit tests are in artifact_view_test.py::TestFindEntry
 
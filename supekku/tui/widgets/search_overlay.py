@@ -15,8 +15,7 @@ from textual.widgets import DataTable, Input, Static
 
 from supekku.scripts.lib.core.artifact_view import ArtifactEntry
 from supekku.scripts.lib.formatters.theme import styled_text
-from supekku.tui.search.index import SearchEntry
-from supekku.tui.search.scorer import search
+from supekku.tui.search.scorer import SearchEngine
 
 # Column layout for results table.
 _COLUMNS = (
@@ -102,9 +101,11 @@ class SearchOverlay(ModalScreen[ArtifactEntry | None]):
   }
   """
 
-  def __init__(self, *, index: list[SearchEntry], **kwargs) -> None:
+  def __init__(self, *, engine: SearchEngine, **kwargs) -> None:
     super().__init__(**kwargs)
-    self._index = index
+    self._engine = engine
+    # Entries of the rows currently shown, keyed by row key (artifact ID).
+    self._shown: dict[str, ArtifactEntry] = {}
 
   def compose(self) -> ComposeResult:
     with Static(id="search-container"):
@@ -128,11 +129,13 @@ class SearchOverlay(ModalScreen[ArtifactEntry | None]):
   def _update_results(self, query: str) -> None:
     table = self.query_one("#search-results", DataTable)
     table.clear()
+    self._shown.clear()
     if not query:
       return
-    hits = search(query, self._index)
+    hits = self._engine.search(query)
     for se in hits:
       entry = se.entry
+      self._shown[entry.id] = entry
       art_type = entry.artifact_type
       type_style = f"artifact.group.{art_type.group.value}"
       id_style = f"{art_type.value}.id"
@@ -149,12 +152,7 @@ class SearchOverlay(ModalScreen[ArtifactEntry | None]):
     event: DataTable.RowSelected,
   ) -> None:
     event.stop()
-    row_key = event.row_key.value
-    for se in self._index:
-      if se.entry.id == row_key:
-        self.dismiss(se.entry)
-        return
-    self.dismiss(None)
+    self.dismiss(self._shown.get(event.row_key.value or ""))
 
   def action_dismiss_overlay(self) -> None:
     """Dismiss overlay without selection."""
@@ -15,6 +15,8 @@ from supekku.scripts.lib.core.artifact_view import (
 )
 from supekku.tui.app import SpecDriverApp
 from supekku.tui.browser import BrowserScreen
+from supekku.tui.search.index import SearchEntry
+from supekku.tui.search.scorer import SearchEngine
 from supekku.tui.widgets.search_overlay import SearchOverlay
 
 
@@ -68,7 +70,7 @@ def _make_app(snapshot: ArtifactSnapshot | None = None):
     watch=False,
   )
   # Pre-populate search index cache to avoid real registry access.
-  app._search_index = []  # noqa: SLF001
+  app._search_engine = SearchEngine()  # noqa: SLF001
   return app
 
 
@@ -142,3 +144,34 @@ class TestSearchOverlayCtrlF:
       await pilot.pause()
       # Should still be on BrowserScreen, not SearchOverlay.
       assert isinstance(app.screen, BrowserScreen)
+
+
+class TestSearchOverlaySelection:
+  """Selecting a result row dismisses with that row's entry."""
+
+  @pytest.mark.asyncio()
+  async def test_enter_selects_result_row(self):
+    entry = _mock_snapshot().entries[ArtifactType.DELTA]["DE-087"]
+    engine = SearchEngine(
+      [
+        SearchEntry(
+          entry=entry,
+          searchable_fields={"id": entry.id, "title": entry.title},
+          relation_targets=(),
+        ),
+      ],
+    )
+    selected: list[ArtifactEntry | None] = []
+    app = _make_app()
+    async with app.run_test(size=(120, 40)) as pilot:
+      await pilot.pause()
+      app.push_screen(SearchOverlay(engine=engine), selected.append)
+      await pilot.pause()
+      await pilot.press(*"search")
+      await pilot.pause()
+      assert app.screen.query_one("#search-results", DataTable).row_count == 1
+
+      await pilot.press("enter")
+      await pilot.pause()
+
+    assert selected == [entry]
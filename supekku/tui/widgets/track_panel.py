@@ -15,6 +15,7 @@ _COLUMNS = (
   ("Session", "session", 10),
   ("Command", "cmd", None),
   ("Artifact", "artifact", 16),
+  ("Took", "took", 8),
   ("Status", "status", 8),
 )
 
@@ -40,6 +41,19 @@ def format_timestamp(ts: str | None) -> str:
     return ts[:8] if len(ts) >= 8 else ts
 
 
+def format_duration(event: dict) -> str:
+  """Wall time of a profiled command (``spec-driver --profile``), else ""."""
+  profile = event.get("profile")
+  if not isinstance(profile, dict):
+    return ""
+  wall_ms = profile.get("wall_ms")
+  if not isinstance(wall_ms, int | float):
+    return ""
+  if wall_ms >= 1000:
+    return f"{wall_ms / 1000:.1f} s"
+  return f"{wall_ms:.0f} ms"
+
+
 class TrackPanel(DataTable):
   """Scrolling event stream with row selection for artifact navigation."""
 
@@ -89,6 +103,7 @@ class TrackPanel(DataTable):
       styled_text(session[:8], session_style),
       styled_text(cmd, "track.cmd"),
       styled_text(artifact, "track.artifact") if artifact else "",
+      format_duration(event),
       styled_text(status, status_style) if status_style else status,
       key=row_key,
     )